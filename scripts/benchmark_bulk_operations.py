@@ -19,7 +19,7 @@ import uuid
 # Add the project root to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from src.database.db_manager import DatabaseManager
+from src.database.backends import open_database
 from src.models.qb_models import QBPassingStats, QBSplitsType1, QBSplitsType2, BulkInsertResult, Player
 from src.config.config import config
 
@@ -47,7 +47,7 @@ class BenchmarkResult:
 class PerformanceBenchmark:
     """Comprehensive performance benchmarking for bulk operations"""
     
-    def __init__(self, db_manager: DatabaseManager):
+    def __init__(self, db_manager: Any):
         self.db_manager = db_manager
         self.results: List[BenchmarkResult] = []
         self.process = psutil.Process()
@@ -374,6 +374,39 @@ class PerformanceBenchmark:
             errors=result.errors
         )
     
+    def benchmark_upsert_method(self, stats: List[QBPassingStats], method: str) -> BenchmarkResult:
+        """Benchmark DatabaseManager's upsert with a forced method ('batch' or 'copy')"""
+        print(f"Benchmarking {method} upsert for {len(stats)} records...")
+        
+        gc.collect()
+        peak_memory = self.monitor_memory()
+        errors = []
+        success_count = 0
+        
+        start_time = time.time()
+        
+        try:
+            success_count = self.db_manager.insert_qb_basic_stats(stats, method=method)
+            peak_memory = max(peak_memory, self.monitor_memory())
+        except Exception as e:
+            errors.append(str(e))
+        
+        execution_time = time.time() - start_time
+        
+        # execute_batch sends one statement per 100 rows; COPY + merge is four statements
+        database_calls = (len(stats) + 99) // 100 if method == "batch" else 4
+        
+        return BenchmarkResult(
+            test_name=f"Upsert ({method})",
+            record_count=len(stats),
+            execution_time=execution_time,
+            records_per_second=len(stats) / execution_time if execution_time > 0 else 0,
+            memory_peak_mb=peak_memory,
+            database_calls=database_calls,
+            success_rate=(success_count / len(stats)) * 100 if stats else 0,
+            errors=errors
+        )
+    
     def benchmark_combined_operations(self, stats: List[QBPassingStats], splits: List[QBSplitsType1]) -> BenchmarkResult:
         """Benchmark combined bulk operations"""
         print(f"Benchmarking combined operations: {len(stats)} stats + {len(splits)} splits...")
@@ -468,6 +501,14 @@ class PerformanceBenchmark:
                     self.results.append(bulk_result)
                     print(f"✓ {bulk_result}")
             
+            # Compare the execute_batch upsert with COPY into a staging table + one merge
+            for method in ("batch", "copy"):
+                method_result = self.benchmark_upsert_method(stats, method)
+                size_results[f"upsert_{method}"] = method_result
+                self.results.append(method_result)
+                print(f"✓ {method_result}")
+            self._display_copy_comparison(size_results["upsert_batch"], size_results["upsert_copy"])
+            
             # Benchmark splits
             splits_result = self.benchmark_bulk_splits_insert(splits[:min(size, len(splits))])
             size_results["splits"] = splits_result
@@ -514,6 +555,17 @@ class PerformanceBenchmark:
         else:
             print("⚠️  Improvement below target, consider optimization")
     
+    def _display_copy_comparison(self, batch: BenchmarkResult, copy: BenchmarkResult):
+        """Display the execute_batch vs COPY upsert comparison"""
+        print("\n📈 COPY VS EXECUTE_BATCH UPSERT")
+        print("-" * 40)
+        if batch.errors or copy.errors or copy.execution_time <= 0:
+            print("⚠️  Comparison skipped: one of the runs failed")
+            return
+        print(f"execute_batch: {batch.execution_time:.2f}s ({batch.records_per_second:.1f} rec/s)")
+        print(f"COPY + merge:  {copy.execution_time:.2f}s ({copy.records_per_second:.1f} rec/s)")
+        print(f"Speedup: {batch.execution_time / copy.execution_time:.1f}x")
+    
     def generate_report(self) -> str:
         """Generate a comprehensive benchmark report"""
         report = []
@@ -572,7 +624,7 @@ def main():
     
     # Initialize database manager
     try:
-        db_manager = DatabaseManager()
+        db_manager = open_database()
         
         # Test database connection
         if not db_manager.test_connection():
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Row Decoding Benchmark
+Compares per-field row.find() lookups against the single-pass RowDecoder
+on saved PFR pages replicated to a realistic row count
+"""
+
+import sys
+import os
+import time
+import argparse
+import statistics
+from typing import Callable, List
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.html_parser import HTMLParser, make_soup
+from src.core.row_decoder import RowDecoder
+from src.utils.data_utils import safe_int, safe_float, safe_percentage
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), '..', 'tests', 'fixtures')
+
+CONVERTERS = {'int': safe_int, 'float': safe_float, 'percentage': safe_percentage, 'str': str}
+
+
+def load_rows(fixture: str, table_id: str, copies: int) -> List:
+    """Parse a fixture table and replicate its body rows"""
+    with open(os.path.join(FIXTURES_DIR, fixture), 'r', encoding='utf-8') as f:
+        html = f.read()
+    soup = make_soup(html, 'lxml')
+    HTMLParser.expand_commented_tables(soup, [table_id])
+    tbody = soup.find('table', id=table_id).find('tbody')
+    body = ''.join(str(row) for row in tbody.find_all('tr')) * copies
+    replicated = make_soup(f"<table><tbody>{body}</tbody></table>", 'lxml')
+    return replicated.find_all('tr')
+
+
+def per_field_lookup(decoder: RowDecoder, tag: str) -> Callable:
+    """The lookup the extractors used before RowDecoder: one row.find per field"""
+    def decode(row):
+        record = {}
+        for data_stat, field_name, convert in decoder.plan:
+            cell = row.find(tag, {'data-stat': data_stat})
+            if cell:
+                record[field_name] = convert(cell.get_text(strip=True))
+        return record
+    return decode
+
+
+def time_decode(decode: Callable, rows: List, repeats: int) -> float:
+    """Best-of-N seconds to decode every row"""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for row in rows:
+            decode(row)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description='Benchmark per-field lookups against RowDecoder')
+    parser.add_argument('--copies', type=int, default=500, help='Times each fixture row is replicated')
+    parser.add_argument('--repeats', type=int, default=5, help='Timing repeats (best is reported)')
+    args = parser.parse_args()
+
+    cases = [
+        ('passing', 'pfr_passing_2024_sample.html', 'passing', 'enhanced_passing'),
+        ('basic splits', 'pfr_splits_2024_sample.html', 'stats', 'splits_basic'),
+        ('advanced splits', 'pfr_splits_2024_sample.html', 'advanced_splits', 'splits_advanced'),
+    ]
+
+    print(f"{'table':<18}{'rows':>8}{'row.find':>12}{'RowDecoder':>12}{'speedup':>10}")
+    speedups = []
+    for label, fixture, table_id, table_type in cases:
+        rows = load_rows(fixture, table_id, args.copies)
+        decoder = RowDecoder.for_table_type(table_type, CONVERTERS, strip_text=True, skip_missing=True)
+
+        old_seconds = time_decode(per_field_lookup(decoder, 'td'), rows, args.repeats)
+        new_seconds = time_decode(decoder.decode, rows, args.repeats)
+        speedup = old_seconds / new_seconds if new_seconds else 0.0
+        speedups.append(speedup)
+
+        print(f"{label:<18}{len(rows):>8}{old_seconds:>11.3f}s{new_seconds:>11.3f}s{speedup:>9.1f}x")
+
+    print(f"\nMedian speedup: {statistics.median(speedups):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
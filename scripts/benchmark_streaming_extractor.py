@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Streaming Extraction Benchmark
+Compares peak memory and time of DOM-based splits extraction against the
+streaming extractor on synthetic splits pages of increasing size
+"""
+
+import sys
+import os
+import time
+import argparse
+import resource
+import tempfile
+import multiprocessing
+from datetime import datetime
+from unittest.mock import Mock
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), '..', 'tests', 'fixtures', 'pfr_splits_2024_sample.html')
+
+
+def build_page(path: str, copies: int):
+    """Write a splits page whose basic splits body is repeated `copies` times"""
+    with open(FIXTURE_PATH, 'r', encoding='utf-8') as f:
+        html = f.read()
+    start = html.index('<tbody>') + len('<tbody>')
+    end = html.index('</tbody>')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(html[:start])
+        for _ in range(copies):
+            f.write(html[start:end])
+        f.write(html[end:])
+
+
+def run_dom(path: str) -> int:
+    from src.scrapers.splits_extractor import SplitsExtractor
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    request_manager = Mock()
+    request_manager.get_page.return_value = {'success': True, 'content': content, 'error': None}
+    result = SplitsExtractor(Mock(), request_manager=request_manager).extract_player_splits(
+        'BurrJo01', 'Joe Burrow', 2024, datetime.now()
+    )
+    return len(result.basic_splits) + len(result.advanced_splits)
+
+
+def run_streaming(path: str) -> int:
+    from pathlib import Path
+    from src.core.streaming_extractor import StreamingTableExtractor
+    return sum(1 for _ in StreamingTableExtractor().iter_splits(Path(path), 'BurrJo01', 'Joe Burrow', 2024))
+
+
+def measure(args):
+    """Run one extraction in a fresh process and report (rows, seconds, peak RSS growth MB)"""
+    import logging
+    logging.disable(logging.CRITICAL)
+    method, path = args
+    runner = run_dom if method == 'dom' else run_streaming
+    import src.core.streaming_extractor  # noqa: F401  (import cost is paid before the baseline)
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    rows = runner(path)
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rows, elapsed, (peak_kb - baseline_kb) / 1024
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description='Benchmark DOM vs streaming splits extraction')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1, 100, 1000],
+                        help='Times the basic splits rows are repeated')
+    args = parser.parse_args()
+
+    print(f"{'page':>10}{'rows':>8}{'DOM time':>11}{'DOM peak':>11}{'stream time':>13}{'stream peak':>13}")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for copies in args.sizes:
+            path = os.path.join(temp_dir, f'splits_{copies}.html')
+            build_page(path, copies)
+            size_mb = os.path.getsize(path) / (1024 * 1024)
+
+            results = {}
+            for method in ('dom', 'streaming'):
+                with multiprocessing.Pool(1, maxtasksperchild=1) as pool:
+                    results[method] = pool.apply(measure, ((method, path),))
+
+            dom_rows, dom_time, dom_peak = results['dom']
+            stream_rows, stream_time, stream_peak = results['streaming']
+            if dom_rows != stream_rows:
+                print(f"Row count mismatch: DOM {dom_rows}, streaming {stream_rows}")
+            print(f"{size_mb:>8.1f}MB{stream_rows:>8}{dom_time:>10.2f}s{dom_peak:>9.1f}MB"
+                  f"{stream_time:>12.2f}s{stream_peak:>11.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
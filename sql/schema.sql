@@ -93,6 +93,7 @@ CREATE TABLE IF NOT EXISTS qb_passing_stats (
     -- Metadata
     scraped_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    row_hash VARCHAR(32),  -- Hash of the scraped fields; upserts skip rows whose hash is unchanged
     
     -- Primary key and constraints
     PRIMARY KEY (pfr_id, season),
@@ -102,8 +103,12 @@ CREATE TABLE IF NOT EXISTS qb_passing_stats (
 
 -- QB Splits Table (matches advanced_stats_1.csv exactly)
 -- Raw data from splits page with ALL columns
+-- Range partitioned by season, one partition per season (qb_splits_2024, ...).
+-- DatabaseManager.ensure_season_partitions creates partitions before rows for a
+-- new season are written; DatabaseManager.migrate_to_partitioned converts tables
+-- created before partitioning.
 CREATE TABLE IF NOT EXISTS qb_splits (
-    id BIGSERIAL PRIMARY KEY,
+    id BIGSERIAL,
     pfr_id VARCHAR(20) NOT NULL,
     player_name VARCHAR(100) NOT NULL,
     season INTEGER NOT NULL CHECK (season >= 1920 AND season <= 2030),
@@ -158,16 +163,19 @@ CREATE TABLE IF NOT EXISTS qb_splits (
     -- Metadata
     scraped_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    row_hash VARCHAR(32),  -- Hash of the scraped fields; upserts skip rows whose hash is unchanged
     
     -- Constraints
     CONSTRAINT fk_qb_splits_player FOREIGN KEY (pfr_id) REFERENCES players(pfr_id) ON DELETE CASCADE,
-    CONSTRAINT unique_player_season_split UNIQUE(pfr_id, season, split, value)
-);
+    CONSTRAINT unique_player_season_split UNIQUE(pfr_id, season, split, value),
+    PRIMARY KEY (id, season)  -- Keys of a partitioned table must include the partition key
+) PARTITION BY RANGE (season);
 
 -- QB Splits Advanced Table (matches advanced_stats.2.csv exactly)
 -- Raw data from advanced splits page with ALL columns
+-- Range partitioned by season like qb_splits
 CREATE TABLE IF NOT EXISTS qb_splits_advanced (
-    id BIGSERIAL PRIMARY KEY,
+    id BIGSERIAL,
     pfr_id VARCHAR(20) NOT NULL,
     player_name VARCHAR(100) NOT NULL,
     season INTEGER NOT NULL CHECK (season >= 1920 AND season <= 2030),
@@ -201,10 +209,25 @@ CREATE TABLE IF NOT EXISTS qb_splits_advanced (
     -- Metadata
     scraped_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    row_hash VARCHAR(32),  -- Hash of the scraped fields; upserts skip rows whose hash is unchanged
     
     -- Constraints
     CONSTRAINT fk_qb_splits_advanced_player FOREIGN KEY (pfr_id) REFERENCES players(pfr_id) ON DELETE CASCADE,
-    CONSTRAINT unique_player_season_split_advanced UNIQUE(pfr_id, season, split, value)
+    CONSTRAINT unique_player_season_split_advanced UNIQUE(pfr_id, season, split, value),
+    PRIMARY KEY (id, season)  -- Keys of a partitioned table must include the partition key
+) PARTITION BY RANGE (season);
+
+ALTER TABLE qb_passing_stats ADD COLUMN IF NOT EXISTS row_hash VARCHAR(32);
+ALTER TABLE qb_splits ADD COLUMN IF NOT EXISTS row_hash VARCHAR(32);
+ALTER TABLE qb_splits_advanced ADD COLUMN IF NOT EXISTS row_hash VARCHAR(32);
+
+-- When each player's splits were last fetched and parsed. The row-hash upsert
+-- leaves unchanged splits untouched, so their scraped_at cannot tell this
+CREATE TABLE IF NOT EXISTS qb_splits_checks (
+    pfr_id VARCHAR(20) NOT NULL,
+    season INTEGER NOT NULL,
+    checked_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    PRIMARY KEY (pfr_id, season)
 );
 
 -- Scraping Log Table (for monitoring and audit trail)
@@ -225,9 +248,12 @@ CREATE TABLE IF NOT EXISTS scraping_logs (
     warnings TEXT[],
     rate_limit_violations INTEGER DEFAULT 0,
     processing_time_seconds DECIMAL(10,2),
+    scope VARCHAR(20) DEFAULT 'season',  -- 'season' for whole-season crawls, 'players' for --players runs
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
 
+ALTER TABLE scraping_logs ADD COLUMN IF NOT EXISTS scope VARCHAR(20) DEFAULT 'season';
+
 -- Indexes for performance optimization
 
 -- Player table indexes
@@ -446,6 +472,30 @@ SELECT
 FROM scraping_logs
 ORDER BY table_name;
 
+-- Materialized summaries
+-- Monitoring reads (get_database_stats, get_season_summary, the monitor, health and
+-- data summary commands) use these instead of the views above, so frequent polling
+-- does not rescan every table. DatabaseManager.refresh_summaries refreshes them
+-- CONCURRENTLY after bulk loads (readers are not blocked; the unique indexes are
+-- required for that) and records each refresh in summary_refreshes.
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_database_stats AS
+SELECT * FROM database_stats;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_database_stats_table ON mv_database_stats(table_name);
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_qb_season_summary AS
+SELECT * FROM qb_season_summary;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_qb_season_summary_player_season ON mv_qb_season_summary(pfr_id, season);
+CREATE INDEX IF NOT EXISTS idx_mv_qb_season_summary_season ON mv_qb_season_summary(season);
+
+-- When each materialized summary was last refreshed
+CREATE TABLE IF NOT EXISTS summary_refreshes (
+    view_name VARCHAR(63) PRIMARY KEY,
+    refreshed_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    duration_seconds DECIMAL(10,3)
+);
+
 -- Grant permissions for Supabase
 GRANT USAGE ON SCHEMA public TO anon, authenticated;
 GRANT SELECT ON ALL TABLES IN SCHEMA public TO anon, authenticated;
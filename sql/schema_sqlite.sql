@@ -0,0 +1,262 @@
+-- NFL QB Data Database Schema for the embedded SQLite backend
+-- Same tables, columns, keys and views as schema.sql, in SQLite types.
+-- Postgres-only pieces (season partitions, materialized summaries, plpgsql
+-- functions and updated_at triggers, Supabase grants) have no counterpart here;
+-- the upserts set updated_at themselves.
+-- Used by SQLiteDatabaseManager.create_tables for DATABASE_URL=sqlite:///path.
+
+-- Player Master Table
+CREATE TABLE IF NOT EXISTS players (
+    pfr_id TEXT PRIMARY KEY,  -- PFR unique ID (e.g., 'burrjo01')
+    player_name TEXT NOT NULL,
+    first_name TEXT,
+    last_name TEXT,
+    position TEXT DEFAULT 'QB',
+    height_inches INTEGER,
+    weight_lbs INTEGER,
+    birth_date TEXT,
+    age INTEGER,
+    college TEXT,
+    draft_year INTEGER,
+    draft_round INTEGER,
+    draft_pick INTEGER,
+    pfr_url TEXT NOT NULL,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT valid_height CHECK (height_inches IS NULL OR (height_inches > 60 AND height_inches < 84)),
+    CONSTRAINT valid_weight CHECK (weight_lbs IS NULL OR (weight_lbs > 150 AND weight_lbs < 350)),
+    CONSTRAINT valid_age CHECK (age IS NULL OR (age > 15 AND age < 50)),
+    CONSTRAINT valid_draft_year CHECK (draft_year IS NULL OR (draft_year >= 1936 AND draft_year <= 2030)),
+    CONSTRAINT valid_draft_round CHECK (draft_round IS NULL OR (draft_round >= 1 AND draft_round <= 10)),
+    CONSTRAINT valid_draft_pick CHECK (draft_pick IS NULL OR (draft_pick >= 1 AND draft_pick <= 300))
+);
+
+-- Team Master Table
+CREATE TABLE IF NOT EXISTS teams (
+    team_code TEXT PRIMARY KEY,
+    team_name TEXT NOT NULL,
+    city TEXT NOT NULL,
+    conference TEXT CHECK (conference IN ('AFC', 'NFC')),
+    division TEXT CHECK (division IN ('North', 'South', 'East', 'West')),
+    founded_year INTEGER,
+    stadium_name TEXT,
+    stadium_capacity INTEGER,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+-- QB Passing Statistics Table (matches 2024_passing.csv exactly)
+CREATE TABLE IF NOT EXISTS qb_passing_stats (
+    pfr_id TEXT NOT NULL,
+    player_name TEXT NOT NULL,
+    player_url TEXT NOT NULL,
+    season INTEGER NOT NULL CHECK (season >= 1920 AND season <= 2030),
+    rk INTEGER,
+    age INTEGER,
+    team TEXT,
+    pos TEXT,
+    g INTEGER,
+    gs INTEGER,
+    qb_rec TEXT,
+    cmp INTEGER,
+    att INTEGER,
+    inc INTEGER,
+    cmp_pct REAL,
+    yds INTEGER,
+    td INTEGER,
+    td_pct REAL,
+    int INTEGER,
+    int_pct REAL,
+    first_downs INTEGER,
+    succ_pct REAL,
+    lng INTEGER,
+    y_a REAL,
+    ay_a REAL,
+    y_c REAL,
+    y_g REAL,
+    rate REAL,
+    qbr REAL,
+    sk INTEGER,
+    sk_yds INTEGER,
+    sk_pct REAL,
+    ny_a REAL,
+    any_a REAL,
+    four_qc INTEGER,
+    gwd INTEGER,
+    awards TEXT,
+    player_additional TEXT,
+    scraped_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    row_hash TEXT,
+
+    PRIMARY KEY (pfr_id, season),
+    CONSTRAINT fk_qb_passing_stats_player FOREIGN KEY (pfr_id) REFERENCES players(pfr_id) ON DELETE CASCADE,
+    CONSTRAINT fk_qb_passing_stats_team FOREIGN KEY (team) REFERENCES teams(team_code) ON DELETE RESTRICT
+);
+
+-- QB Splits Table (matches advanced_stats_1.csv exactly)
+CREATE TABLE IF NOT EXISTS qb_splits (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    pfr_id TEXT NOT NULL,
+    player_name TEXT NOT NULL,
+    season INTEGER NOT NULL CHECK (season >= 1920 AND season <= 2030),
+    split TEXT,
+    value TEXT,
+    g INTEGER,
+    w INTEGER,
+    l INTEGER,
+    t INTEGER,
+    cmp INTEGER,
+    att INTEGER,
+    inc INTEGER,
+    cmp_pct REAL,
+    yds INTEGER,
+    td INTEGER,
+    int INTEGER,
+    rate REAL,
+    sk INTEGER,
+    sk_yds INTEGER,
+    y_a REAL,
+    ay_a REAL,
+    a_g REAL,
+    y_g REAL,
+    rush_att INTEGER,
+    rush_yds INTEGER,
+    rush_y_a REAL,
+    rush_td INTEGER,
+    rush_a_g REAL,
+    rush_y_g REAL,
+    total_td INTEGER,
+    pts INTEGER,
+    fmb INTEGER,
+    fl INTEGER,
+    ff INTEGER,
+    fr INTEGER,
+    fr_yds INTEGER,
+    fr_td INTEGER,
+    scraped_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    row_hash TEXT,
+
+    CONSTRAINT fk_qb_splits_player FOREIGN KEY (pfr_id) REFERENCES players(pfr_id) ON DELETE CASCADE,
+    CONSTRAINT unique_player_season_split UNIQUE(pfr_id, season, split, value)
+);
+
+-- QB Splits Advanced Table (matches advanced_stats.2.csv exactly)
+CREATE TABLE IF NOT EXISTS qb_splits_advanced (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    pfr_id TEXT NOT NULL,
+    player_name TEXT NOT NULL,
+    season INTEGER NOT NULL CHECK (season >= 1920 AND season <= 2030),
+    split TEXT,
+    value TEXT,
+    cmp INTEGER,
+    att INTEGER,
+    inc INTEGER,
+    cmp_pct REAL,
+    yds INTEGER,
+    td INTEGER,
+    first_downs INTEGER,
+    int INTEGER,
+    rate REAL,
+    sk INTEGER,
+    sk_yds INTEGER,
+    y_a REAL,
+    ay_a REAL,
+    rush_att INTEGER,
+    rush_yds INTEGER,
+    rush_y_a REAL,
+    rush_td INTEGER,
+    rush_first_downs INTEGER,
+    scraped_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    row_hash TEXT,
+
+    CONSTRAINT fk_qb_splits_advanced_player FOREIGN KEY (pfr_id) REFERENCES players(pfr_id) ON DELETE CASCADE,
+    CONSTRAINT unique_player_season_split_advanced UNIQUE(pfr_id, season, split, value)
+);
+
+-- When each player's splits were last fetched and parsed. The row-hash upsert
+-- leaves unchanged splits untouched, so their scraped_at cannot tell this
+CREATE TABLE IF NOT EXISTS qb_splits_checks (
+    pfr_id TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    checked_at TEXT NOT NULL,
+    PRIMARY KEY (pfr_id, season)
+);
+
+-- Scraping Log Table (errors and warnings hold JSON arrays)
+CREATE TABLE IF NOT EXISTS scraping_logs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    session_id TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    start_time TEXT NOT NULL,
+    end_time TEXT,
+    total_requests INTEGER DEFAULT 0,
+    successful_requests INTEGER DEFAULT 0,
+    failed_requests INTEGER DEFAULT 0,
+    total_players INTEGER DEFAULT 0,
+    total_passing_stats INTEGER DEFAULT 0,
+    total_splits INTEGER DEFAULT 0,
+    total_splits_advanced INTEGER DEFAULT 0,
+    errors TEXT,
+    warnings TEXT,
+    rate_limit_violations INTEGER DEFAULT 0,
+    processing_time_seconds REAL,
+    scope TEXT DEFAULT 'season',
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Indexes
+CREATE INDEX IF NOT EXISTS idx_players_name ON players(player_name);
+CREATE INDEX IF NOT EXISTS idx_qb_passing_stats_season ON qb_passing_stats(season);
+CREATE INDEX IF NOT EXISTS idx_qb_passing_stats_team ON qb_passing_stats(team);
+CREATE INDEX IF NOT EXISTS idx_qb_passing_stats_season_rate ON qb_passing_stats(season, rate DESC);
+CREATE INDEX IF NOT EXISTS idx_qb_splits_season_split ON qb_splits(season, split);
+CREATE INDEX IF NOT EXISTS idx_qb_splits_split_value ON qb_splits(split, value);
+CREATE INDEX IF NOT EXISTS idx_qb_splits_advanced_season_split ON qb_splits_advanced(season, split);
+CREATE INDEX IF NOT EXISTS idx_qb_splits_advanced_split_value ON qb_splits_advanced(split, value);
+CREATE INDEX IF NOT EXISTS idx_scraping_logs_session_id ON scraping_logs(session_id);
+CREATE INDEX IF NOT EXISTS idx_scraping_logs_season ON scraping_logs(season);
+
+-- Season summary view (combines all data types)
+CREATE VIEW IF NOT EXISTS qb_season_summary AS
+SELECT
+    p.pfr_id,
+    p.player_name,
+    ps.season,
+    ps.team,
+    ps.age,
+    ps.g as games,
+    ps.gs as games_started,
+    ps.cmp as completions,
+    ps.att as attempts,
+    ps.cmp_pct as completion_pct,
+    ps.yds as pass_yards,
+    ps.td as pass_tds,
+    ps.int as interceptions,
+    ps.rate as passer_rating,
+    ps.qbr,
+    ps.sk as sacks,
+    ps.sk_yds as sack_yards,
+    ps.four_qc as fourth_quarter_comebacks,
+    ps.gwd as game_winning_drives,
+    ps.awards
+FROM players p
+JOIN qb_passing_stats ps ON p.pfr_id = ps.pfr_id
+ORDER BY ps.season DESC, ps.rate DESC NULLS LAST;
+
+-- Database statistics view
+CREATE VIEW IF NOT EXISTS database_stats AS
+SELECT 'players' as table_name, COUNT(*) as record_count,
+       MIN(created_at) as earliest_record, MAX(created_at) as latest_record
+FROM players
+UNION ALL
+SELECT 'qb_passing_stats', COUNT(*), MIN(scraped_at), MAX(scraped_at) FROM qb_passing_stats
+UNION ALL
+SELECT 'qb_splits', COUNT(*), MIN(scraped_at), MAX(scraped_at) FROM qb_splits
+UNION ALL
+SELECT 'qb_splits_advanced', COUNT(*), MIN(scraped_at), MAX(scraped_at) FROM qb_splits_advanced
+UNION ALL
+SELECT 'scraping_logs', COUNT(*), MIN(created_at), MAX(created_at) FROM scraping_logs
+ORDER BY table_name;
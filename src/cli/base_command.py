@@ -12,7 +12,7 @@ from datetime import datetime
 from argparse import ArgumentParser, Namespace
 
 from src.config.config import config  # avoid collision with external "config" package
-from src.database.db_manager import DatabaseManager
+from src.database.backends import open_database
 
 logger = logging.getLogger(__name__)
 
@@ -104,17 +104,7 @@ class BaseCommand(ABC):
     def get_database_manager(self) -> Any:
         """Get database manager instance (lazy initialization)"""
         if self.db_manager is None:
-            if DatabaseManager is not None:
-                self.db_manager = DatabaseManager()
-            else:
-                # Return mock for testing
-                mock_db_manager = type('MockDatabaseManager', (object,), {
-                    'health_check': lambda: {'connection_ok': True, 'tables_exist': True, 'data_accessible': True},
-                    'validate_data_integrity': lambda: {},
-                    'get_database_stats': lambda: {'qb_stats_count': 0, 'qb_splits_count': 0},
-                    'cleanup_old_data': lambda days: 0
-                })()
-                self.db_manager = mock_db_manager
+            self.db_manager = open_database()
         return self.db_manager
     
     def handle_error(self, error: Exception, message: Optional[str] = None) -> int:
@@ -11,6 +11,7 @@ from argparse import ArgumentParser, Namespace
 from typing import Dict, Any, List
 
 from src.cli.base_command import BaseCommand
+from src.core.host_scheduler import HostRateScheduler, set_host_scheduler
 
 # Use try/except for optional imports
 try:
@@ -23,6 +24,8 @@ except ImportError:
         BatchSession = None
         BatchStatus = None
 
+from src.operations.work_queue import DEFAULT_LEASE_SECONDS, open_work_queue
+
 
 class BatchCommand(BaseCommand):
     """Batch operations command for large-scale scraping with session management"""
@@ -53,6 +56,9 @@ class BatchCommand(BaseCommand):
         scrape_season_parser.add_argument('--session-id', type=str, help='Session ID for resuming')
         scrape_season_parser.add_argument('--resume', action='store_true', help='Resume existing session')
         scrape_season_parser.add_argument('--max-workers', type=int, default=3, help='Maximum parallel workers')
+        scrape_season_parser.add_argument('--request-budget', type=str, metavar='PATH',
+                                          help='SQLite file shared by concurrent batch processes to cap their total request rate')
+        self._add_queue_arguments(scrape_season_parser)
         
         # Scrape players subcommand
         scrape_players_parser = subparsers.add_parser('scrape-players', help='Scrape specific players')
@@ -60,10 +66,28 @@ class BatchCommand(BaseCommand):
         scrape_players_parser.add_argument('--season', type=int, default=2024, help='Season year (default: 2024)')
         scrape_players_parser.add_argument('--session-id', type=str, help='Session ID')
         scrape_players_parser.add_argument('--max-workers', type=int, default=3, help='Maximum parallel workers')
+        scrape_players_parser.add_argument('--request-budget', type=str, metavar='PATH',
+                                           help='SQLite file shared by concurrent batch processes to cap their total request rate')
+        self._add_queue_arguments(scrape_players_parser)
+        
+        # Worker subcommand
+        worker_parser = subparsers.add_parser('worker', help='Pull and scrape items of a queued session')
+        worker_parser.add_argument('--session-id', type=str, required=True, help='Queued session to work on')
+        worker_parser.add_argument('--queue-db', type=str, metavar='URL_OR_PATH',
+                                   help='Work queue: Postgres URL or SQLite file (default: DATABASE_URL)')
+        worker_parser.add_argument('--worker-id', type=str, help='Name for this worker\'s leases (default: host:pid)')
+        worker_parser.add_argument('--lease-seconds', type=float, default=DEFAULT_LEASE_SECONDS,
+                                   help=f'Lease length; unrenewed items go back to the queue after it (default: {DEFAULT_LEASE_SECONDS:.0f})')
+        worker_parser.add_argument('--poll-interval', type=float, default=5.0,
+                                   help='Seconds to wait while other workers hold the remaining items (default: 5)')
+        worker_parser.add_argument('--request-budget', type=str, metavar='PATH',
+                                   help='SQLite file shared by concurrent batch processes to cap their total request rate')
         
         # Status subcommand
         status_parser = subparsers.add_parser('status', help='Check batch session status')
         status_parser.add_argument('--session-id', type=str, required=True, help='Session ID to check')
+        status_parser.add_argument('--queue-db', type=str, metavar='URL_OR_PATH',
+                                   help='Work queue of a queued session (default: DATABASE_URL)')
         
         # List sessions subcommand
         list_parser = subparsers.add_parser('list', help='List all batch sessions')
@@ -79,6 +103,19 @@ class BatchCommand(BaseCommand):
         cleanup_parser.add_argument('--all', action='store_true', help='Clean up all completed sessions')
         cleanup_parser.add_argument('--older-than', type=int, help='Clean up sessions older than N days')
     
+    def _add_queue_arguments(self, parser: ArgumentParser):
+        """Options for handing a session to batch worker processes"""
+        parser.add_argument('--queue', action='store_true',
+                            help='Queue the items for `batch worker` processes instead of scraping them here')
+        parser.add_argument('--queue-db', type=str, metavar='URL_OR_PATH',
+                            help='Work queue: Postgres URL or SQLite file (default: DATABASE_URL)')
+    
+    def _open_queue(self, args: Namespace) -> Any:
+        """Work queue for the session if --queue was given, otherwise None"""
+        if not getattr(args, 'queue', False):
+            return None
+        return open_work_queue(args.queue_db)
+    
     def run(self, args: Namespace) -> int:
         """Execute the batch command"""
         if not args.subcommand:
@@ -90,6 +127,8 @@ class BatchCommand(BaseCommand):
                 return self._handle_scrape_season(args)
             elif args.subcommand == 'scrape-players':
                 return self._handle_scrape_players(args)
+            elif args.subcommand == 'worker':
+                return self._handle_worker(args)
             elif args.subcommand == 'status':
                 return self._handle_status(args)
             elif args.subcommand == 'list':
@@ -120,18 +159,24 @@ class BatchCommand(BaseCommand):
             return 0
         
         # Real batch operation
+        self._configure_request_budget(args)
         batch_manager = BatchOperationManager(max_workers=args.max_workers)
         
         try:
+            queue = self._open_queue(args)
             session = batch_manager.batch_scrape_season(
                 season=args.year,
                 session_id=args.session_id,
-                resume=args.resume
+                resume=args.resume,
+                queue=queue
             )
             
             print(f"Batch session created: {session.session_id}")
             print(f"Status: {session.status.value}")
             print(f"Total items: {session.progress.total_items}")
+            if queue is not None:
+                self._print_queue_hint(session.session_id, args)
+                return 0
             
             # Wait for completion or show progress
             if session.status == BatchStatus.RUNNING:
@@ -159,18 +204,24 @@ class BatchCommand(BaseCommand):
             return 0
         
         # Real batch operation
+        self._configure_request_budget(args)
         batch_manager = BatchOperationManager(max_workers=args.max_workers)
         
         try:
+            queue = self._open_queue(args)
             session = batch_manager.batch_scrape_players(
                 player_names=args.players,
                 session_id=args.session_id,
-                season=args.season
+                season=args.season,
+                queue=queue
             )
             
             print(f"Batch session created: {session.session_id}")
             print(f"Status: {session.status.value}")
             print(f"Total items: {session.progress.total_items}")
+            if queue is not None:
+                self._print_queue_hint(session.session_id, args)
+                return 0
             
             # Wait for completion or show progress
             if session.status == BatchStatus.RUNNING:
@@ -184,6 +235,51 @@ class BatchCommand(BaseCommand):
             self.logger.error(f"Batch player scrape failed: {e}")
             return 1
     
+    def _print_queue_hint(self, session_id: str, args: Namespace) -> None:
+        """Tell the user how to start workers for a queued session"""
+        queue_db = f" --queue-db {args.queue_db}" if args.queue_db else ""
+        print("Items queued. Start any number of workers, on this or other machines, with:")
+        print(f"  pfr-qb-scraper batch worker --session-id {session_id}{queue_db}")
+    
+    def _handle_worker(self, args: Namespace) -> int:
+        """Handle a queue worker: claim, scrape and report items until the session is drained"""
+        if BatchOperationManager is None:
+            self.logger.error("BatchOperationManager not available")
+            return 1
+        
+        self._configure_request_budget(args)
+        queue = open_work_queue(args.queue_db, lease_seconds=args.lease_seconds)
+        batch_manager = BatchOperationManager(max_workers=1)
+        
+        try:
+            stats = batch_manager.run_worker(
+                queue, args.session_id,
+                worker_id=args.worker_id,
+                poll_interval=args.poll_interval
+            )
+        except KeyboardInterrupt:
+            # Leases of an interrupted item run out and the item goes back to the queue
+            print("Worker interrupted; its current item returns to the queue when the lease expires")
+            return 130
+        finally:
+            queue.close()
+        
+        print(f"Worker finished session {args.session_id}: "
+              f"{stats['completed']} completed, {stats['retried']} retried, "
+              f"{stats['failed']} failed, {stats['lost']} lost leases")
+        return 0
+    
+    def _configure_request_budget(self, args: Namespace) -> None:
+        """Share the per-host request budget with other processes when requested"""
+        budget_path = getattr(args, 'request_budget', None)
+        if not budget_path:
+            return
+        scheduler = set_host_scheduler(HostRateScheduler.from_config(self.config.scraping, budget_path=budget_path))
+        self.logger.info(
+            f"Leasing requests from shared budget {budget_path} "
+            f"({scheduler.requests_per_minute} req/min across all processes)"
+        )
+    
     def _handle_status(self, args: Namespace) -> int:
         """Handle status checking"""
         self.logger.info(f"Checking status for session: {args.session_id}")
@@ -234,12 +330,16 @@ class BatchCommand(BaseCommand):
             if eta:
                 print(f"  Estimated Completion: {eta}")
         
-        # Show item counts
-        item_counts = status.get('item_counts', {})
-        if item_counts:
+        # Show item counts; workers report a queued session's progress to the queue
+        session = batch_manager.get_session(args.session_id)
+        if session.config.get('queued'):
+            item_counts = open_work_queue(args.queue_db).counts(args.session_id)
+            print("\nQueue Counts:")
+        else:
+            item_counts = status.get('item_counts', {})
             print(f"\nItem Counts:")
-            for count_type, count in item_counts.items():
-                print(f"  {count_type.title()}: {count}")
+        for count_type, count in item_counts.items():
+            print(f"  {count_type.title()}: {count}")
         
         return 0
     
@@ -10,6 +10,7 @@ from typing import List
 from src.cli.base_command import BaseCommand
 from src.cli.commands.populate_command import PopulateCommand
 from src.cli.commands.cleanup_command import CleanupCommand
+from src.utils.data_utils import parse_season_range
 
 # Use try/except for optional imports
 try:
@@ -48,9 +49,13 @@ class DataCommand(BaseCommand):
         
         # Export subcommand
         export_parser = subparsers.add_parser('export', help='Export data from database')
-        export_parser.add_argument('--season', type=int, help='Season to export')
-        export_parser.add_argument('--format', choices=['json', 'csv'], default='json', help='Export format')
+        export_parser.add_argument('--season', help='Season or seasons to export, e.g. 2024 or 2019-2024')
+        export_parser.add_argument('--format', choices=['json', 'jsonl', 'csv'], default='json',
+                                   help='Export format (jsonl and csv write one file per dataset)')
         export_parser.add_argument('--output', help='Output file path')
+        export_parser.add_argument('--columns', nargs='+', help='Only export these columns')
+        export_parser.add_argument('--compression', choices=['gzip', 'zstd'],
+                                   help='Compress the output (zstd needs the zstandard package)')
         
         # Import subcommand
         import_parser = subparsers.add_parser('import', help='Import data to database')
@@ -65,17 +70,24 @@ class DataCommand(BaseCommand):
         # Summary subcommand
         summary_parser = subparsers.add_parser('summary', help='Show data summary')
         summary_parser.add_argument('--season', type=int, help='Season to summarize')
+        summary_parser.add_argument('--refresh', action='store_true',
+                                    help='Refresh the materialized summaries first')
         
         # Clear subcommand
         clear_parser = subparsers.add_parser('clear', help='Clear all data from database')
         clear_parser.add_argument('--confirm', action='store_true', help='Confirm clearing all data')
         clear_parser.add_argument('--season', type=int, help='Clear data for specific season only')
         clear_parser.add_argument('--tables', nargs='+', help='Specific tables to clear')
+        
+        # Partition subcommand
+        partition_parser = subparsers.add_parser('partition',
+                                                 help='Move splits tables to season range partitioning')
+        partition_parser.add_argument('--confirm', action='store_true', help='Confirm migrating the tables')
 
     def run(self, args: Namespace) -> int:
         """Execute the data command"""
         if not args.data_subcommand:
-            self.print_error("No data subcommand specified. Use 'export', 'import', 'quality', 'summary', or 'clear'.")
+            self.print_error("No data subcommand specified. Use 'export', 'import', 'quality', 'summary', 'clear', or 'partition'.")
             return 1
 
         if args.data_subcommand == 'export':
@@ -88,10 +100,23 @@ class DataCommand(BaseCommand):
             return self._handle_summary(args)
         elif args.data_subcommand == 'clear':
             return self._handle_clear(args)
+        elif args.data_subcommand == 'partition':
+            return self._handle_partition(args)
         
         self.print_error(f"Unknown data subcommand: {args.data_subcommand}")
         return 1
     
+    def _use_database(self) -> bool:
+        """Point the DataManager at the database so reads stream real rows"""
+        try:
+            db_manager = self.get_database_manager()
+        except Exception as e:
+            self.handle_error(e, "Failed to connect to database")
+            return False
+        if hasattr(db_manager, 'stream_rows'):
+            self.data_manager.db_manager = db_manager
+        return True
+
     def _handle_populate(self, args: Namespace) -> int:
         """Handle the populate subcommand"""
         populate_command = PopulateCommand()
@@ -107,6 +132,8 @@ class DataCommand(BaseCommand):
         if not self.data_manager:
             self.print_error("DataManager not available")
             return 1
+        if not self._use_database():
+            return 1
             
         self.print_info("Running data validation...")
         validation_results = self.data_manager.validate_data(season=args.season)
@@ -138,14 +165,19 @@ class DataCommand(BaseCommand):
         if not self.data_manager:
             self.print_error("DataManager not available")
             return 1
+        if not self._use_database():
+            return 1
             
         self.print_info(f"Exporting data to {args.format} format...")
         
         try:
+            seasons = parse_season_range(args.season) if args.season else None
             output_file = self.data_manager.export_data(
                 format=args.format,
-                season=args.season,
-                output_file=args.output
+                season=seasons[0] if seasons and len(seasons) == 1 else seasons,
+                output_file=args.output,
+                columns=getattr(args, 'columns', None),
+                compression=getattr(args, 'compression', None)
             )
             self.print_success(f"Data exported successfully to: {output_file}")
             return 0
@@ -238,8 +270,14 @@ class DataCommand(BaseCommand):
         if not self.data_manager:
             self.print_error("DataManager not available")
             return 1
+        if not self._use_database():
+            return 1
             
         self.print_info("Generating data summary...")
+        db_manager = self.data_manager.db_manager
+        if getattr(args, 'refresh', False) and hasattr(db_manager, 'refresh_summaries'):
+            for view, seconds in db_manager.refresh_summaries().items():
+                self.print_info(f"Refreshed {view} in {seconds:.2f}s")
         summary = self.data_manager.get_data_summary(season=args.season)
         
         self.print_section_header("Data Summary")
@@ -251,6 +289,10 @@ class DataCommand(BaseCommand):
             else:
                 self.print_info(f"{key.replace('_', ' ').title()}: {value}")
         
+        freshness = db_manager.get_summary_freshness() if hasattr(db_manager, 'get_summary_freshness') else {}
+        for view, info in freshness.items():
+            self.print_info(f"{view} refreshed {info['age_seconds']:.0f}s ago")
+        
         return 0 
 
     def _handle_clear(self, args: Namespace) -> int:
@@ -315,34 +357,41 @@ class DataCommand(BaseCommand):
         return 0
     
     def _clear_season_data(self, db_manager, season: int) -> int:
-        """Clear data for specific season"""
-        tables_to_clear = [
-            'qb_splits_advanced', 
-            'qb_splits',
-            'qb_passing_stats'
-        ]
-        
-        total_deleted = 0
+        """Clear data for specific season (a partition truncate on the partitioned splits tables)"""
+        try:
+            removed = db_manager.clear_season(season)
+        except Exception as e:
+            self.print_error(f"❌ Error clearing season {season}: {e}")
+            return 1
         
-        for table in tables_to_clear:
-            try:
-                # Get count before deletion
-                count_result = db_manager.query(f"SELECT COUNT(*) as count FROM {table} WHERE season = %s", (season,))
-                count_before = count_result[0]['count'] if count_result else 0
-                
-                # Delete records for specific season
-                deleted_count = db_manager.execute(f"DELETE FROM {table} WHERE season = %s", (season,))
-                
-                self.print_info(f"✅ Deleted {deleted_count} records from {table} for season {season} (was {count_before})")
-                total_deleted += deleted_count
-                
-            except Exception as e:
-                self.print_error(f"❌ Error clearing table {table}: {e}")
-                continue
+        for table, count in removed.items():
+            self.print_info(f"✅ Removed {count} records from {table} for season {season}")
         
-        self.print_success(f"✅ Season {season} data clearing completed! Total records deleted: {total_deleted}")
+        self.print_success(f"✅ Season {season} data clearing completed! Total records deleted: {sum(removed.values())}")
         return 0
     
+    def _handle_partition(self, args: Namespace) -> int:
+        """Handle moving the splits tables to season partitioning"""
+        if not args.confirm:
+            self.print_warning("⚠️  This rebuilds qb_splits and qb_splits_advanced as season-partitioned tables.")
+            self.print_info("Each table is copied and swapped in one transaction; writes to it wait until it finishes.")
+            self.print_info("Use --confirm to proceed.")
+            return 1
+        
+        try:
+            from src.database.tables import SPLITS_TABLES
+            db_manager = self.get_database_manager()
+            for table in SPLITS_TABLES:
+                moved = db_manager.migrate_to_partitioned(table)
+                self.print_success(f"✅ {table}: {moved} rows moved into season partitions")
+            return 0
+        except NotImplementedError as e:
+            self.print_error(f"❌ {e}")
+            return 1
+        except Exception as e:
+            self.handle_error(e, "Failed to partition splits tables")
+            return 1
+    
     def _clear_specific_tables(self, db_manager, tables: list) -> int:
         """Clear specific tables"""
         total_deleted = 0
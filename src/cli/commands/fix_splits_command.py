@@ -9,9 +9,8 @@ import logging
 import argparse
 from typing import Dict, Any, List
 from argparse import ArgumentParser, Namespace
-from datetime import datetime
 from src.cli.base_command import BaseCommand
-from src.database.db_manager import DatabaseManager
+from src.database.backends import open_database
 from src.utils.data_utils import logger
 
 class FixSplitsCommand(BaseCommand):
@@ -19,7 +18,7 @@ class FixSplitsCommand(BaseCommand):
     
     def __init__(self):
         super().__init__()
-        self.db_manager = DatabaseManager()
+        self.db_manager = open_database()
     
     @property
     def name(self) -> str:
@@ -32,7 +31,8 @@ class FixSplitsCommand(BaseCommand):
     def add_arguments(self, parser):
         """Add command-specific arguments"""
         parser.add_argument(
-            '--preview',
+            '--preview', '--dry-run',
+            dest='preview',
             action='store_true',
             help='Preview changes without applying them'
         )
@@ -226,6 +226,20 @@ class FixSplitsCommand(BaseCommand):
         
         return split_mapping
     
+    def _print_results(self, results: Dict[str, Dict[str, Any]], verb: str) -> int:
+        """Print per-table changes and split distributions, returning the rows moved"""
+        total = 0
+        for table, result in results.items():
+            print(f"\n--- {table} ---")
+            for value, (new_split_type, count) in sorted(result['changes'].items(), key=lambda item: -item[1][1]):
+                print(f"  ✓ {verb} {count} records: '{value}' -> '{new_split_type}'")
+                total += count
+            
+            print(f"\n=== {table} Split Distribution ===")
+            for split, count in result['distribution'].items():
+                print(f"  - {split}: {count} records")
+        return total
+    
     def preview_changes(self, args):
         """Preview what changes would be made"""
         
@@ -234,94 +248,41 @@ class FixSplitsCommand(BaseCommand):
         print("=== Preview of Split Category Changes ===")
         print("(This is a preview - no changes will be made)")
         
-        total_to_update = 0
-        for value, new_split_type in split_mapping.items():
-            # Count records that would be updated
-            result = self.db_manager.query("""
-                SELECT COUNT(*) 
-                FROM qb_splits 
-                WHERE split = 'other' AND value = %s
-            """, (value,))
-            
-            count = result[0]['count'] if result else 0
-            if count > 0:
-                print(f"  '{value}' -> '{new_split_type}': {count} records")
-                total_to_update += count
+        results = self.db_manager.recategorize_splits(split_mapping, dry_run=True)
+        total_to_update = self._print_results(results, 'Would update')
         
         print(f"\nTotal records that would be updated: {total_to_update}")
-        
-        # Show current distribution
-        print(f"\n=== Current Split Distribution ===")
-        result = self.db_manager.query("""
-            SELECT split, COUNT(*) as count 
-            FROM qb_splits 
-            GROUP BY split 
-            ORDER BY count DESC
-        """)
-        
-        for row in result:
-            print(f"  - {row['split']}: {row['count']} records")
     
     def fix_splits(self, args):
-        """Fix the split categories"""
+        """Fix the split categories in one set-based update per table, all in one transaction"""
         
         split_mapping = self.create_split_mapping()
         
         print("=== Fixing Split Categories ===")
         print(f"Mapping {len(split_mapping)} value types to proper split categories")
         
-        # Get current stats
-        result = self.db_manager.query("SELECT COUNT(*) as count FROM qb_splits WHERE split = 'other'")
-        total_other = result[0]['count'] if result else 0
-        print(f"Total 'other' splits to process: {total_other}")
-        
-        if total_other == 0:
-            print("✅ No 'other' splits found - all splits are already properly categorized!")
-            return
-        
-        # Process each mapping
-        updated_count = 0
-        for value, new_split_type in split_mapping.items():
-            # Update records for this value
-            result = self.db_manager.execute("""
-                UPDATE qb_splits 
-                SET split = %s, updated_at = %s
-                WHERE split = 'other' AND value = %s
-            """, (new_split_type, datetime.now(), value))
-            
-            if result > 0:
-                print(f"  ✓ Updated {result} records: '{value}' -> '{new_split_type}'")
-                updated_count += result
+        results = self.db_manager.recategorize_splits(split_mapping)
+        updated_count = self._print_results(results, 'Updated')
+        remaining = {table: result['distribution'].get('other', 0) for table, result in results.items()}
         
         print(f"\n=== Update Summary ===")
         print(f"Total records updated: {updated_count}")
-        print(f"Records remaining as 'other': {total_other - updated_count}")
-        
-        # Show new split distribution
-        print(f"\n=== New Split Distribution ===")
-        result = self.db_manager.query("""
-            SELECT split, COUNT(*) as count 
-            FROM qb_splits 
-            GROUP BY split 
-            ORDER BY count DESC
-        """)
-        
-        for row in result:
-            print(f"  - {row['split']}: {row['count']} records")
+        print(f"Records remaining as 'other': {sum(remaining.values())}")
         
         # Show any remaining "other" values
-        if total_other - updated_count > 0:
-            print(f"\n=== Remaining 'other' values ===")
-            result = self.db_manager.query("""
-                SELECT value, COUNT(*) as count 
-                FROM qb_splits 
-                WHERE split = 'other' 
-                GROUP BY value 
-                ORDER BY count DESC
-            """)
-            
-            for row in result:
-                print(f"  - {row['value']}: {row['count']} records")
+        for table, count in remaining.items():
+            if count > 0:
+                print(f"\n=== Remaining 'other' values in {table} ===")
+                result = self.db_manager.query(f"""
+                    SELECT value, COUNT(*) as count 
+                    FROM {table} 
+                    WHERE split = 'other' 
+                    GROUP BY value 
+                    ORDER BY count DESC
+                """)
+                
+                for row in result:
+                    print(f"  - {row['value']}: {row['count']} records")
     
     def run(self, args):
         """Execute the command"""
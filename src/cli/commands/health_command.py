@@ -115,7 +115,8 @@ class HealthCommand(BaseCommand):
         optional_checks = {
             'indexes_optimal': 'Database Indexes',
             'disk_space_ok': 'Disk Space',
-            'memory_ok': 'Memory Usage'
+            'memory_ok': 'Memory Usage',
+            'summaries_refreshed': 'Materialized Summaries'
         }
         
         # Show critical checks
@@ -157,6 +158,12 @@ class HealthCommand(BaseCommand):
                 for key, value in metrics.items():
                     self.print_info(f"  {key}: {value}")
             
+            # Materialized summary ages
+            if health_results.get('summary_freshness'):
+                self.print_info("Materialized Summaries:")
+                for view, age in health_results['summary_freshness'].items():
+                    self.print_info(f"  {view}: {age}")
+            
             # System resources
             if 'system_resources' in health_results:
                 resources = health_results['system_resources']
@@ -147,6 +147,7 @@ class MonitorCommand(BaseCommand):
             self.print_info(f"Unique Players: {unique_players:,}")
             self.print_info(f"Unique Teams: {unique_teams:,}")
             self.print_info(f"Seasons Covered: {unique_seasons:,}")
+            self._show_summary_freshness(db_manager)
             
             # Calculate some derived metrics
             if unique_players > 0:
@@ -158,6 +159,15 @@ class MonitorCommand(BaseCommand):
         except Exception as e:
             self.print_error(f"Failed to retrieve performance metrics: {e}")
     
+    def _show_summary_freshness(self, db_manager) -> None:
+        """Show how old the materialized summaries behind these numbers are"""
+        freshness = db_manager.get_summary_freshness()
+        if not freshness:
+            self.print_warning("Summary freshness unknown (summaries never refreshed)")
+            return
+        oldest = max(info['age_seconds'] for info in freshness.values())
+        self.print_info(f"Summaries Refreshed: {oldest:.0f}s ago")
+    
     def _show_data_quality_metrics(self, db_manager) -> None:
         """Show data quality metrics"""
         self.print_section_header("Data Quality Metrics")
@@ -11,7 +11,10 @@ from argparse import ArgumentParser, Namespace
 
 from src.cli.base_command import BaseCommand
 from src.operations.scraping_operation import ScrapingOperation
-from src.database.db_manager import DatabaseManager
+from src.operations.crawl_planner import CrawlPlan, CrawlPlanner
+from src.database.backends import open_database
+from src.core.page_cache import PageCache
+from src.utils.data_utils import format_duration, parse_season_range
 from src.config.config import config
 
 
@@ -41,6 +44,10 @@ class ScrapeCommand(BaseCommand):
             default=self.config.app.target_season,
             help=f'Season year to scrape (default: {self.config.app.target_season})'
         )
+        parser.add_argument(
+            '--seasons',
+            help='Several seasons to scrape, e.g. "2019-2024" or "2018,2020-2022" (overrides --season)'
+        )
         parser.add_argument(
             '--min-delay', 
             type=float, 
@@ -63,6 +70,12 @@ class ScrapeCommand(BaseCommand):
             nargs='+',
             help='Specific player names to scrape'
         )
+        parser.add_argument(
+            '--career',
+            action='store_true',
+            help='Harvest every career season of --players from one player page each '
+                 '(PFR IDs, or names already stored from a season crawl)'
+        )
         parser.add_argument(
             '--validate', 
             action='store_true',
@@ -73,6 +86,31 @@ class ScrapeCommand(BaseCommand):
             action='store_true',
             help='Enable detailed progress tracking'
         )
+        parser.add_argument(
+            '--replay',
+            action='store_true',
+            help='Serve pages only from the page cache; never make network requests'
+        )
+        parser.add_argument(
+            '--cache-dir',
+            default=self.config.cache.cache_dir,
+            help=f'Page cache directory (default: {self.config.cache.cache_dir})'
+        )
+        parser.add_argument(
+            '--no-cache',
+            action='store_true',
+            help='Disable the persistent page cache'
+        )
+        parser.add_argument(
+            '--incremental',
+            action='store_true',
+            help='Skip complete seasons and fetch splits only for players whose stats changed'
+        )
+        parser.add_argument(
+            '--plan',
+            action='store_true',
+            help='Print the incremental crawl plan with its request count and estimated time, then exit'
+        )
     
     def validate_args(self, args: Namespace) -> List[str]:
         """Validate scrape command arguments"""
@@ -94,6 +132,30 @@ class ScrapeCommand(BaseCommand):
         if args.min_delay > args.max_delay:
             errors.append(f"Min delay ({args.min_delay}) cannot be greater than max delay ({args.max_delay}).")
         
+        # Replay needs a cache to replay from
+        if getattr(args, 'replay', False) and getattr(args, 'no_cache', False):
+            errors.append("--replay cannot be combined with --no-cache.")
+        
+        # Career harvest works per player
+        if getattr(args, 'career', False) and not args.players:
+            errors.append("--career requires --players.")
+        if getattr(args, 'career', False) and args.splits_only:
+            errors.append("--career cannot be combined with --splits-only.")
+        
+        # Validate season ranges
+        if getattr(args, 'seasons', None):
+            try:
+                seasons = parse_season_range(args.seasons)
+                if seasons[0] < 1970 or seasons[-1] > 2030:
+                    errors.append(f"Invalid seasons: {args.seasons}. Must be between 1970 and 2030.")
+            except ValueError as e:
+                errors.append(str(e))
+            if getattr(args, 'career', False):
+                errors.append("--seasons cannot be combined with --career.")
+        
+        if getattr(args, 'incremental', False) and args.splits_only:
+            errors.append("--incremental cannot be combined with --splits-only.")
+        
         # Validate player names if provided
         if args.players:
             for player in args.players:
@@ -113,45 +175,71 @@ class ScrapeCommand(BaseCommand):
                     self.print_error(error)
                 return 1
             
-            self.logger.info(f"Starting scrape for season {args.season}")
+            seasons = self._seasons(args)
+            if getattr(args, 'plan', False):
+                return self._print_plan(args, seasons)
+            
+            self.logger.info(f"Starting scrape for seasons {seasons}")
             
             # Show configuration
             self.print_section_header("Scraping Configuration")
-            self.print_info(f"Season: {args.season}")
+            season_label = ', '.join(str(season) for season in seasons)
+            self.print_info(f"Season: {'all career seasons' if getattr(args, 'career', False) else season_label}")
             self.print_info(f"Delay Range: {args.min_delay}s - {args.max_delay}s")
             self.print_info(f"Splits Only: {'Yes' if args.splits_only else 'No'}")
+            self.print_info(f"Incremental: {'Yes' if getattr(args, 'incremental', False) else 'No'}")
             self.print_info(f"Progress Tracking: {'Yes' if args.progress else 'No'}")
             if args.players:
                 self.print_info(f"Players: {', '.join(args.players)}")
             
+            page_cache = self._build_page_cache(args)
+            if page_cache:
+                mode = "replay only" if page_cache.replay else "read-through"
+                self.print_info(f"Page Cache: {page_cache.cache_dir} ({mode})")
+            else:
+                self.print_info("Page Cache: disabled")
+            
             # Run scraping
             self.print_section_header("Running Scraper")
             
             # Initialize database manager and scraping operation
-            db_manager = DatabaseManager()
+            db_manager = open_database()
             scraping_operation = ScrapingOperation(
                 config=self.config,
                 db_manager=db_manager,
                 min_delay=args.min_delay,
-                max_delay=args.max_delay
+                max_delay=args.max_delay,
+                page_cache=page_cache
             )
             
             # Execute the scraping operation
-            result = scraping_operation.execute(
-                args.season, 
-                player_names=args.players,
-                splits_only=args.splits_only
-            )
+            if getattr(args, 'career', False):
+                results = [scraping_operation.execute_career(args.players)]
+            else:
+                results = [
+                    scraping_operation.execute(
+                        season,
+                        player_names=args.players,
+                        splits_only=args.splits_only,
+                        incremental=getattr(args, 'incremental', False)
+                    )
+                    for season in seasons
+                ]
             
             # Print results
-            self._print_scraping_results(result, scraping_operation)
+            for result in results:
+                self._print_scraping_results(result, scraping_operation)
+            if page_cache:
+                self._print_cache_stats(page_cache)
+            
+            success = all(result.success for result in results)
             
             # Validate if requested
-            if args.validate and result.success:
+            if args.validate and success:
                 self.logger.info("Running post-scrape validation")
                 return self._run_validation()
             
-            return 0 if result.success else 1
+            return 0 if success else 1
             
         except (ConnectionError, OSError) as e:
             return self.handle_error(e, "Connection error during scraping")
@@ -160,6 +248,60 @@ class ScrapeCommand(BaseCommand):
         except Exception as e:
             return self.handle_error(e, "Scraping failed")
     
+    def _seasons(self, args: Namespace) -> List[int]:
+        """Seasons to scrape: --seasons if given, otherwise --season"""
+        if getattr(args, 'seasons', None):
+            return parse_season_range(args.seasons)
+        return [args.season]
+    
+    def _print_plan(self, args: Namespace, seasons: List[int]) -> int:
+        """Print the incremental crawl plan without fetching anything"""
+        planner = CrawlPlanner(
+            open_database(),
+            self.config.scraping,
+            min_delay=args.min_delay,
+            max_delay=args.max_delay
+        )
+        plan = planner.plan(seasons, player_names=args.players)
+        self._print_crawl_plan(plan)
+        return 0
+    
+    def _print_crawl_plan(self, plan: CrawlPlan) -> None:
+        """Print a crawl plan per season with its totals"""
+        self.print_section_header("Crawl Plan")
+        for season_plan in plan.seasons:
+            self.print_info(
+                f"{season_plan.season}: {season_plan.state:<8} {season_plan.requests:>4} requests  ({season_plan.reason})"
+            )
+        
+        self.print_section_header("Estimate")
+        self.print_info(f"Requests: {plan.total_requests}")
+        self.print_info(f"Pace: {plan.seconds_per_request:.1f}s per request")
+        self.print_info(f"Estimated Wall Time: {format_duration(plan.estimated_seconds)}")
+        if plan.total_requests == 0:
+            self.print_success("Nothing to fetch")
+    
+    def _build_page_cache(self, args: Namespace) -> Optional[PageCache]:
+        """Create the page cache from config, honoring CLI overrides"""
+        if getattr(args, 'no_cache', False):
+            return None
+        replay = getattr(args, 'replay', False) or self.config.cache.replay
+        if not self.config.cache.enabled and not replay:
+            return None
+        return PageCache(
+            cache_dir=getattr(args, 'cache_dir', None) or self.config.cache.cache_dir,
+            ttl_hours=self.config.cache.ttl_hours,
+            max_size_mb=self.config.cache.max_size_mb,
+            replay=replay
+        )
+    
+    def _print_cache_stats(self, page_cache: PageCache) -> None:
+        """Print page cache hit/miss statistics"""
+        stats = page_cache.stats()
+        self.print_section_header("Page Cache")
+        self.print_info(f"Hits: {stats['hits']}  Misses: {stats['misses']}  Hit Rate: {stats['hit_rate']:.1%}")
+        self.print_info(f"Stored Pages: {stats['entries']} ({stats['size_mb']:.1f} MB)")
+    
     def _print_scraping_results(self, result, scraping_operation) -> None:
         """Print scraping results in a formatted way"""
         self.print_section_header("Scraping Results")
@@ -11,6 +11,11 @@ from .html_parser import HTMLParser
 from .pfr_data_extractor import PFRDataExtractor, ExtractionResult
 from .pfr_structure_analyzer import PFRStructureAnalyzer, TableInfo, DataStatMapping
 from .selenium_manager import SeleniumManager, SeleniumConfig
+from .page_cache import PageCache, CacheEntry
+from .row_decoder import RowDecoder
+from .host_scheduler import HostRateScheduler, TokenBucket, get_host_scheduler, set_host_scheduler
+from .request_budget import SharedRequestBudget, SharedTokenBucket
+from .async_pipeline import AsyncPipeline, PipelineStats
 
 __all__ = [
     'CoreScraper',
@@ -22,5 +27,16 @@ __all__ = [
     'TableInfo',
     'DataStatMapping',
     'SeleniumManager',
-    'SeleniumConfig'
+    'SeleniumConfig',
+    'PageCache',
+    'CacheEntry',
+    'RowDecoder',
+    'HostRateScheduler',
+    'TokenBucket',
+    'get_host_scheduler',
+    'set_host_scheduler',
+    'SharedRequestBudget',
+    'SharedTokenBucket',
+    'AsyncPipeline',
+    'PipelineStats'
 ] 
\ No newline at end of file
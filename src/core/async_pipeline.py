@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Async Fetch/Parse/Store Pipeline for NFL QB Data Scraping
+Overlaps parsing and database writes with the politeness wait between requests.
+
+The fetch stage runs the (blocking, rate-limited) fetch callable one item at
+a time, the parse stage runs in its own executor, and the store stage
+groups whatever records have accumulated into batched writes. Bounded queues
+between the stages keep at most ``queue_size`` fetched pages in memory, so a
+slow database applies backpressure instead of piling up pages. Season wall-clock time approaches
+requests x politeness delay, with parse and insert time hidden behind it.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, List
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+@dataclass
+class PipelineStats:
+    """Counters and per-stage busy time for one pipeline run"""
+    items: int = 0
+    fetched: int = 0
+    fetch_failures: int = 0
+    parsed: int = 0
+    parse_failures: int = 0
+    records_parsed: int = 0
+    records_stored: int = 0
+    batches_stored: int = 0
+    store_failures: int = 0
+    fetch_seconds: float = 0.0
+    parse_seconds: float = 0.0
+    store_seconds: float = 0.0
+    wall_seconds: float = 0.0
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def overlapped_seconds(self) -> float:
+        """Stage time hidden by running the stages concurrently"""
+        return max(0.0, self.fetch_seconds + self.parse_seconds + self.store_seconds - self.wall_seconds)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for logging and reports"""
+        return {
+            'items': self.items,
+            'fetched': self.fetched,
+            'fetch_failures': self.fetch_failures,
+            'parsed': self.parsed,
+            'parse_failures': self.parse_failures,
+            'records_parsed': self.records_parsed,
+            'records_stored': self.records_stored,
+            'batches_stored': self.batches_stored,
+            'store_failures': self.store_failures,
+            'fetch_seconds': round(self.fetch_seconds, 3),
+            'parse_seconds': round(self.parse_seconds, 3),
+            'store_seconds': round(self.store_seconds, 3),
+            'wall_seconds': round(self.wall_seconds, 3),
+            'overlapped_seconds': round(self.overlapped_seconds, 3),
+            'errors': list(self.errors)
+        }
+
+
+class AsyncPipeline:
+    """
+    Three-stage asyncio pipeline: fetch -> parse -> batched store.
+
+    The stage callables are ordinary blocking functions; each stage runs
+    them in its own thread pool so a fetch waiting on the rate limiter never
+    blocks parsing or inserting the previous item.
+    """
+
+    def __init__(self, fetch: Callable[[Any], Any], parse: Callable[[Any, Any], Iterable[Any]],
+                 store: Callable[[List[Any]], int], queue_size: int = 4, batch_size: int = 500,
+                 fetch_workers: int = 1, parse_workers: int = 1, describe: Callable[[Any], str] = str):
+        """
+        Initialize the pipeline.
+
+        Args:
+            fetch: fetch(item) -> page; raising or returning None marks the item failed
+            parse: parse(item, page) -> records; raising marks the item failed
+            store: store(records) -> number stored, called with up to batch_size records
+            queue_size: Maximum items waiting between two stages
+            batch_size: Records per store call
+            fetch_workers: Concurrent fetches (the host scheduler still paces them)
+            parse_workers: Concurrent parses
+            describe: Short label for an item in error messages
+        """
+        if queue_size < 1 or batch_size < 1 or fetch_workers < 1 or parse_workers < 1:
+            raise ValueError("queue_size, batch_size and worker counts must be at least 1")
+        self.fetch = fetch
+        self.parse = parse
+        self.store = store
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.fetch_workers = fetch_workers
+        self.parse_workers = parse_workers
+        self.describe = describe
+
+    def run(self, items: Iterable[Any]) -> PipelineStats:
+        """Run the pipeline to completion from synchronous code"""
+        return asyncio.run(self.run_async(items))
+
+    async def run_async(self, items: Iterable[Any]) -> PipelineStats:
+        """
+        Run every item through fetch, parse and store.
+
+        Args:
+            items: Work items passed to the fetch callable
+
+        Returns:
+            PipelineStats for the run
+        """
+        stats = PipelineStats()
+        start = time.perf_counter()
+        work_q: asyncio.Queue = asyncio.Queue()
+        parse_q: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        store_q: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+
+        for item in items:
+            work_q.put_nowait(item)
+            stats.items += 1
+        for _ in range(self.fetch_workers):
+            work_q.put_nowait(_DONE)
+
+        fetch_pool = ThreadPoolExecutor(self.fetch_workers, thread_name_prefix='pipeline-fetch')
+        parse_pool = ThreadPoolExecutor(self.parse_workers, thread_name_prefix='pipeline-parse')
+        store_pool = ThreadPoolExecutor(1, thread_name_prefix='pipeline-store')
+        try:
+            fetchers = [asyncio.create_task(self._fetch_stage(work_q, parse_q, fetch_pool, stats))
+                        for _ in range(self.fetch_workers)]
+            parsers = [asyncio.create_task(self._parse_stage(parse_q, store_q, parse_pool, stats))
+                       for _ in range(self.parse_workers)]
+            storer = asyncio.create_task(self._store_stage(store_q, store_pool, stats))
+
+            await asyncio.gather(*fetchers)
+            for _ in range(self.parse_workers):
+                await parse_q.put(_DONE)
+            await asyncio.gather(*parsers)
+            await store_q.put(_DONE)
+            await storer
+        finally:
+            for pool in (fetch_pool, parse_pool, store_pool):
+                pool.shutdown(wait=True)
+
+        stats.wall_seconds = time.perf_counter() - start
+        logger.info(
+            f"Pipeline finished {stats.items} items in {stats.wall_seconds:.2f}s: "
+            f"{stats.records_stored} records stored, {stats.overlapped_seconds:.2f}s of stage time overlapped"
+        )
+        return stats
+
+    async def _timed(self, pool: ThreadPoolExecutor, func: Callable, *args):
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        result = await loop.run_in_executor(pool, func, *args)
+        return result, time.perf_counter() - started
+
+    async def _fetch_stage(self, work_q: asyncio.Queue, parse_q: asyncio.Queue,
+                           pool: ThreadPoolExecutor, stats: PipelineStats):
+        while True:
+            item = work_q.get_nowait()
+            if item is _DONE:
+                return
+            try:
+                page, elapsed = await self._timed(pool, self.fetch, item)
+                stats.fetch_seconds += elapsed
+                if page is None:
+                    raise ValueError("no page returned")
+                stats.fetched += 1
+            except Exception as e:
+                stats.fetch_failures += 1
+                stats.errors.append(f"Fetch failed for {self.describe(item)}: {e}")
+                logger.error(f"Pipeline fetch failed for {self.describe(item)}: {e}")
+                continue
+            # Blocks while parse_q is full, so fetching never runs far ahead of parsing
+            await parse_q.put((item, page))
+
+    async def _parse_stage(self, parse_q: asyncio.Queue, store_q: asyncio.Queue,
+                           pool: ThreadPoolExecutor, stats: PipelineStats):
+        while True:
+            entry = await parse_q.get()
+            if entry is _DONE:
+                return
+            item, page = entry
+            try:
+                records, elapsed = await self._timed(pool, self._parse_to_list, item, page)
+                stats.parse_seconds += elapsed
+                stats.parsed += 1
+                stats.records_parsed += len(records)
+            except Exception as e:
+                stats.parse_failures += 1
+                stats.errors.append(f"Parse failed for {self.describe(item)}: {e}")
+                logger.error(f"Pipeline parse failed for {self.describe(item)}: {e}")
+                continue
+            if records:
+                await store_q.put(records)
+
+    def _parse_to_list(self, item: Any, page: Any) -> List[Any]:
+        return list(self.parse(item, page) or [])
+
+    async def _store_stage(self, store_q: asyncio.Queue, pool: ThreadPoolExecutor, stats: PipelineStats):
+        pending: List[Any] = []
+        while True:
+            records = await store_q.get()
+            if records is _DONE:
+                break
+            pending.extend(records)
+            # Group commit: write whatever has accumulated once nothing else is
+            # waiting, so inserts happen during the next politeness wait
+            while len(pending) >= self.batch_size or (pending and store_q.empty()):
+                batch, pending = pending[:self.batch_size], pending[self.batch_size:]
+                await self._store_batch(batch, pool, stats)
+        if pending:
+            await self._store_batch(pending, pool, stats)
+
+    async def _store_batch(self, batch: List[Any], pool: ThreadPoolExecutor, stats: PipelineStats):
+        try:
+            stored, elapsed = await self._timed(pool, self.store, batch)
+            stats.store_seconds += elapsed
+            stats.records_stored += stored or 0
+            stats.batches_stored += 1
+        except Exception as e:
+            stats.store_failures += 1
+            stats.errors.append(f"Store failed for a batch of {len(batch)} records: {e}")
+            logger.error(f"Pipeline store failed for a batch of {len(batch)} records: {e}")
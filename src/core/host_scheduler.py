@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Host Request Scheduler for NFL QB Data Scraping
+Process-wide, lock-protected token buckets keyed by host.
+
+Every fetch path (requests and Selenium) acquires a token for the target
+host before touching the network, so the request rate to a host stays
+within one configured budget no matter how many worker threads or
+RequestManager/SeleniumManager instances exist. A Retry-After from the
+server pauses the host for every worker at once.
+
+With a SharedRequestBudget the buckets live in a SQLite file instead, and
+the budget holds across every scraper process pointed at that file.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional, Any
+from urllib.parse import urlparse
+
+from src.core.request_budget import SharedRequestBudget
+
+try:
+    from src.config.config import config
+except ImportError:
+    config = None
+
+logger = logging.getLogger(__name__)
+
+
+def host_of(url_or_host: str) -> str:
+    """Normalize a URL or bare host name to the scheduler's host key"""
+    if '://' in url_or_host:
+        url_or_host = urlparse(url_or_host).netloc
+    return url_or_host.lower()
+
+
+def parse_retry_after(value: Optional[str], now: Optional[datetime] = None) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP-date
+        now: Current time for HTTP-date values (default: now, UTC)
+
+    Returns:
+        Seconds to wait, or None if the header is missing or malformed
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        logger.debug(f"Ignoring malformed Retry-After header: {value!r}")
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    now = now or datetime.now(timezone.utc)
+    return max(0.0, (retry_at - now).total_seconds())
+
+
+class TokenBucket:
+    """
+    Token bucket for a single host.
+
+    Tokens accrue at requests_per_minute / 60 per second up to ``burst``.
+    Reservations may drive the balance negative, which queues concurrent
+    callers one refill interval apart instead of letting them race.
+    """
+
+    def __init__(self, requests_per_minute: float, burst: int = 1,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the bucket.
+
+        Args:
+            requests_per_minute: Sustained request budget
+            burst: Requests allowed back to back after an idle period
+            clock: Monotonic clock (injectable for tests)
+        """
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        self.rate = requests_per_minute / 60.0
+        self.capacity = float(max(1, burst))
+        self.clock = clock
+        self.tokens = self.capacity
+        self.updated = clock()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token, returning how long the caller must wait before using it.
+
+        Returns:
+            Seconds to wait (0 when a token is available now)
+        """
+        with self._lock:
+            now = self.clock()
+            # `updated` is in the future while the host is paused by Retry-After
+            start = max(now, self.updated)
+            self.tokens = min(self.capacity, self.tokens + (start - self.updated) * self.rate)
+            self.updated = start
+            self.tokens -= 1.0
+            ready_at = start + max(0.0, -self.tokens) / self.rate
+            return max(0.0, ready_at - now)
+
+    def pause(self, seconds: float):
+        """Stop handing out tokens for the given number of seconds"""
+        with self._lock:
+            resume_at = self.clock() + seconds
+            self.paused_until = max(self.paused_until, resume_at)
+            if resume_at > self.updated:
+                self.updated = resume_at
+                # One request may go as soon as the pause ends; no burst after it
+                self.tokens = 1.0
+
+    def pause_remaining(self) -> float:
+        """Seconds left in the current pause (0 when not paused)"""
+        with self._lock:
+            return max(0.0, self.paused_until - self.clock())
+
+    def set_rate(self, requests_per_minute: float, burst: Optional[int] = None):
+        """Change the budget without losing queued reservations"""
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        with self._lock:
+            self.rate = requests_per_minute / 60.0
+            if burst is not None:
+                self.capacity = float(max(1, burst))
+                self.tokens = min(self.tokens, self.capacity)
+
+
+class HostRateScheduler:
+    """Process-wide request budget, one token bucket per host"""
+
+    def __init__(self, requests_per_minute: float = 8.0, burst: int = 1,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep,
+                 budget: Optional[SharedRequestBudget] = None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            requests_per_minute: Default budget for every host
+            burst: Default burst size for every host
+            clock: Monotonic clock (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+            budget: Cross-process budget to keep buckets in (default: in-process buckets)
+        """
+        self.requests_per_minute = requests_per_minute
+        self.burst = burst
+        self.budget = budget
+        self.clock = clock
+        self.sleep = sleep
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, scraping_config, budget_path: Optional[str] = None) -> 'HostRateScheduler':
+        """
+        Build a scheduler from a ScrapingConfig.
+
+        Args:
+            scraping_config: Scraping settings with the request budget
+            budget_path: Shared budget file overriding ``request_budget_path``
+        """
+        budget_path = budget_path or getattr(scraping_config, 'request_budget_path', '')
+        return cls(
+            requests_per_minute=scraping_config.requests_per_minute,
+            burst=scraping_config.request_burst,
+            budget=SharedRequestBudget(budget_path) if budget_path else None
+        )
+
+    def _bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                if self.budget is not None:
+                    bucket = self.budget.bucket(host, self.requests_per_minute, self.burst)
+                else:
+                    bucket = TokenBucket(self.requests_per_minute, self.burst, self.clock)
+                self._buckets[host] = bucket
+                self._stats[host] = {'acquired': 0, 'waited_seconds': 0.0, 'pauses': 0, 'paused_seconds': 0.0}
+            return bucket
+
+    def acquire(self, url_or_host: str) -> float:
+        """
+        Block until a request to the host is within budget.
+
+        Args:
+            url_or_host: Target URL or host name
+
+        Returns:
+            Seconds spent waiting
+        """
+        host = host_of(url_or_host)
+        bucket = self._bucket(host)
+        wait_time = bucket.reserve()
+        if wait_time > 0:
+            logger.debug(f"Rate limiting {host}: waiting {wait_time:.2f}s for a request slot")
+            self.sleep(wait_time)
+        # Reservations taken before a pause started must still sit it out
+        remaining = bucket.pause_remaining()
+        while remaining > 0:
+            self.sleep(remaining)
+            wait_time += remaining
+            remaining = bucket.pause_remaining()
+        with self._lock:
+            stats = self._stats[host]
+            stats['acquired'] += 1
+            stats['waited_seconds'] += wait_time
+        return wait_time
+
+    def pause(self, url_or_host: str, seconds: float):
+        """
+        Pause all requests to a host, e.g. after a 429 or Retry-After.
+
+        Args:
+            url_or_host: Target URL or host name
+            seconds: How long to hold every worker off the host
+        """
+        host = host_of(url_or_host)
+        self._bucket(host).pause(seconds)
+        with self._lock:
+            stats = self._stats[host]
+            stats['pauses'] += 1
+            stats['paused_seconds'] += seconds
+        logger.warning(f"Pausing requests to {host} for {seconds:.1f}s")
+
+    def pause_for_response(self, url: str, retry_after: Optional[str], default_seconds: float) -> float:
+        """
+        Pause a host for a throttling response, honoring Retry-After when present.
+
+        Args:
+            url: Requested URL
+            retry_after: Retry-After header value, if any
+            default_seconds: Pause to use when the header is missing or malformed
+
+        Returns:
+            Seconds the host was paused for
+        """
+        seconds = parse_retry_after(retry_after)
+        if seconds is None:
+            seconds = default_seconds
+        self.pause(url, seconds)
+        return seconds
+
+    def set_rate(self, url_or_host: str, requests_per_minute: float, burst: Optional[int] = None):
+        """Override the budget for one host"""
+        self._bucket(host_of(url_or_host)).set_rate(requests_per_minute, burst)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-host acquisition and pause counters"""
+        with self._lock:
+            return {host: dict(stats) for host, stats in self._stats.items()}
+
+
+_scheduler: Optional[HostRateScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_host_scheduler() -> HostRateScheduler:
+    """Get the process-wide scheduler, creating it from config on first use"""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            if config is not None:
+                _scheduler = HostRateScheduler.from_config(config.scraping)
+            else:
+                _scheduler = HostRateScheduler()
+            shared = f", shared via {_scheduler.budget.path}" if _scheduler.budget else ""
+            logger.info(
+                f"Initialized host request scheduler "
+                f"({_scheduler.requests_per_minute} req/min, burst {_scheduler.burst}{shared})"
+            )
+        return _scheduler
+
+
+def set_host_scheduler(scheduler: HostRateScheduler) -> HostRateScheduler:
+    """
+    Replace the process-wide scheduler.
+
+    Call before creating fetchers; existing RequestManager/SeleniumManager
+    instances keep the scheduler they were built with.
+    """
+    global _scheduler
+    with _scheduler_lock:
+        _scheduler = scheduler
+    return scheduler
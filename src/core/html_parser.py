@@ -6,32 +6,128 @@ Handles all data extraction from Pro Football Reference HTML content.
 
 import logging
 from typing import List, Dict, Optional, Union, Any
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, Tag, Comment, SoupStrainer
 import re
 
+from .row_decoder import RowDecoder
+
+# Use try/except for optional imports
+try:
+    from src.config.config import config
+except ImportError:
+    # Fallback when imported outside the src package
+    config = None
+
 logger = logging.getLogger(__name__)
 
+PARSER_BACKENDS = ('html.parser', 'lxml', 'lxml-strained')
+
+
+def get_parser_backend() -> str:
+    """Get the configured HTML parser backend, defaulting to lxml"""
+    if config is not None:
+        return config.scraping.parser_backend
+    return 'lxml'
+
+
+def make_soup(html_content: Union[str, bytes], backend: Optional[str] = None,
+              table_ids: Optional[List[str]] = None) -> BeautifulSoup:
+    """
+    Parse HTML with the configured parser backend.
+    
+    Args:
+        html_content: Raw HTML content
+        backend: 'html.parser', 'lxml', or 'lxml-strained' (default: from config)
+        table_ids: Tables the caller needs; 'lxml-strained' only builds these
+            tables and their PFR wrapper divs (div_<id>, all_<id>)
+            
+    Returns:
+        BeautifulSoup object
+    """
+    backend = backend or get_parser_backend()
+    if backend == 'html.parser':
+        return BeautifulSoup(html_content, 'html.parser')
+    if backend == 'lxml':
+        return BeautifulSoup(html_content, 'lxml')
+    if backend == 'lxml-strained':
+        if not table_ids:
+            return BeautifulSoup(html_content, 'lxml')
+        wanted_ids = set()
+        for table_id in table_ids:
+            wanted_ids.update((table_id, f'div_{table_id}', f'all_{table_id}'))
+        strainer = SoupStrainer(id=lambda value: value in wanted_ids)
+        return BeautifulSoup(html_content, 'lxml', parse_only=strainer)
+    raise ValueError(f"Unknown HTML parser backend: {backend}")
+
 
 class HTMLParser:
     """Extracts structured QB data from Pro Football Reference HTML."""
 
-    def parse_html(self, html_content: str) -> Optional[BeautifulSoup]:
+    def __init__(self, backend: Optional[str] = None):
+        """
+        Initialize the parser.
+        
+        Args:
+            backend: HTML parser backend (default: from config)
+        """
+        self.backend = backend or get_parser_backend()
+        converters = {'int': self._safe_int, 'float': self._safe_float, 'str': str}
+        self.passing_row_decoder = RowDecoder.for_table_type(
+            'html_passing', converters, extra_stats=('player', 'name_display', 'rank_offense', 'rk')
+        )
+        self.splits_row_decoder = RowDecoder.for_table_type('html_splits', converters)
+
+    def parse_html(self, html_content: str, table_ids: Optional[List[str]] = None) -> Optional[BeautifulSoup]:
         """
         Parse HTML content into BeautifulSoup object.
         
         Args:
             html_content: Raw HTML content
+            table_ids: Tables the caller needs (lets strained backends skip the rest)
             
         Returns:
             BeautifulSoup object if successful, None otherwise
         """
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = make_soup(html_content, self.backend, table_ids)
             return soup
         except Exception as e:
             logger.error(f"Failed to parse HTML: {e}")
             return None
 
+    @staticmethod
+    def expand_commented_tables(soup: BeautifulSoup, table_ids: Optional[List[str]] = None,
+                                backend: Optional[str] = None) -> int:
+        """
+        Replace HTML comments that wrap tables with the parsed tables, in place.
+
+        PFR ships most secondary tables (e.g. advanced splits) inside HTML
+        comments and unhides them client-side, so they are invisible to a
+        plain parse of the static response.
+
+        Args:
+            soup: Parsed page to modify
+            table_ids: Only expand comments containing one of these table ids (default: all)
+            backend: HTML parser backend for the comment contents (default: from config)
+
+        Returns:
+            Number of comments expanded
+        """
+        expanded = 0
+        comments = soup.find_all(string=lambda text: isinstance(text, Comment) and '<table' in text)
+        for comment in comments:
+            if table_ids and not any(f'id="{table_id}"' in comment for table_id in table_ids):
+                continue
+            fragment = make_soup(str(comment), backend)
+            # lxml wraps fragments in <html><body>; only splice in the body contents
+            nodes = list(fragment.body.contents) if fragment.body else list(fragment.contents)
+            comment.replace_with(*nodes)
+            expanded += 1
+        
+        if expanded:
+            logger.debug(f"Expanded {expanded} comment-wrapped tables")
+        return expanded
+
     def parse_passing_stats_table(self, soup: BeautifulSoup, season: int) -> List[Dict[str, Union[str, int, float]]]:
         """
         Parses the main passing stats table for a given season.
@@ -54,13 +150,15 @@ class HTMLParser:
             if row.get('class') and 'thead' in row.get('class'):
                 continue
 
+            # Index the row's cells once instead of one find() per field
+            cells = self.passing_row_decoder.index_row(row)
+
             # Extract position to filter for QBs only
-            pos_cell = row.find('td', {'data-stat': 'pos'})
-            if not pos_cell or not isinstance(pos_cell, Tag) or pos_cell.text.strip().upper() != 'QB':
+            if cells.get('pos', '').upper() != 'QB':
                 continue
 
             # Extract player URL and PFR ID
-            player_cell = row.find('td', {'data-stat': 'player'})
+            player_cell = row.find('td', {'data-stat': 'player'}) if 'player' in cells else None
             if not player_cell or not isinstance(player_cell, Tag):
                 player_cell = row.find('td', {'data-stat': 'name_display'})
             
@@ -77,63 +175,158 @@ class HTMLParser:
             if not pfr_id:
                 continue
 
-            # Helper function to safely get cell text
-            def get_cell_text(stat_name: str) -> str:
-                cell = row.find('td', {'data-stat': stat_name})
-                return cell.text.strip() if cell and isinstance(cell, Tag) else ''
-
-            # Helper function to safely get cell value as int
-            def get_cell_int(stat_name: str) -> int:
-                return self._safe_int(get_cell_text(stat_name))
-
-            # Helper function to safely get cell value as float
-            def get_cell_float(stat_name: str) -> float:
-                return self._safe_float(get_cell_text(stat_name))
-
-            stats = {
+            stats = self.passing_row_decoder.decode(cells=cells)
+            stats.update({
                 'pfr_id': pfr_id,
                 'player_url': f"https://www.pro-football-reference.com{player_url}",
                 'season': season,
                 'player_name': player_link.text.strip(),
-                'team': self._normalize_pfr_team_code(get_cell_text('team')),
-                'age': get_cell_int('age'),
-                'pos': get_cell_text('pos').strip(),
-                'g': get_cell_int('g'),
-                'gs': get_cell_int('gs'),
-                'qb_rec': get_cell_text('qb_rec'),
-                'cmp': get_cell_int('pass_cmp'),
-                'att': get_cell_int('pass_att'),
-                'cmp_pct': get_cell_float('pass_cmp_perc'),
-                'yds': get_cell_int('pass_yds'),
-                'td': get_cell_int('pass_td'),
-                'td_pct': get_cell_float('pass_td_perc'),
-                'int': get_cell_int('pass_int'),
-                'int_pct': get_cell_float('pass_int_perc'),
-                'first_downs': get_cell_int('pass_first_down'),
-                'succ_pct': get_cell_float('pass_success_perc'),
-                'lng': get_cell_int('pass_long'),
-                'y_a': get_cell_float('pass_yds_per_att'),
-                'ay_a': get_cell_float('pass_adj_yds_per_att'),
-                'y_c': get_cell_float('pass_yds_per_cmp'),
-                'y_g': get_cell_float('pass_yds_per_g'),
-                'rate': get_cell_float('pass_rating'),
-                'qbr': get_cell_float('qbr'),
-                'sk': get_cell_int('sacked'),
-                'sk_yds': get_cell_int('sacked_yds'),
-                'sk_pct': get_cell_float('sacked_perc'),
-                'ny_a': get_cell_float('net_yds_per_pass_att'),
-                'any_a': get_cell_float('adj_net_yds_per_pass_att'),
-                'four_qc': get_cell_int('comebacks'),
-                'gwd': get_cell_int('gwd'),
-                'awards': get_cell_text('awards'),
-                'player_additional': get_cell_text('player_additional'),
-                # Add some missing fields with defaults
-                'rk': get_cell_int('rank_offense') or get_cell_int('rk')
-            }
+                'team': self._normalize_pfr_team_code(stats['team']),
+                'rk': self._safe_int(cells.get('rank_offense', '')) or self._safe_int(cells.get('rk', ''))
+            })
             stats_list.append(stats)
             
         return stats_list
 
+    def parse_advanced_passing_tables(self, soup: BeautifulSoup, season: int) -> Dict[str, Dict[str, Any]]:
+        """
+        Parses the season-wide advanced passing tables, keyed by PFR ID.
+
+        passing_advanced.htm splits its columns over several tables, most of
+        them comment-wrapped. Only columns that map to qb_passing_stats fields
+        are kept; multi-team total rows (2TM, 3TM) win over per-team rows.
+
+        Args:
+            soup: BeautifulSoup object of the season advanced passing page.
+            season: The season year.
+
+        Returns:
+            Dictionary of PFR ID to the non-empty qb_passing_stats fields found.
+        """
+        self.expand_commented_tables(soup, backend=self.backend)
+        advanced: Dict[str, Dict[str, Any]] = {}
+        total_rows = set()
+        
+        for table in soup.find_all('table'):
+            if not table.tbody:
+                continue
+            for row in table.tbody.find_all('tr'):
+                if row.get('class') and 'thead' in row.get('class'):
+                    continue
+                player_cell = row.find('td', {'data-stat': 'name_display'}) or row.find('td', {'data-stat': 'player'})
+                player_link = player_cell.find('a') if player_cell else None
+                pfr_id = self._extract_pfr_id(player_link.get('href', '')) if player_link else None
+                if not pfr_id:
+                    continue
+                
+                # Keep only columns this table actually has; the decoder defaults the rest
+                cells = self.passing_row_decoder.index_row(row)
+                decoded = self.passing_row_decoder.decode(cells=cells)
+                values = {field: decoded[field] for data_stat, field, _ in self.passing_row_decoder.plan
+                          if cells.get(data_stat, '') != ''}
+                team = self._normalize_pfr_team_code(values.get('team') or '')
+                is_total = team.endswith('TM')
+                if pfr_id in total_rows and not is_total:
+                    continue
+                
+                fields = advanced.setdefault(pfr_id, {})
+                if is_total:
+                    fields.update(values)
+                    total_rows.add(pfr_id)
+                else:
+                    for field, value in values.items():
+                        fields.setdefault(field, value)
+        
+        logger.info(f"Parsed advanced passing columns for {len(advanced)} players in {season}")
+        return advanced
+
+    @staticmethod
+    def merge_advanced_passing_stats(passing_stats: List[Any], advanced: Dict[str, Dict[str, Any]]) -> int:
+        """
+        Fill missing passing stats fields from parse_advanced_passing_tables output.
+
+        Values already present are never overwritten, so the main passing
+        table stays authoritative. Works on dicts and stats objects alike.
+
+        Args:
+            passing_stats: Stats dicts or QBPassingStats objects with a pfr_id
+            advanced: Advanced fields keyed by PFR ID
+
+        Returns:
+            Number of fields filled in
+        """
+        filled = 0
+        for stats in passing_stats:
+            is_dict = isinstance(stats, dict)
+            pfr_id = stats.get('pfr_id') if is_dict else getattr(stats, 'pfr_id', None)
+            for field, value in advanced.get(pfr_id, {}).items():
+                if field in ('team', 'pos', 'awards', 'player_additional'):
+                    continue
+                if is_dict:
+                    if stats.get(field) is None:
+                        stats[field] = value
+                        filled += 1
+                elif hasattr(stats, field) and getattr(stats, field) is None:
+                    setattr(stats, field, value)
+                    filled += 1
+        return filled
+
+    def parse_player_career_passing(self, soup: BeautifulSoup, pfr_id: str, player_name: str,
+                                    player_url: str) -> List[Dict[str, Union[str, int, float]]]:
+        """
+        Parses every season row of the passing table on a player's page.
+
+        A player page carries the whole career, so one fetch yields a
+        qb_passing_stats row per season. Multi-team seasons keep the 2TM/3TM
+        total row; the career summary rows in the table footer are ignored.
+
+        Args:
+            soup: BeautifulSoup object of the player page (/players/X/ID.htm).
+            pfr_id: The player's PFR ID.
+            player_name: The player's name.
+            player_url: Full URL of the player page.
+
+        Returns:
+            A list of dictionaries, one per season, in page order.
+        """
+        self.expand_commented_tables(soup, table_ids=['passing'], backend=self.backend)
+        table = soup.find('table', id='passing')
+        if not table or not isinstance(table, Tag) or not table.tbody:
+            logger.warning(f"Could not find career passing table for {player_name}")
+            return []
+
+        seasons: Dict[int, Dict[str, Any]] = {}
+        for row in table.tbody.find_all('tr'):
+            if row.get('class') and 'thead' in row.get('class'):
+                continue
+
+            # The season is the row header (<th>), which the decoder does not index
+            year_cell = row.find(['th', 'td'], {'data-stat': 'year_id'})
+            year_text = re.sub(r'\D', '', year_cell.get_text(strip=True)) if year_cell else ''
+            if len(year_text) != 4:
+                continue
+            season = int(year_text)
+
+            cells = self.passing_row_decoder.index_row(row)
+
+            stats = self.passing_row_decoder.decode(cells=cells)
+            team = self._normalize_pfr_team_code(stats['team'] or cells.get('team_name_abbr', ''))
+            if season in seasons and not team.endswith('TM'):
+                continue
+
+            stats.update({
+                'pfr_id': pfr_id,
+                'player_url': player_url,
+                'season': season,
+                'player_name': player_name,
+                'team': team,
+                'rk': None
+            })
+            seasons[season] = stats
+
+        logger.info(f"Parsed {len(seasons)} career passing seasons for {player_name}")
+        return list(seasons.values())
+
     def parse_splits_tables(self, soup: BeautifulSoup, player_info: Dict[str, Any]) -> List[Dict[str, str]]:
         """
         Parse splits tables from a player's splits page.
@@ -289,68 +482,17 @@ class HTMLParser:
 
     def _extract_split_row_stats(self, row: Tag) -> Optional[Dict[str, Union[str, int, float]]]:
         """Extract statistics from a single split row."""
-        def get_cell_text(stat_name: str) -> str:
-            cell = row.find('td', {'data-stat': stat_name})
-            return cell.text.strip() if cell and isinstance(cell, Tag) else ''
-
-        def get_cell_int(stat_name: str) -> int:
-            return self._safe_int(get_cell_text(stat_name))
-
-        def get_cell_float(stat_name: str) -> float:
-            return self._safe_float(get_cell_text(stat_name))
+        cells = self.splits_row_decoder.index_row(row)
 
         # Extract split identifier
-        split_cell = row.find('td', {'data-stat': 'split'})
-        value_cell = row.find('td', {'data-stat': 'value'})
-        
-        if not split_cell or not value_cell:
+        if 'split' not in cells or 'value' not in cells:
             return None
         
-        split_name = split_cell.text.strip()
-        split_value = value_cell.text.strip()
-        
-        if not split_name or not split_value:
+        if not cells['split'] or not cells['value']:
             return None
 
         # Extract all available statistics
-        stats = {
-            'split': split_name,
-            'value': split_value,
-            'g': get_cell_int('g'),
-            'w': get_cell_int('w'),
-            'l': get_cell_int('l'),
-            't': get_cell_int('t'),
-            'cmp': get_cell_int('pass_cmp'),
-            'att': get_cell_int('pass_att'),
-            'inc': get_cell_int('pass_inc'),
-            'cmp_pct': get_cell_float('pass_cmp_perc'),
-            'yds': get_cell_int('pass_yds'),
-            'td': get_cell_int('pass_td'),
-            'int': get_cell_int('pass_int'),
-            'rate': get_cell_float('pass_rating'),
-            'sk': get_cell_int('pass_sacked'),
-            'sk_yds': get_cell_int('pass_sacked_yds'),
-            'y_a': get_cell_float('pass_yds_per_att'),
-            'ay_a': get_cell_float('pass_adj_yds_per_att'),
-            'a_g': get_cell_float('pass_att_per_g'),
-            'y_g': get_cell_float('pass_yds_per_g'),
-            'rush_att': get_cell_int('rush_att'),
-            'rush_yds': get_cell_int('rush_yds'),
-            'rush_y_a': get_cell_float('rush_yds_per_att'),
-            'rush_td': get_cell_int('rush_td'),
-            'rush_a_g': get_cell_float('rush_att_per_g'),
-            'rush_y_g': get_cell_float('rush_yds_per_g'),
-            'total_td': get_cell_int('all_td'),
-            'pts': get_cell_int('scoring'),
-            'fmb': get_cell_int('fumbles'),
-            'fl': get_cell_int('fumbles_lost'),
-            'ff': get_cell_int('fumbles_forced'),
-            'fr': get_cell_int('fumbles_rec'),
-            'fr_yds': get_cell_int('fumbles_rec_yds'),
-            'fr_td': get_cell_int('fumbles_rec_td')
-        }
-        
-        return stats
+        return self.splits_row_decoder.decode(cells=cells)
 
     def _extract_pfr_id(self, player_url: str) -> Optional[str]:
         """Extract PFR ID from player URL."""
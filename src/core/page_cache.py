@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Persistent Page Cache for NFL QB Data Scraping
+Content-addressed on-disk store for raw HTML so pages can be re-parsed
+without refetching them from Pro Football Reference.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Optional, Dict, Any, List
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    """Index record pointing a URL at a stored page body"""
+    url: str
+    variant: str
+    content_hash: str
+    size_bytes: int
+    fetched_at: float
+    last_accessed: float
+
+    def is_expired(self, ttl_seconds: float, now: Optional[float] = None) -> bool:
+        """Check whether the entry is older than the given TTL"""
+        if ttl_seconds <= 0:
+            return False
+        now = now if now is not None else time.time()
+        return now - self.fetched_at > ttl_seconds
+
+
+class PageCache:
+    """
+    Content-addressed on-disk store for raw page HTML.
+
+    Page bodies are gzip-compressed and stored once per SHA-256 of their
+    content under ``blobs/``; a small JSON index entry per (url, variant)
+    under ``index/`` points at the body. Identical pages fetched from
+    different URLs therefore share storage.
+
+    In replay mode the cache is the only source of pages: expired entries
+    are still served and misses never fall through to the network.
+    """
+
+    def __init__(self, cache_dir: str = 'cache/pages', ttl_hours: float = 24.0 * 7,
+                 max_size_mb: float = 2048.0, replay: bool = False):
+        """
+        Initialize the page cache.
+
+        Args:
+            cache_dir: Root directory for blobs and index entries
+            ttl_hours: Age after which entries are considered stale (0 disables expiry)
+            max_size_mb: Total blob size above which the least recently used pages are evicted
+            replay: Serve only from the cache and never allow network fetches
+        """
+        self.cache_dir = Path(cache_dir)
+        self.blob_dir = self.cache_dir / 'blobs'
+        self.index_dir = self.cache_dir / 'index'
+        self.ttl_seconds = ttl_hours * 3600.0
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.replay = replay
+
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._size_bytes: Optional[int] = None  # Lazily computed running blob total
+
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+
+        logger.info(
+            f"Initialized PageCache at {self.cache_dir} "
+            f"(ttl={ttl_hours}h, max={max_size_mb}MB, replay={replay})"
+        )
+
+    @classmethod
+    def from_config(cls, cache_config) -> Optional['PageCache']:
+        """
+        Build a cache from a CacheConfig, or return None when caching is disabled.
+
+        Args:
+            cache_config: CacheConfig instance
+
+        Returns:
+            PageCache instance or None
+        """
+        if not cache_config.enabled:
+            return None
+        return cls(
+            cache_dir=cache_config.cache_dir,
+            ttl_hours=cache_config.ttl_hours,
+            max_size_mb=cache_config.max_size_mb,
+            replay=cache_config.replay
+        )
+
+    @staticmethod
+    def _key(url: str, variant: str) -> str:
+        """Build the index key for a URL and fetch variant"""
+        return hashlib.sha256(f"{variant}|{url}".encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.index_dir / key[:2] / f"{key}.json"
+
+    def _blob_path(self, content_hash: str) -> Path:
+        return self.blob_dir / content_hash[:2] / f"{content_hash}.html.gz"
+
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes):
+        """Write a file via rename so readers never see partial content"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _load_entry(self, path: Path) -> Optional[CacheEntry]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return CacheEntry(**json.load(f))
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Discarding unreadable cache entry {path}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+    def _save_entry(self, key: str, entry: CacheEntry):
+        self._atomic_write(self._entry_path(key), json.dumps(asdict(entry)).encode('utf-8'))
+
+    def get(self, url: str, variant: str = 'default') -> Optional[str]:
+        """
+        Look up a cached page.
+
+        Args:
+            url: Page URL
+            variant: Fetch variant (e.g. 'requests', 'selenium_js')
+
+        Returns:
+            Page HTML or None on a miss or expired entry
+        """
+        key = self._key(url, variant)
+        with self._lock:
+            entry_path = self._entry_path(key)
+            entry = self._load_entry(entry_path) if entry_path.exists() else None
+
+            if entry is None or (not self.replay and entry.is_expired(self.ttl_seconds)):
+                self.misses += 1
+                return None
+
+            try:
+                with gzip.open(self._blob_path(entry.content_hash), 'rb') as f:
+                    content = f.read().decode('utf-8')
+            except (OSError, EOFError) as e:
+                logger.warning(f"Cache blob missing or corrupt for {url}: {e}")
+                entry_path.unlink(missing_ok=True)
+                self.misses += 1
+                return None
+
+            entry.last_accessed = time.time()
+            self._save_entry(key, entry)
+            self.hits += 1
+
+        logger.debug(f"Page cache hit: {url}")
+        return content
+
+    def put(self, url: str, content: str, variant: str = 'default') -> str:
+        """
+        Store a fetched page.
+
+        Args:
+            url: Page URL
+            content: Page HTML
+            variant: Fetch variant (e.g. 'requests', 'selenium_js')
+
+        Returns:
+            SHA-256 content hash of the stored page
+        """
+        body = content.encode('utf-8')
+        content_hash = hashlib.sha256(body).hexdigest()
+        now = time.time()
+
+        with self._lock:
+            blob_path = self._blob_path(content_hash)
+            if not blob_path.exists():
+                compressed = gzip.compress(body)
+                self._atomic_write(blob_path, compressed)
+                if self._size_bytes is not None:
+                    self._size_bytes += len(compressed)
+
+            entry = CacheEntry(
+                url=url,
+                variant=variant,
+                content_hash=content_hash,
+                size_bytes=blob_path.stat().st_size,
+                fetched_at=now,
+                last_accessed=now
+            )
+            self._save_entry(self._key(url, variant), entry)
+            self.stores += 1
+
+            if self.max_size_bytes > 0 and self._current_size() > self.max_size_bytes:
+                self.evict()
+
+        logger.debug(f"Cached page {url} ({len(body)} bytes, {content_hash[:12]})")
+        return content_hash
+
+    def _iter_entries(self) -> List[tuple]:
+        entries = []
+        for path in self.index_dir.glob('*/*.json'):
+            entry = self._load_entry(path)
+            if entry is not None:
+                entries.append((path, entry))
+        return entries
+
+    def _total_blob_size(self) -> int:
+        return sum(p.stat().st_size for p in self.blob_dir.glob('*/*.html.gz'))
+
+    def _current_size(self) -> int:
+        if self._size_bytes is None:
+            self._size_bytes = self._total_blob_size()
+        return self._size_bytes
+
+    def _remove_orphan_blobs(self, entries: List[tuple]) -> int:
+        referenced = {entry.content_hash for _, entry in entries}
+        removed = 0
+        for blob in self.blob_dir.glob('*/*.html.gz'):
+            if blob.name[:-len('.html.gz')] not in referenced:
+                blob.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def evict(self) -> int:
+        """
+        Remove expired entries, then least recently used pages until the
+        store is under its size limit. Expired entries are kept in replay mode.
+
+        Returns:
+            Number of index entries removed
+        """
+        with self._lock:
+            entries = self._iter_entries()
+            removed = 0
+
+            if not self.replay and self.ttl_seconds > 0:
+                now = time.time()
+                live = []
+                for path, entry in entries:
+                    if entry.is_expired(self.ttl_seconds, now):
+                        path.unlink(missing_ok=True)
+                        removed += 1
+                    else:
+                        live.append((path, entry))
+                entries = live
+
+            self._remove_orphan_blobs(entries)
+
+            if self.max_size_bytes > 0:
+                total = self._total_blob_size()
+                entries.sort(key=lambda item: item[1].last_accessed)
+                while entries and total > self.max_size_bytes:
+                    path, entry = entries.pop(0)
+                    path.unlink(missing_ok=True)
+                    removed += 1
+                    if not any(e.content_hash == entry.content_hash for _, e in entries):
+                        blob = self._blob_path(entry.content_hash)
+                        if blob.exists():
+                            total -= blob.stat().st_size
+                            blob.unlink()
+
+            self.evictions += removed
+            self._size_bytes = None
+
+        if removed:
+            logger.info(f"Evicted {removed} pages from cache")
+        return removed
+
+    def clear(self):
+        """Remove every cached page"""
+        with self._lock:
+            for path in list(self.index_dir.glob('*/*.json')) + list(self.blob_dir.glob('*/*.html.gz')):
+                path.unlink(missing_ok=True)
+            self._size_bytes = 0
+        logger.info(f"Cleared page cache at {self.cache_dir}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        with self._lock:
+            entry_count = sum(1 for _ in self.index_dir.glob('*/*.json'))
+            blob_count = sum(1 for _ in self.blob_dir.glob('*/*.html.gz'))
+            total_size = self._total_blob_size()
+        lookups = self.hits + self.misses
+        return {
+            'cache_dir': str(self.cache_dir),
+            'replay': self.replay,
+            'entries': entry_count,
+            'blobs': blob_count,
+            'size_mb': total_size / (1024 * 1024),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'stores': self.stores,
+            'evictions': self.evictions,
+        }
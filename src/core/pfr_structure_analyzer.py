@@ -8,7 +8,7 @@ and validate data extraction against the database schema.
 
 import logging
 from typing import Dict, List, Optional, Set, Tuple, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from bs4 import BeautifulSoup, Tag
 import re
 
@@ -55,6 +55,7 @@ class PFRStructureAnalyzer:
         self.qb_basic_stats_mappings = self._create_qb_basic_stats_mappings()
         self.qb_splits_mappings = self._create_qb_splits_mappings()
         self.qb_splits_advanced_mappings = self._create_qb_splits_advanced_mappings()
+        self.row_decoder_mappings = self._create_row_decoder_mappings()
         
     def _create_qb_basic_stats_mappings(self) -> List[DataStatMapping]:
         """Create mappings for QB Basic Stats table (33 columns)."""
@@ -159,6 +160,141 @@ class PFRStructureAnalyzer:
             DataStatMapping("rush_first_down", "rush_first_down", "int", True, "Rush first downs"),
         ]
     
+    def _create_row_decoder_mappings(self) -> Dict[str, List[DataStatMapping]]:
+        """
+        Create the per-consumer mappings that row decoders are compiled from.
+        
+        Each list is derived from the schema mappings above, renamed to the
+        data-stat names one existing row extractor reads and the record
+        fields it writes, so a compiled decoder returns the same record that
+        extractor always has and a schema column change reaches every decoder.
+        """
+        passing_fields = {
+            "qb_rec": "qb_rec", "pass_cmp_perc": "cmp_pct", "pass_td_perc": "td_pct",
+            "pass_int_perc": "int_pct", "pass_first_down": "first_downs", "pass_success_rate": "succ_pct",
+            "pass_yds_per_att": "y_a", "pass_adj_yds_per_att": "ay_a", "pass_yds_per_cmp": "y_c",
+            "pass_yds_per_g": "y_g", "pass_rating": "rate", "pass_sacked": "sk", "pass_sacked_yds": "sk_yds",
+            "pass_sacked_perc": "sk_pct", "pass_net_yds_per_att": "ny_a", "pass_adj_net_yds_per_att": "any_a",
+            "pass_4qc": "four_qc", "pass_gwd": "gwd",
+        }
+        splits_fields = {
+            "pass_cmp_perc": "cmp_pct", "pass_rating": "rate", "pass_sacked": "sk", "pass_sacked_yds": "sk_yds",
+            "pass_yds_per_att": "y_a", "pass_adj_yds_per_att": "ay_a", "pass_att_per_g": "a_g",
+            "pass_yds_per_g": "y_g", "rush_yds_per_att": "rush_y_a", "rush_att_per_g": "rush_a_g",
+            "rush_yds_per_g": "rush_y_g", "points": "pts", "fumbles": "fmb", "fumbles_lost": "fl",
+            "fumbles_forced": "ff", "fumbles_recovered": "fr", "fumble_yds": "fr_yds", "fumble_td": "fr_td",
+        }
+        splits_data_stats = {
+            "points": "scoring", "fumbles_recovered": "fumbles_rec", "fumble_yds": "fumbles_rec_yds",
+            "fumble_td": "fumbles_rec_td",
+        }
+        # The schema list has a per-game rushing column where the page has total touchdowns
+        splits_replaced = {
+            "rush_td_per_g": DataStatMapping("all_td", "total_td", "int", True, "Total touchdowns"),
+        }
+        
+        html_passing = self._derive_mappings(
+            self.qb_basic_stats_mappings, passing_fields, skip=("ranker", "player"),
+            data_stats={
+                "pass_success_rate": "pass_success_perc", "pass_sacked": "sacked", "pass_sacked_yds": "sacked_yds",
+                "pass_sacked_perc": "sacked_perc", "pass_net_yds_per_att": "net_yds_per_pass_att",
+                "pass_adj_net_yds_per_att": "adj_net_yds_per_pass_att", "pass_4qc": "comebacks", "pass_gwd": "gwd",
+            }
+        )
+        
+        enhanced_passing = self._derive_mappings(
+            self.qb_basic_stats_mappings, passing_fields, skip=("player", "team", "player_additional"),
+            data_stats={
+                "ranker": "rank", "pass_cmp_perc": "pass_cmp_pct", "pass_td_perc": "pass_td_pct",
+                "pass_int_perc": "pass_int_pct", "pass_success_rate": "pass_succ_pct",
+                "pass_sacked_perc": "pass_sacked_pct",
+            },
+            percentage_type="percentage"
+        )
+        
+        raw_passing = self._derive_mappings(
+            self.qb_basic_stats_mappings, passing_fields, skip=("player",),
+            data_stats={
+                "team": "team_name_abbr", "g": "games", "gs": "games_started", "pass_cmp_perc": "pass_cmp_pct",
+                "pass_td_perc": "pass_td_pct", "pass_int_perc": "pass_int_pct", "pass_success_rate": "pass_success",
+                "pass_sacked_perc": "pass_sacked_pct", "pass_4qc": "comebacks", "pass_gwd": "game_winning_drives",
+            }
+        )
+        
+        html_splits = self._derive_mappings(
+            self.qb_splits_mappings, splits_fields, data_stats=splits_data_stats, replaced=splits_replaced
+        )
+        
+        splits_basic = self._derive_mappings(
+            self.qb_splits_mappings, splits_fields,
+            data_stats=dict(splits_data_stats, split="split_id", value="split_value", w="wins", l="losses", t="ties"),
+            replaced=splits_replaced, percentage_type="percentage"
+        )
+        
+        splits_advanced = self._derive_mappings(
+            self.qb_splits_advanced_mappings,
+            {
+                "pass_cmp_perc": "cmp_pct", "pass_first_down": "first_downs", "pass_rating": "rate",
+                "pass_sacked": "sk", "pass_sacked_yds": "sk_yds", "pass_yds_per_att": "y_a",
+                "pass_adj_yds_per_att": "ay_a", "rush_yds_per_att": "rush_y_a", "rush_first_down": "rush_first_downs",
+            },
+            data_stats={"split": "split_type", "value": "split_value"},
+            percentage_type="percentage"
+        )
+        
+        return {
+            'html_passing': html_passing,
+            'html_splits': html_splits,
+            'splits_basic': splits_basic,
+            'splits_advanced': splits_advanced,
+            'enhanced_passing': enhanced_passing,
+            'raw_passing': raw_passing,
+        }
+    
+    def _derive_mappings(self, base: List[DataStatMapping], fields: Dict[str, str],
+                         data_stats: Optional[Dict[str, str]] = None, skip: Tuple[str, ...] = (),
+                         replaced: Optional[Dict[str, DataStatMapping]] = None,
+                         percentage_type: str = "float") -> List[DataStatMapping]:
+        """
+        Derive a row extractor's mappings from schema mappings.
+        
+        Args:
+            base: Schema mappings, in output order
+            fields: Schema data-stat -> record field the extractor writes, where it differs
+            data_stats: Schema data-stat -> data-stat the extractor reads, where it differs
+            skip: Schema data-stats the extractor does not read
+            replaced: Schema data-stat -> mapping used in its place
+            percentage_type: Data type for the percentage (*_perc) columns
+            
+        Returns:
+            List of DataStatMapping objects
+            
+        Raises:
+            ValueError: If an override names a data-stat the schema mappings no longer have
+        """
+        data_stats = data_stats or {}
+        replaced = replaced or {}
+        known = {m.pfr_attribute for m in base}
+        unknown = (set(fields) | set(data_stats) | set(skip) | set(replaced)) - known
+        if unknown:
+            raise ValueError(f"Row decoder overrides for unknown data-stats: {sorted(unknown)}")
+        
+        derived = []
+        for mapping in base:
+            attribute = mapping.pfr_attribute
+            if attribute in skip:
+                continue
+            if attribute in replaced:
+                derived.append(replaced[attribute])
+                continue
+            derived.append(replace(
+                mapping,
+                pfr_attribute=data_stats.get(attribute, attribute),
+                database_field=fields.get(attribute, mapping.database_field),
+                data_type=percentage_type if mapping.database_field.endswith("_perc") else mapping.data_type
+            ))
+        return derived
+    
     def analyze_page_structure(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """
         Analyze the complete structure of a PFR page.
@@ -424,11 +560,14 @@ class PFRStructureAnalyzer:
         Get field mappings for a specific table type.
         
         Args:
-            table_type: Type of table ('basic_stats', 'splits', 'advanced_splits')
+            table_type: Type of table ('basic_stats', 'splits', 'advanced_splits'),
+                or a row decoder type (see _create_row_decoder_mappings)
             
         Returns:
             List of DataStatMapping objects
         """
+        if table_type in self.row_decoder_mappings:
+            return self.row_decoder_mappings[table_type]
         if table_type == 'basic_stats':
             return self.qb_basic_stats_mappings
         elif table_type == 'splits':
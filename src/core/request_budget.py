@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Shared Request Budget for NFL QB Data Scraping
+SQLite-backed token buckets that several scraper processes lease from.
+
+Each process keeps its own HostRateScheduler, but when the scheduler is
+built over a SharedRequestBudget its per-host buckets live in one SQLite
+file. Every reservation is a short ``BEGIN IMMEDIATE`` transaction, so
+processes queue on the file lock and the configured rate is the total
+across all of them rather than per process.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Any, Iterator, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS host_buckets (
+    host TEXT PRIMARY KEY,
+    rate REAL NOT NULL,
+    capacity REAL NOT NULL,
+    tokens REAL NOT NULL,
+    updated REAL NOT NULL,
+    paused_until REAL NOT NULL DEFAULT 0,
+    leases INTEGER NOT NULL DEFAULT 0
+)
+"""
+
+
+class SharedRequestBudget:
+    """Per-host token buckets stored in a SQLite file shared between processes"""
+
+    def __init__(self, path: Union[str, os.PathLike], clock: Callable[[], float] = time.time,
+                 busy_timeout: float = 30.0):
+        """
+        Initialize the shared budget.
+
+        Args:
+            path: SQLite file all cooperating processes point at
+            clock: Wall clock shared by every process (injectable for tests)
+            busy_timeout: Seconds to wait for another process's lock
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.clock = clock
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        with self._transaction() as conn:
+            conn.execute(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        # One connection per thread and per process (connections must not cross a fork)
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or getattr(self._local, 'pid', None) != os.getpid():
+            conn = sqlite3.connect(str(self.path), timeout=self.busy_timeout, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        # IMMEDIATE takes the write lock up front so concurrent reservations serialize
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield conn
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+
+    def _row(self, conn: sqlite3.Connection, host: str, rate: float, capacity: float) -> Dict[str, float]:
+        row = conn.execute(
+            'SELECT rate, capacity, tokens, updated, paused_until FROM host_buckets WHERE host = ?', (host,)
+        ).fetchone()
+        if row is None:
+            now = self.clock()
+            conn.execute(
+                'INSERT INTO host_buckets (host, rate, capacity, tokens, updated) VALUES (?, ?, ?, ?, ?)',
+                (host, rate, capacity, capacity, now)
+            )
+            return {'rate': rate, 'capacity': capacity, 'tokens': capacity, 'updated': now, 'paused_until': 0.0}
+        return dict(zip(('rate', 'capacity', 'tokens', 'updated', 'paused_until'), row))
+
+    def bucket(self, host: str, requests_per_minute: float, burst: int = 1) -> 'SharedTokenBucket':
+        """
+        Get a handle on a host's shared bucket.
+
+        The first process to see a host sets its budget; later processes use
+        the stored budget unless they call ``set_rate``.
+        """
+        return SharedTokenBucket(self, host, requests_per_minute, burst)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Current state of every host bucket"""
+        rows = self._connection().execute(
+            'SELECT host, rate, capacity, tokens, updated, paused_until, leases FROM host_buckets ORDER BY host'
+        ).fetchall()
+        columns = ('host', 'rate', 'capacity', 'tokens', 'updated', 'paused_until', 'leases')
+        return [dict(zip(columns, row)) for row in rows]
+
+    def close(self):
+        """Close this thread's connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class SharedTokenBucket:
+    """
+    Token bucket whose state lives in a SharedRequestBudget.
+
+    Same reserve/pause interface as TokenBucket, so HostRateScheduler can
+    use either.
+    """
+
+    def __init__(self, budget: SharedRequestBudget, host: str, requests_per_minute: float, burst: int = 1):
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        self.budget = budget
+        self.host = host
+        self.rate = requests_per_minute / 60.0
+        self.capacity = float(max(1, burst))
+        with budget._transaction() as conn:
+            budget._row(conn, host, self.rate, self.capacity)
+
+    def reserve(self) -> float:
+        """Lease a request slot, returning how long to wait before using it"""
+        with self.budget._transaction() as conn:
+            state = self.budget._row(conn, self.host, self.rate, self.capacity)
+            now = self.budget.clock()
+            start = max(now, state['updated'])
+            tokens = min(state['capacity'], state['tokens'] + (start - state['updated']) * state['rate'])
+            tokens -= 1.0
+            conn.execute(
+                'UPDATE host_buckets SET tokens = ?, updated = ?, leases = leases + 1 WHERE host = ?',
+                (tokens, start, self.host)
+            )
+            ready_at = start + max(0.0, -tokens) / state['rate']
+            return max(0.0, ready_at - now)
+
+    def pause(self, seconds: float):
+        """Stop every process from leasing slots for the given number of seconds"""
+        with self.budget._transaction() as conn:
+            state = self.budget._row(conn, self.host, self.rate, self.capacity)
+            resume_at = self.budget.clock() + seconds
+            if resume_at > state['updated']:
+                conn.execute(
+                    'UPDATE host_buckets SET tokens = 1.0, updated = ?, paused_until = MAX(paused_until, ?) '
+                    'WHERE host = ?',
+                    (resume_at, resume_at, self.host)
+                )
+            else:
+                conn.execute(
+                    'UPDATE host_buckets SET paused_until = MAX(paused_until, ?) WHERE host = ?',
+                    (resume_at, self.host)
+                )
+
+    def pause_remaining(self) -> float:
+        """Seconds left in the current pause (0 when not paused)"""
+        row = self.budget._connection().execute(
+            'SELECT paused_until FROM host_buckets WHERE host = ?', (self.host,)
+        ).fetchone()
+        return max(0.0, row[0] - self.budget.clock()) if row else 0.0
+
+    def set_rate(self, requests_per_minute: float, burst: Optional[int] = None):
+        """Change the shared budget for every process"""
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        self.rate = requests_per_minute / 60.0
+        if burst is not None:
+            self.capacity = float(max(1, burst))
+        with self.budget._transaction() as conn:
+            self.budget._row(conn, self.host, self.rate, self.capacity)
+            conn.execute(
+                'UPDATE host_buckets SET rate = ?, capacity = ?, tokens = MIN(tokens, ?) WHERE host = ?',
+                (self.rate, self.capacity, self.capacity, self.host)
+            )
@@ -6,6 +6,7 @@ Enhanced with user agent rotation and better anti-detection measures.
 """
 
 import logging
+import threading
 import time
 import random
 import json
@@ -17,6 +18,9 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from dataclasses import dataclass
 
+from src.core.page_cache import PageCache
+from src.core.host_scheduler import HostRateScheduler, get_host_scheduler
+
 logger = logging.getLogger(__name__)
 
 
@@ -249,43 +253,52 @@ class RateLimiter:
         self.last_request_time = 0.0
         self.consecutive_failures = 0
         self.max_delay = 15.0  # Increased maximum delay in seconds
+        self._lock = threading.Lock()
     
     def wait(self):
         """Waits for the configured delay with jitter and adaptive backoff"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        
-        # Calculate delay with jitter
-        jitter = random.uniform(-self.jitter_range, self.jitter_range)
-        delay = max(self.base_delay, self.base_delay + jitter)
-        
-        # Add adaptive backoff for consecutive failures
-        if self.consecutive_failures > 0:
-            backoff_multiplier = min(2 ** self.consecutive_failures, 6)  # Increased cap to 6x
-            delay = min(delay * backoff_multiplier, self.max_delay)
-        
-        if time_since_last < delay:
-            sleep_time = delay - time_since_last
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
-            time.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
+        # Held while sleeping so threads sharing this limiter are spaced out, not released together
+        with self._lock:
+            current_time = time.time()
+            time_since_last = current_time - self.last_request_time
+            
+            # Calculate delay with jitter
+            jitter = random.uniform(-self.jitter_range, self.jitter_range)
+            delay = max(self.base_delay, self.base_delay + jitter)
+            
+            # Add adaptive backoff for consecutive failures
+            if self.consecutive_failures > 0:
+                backoff_multiplier = min(2 ** self.consecutive_failures, 6)  # Increased cap to 6x
+                delay = min(delay * backoff_multiplier, self.max_delay)
+            
+            if time_since_last < delay:
+                sleep_time = delay - time_since_last
+                logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
+                time.sleep(sleep_time)
+            
+            self.last_request_time = time.time()
     
     def record_failure(self):
         """Record a failed request to increase backoff"""
-        self.consecutive_failures += 1
+        with self._lock:
+            self.consecutive_failures += 1
     
     def record_success(self):
         """Record a successful request to reset backoff"""
-        self.consecutive_failures = 0
+        with self._lock:
+            self.consecutive_failures = 0
 
 
 class RequestManager:
     """Enhanced HTTP request manager with user agent rotation and better anti-detection"""
 
-    def __init__(self, config=None, rate_limit_delay: Optional[float] = None, jitter_range: Optional[float] = None):
+    def __init__(self, config=None, rate_limit_delay: Optional[float] = None, jitter_range: Optional[float] = None,
+                 page_cache: Optional[PageCache] = None, host_scheduler: Optional[HostRateScheduler] = None):
         self.config = config or self._default_config()
+        self.page_cache = page_cache
         self.rate_limiter = RateLimiter(rate_limit_delay, jitter_range)
+        # Shared with every other fetcher in the process; caps the aggregate rate per host
+        self.host_scheduler = host_scheduler or get_host_scheduler()
         self.user_agent_rotator = UserAgentRotator()
         self.browser_fingerprint = BrowserFingerprint()
         self.session = self._create_session()
@@ -320,8 +333,8 @@ class RequestManager:
         retry_strategy = Retry(
             total=3,
             backoff_factor=2,  # Increased backoff factor
-            status_forcelist=[429, 403, 500, 502, 503, 504],  # Added 403
-            respect_retry_after_header=True,
+            # 429/403/503 are handled in get() so the pause applies to every worker via the host scheduler
+            status_forcelist=[500, 502, 504],
         )
         
         adapter = HTTPAdapter(max_retries=retry_strategy)
@@ -432,6 +445,10 @@ class RequestManager:
         Returns:
             A requests.Response object on success, or None on failure.
         """
+        cached = self._get_cached_response(url)
+        if cached is not None or self._replay_only(url):
+            return cached
+        
         self.metrics.total_requests += 1
         self._request_count += 1
         
@@ -442,7 +459,7 @@ class RequestManager:
         for attempt in range(max_retries):
             try:
                 # Rate limiting
-                self.rate_limiter.wait()
+                self._wait_for_slot(url)
                 
                 # Simulate human behavior
                 self._simulate_human_behavior()
@@ -478,17 +495,21 @@ class RequestManager:
                     self.rate_limiter.record_success()
                     self._last_url = url
                     self._consecutive_failures = 0  # Reset on success
+                    if self.page_cache:
+                        self.page_cache.put(url, response.text, variant='requests')
                     return response
-                elif response.status_code == 429:
+                elif response.status_code in (429, 503):
                     self.metrics.rate_limit_violations += 1
                     self.rate_limiter.record_failure()
                     self._consecutive_failures += 1
-                    wait_time = 60 * (attempt + 1)  # Longer wait for rate limits
+                    # Longer wait for rate limits; the next acquire() blocks until the pause ends
+                    wait_time = self.host_scheduler.pause_for_response(
+                        url, response.headers.get('Retry-After'), 60 * (attempt + 1)
+                    )
                     logger.warning(
-                        f"Rate limited on attempt {attempt + 1} for {url}. "
-                        f"Waiting {wait_time}s before retry."
+                        f"Rate limited ({response.status_code}) on attempt {attempt + 1} for {url}. "
+                        f"Waiting {wait_time:.0f}s before retry."
                     )
-                    time.sleep(wait_time)
                 elif response.status_code == 403:
                     self.rate_limiter.record_failure()
                     self._consecutive_failures += 1
@@ -517,6 +538,42 @@ class RequestManager:
         logger.error(f"Failed to fetch {url} after {max_retries} attempts")
         return None
     
+    def _wait_for_slot(self, url: str):
+        """
+        Wait until a network attempt to url may start.
+        
+        The shared host scheduler already spaces every fetcher's requests, so
+        this manager's own limiter only paces requests when no scheduler is set;
+        waiting on both would stack the two delays.
+        """
+        if self.host_scheduler is not None:
+            self.host_scheduler.acquire(url)
+        else:
+            self.rate_limiter.wait()
+    
+    def _replay_only(self, url: str) -> bool:
+        """Check whether the cache is in replay mode, logging the miss if so"""
+        if self.page_cache and self.page_cache.replay:
+            logger.warning(f"Replay mode: {url} not in page cache, skipping network fetch")
+            return True
+        return False
+
+    def _get_cached_response(self, url: str) -> Optional[requests.Response]:
+        """Build a Response from the page cache, or return None on a miss"""
+        if not self.page_cache:
+            return None
+        content = self.page_cache.get(url, variant='requests')
+        if content is None:
+            return None
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response.encoding = 'utf-8'
+        response._content = content.encode('utf-8')
+        response.headers['content-type'] = 'text/html; charset=utf-8'
+        response.headers['X-Page-Cache'] = 'HIT'
+        return response
+    
     def get_metrics(self) -> ScrapingMetrics:
         """Returns the current scraping metrics."""
         return self.metrics
@@ -575,6 +632,13 @@ class RequestManager:
         Returns:
             Dict with 'success', 'content', and 'error' keys.
         """
+        if self.page_cache:
+            content = self.page_cache.get(url, variant='requests')
+            if content is not None:
+                return {'success': True, 'content': content, 'error': None}
+            if self._replay_only(url):
+                return {'success': False, 'content': None, 'error': f"Replay mode: page not cached: {url}"}
+        
         max_retries = getattr(self.config, 'max_retries', 3)
         timeout = getattr(self.config, 'timeout', 30)
         
@@ -582,17 +646,25 @@ class RequestManager:
         attempt = 0
         error = None
         while attempt < max_retries:
-            # Use the existing rate limiter
-            self.rate_limiter.wait()
+            self._wait_for_slot(url)
             
             try:
                 logger.info(f"Fetching URL (attempt {attempt+1}): {url}")
                 response = self.session.get(url, timeout=timeout)
                 if response.status_code == 200:
+                    if self.page_cache:
+                        self.page_cache.put(url, response.text, variant='requests')
                     return {'success': True, 'content': response.text, 'error': None}
                 else:
                     error = f"HTTP {response.status_code}: {response.reason}"
                     logger.warning(f"Request failed: {error}")
+                    if response.status_code in (429, 503):
+                        self.metrics.rate_limit_violations += 1
+                        self.host_scheduler.pause_for_response(
+                            url, response.headers.get('Retry-After'), 7.0 * (2 ** attempt)
+                        )
+                        attempt += 1
+                        continue
             except requests.RequestException as e:
                 error = str(e)
                 logger.warning(f"Request exception: {error}")
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Row Decoder for NFL QB Data
+Single-pass decoding of PFR table rows, compiled from DataStatMapping lists.
+
+Looking up each field with ``row.find('td', {'data-stat': ...})`` rescans
+the row's cells once per field (~35 scans per row). A RowDecoder walks the
+cells once into a data-stat -> text map and then applies a precomputed
+(data-stat, field, converter) plan.
+"""
+
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from bs4 import Tag
+
+from .pfr_structure_analyzer import PFRStructureAnalyzer, DataStatMapping
+
+logger = logging.getLogger(__name__)
+
+_analyzer: Optional[PFRStructureAnalyzer] = None
+
+
+def _get_analyzer() -> PFRStructureAnalyzer:
+    global _analyzer
+    if _analyzer is None:
+        _analyzer = PFRStructureAnalyzer()
+    return _analyzer
+
+
+class RowDecoder:
+    """Compiled field/converter plan for one table type"""
+
+    def __init__(self, mappings: List[DataStatMapping], converters: Dict[str, Callable[[Any], Any]],
+                 cell_tags: Sequence[str] = ('td',), strip_text: bool = False,
+                 skip_missing: bool = False, skip_empty: bool = False, missing_text: Optional[str] = ''):
+        """
+        Compile a decoder.
+
+        Args:
+            mappings: Field mappings to compile, in output order
+            converters: Converter per DataStatMapping.data_type (e.g. 'int', 'float', 'str')
+            cell_tags: Cell tags to index ('td' only matches row.find('td', ...))
+            strip_text: Use get_text(strip=True) instead of get_text().strip()
+            skip_missing: Leave fields out when their cell is absent
+            skip_empty: Leave fields out when their cell text is empty
+            missing_text: Text handed to the converter for absent cells
+        """
+        missing_types = {m.data_type for m in mappings} - set(converters)
+        if missing_types:
+            raise ValueError(f"No converter for data types: {sorted(missing_types)}")
+
+        self.plan: Tuple[Tuple[str, str, Callable[[Any], Any]], ...] = tuple(
+            (m.pfr_attribute, m.database_field, converters[m.data_type]) for m in mappings
+        )
+        self.wanted = frozenset(m.pfr_attribute for m in mappings)
+        self.cell_tags = list(cell_tags)
+        self.strip_text = strip_text
+        self.skip_missing = skip_missing
+        self.skip_empty = skip_empty
+        self.missing_text = missing_text
+
+    @classmethod
+    def for_table_type(cls, table_type: str, converters: Dict[str, Callable[[Any], Any]],
+                       extra_stats: Iterable[str] = (), **options) -> 'RowDecoder':
+        """
+        Compile a decoder from PFRStructureAnalyzer's mappings for a table type.
+
+        Args:
+            table_type: Any type accepted by PFRStructureAnalyzer.get_field_mappings
+            converters: Converter per data type
+            extra_stats: Additional data-stat cells to index for the caller's own use
+            **options: Passed through to RowDecoder
+
+        Returns:
+            Compiled RowDecoder
+        """
+        decoder = cls(_get_analyzer().get_field_mappings(table_type), converters, **options)
+        if extra_stats:
+            decoder.wanted = decoder.wanted | frozenset(extra_stats)
+        return decoder
+
+    def index_cells(self, cells: Iterable[Tag]) -> Dict[str, str]:
+        """
+        Map data-stat -> cell text for the cells this decoder needs.
+
+        The first cell with a given data-stat wins, matching row.find().
+        """
+        index: Dict[str, str] = {}
+        wanted = self.wanted
+        for cell in cells:
+            data_stat = cell.get('data-stat')
+            if data_stat in wanted and data_stat not in index:
+                index[data_stat] = cell.get_text(strip=True) if self.strip_text else cell.get_text().strip()
+        return index
+
+    def index_row(self, row: Tag) -> Dict[str, str]:
+        """Map data-stat -> cell text for a row's cells in one pass"""
+        return self.index_cells(row.find_all(self.cell_tags))
+
+    def decode(self, row: Optional[Tag] = None, cells: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        Decode a row (or an already indexed row) into a record dict.
+
+        Args:
+            row: Table row to decode
+            cells: Output of index_row/index_cells, to avoid indexing twice
+
+        Returns:
+            Dict keyed by database field
+        """
+        if cells is None:
+            cells = self.index_row(row)
+
+        record: Dict[str, Any] = {}
+        for data_stat, field_name, convert in self.plan:
+            text = cells.get(data_stat)
+            if text is None:
+                if self.skip_missing:
+                    continue
+                text = self.missing_text
+            elif self.skip_empty and not text:
+                continue
+            record[field_name] = convert(text)
+        return record
@@ -62,7 +62,8 @@ class CoreScraper:
     
     def __init__(self, request_manager: RequestManager, html_parser: HTMLParser,
                  data_extractor: PFRDataExtractor, db_manager: DatabaseManager,
-                 config: Config, selenium_manager: Optional[SeleniumManager] = None):
+                 config: Config, selenium_manager: Optional[SeleniumManager] = None,
+                 use_season_leaderboards: bool = True, include_advanced_leaderboard: bool = False):
         """
         Initialize the CoreScraper with dependencies.
         
@@ -73,6 +74,10 @@ class CoreScraper:
             db_manager: Manager for database operations
             config: Application configuration
             selenium_manager: Optional Selenium manager for JavaScript-heavy pages
+            use_season_leaderboards: Take PFR IDs and basic stats from the season-wide
+                passing pages instead of one player page per QB
+            include_advanced_leaderboard: Also fetch passing_advanced.htm to fill gaps
+                in the leaderboard stats (one more request per season)
         """
         self.request_manager = request_manager
         self.html_parser = html_parser
@@ -80,6 +85,8 @@ class CoreScraper:
         self.db_manager = db_manager
         self.config = config
         self.selenium_manager = selenium_manager
+        self.use_season_leaderboards = use_season_leaderboards
+        self.include_advanced_leaderboard = include_advanced_leaderboard
         
         # Initialize structure analyzer for debugging and validation
         self.structure_analyzer = PFRStructureAnalyzer()
@@ -142,10 +149,16 @@ class CoreScraper:
         """
         logger.info(f"Starting QB scraping for season {season}")
         
+        # One or two season-wide requests replace a player page per QB
+        leaderboard = self._load_season_leaderboard(season) if self.use_season_leaderboards else {}
+        
         # Get list of QBs to scrape
         if player_names:
             qbs_to_scrape = player_names
             logger.info(f"Scraping specific players: {qbs_to_scrape}")
+        elif leaderboard:
+            qbs_to_scrape = [row['player_name'] for row in leaderboard.values()]
+            logger.info(f"Found {len(qbs_to_scrape)} QBs on the {season} passing leaderboard")
         else:
             qbs_to_scrape = self._get_qb_list_for_season(season)
             logger.info(f"Found {len(qbs_to_scrape)} QBs to scrape for {season}")
@@ -168,7 +181,9 @@ class CoreScraper:
             logger.info(f"Scraping {player_name} ({i}/{len(qbs_to_scrape)})")
             
             try:
-                player_result = self._scrape_single_qb(player_name, season, splits_only)
+                player_result = self._scrape_single_qb(
+                    player_name, season, splits_only, leaderboard.get(player_name.strip().lower())
+                )
                 results['player_results'].append(player_result)
                 
                 if player_result['success']:
@@ -207,8 +222,8 @@ class CoreScraper:
         
         return results
     
-    def _scrape_single_qb(self, player_name: str, season: int, 
-                          splits_only: bool) -> Dict[str, Any]:
+    def _scrape_single_qb(self, player_name: str, season: int, splits_only: bool,
+                          leaderboard_row: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Scrape data for a single QB.
         
@@ -216,6 +231,7 @@ class CoreScraper:
             player_name: Name of the QB to scrape
             season: Season year
             splits_only: If True, only scrape splits data
+            leaderboard_row: The player's season leaderboard stats, if already loaded
             
         Returns:
             Dictionary with scraping results for this player
@@ -234,7 +250,7 @@ class CoreScraper:
         
         try:
             # Get PFR ID for the player
-            pfr_id = self._get_pfr_id(player_name)
+            pfr_id = leaderboard_row['pfr_id'] if leaderboard_row else self._get_pfr_id(player_name)
             if not pfr_id:
                 error_msg = f"Could not find PFR ID for {player_name}"
                 result['errors'].append(error_msg)
@@ -242,7 +258,10 @@ class CoreScraper:
                 return result
             
             # Scrape basic stats (unless splits_only is True)
-            if not splits_only:
+            if not splits_only and leaderboard_row:
+                result['extracted_data']['basic_stats'] = leaderboard_row
+                result['data_count'] += 1
+            elif not splits_only:
                 basic_stats_result = self._scrape_basic_stats(pfr_id, player_name, season)
                 if basic_stats_result['success']:
                     result['extracted_data']['basic_stats'] = basic_stats_result['data']
@@ -281,6 +300,102 @@ class CoreScraper:
         
         return result
     
+    def _load_season_leaderboard(self, season: int) -> Dict[str, Dict[str, Any]]:
+        """
+        Load every QB's passing stats for a season from the leaderboard pages.
+        
+        Reads /years/{season}/passing.htm and, with include_advanced_leaderboard,
+        fills gaps from passing_advanced.htm when that page is available.
+        
+        Args:
+            season: Season year
+            
+        Returns:
+            Stats dictionaries keyed by lower-cased player name (empty on failure)
+        """
+        response = self._fetch_page_with_fallback(
+            f"https://www.pro-football-reference.com/years/{season}/passing.htm"
+        )
+        if not response['success']:
+            logger.warning(f"Season passing leaderboard unavailable for {season}; using player pages")
+            return {}
+        
+        soup = self.html_parser.parse_html(response['content'])
+        passing_stats = self.html_parser.parse_passing_stats_table(soup, season) if soup else []
+        if not passing_stats:
+            return {}
+        
+        advanced_response = {'success': False}
+        if self.include_advanced_leaderboard:
+            advanced_response = self._fetch_page_with_fallback(
+                f"https://www.pro-football-reference.com/years/{season}/passing_advanced.htm"
+            )
+        if advanced_response['success']:
+            advanced_soup = self.html_parser.parse_html(advanced_response['content'])
+            if advanced_soup:
+                advanced = self.html_parser.parse_advanced_passing_tables(advanced_soup, season)
+                self.html_parser.merge_advanced_passing_stats(passing_stats, advanced)
+        
+        leaderboard: Dict[str, Dict[str, Any]] = {}
+        for stats in passing_stats:
+            # Multi-team QBs are listed total row first; keep that one
+            leaderboard.setdefault(stats['player_name'].strip().lower(), stats)
+        logger.info(f"Loaded {len(leaderboard)} QBs from the {season} passing leaderboard")
+        return leaderboard
+    
+    def scrape_player_career(self, pfr_id: str, player_name: Optional[str] = None,
+                             seasons: Optional[List[int]] = None) -> Dict[str, Any]:
+        """
+        Scrape every season of a QB's passing stats from one player page fetch.
+
+        Args:
+            pfr_id: Player's PFR ID
+            player_name: Player's name (default: read from the page heading)
+            seasons: Optional seasons to keep (default: the whole career)
+
+        Returns:
+            Dictionary with the per-season stats under 'seasons'
+        """
+        logger.info(f"Harvesting career passing stats for {player_name or pfr_id}")
+
+        result = {
+            'player_name': player_name,
+            'pfr_id': pfr_id,
+            'success': False,
+            'seasons': [],
+            'errors': [],
+            'warnings': []
+        }
+
+        url = f"https://www.pro-football-reference.com/players/{pfr_id[0]}/{pfr_id}.htm"
+        response = self._fetch_page_with_fallback(url, enable_js=False)
+        if not response['success']:
+            result['errors'].append(f"Failed to get player page: {response['error']}")
+            return result
+
+        # The name heading sits in the meta block, outside the passing table
+        table_ids = ['passing'] if player_name else ['passing', 'meta']
+        soup = self.html_parser.parse_html(response['content'], table_ids=table_ids)
+        if not soup:
+            result['errors'].append("Failed to parse player page HTML")
+            return result
+
+        if player_name is None:
+            heading = soup.find('h1')
+            player_name = heading.get_text(strip=True) if heading else pfr_id
+            result['player_name'] = player_name
+
+        career = self.html_parser.parse_player_career_passing(soup, pfr_id, player_name, url)
+        if seasons:
+            wanted = set(seasons)
+            career = [stats for stats in career if stats['season'] in wanted]
+
+        result['seasons'] = career
+        result['success'] = bool(career)
+        if not career:
+            result['warnings'].append(f"No passing seasons found for {player_name}")
+        return result
+
     def _scrape_basic_stats(self, pfr_id: str, player_name: str, 
                            season: int) -> Dict[str, Any]:
         """
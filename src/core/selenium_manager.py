@@ -19,6 +19,8 @@ from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 from .request_manager import UserAgentRotator
+from .page_cache import PageCache
+from .host_scheduler import HostRateScheduler, get_host_scheduler
 
 logger = logging.getLogger(__name__)
 
@@ -126,14 +128,19 @@ class HumanBehaviorSimulator:
 class SeleniumManager:
     """Manages Selenium browser automation for web scraping"""
     
-    def __init__(self, config: Optional[SeleniumConfig] = None):
+    def __init__(self, config: Optional[SeleniumConfig] = None, page_cache: Optional[PageCache] = None,
+                 host_scheduler: Optional[HostRateScheduler] = None):
         """
         Initialize the Selenium manager.
         
         Args:
             config: Configuration for Selenium browser automation
+            page_cache: Optional persistent page cache consulted before starting the browser
+            host_scheduler: Per-host request budget (default: the process-wide scheduler)
         """
         self.config = config or SeleniumConfig()
+        self.page_cache = page_cache
+        self.host_scheduler = host_scheduler or get_host_scheduler()
         self.driver = None
         self.wait = None
         self.human_simulator = None
@@ -254,6 +261,15 @@ class SeleniumManager:
         Returns:
             Dict with 'success', 'content', and 'error' keys
         """
+        cache_variant = 'selenium_js' if enable_js else 'selenium'
+        if self.page_cache:
+            content = self.page_cache.get(url, variant=cache_variant)
+            if content is not None:
+                return {'success': True, 'content': content, 'error': None}
+            if self.page_cache.replay:
+                logger.warning(f"Replay mode: {url} not in page cache, skipping browser fetch")
+                return {'success': False, 'content': None, 'error': f"Replay mode: page not cached: {url}"}
+        
         if self._should_rotate_session():
             self.end_session()
             self.start_session()
@@ -270,6 +286,7 @@ class SeleniumManager:
                     self.driver.execute_script("document.documentElement.style.pointerEvents = 'auto';")
                 
                 # Navigate to URL
+                self.host_scheduler.acquire(url)
                 self.driver.get(url)
                 
                 # Wait for page to load
@@ -291,6 +308,8 @@ class SeleniumManager:
                     raise Exception("Page content is suspiciously short")
                 
                 logger.info(f"Successfully fetched page: {url}")
+                if self.page_cache:
+                    self.page_cache.put(url, page_source, variant=cache_variant)
                 return {
                     'success': True,
                     'content': page_source,
@@ -383,7 +402,9 @@ class SeleniumManager:
     
     def __enter__(self):
         """Context manager entry"""
-        self.start_session()
+        # Replay mode never touches the network, so don't launch a browser
+        if not (self.page_cache and self.page_cache.replay):
+            self.start_session()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
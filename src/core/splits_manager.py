@@ -8,13 +8,14 @@ Provides comprehensive QB splits extraction with proper error handling and loggi
 import time
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from ..models.qb_models import QBSplitsType1, QBSplitsType2, QBPassingStats
 from ..scrapers.splits_extractor import SplitsExtractor, SplitsExtractionResult
 from .selenium_manager import SeleniumManager
+from .request_manager import RequestManager
 from ..config.config import config
 from ..utils.data_utils import (
     generate_session_id, calculate_processing_time,
@@ -63,9 +64,10 @@ class SplitsManager:
     - Validation and quality assurance
     """
     
-    def __init__(self, selenium_manager: SeleniumManager):
+    def __init__(self, selenium_manager: SeleniumManager, request_manager: Optional[RequestManager] = None):
         self.selenium_manager = selenium_manager
-        self.splits_extractor = SplitsExtractor(selenium_manager)
+        self.request_manager = request_manager
+        self.splits_extractor = SplitsExtractor(selenium_manager, request_manager=request_manager)
         self.metrics = SplitsManagerMetrics(start_time=datetime.now())
         
         # Configuration
@@ -76,16 +78,20 @@ class SplitsManager:
         logger.info(f"Initialized SplitsManager with session ID: {self.session_id}")
     
     def extract_all_player_splits(self, qb_stats: List[QBPassingStats], 
-                                 use_concurrent: bool = False) -> Tuple[List[QBSplitsType1], List[QBSplitsType2]]:
+                                 use_concurrent: bool = False,
+                                 on_player: Optional[Callable[[SplitsExtractionResult], None]] = None
+                                 ) -> Tuple[List[QBSplitsType1], List[QBSplitsType2]]:
         """
         Extract splits data for all QB players
         
         Args:
             qb_stats: List of QB passing stats to extract splits for
             use_concurrent: Whether to use concurrent processing
+            on_player: Called with each player's result as it is extracted; the
+                splits are then handed off instead of collected
             
         Returns:
-            Tuple of (basic_splits, advanced_splits) lists
+            Tuple of (basic_splits, advanced_splits) lists (empty when on_player is given)
         """
         logger.info(f"Starting splits extraction for {len(qb_stats)} players")
         self.metrics.total_players = len(qb_stats)
@@ -95,10 +101,10 @@ class SplitsManager:
         
         if use_concurrent and self.max_workers > 1:
             logger.info(f"Using concurrent processing with {self.max_workers} workers")
-            basic_splits, advanced_splits = self._extract_splits_concurrent(qb_stats)
+            basic_splits, advanced_splits = self._extract_splits_concurrent(qb_stats, on_player)
         else:
             logger.info("Using sequential processing")
-            basic_splits, advanced_splits = self._extract_splits_sequential(qb_stats)
+            basic_splits, advanced_splits = self._extract_splits_sequential(qb_stats, on_player)
         
         all_basic_splits.extend(basic_splits)
         all_advanced_splits.extend(advanced_splits)
@@ -106,13 +112,15 @@ class SplitsManager:
         # Log final results
         processing_time = calculate_processing_time(self.metrics.start_time, datetime.now())
         logger.info(f"Splits extraction completed: "
-                   f"{len(all_basic_splits)} basic splits, {len(all_advanced_splits)} advanced splits "
+                   f"{self.metrics.total_basic_splits} basic splits, {self.metrics.total_advanced_splits} advanced splits "
                    f"({self.metrics.successful_extractions}/{self.metrics.total_players} successful) "
                    f"in {processing_time:.2f}s")
         
         return all_basic_splits, all_advanced_splits
     
-    def _extract_splits_sequential(self, qb_stats: List[QBPassingStats]) -> Tuple[List[QBSplitsType1], List[QBSplitsType2]]:
+    def _extract_splits_sequential(self, qb_stats: List[QBPassingStats],
+                                   on_player: Optional[Callable[[SplitsExtractionResult], None]] = None
+                                   ) -> Tuple[List[QBSplitsType1], List[QBSplitsType2]]:
         """Extract splits data sequentially"""
         all_basic_splits = []
         all_advanced_splits = []
@@ -130,8 +138,11 @@ class SplitsManager:
                 self.metrics.add_extraction_result(result)
                 
                 # Add extracted data
-                all_basic_splits.extend(result.basic_splits)
-                all_advanced_splits.extend(result.advanced_splits)
+                if on_player is not None:
+                    on_player(result)
+                else:
+                    all_basic_splits.extend(result.basic_splits)
+                    all_advanced_splits.extend(result.advanced_splits)
                 
                 # Log progress
                 if result.errors:
@@ -153,7 +164,9 @@ class SplitsManager:
         
         return all_basic_splits, all_advanced_splits
     
-    def _extract_splits_concurrent(self, qb_stats: List[QBPassingStats]) -> Tuple[List[QBSplitsType1], List[QBSplitsType2]]:
+    def _extract_splits_concurrent(self, qb_stats: List[QBPassingStats],
+                                   on_player: Optional[Callable[[SplitsExtractionResult], None]] = None
+                                   ) -> Tuple[List[QBSplitsType1], List[QBSplitsType2]]:
         """Extract splits data concurrently"""
         all_basic_splits = []
         all_advanced_splits = []
@@ -178,8 +191,11 @@ class SplitsManager:
                     self.metrics.add_extraction_result(result)
                     
                     # Add extracted data
-                    all_basic_splits.extend(result.basic_splits)
-                    all_advanced_splits.extend(result.advanced_splits)
+                    if on_player is not None:
+                        on_player(result)
+                    else:
+                        all_basic_splits.extend(result.basic_splits)
+                        all_advanced_splits.extend(result.advanced_splits)
                     
                     # Log progress
                     if result.errors:
@@ -280,6 +296,8 @@ class SplitsManager:
             'total_errors': self.metrics.total_errors,
             'total_warnings': self.metrics.total_warnings,
             'rate_limit_violations': self.metrics.rate_limit_violations,
+            'static_page_loads': self.splits_extractor.static_page_loads,
+            'selenium_fallbacks': self.splits_extractor.selenium_fallbacks,
             'average_basic_splits_per_player': (self.metrics.total_basic_splits / self.metrics.successful_extractions) if self.metrics.successful_extractions > 0 else 0,
             'average_advanced_splits_per_player': (self.metrics.total_advanced_splits / self.metrics.successful_extractions) if self.metrics.successful_extractions > 0 else 0
         }
@@ -302,6 +320,8 @@ class SplitsManager:
         logger.info(f"Total Errors: {summary['total_errors']}")
         logger.info(f"Total Warnings: {summary['total_warnings']}")
         logger.info(f"Rate Limit Violations: {summary['rate_limit_violations']}")
+        logger.info(f"Static Page Loads: {summary['static_page_loads']}")
+        logger.info(f"Selenium Fallbacks: {summary['selenium_fallbacks']}")
         logger.info("================================")
     
     def extract_player_splits_by_name(self, player_name: str, pfr_id: str, 
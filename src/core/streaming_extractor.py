@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+Streaming Table Extractor for NFL QB Data
+Event-driven extraction of PFR table rows without building a page DOM.
+
+Pages are fed in chunks to an HTML tokenizer that only keeps the row it is
+currently inside. Rows of the selected tables are decoded into model records
+as soon as their ``</tr>`` is seen, so memory per page stays flat regardless
+of page size. Comment-wrapped tables are tokenized from the comment text the
+same way.
+
+The tokenizer is the standard library's ``html.parser`` - the parser behind
+the 'html.parser' backend - rather than lxml: libxml2's incremental HTML
+parser keeps its whole input buffer alive until the document ends.
+
+Experimental: no scraping or reprocessing path uses this module yet; only
+scripts/benchmark_streaming_extractor.py and its tests do. The splits
+pipeline still parses pages with SplitsExtractor, which can fall back to
+the browser when tables are missing.
+"""
+
+import codecs
+import gzip
+import logging
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from html.parser import HTMLParser as HTMLTokenizer
+from typing import Any, Dict, IO, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .html_parser import HTMLParser
+from .row_decoder import RowDecoder
+from ..models.qb_models import QBPassingStats, QBSplitsType1, QBSplitsType2
+from ..scrapers.splits_extractor import SplitsExtractor
+
+logger = logging.getLogger(__name__)
+
+PageSource = Union[str, bytes, os.PathLike, IO]
+
+SPLITS_HEADER_INDICATORS = ('SplitValue', 'CmpAtt', 'YdsIntRate', 'GWLTCmp')
+
+
+@dataclass
+class StreamTableSpec:
+    """A table the streaming extractor knows how to decode"""
+    table_type: str
+    table_id: str
+    model: type
+
+
+@dataclass
+class StreamedCell:
+    """A table cell as seen by the tokenizer"""
+    tag: str
+    data_stat: Optional[str]
+    texts: List[str] = field(default_factory=list)  # Text nodes, as BeautifulSoup would split them
+    link_href: Optional[str] = None  # First <a> in the cell
+    link_texts: Optional[List[str]] = None
+
+    def text(self, strip_parts: bool = True) -> str:
+        """Cell text as get_text(strip=True) (strip_parts) or get_text().strip() would give it"""
+        if strip_parts:
+            return ''.join(text.strip() for text in self.texts)
+        return ''.join(self.texts).strip()
+
+
+@dataclass
+class StreamedRow:
+    """A completed row of a target table"""
+    spec: StreamTableSpec
+    classes: List[str]
+    cells: List[StreamedCell]
+
+
+class _RowTokenizer(HTMLTokenizer):
+    """Collects rows of target tables' bodies while discarding everything else"""
+
+    def __init__(self, specs: Dict[str, StreamTableSpec]):
+        super().__init__(convert_charrefs=True)
+        self.specs = specs
+        self.rows: List[StreamedRow] = []
+        self._spec: Optional[StreamTableSpec] = None
+        self._nested_tables = 0
+        self._in_body = False
+        self._row: Optional[StreamedRow] = None
+        self._cell: Optional[StreamedCell] = None
+        self._in_link = False
+        self._after_data = False
+
+    def handle_starttag(self, tag, attrs):
+        self._after_data = False
+        if self._spec is None:
+            if tag == 'table':
+                self._spec = self.specs.get(dict(attrs).get('id'))
+            return
+
+        if tag == 'table':
+            self._nested_tables += 1
+        elif self._nested_tables:
+            return
+        elif tag == 'tbody':
+            self._in_body = True
+        elif tag == 'tr' and self._in_body:
+            self._finish_row()
+            self._row = StreamedRow(self._spec, (dict(attrs).get('class') or '').split(), [])
+        elif tag in ('td', 'th') and self._row is not None:
+            self._cell = StreamedCell(tag, dict(attrs).get('data-stat'))
+            self._row.cells.append(self._cell)
+        elif tag == 'a' and self._cell is not None and self._cell.link_texts is None:
+            self._cell.link_href = dict(attrs).get('href', '')
+            self._cell.link_texts = []
+            self._in_link = True
+
+    def handle_endtag(self, tag):
+        self._after_data = False
+        if self._spec is None:
+            return
+
+        if tag == 'table':
+            if self._nested_tables:
+                self._nested_tables -= 1
+                return
+            self._finish_row()
+            self._spec = None
+            self._in_body = False
+        elif self._nested_tables:
+            return
+        elif tag == 'tbody':
+            self._finish_row()
+            self._in_body = False
+        elif tag == 'tr':
+            self._finish_row()
+        elif tag in ('td', 'th'):
+            self._cell = None
+            self._in_link = False
+        elif tag == 'a':
+            self._in_link = False
+
+    def handle_data(self, data):
+        if self._cell is None:
+            return
+        # Consecutive data callbacks are one text node split at a feed boundary
+        if self._after_data:
+            self._cell.texts[-1] += data
+            if self._in_link:
+                self._cell.link_texts[-1] += data
+        else:
+            self._cell.texts.append(data)
+            if self._in_link:
+                self._cell.link_texts.append(data)
+        self._after_data = True
+
+    def handle_comment(self, data):
+        self._after_data = False
+        if '<table' in data and any(f'id="{table_id}"' in data for table_id in self.specs):
+            # Comment-wrapped table: tokenize its markup like the page itself
+            nested = _RowTokenizer(self.specs)
+            nested.feed(data)
+            nested.close()
+            self.rows.extend(nested.rows)
+
+    def close(self):
+        super().close()
+        self._finish_row()
+
+    def _finish_row(self):
+        if self._row is not None:
+            self.rows.append(self._row)
+        self._row = None
+        self._cell = None
+        self._in_link = False
+
+
+class StreamingTableExtractor:
+    """
+    Streams rows of selected PFR tables straight into model records.
+
+    Table types cover both the splits extractor ('basic_splits',
+    'advanced_splits') and the PFR data extractor ('basic_stats', 'splits',
+    'advanced_splits'); 'basic_stats' is the season passing table.
+    Records are identical to the DOM-based extractors' output.
+    Experimental, see the module docstring.
+    """
+
+    TABLE_SPECS = {
+        'passing': StreamTableSpec('passing', 'passing', QBPassingStats),
+        'basic_splits': StreamTableSpec('basic_splits', 'stats', QBSplitsType1),
+        'advanced_splits': StreamTableSpec('advanced_splits', 'advanced_splits', QBSplitsType2),
+    }
+    TABLE_TYPE_ALIASES = {'basic_stats': 'passing', 'splits': 'basic_splits'}
+
+    def __init__(self, chunk_size: int = 64 * 1024):
+        """
+        Initialize the extractor.
+
+        Args:
+            chunk_size: Characters fed to the tokenizer at a time
+        """
+        self.chunk_size = chunk_size
+        self.html_parser = HTMLParser(backend='html.parser')
+        self.splits_extractor = SplitsExtractor(selenium_manager=None)
+        self.pages_streamed = 0
+        self.rows_streamed = 0
+
+    def resolve_table_types(self, table_types: Iterable[str],
+                            table_ids: Optional[Dict[str, str]] = None) -> Dict[str, StreamTableSpec]:
+        """
+        Map requested table types to specs keyed by the table id to stream.
+
+        Args:
+            table_types: Table types to extract
+            table_ids: Optional table type -> table id overrides
+
+        Raises:
+            ValueError: If a table type is unknown
+        """
+        specs = {}
+        for table_type in table_types:
+            spec = self.TABLE_SPECS.get(self.TABLE_TYPE_ALIASES.get(table_type, table_type))
+            if spec is None:
+                raise ValueError(f"Unknown streaming table type: {table_type}")
+            specs[(table_ids or {}).get(table_type, spec.table_id)] = spec
+        return specs
+
+    def iter_records(self, source: PageSource, table_types: Iterable[str], season: int,
+                     pfr_id: str = '', player_name: str = '',
+                     scraped_at: Optional[datetime] = None,
+                     table_ids: Optional[Dict[str, str]] = None) -> Iterator[Tuple[str, Any]]:
+        """
+        Stream records from a page.
+
+        Args:
+            source: HTML text/bytes, a file path (str or os.PathLike; .gz is decompressed)
+                or a readable file object. A str without '<' is taken as a path.
+            table_types: Table types to extract
+            season: Season year
+            pfr_id: Player's PFR ID (splits pages)
+            player_name: Player's name (splits pages)
+            scraped_at: Timestamp for the records (default: now)
+            table_ids: Optional table type -> table id overrides
+
+        Yields:
+            Tuples of (table type, model record) in page order
+        """
+        specs = self.resolve_table_types(table_types, table_ids)
+        context = {
+            'pfr_id': pfr_id,
+            'player_name': player_name,
+            'season': season,
+            'scraped_at': scraped_at or datetime.now(),
+        }
+
+        self.pages_streamed += 1
+        tokenizer = _RowTokenizer(specs)
+        for chunk in self._iter_chunks(source):
+            tokenizer.feed(chunk)
+            yield from self._drain(tokenizer, context)
+        tokenizer.close()
+        yield from self._drain(tokenizer, context)
+
+    def iter_passing_stats(self, source: PageSource, season: int,
+                           scraped_at: Optional[datetime] = None) -> Iterator[QBPassingStats]:
+        """Stream QB rows of a season passing page as QBPassingStats"""
+        for _, record in self.iter_records(source, ['passing'], season, scraped_at=scraped_at):
+            yield record
+
+    def iter_splits(self, source: PageSource, pfr_id: str, player_name: str, season: int,
+                    scraped_at: Optional[datetime] = None) -> Iterator[Union[QBSplitsType1, QBSplitsType2]]:
+        """Stream basic and advanced splits rows of a player's splits page"""
+        for _, record in self.iter_records(source, ['basic_splits', 'advanced_splits'], season,
+                                           pfr_id=pfr_id, player_name=player_name, scraped_at=scraped_at):
+            yield record
+
+    def _iter_chunks(self, source: PageSource) -> Iterator[str]:
+        """Yield a page as text in chunk_size pieces"""
+        if isinstance(source, bytes):
+            source = source.decode('utf-8')
+        if isinstance(source, str) and '<' in source:
+            for start in range(0, len(source), self.chunk_size):
+                yield source[start:start + self.chunk_size]
+            return
+
+        if isinstance(source, (str, os.PathLike)):
+            path = os.fspath(source)
+            opener = gzip.open if path.endswith('.gz') else open
+            with opener(path, 'rt', encoding='utf-8') as f:
+                yield from iter(lambda: f.read(self.chunk_size), '')
+            return
+
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        while True:
+            chunk = source.read(self.chunk_size)
+            if not chunk:
+                break
+            yield decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+        yield decoder.decode(b'', final=True)
+
+    def _drain(self, tokenizer: _RowTokenizer, context: Dict[str, Any]) -> Iterator[Tuple[str, Any]]:
+        rows, tokenizer.rows = tokenizer.rows, []
+        for row in rows:
+            record = self._decode_row(row, context)
+            if record is not None:
+                self.rows_streamed += 1
+                yield row.spec.table_type, record
+
+    def _decode_row(self, row: StreamedRow, context: Dict[str, Any]) -> Optional[Any]:
+        try:
+            if row.spec.model is QBPassingStats:
+                return self._passing_record(row, context)
+            if row.spec.model is QBSplitsType1:
+                return self._splits_record(row, self.splits_extractor.basic_row_decoder, context)
+            return self._splits_record(row, self.splits_extractor.advanced_row_decoder, context)
+        except Exception as e:
+            logger.debug(f"Failed to decode streamed {row.spec.table_type} row: {e}")
+            return None
+
+    def _passing_record(self, row: StreamedRow, context: Dict[str, Any]) -> Optional[QBPassingStats]:
+        """Mirror HTMLParser.parse_passing_stats_table for one row"""
+        if 'thead' in row.classes:
+            return None
+
+        decoder = self.html_parser.passing_row_decoder
+        td_cells = [cell for cell in row.cells if cell.tag == 'td']
+        index = _index_cells(td_cells, decoder, strip_parts=False)
+        if index.get('pos', '').upper() != 'QB':
+            return None
+
+        player_cell = _first_cell(td_cells, 'player') or _first_cell(td_cells, 'name_display')
+        if player_cell is None or player_cell.link_texts is None:
+            return None
+        player_url = player_cell.link_href
+        pfr_id = self.html_parser._extract_pfr_id(player_url) if player_url else None
+        if not pfr_id:
+            return None
+
+        stats = decoder.decode(cells=index)
+        stats.update({
+            'pfr_id': pfr_id,
+            'player_url': f"https://www.pro-football-reference.com{player_url}",
+            'season': context['season'],
+            'player_name': ''.join(player_cell.link_texts).strip(),
+            'team': self.html_parser._normalize_pfr_team_code(stats['team']),
+            'rk': (self.html_parser._safe_int(index.get('rank_offense', ''))
+                   or self.html_parser._safe_int(index.get('rk', ''))),
+            'scraped_at': context['scraped_at'],
+            'updated_at': context['scraped_at'],
+        })
+        return QBPassingStats(**stats)
+
+    def _splits_record(self, row: StreamedRow, decoder: RowDecoder, context: Dict[str, Any]) -> Optional[Any]:
+        """Mirror SplitsExtractor's header filtering and row extraction for one row"""
+        cells = row.cells
+        if not cells:
+            return None
+        row_text = ''.join(cell.text() for cell in cells)
+        if any(indicator in row_text for indicator in SPLITS_HEADER_INDICATORS):
+            return None
+        if all(cell.tag == 'th' for cell in cells):
+            return None
+        if len(cells) < 2 or cells[0].text() in ('Split', 'Value'):
+            return None
+
+        row_data = {
+            'pfr_id': context['pfr_id'],
+            'player_name': context['player_name'],
+            'season': context['season'],
+            'scraped_at': context['scraped_at'],
+            'updated_at': context['scraped_at'],
+        }
+        row_data.update(decoder.decode(cells=_index_cells(cells, decoder, strip_parts=True)))
+        if not row_data.get('split') and not row_data.get('value'):
+            return None
+        if not row_data.get('split'):
+            row_data['split'] = 'Continuation'
+        return row.spec.model(**row_data)
+
+
+def _index_cells(cells: List[StreamedCell], decoder: RowDecoder, strip_parts: bool) -> Dict[str, str]:
+    """Map data-stat -> text for the cells a decoder needs, first cell winning"""
+    index: Dict[str, str] = {}
+    for cell in cells:
+        if cell.data_stat in decoder.wanted and cell.data_stat not in index:
+            index[cell.data_stat] = cell.text(strip_parts)
+    return index
+
+
+def _first_cell(cells: List[StreamedCell], data_stat: str) -> Optional[StreamedCell]:
+    for cell in cells:
+        if cell.data_stat == data_stat:
+            return cell
+    return None
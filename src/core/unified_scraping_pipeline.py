@@ -14,6 +14,7 @@ import traceback
 from ..core.selenium_manager import SeleniumManager, SeleniumConfig
 from ..core.pfr_structure_analyzer import PFRStructureAnalyzer
 from ..core.pfr_data_extractor import PFRDataExtractor, ExtractionResult
+from ..core.html_parser import make_soup
 from ..models.qb_models import QBSplitsType1, QBSplitsType2
 from ..utils.data_utils import build_splits_url
 
@@ -105,8 +106,7 @@ class UnifiedScrapingPipeline:
             structure_analysis = None
             if self.enable_structure_analysis:
                 logger.info(f"Analyzing PFR structure for {player_name}")
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(html_content, 'html.parser')
+                soup = make_soup(html_content)
                 structure_analysis = self.structure_analyzer.analyze_page_structure(soup)
                 
                 # Log structure analysis results
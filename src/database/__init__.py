@@ -2,6 +2,12 @@
 Database operations for NFL QB Data Scraping System
 """
 
-from .db_manager import DatabaseManager
+from .backends import open_database
+from .sqlite_manager import SQLiteDatabaseManager
 
-__all__ = ['DatabaseManager'] 
\ No newline at end of file
+try:
+    from .db_manager import DatabaseManager
+except ImportError:  # psycopg2 not installed: only the SQLite backend is available
+    DatabaseManager = None
+
+__all__ = ['DatabaseManager', 'SQLiteDatabaseManager', 'open_database']
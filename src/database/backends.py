@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Storage backend selection for NFL QB Data Scraping System
+Picks the Postgres or the embedded SQLite manager from the connection string
+"""
+
+from typing import Any, Optional
+
+from src.config.config import config
+from src.database.sqlite_manager import SQLiteDatabaseManager, is_sqlite_url
+
+
+def open_database(connection_string: Optional[str] = None, monitor: Optional[Any] = None) -> Any:
+    """
+    Open the database manager that serves connection_string.
+
+    sqlite:///path URLs get the embedded SQLiteDatabaseManager, anything else the
+    Postgres DatabaseManager. psycopg2 is only imported when Postgres is used.
+
+    Args:
+        connection_string: Database URL, DATABASE_URL by default
+        monitor: Optional PerformanceMonitor passed to the manager
+
+    Returns:
+        SQLiteDatabaseManager or DatabaseManager
+    """
+    url = connection_string or config.get_database_url()
+    if is_sqlite_url(url):
+        return SQLiteDatabaseManager(url, monitor=monitor)
+
+    from src.database.db_manager import DatabaseManager
+    return DatabaseManager(url, monitor=monitor)
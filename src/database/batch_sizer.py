@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Adaptive batch sizing for bulk database writes
+Finds the largest batch a link can take without per-batch latency blowing past target
+"""
+
+import logging
+import threading
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveBatchSizer:
+    """
+    Runtime batch size controller for multi-row INSERTs.
+
+    The size doubles while batches finish within the target latency (never
+    past the size the measured rate projects to hit it), scales down in
+    proportion when a batch runs over, and halves when a statement
+    times out or hits memory pressure. Sizes stay within [min_size, max_size].
+    Adjustments are locked, so threads writing the same table can share a sizer.
+    """
+
+    def __init__(self, initial_size: int, min_size: int, max_size: int,
+                 target_seconds: float = 1.0, growth_factor: float = 2.0):
+        """
+        Initialize the sizer.
+
+        Args:
+            initial_size: First batch size to try
+            min_size: Smallest batch size
+            max_size: Largest batch size
+            target_seconds: Per-batch latency to stay under
+            growth_factor: Multiplier applied after a fast batch
+        """
+        if min_size < 1 or max_size < min_size:
+            raise ValueError("Batch sizes must satisfy 1 <= min_size <= max_size")
+        if target_seconds <= 0 or growth_factor <= 1:
+            raise ValueError("target_seconds must be positive and growth_factor above 1")
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_seconds = target_seconds
+        self.growth_factor = growth_factor
+        self.size = self._clamp(initial_size)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, bulk_config: Any, record_count: Optional[int] = None) -> 'AdaptiveBatchSizer':
+        """
+        Create a sizer from BulkOperationConfig.
+
+        The starting size comes from optimize_batch_size when a record count
+        is known, otherwise from the configured batch_size.
+        """
+        initial = bulk_config.batch_size
+        if record_count:
+            initial = bulk_config.optimize_batch_size(record_count)
+        return cls(
+            initial_size=initial,
+            min_size=bulk_config.min_batch_size,
+            max_size=bulk_config.max_batch_size,
+            target_seconds=bulk_config.target_batch_seconds
+        )
+
+    def _clamp(self, size: float) -> int:
+        return max(self.min_size, min(self.max_size, int(size)))
+
+    def record(self, rows: int, seconds: float) -> int:
+        """
+        Adjust the size after a batch completes.
+
+        Args:
+            rows: Rows in the batch
+            seconds: How long the batch took
+
+        Returns:
+            The next batch size
+        """
+        with self._lock:
+            if seconds <= self.target_seconds:
+                # Only grow when the batch was full size; a short tail batch says nothing.
+                # Growth stops where the measured rate says the target would be reached.
+                if rows >= self.size:
+                    projected = rows * self.target_seconds / seconds if seconds > 0 else float('inf')
+                    self.size = self._clamp(min(self.size * self.growth_factor, projected))
+            else:
+                self.size = self._clamp(rows * self.target_seconds / seconds)
+            return self.size
+
+    def shrink(self) -> bool:
+        """
+        Halve the size after a timeout or memory error.
+
+        Returns:
+            False when already at min_size (the failure is not size related)
+        """
+        with self._lock:
+            if self.size <= self.min_size:
+                return False
+            self.size = self._clamp(self.size // 2)
+            size = self.size
+        logger.info(f"Shrinking batch size to {size}")
+        return True
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Thread-safe PostgreSQL connection pool for NFL QB Data Scraping System
+Health-checks idle connections, recycles old ones and reports checkout metrics
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import psycopg2
+from psycopg2 import extensions
+from psycopg2.pool import PoolError
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeoutError(PoolError):
+    """Raised when no connection frees up within the checkout timeout"""
+
+
+class PoolExhaustedError(PoolError):
+    """Raised when the wait queue for connections is already full"""
+
+
+class ThreadSafeConnectionPool:
+    """
+    Connection pool that can be shared by worker threads.
+
+    Checkouts block on a bounded wait queue while every connection is in use.
+    Idle connections are pinged before reuse once they have sat longer than
+    health_check_idle, and connections older than max_age are closed and
+    replaced. Wait time, hold time and saturation of every checkout are sent
+    to an optional PerformanceMonitor as 'db_pool_checkout' and
+    'db_pool_hold' operations.
+    """
+
+    def __init__(self, minconn: int, maxconn: int, dsn: str,
+                 checkout_timeout: float = 30.0, max_waiters: int = 32,
+                 max_age: float = 1800.0, health_check_idle: float = 30.0,
+                 monitor: Optional[Any] = None,
+                 connect: Optional[Callable[..., Any]] = None, **connect_kwargs: Any):
+        """
+        Initialize the pool and open minconn connections.
+
+        Args:
+            minconn: Connections opened up front and kept open
+            maxconn: Most connections open at once
+            dsn: Connection string
+            checkout_timeout: Seconds a checkout waits for a free connection
+            max_waiters: Most threads allowed to wait at once; 0 means no limit
+            max_age: Seconds after which a connection is recycled; 0 disables
+            health_check_idle: Idle seconds after which a connection is pinged before reuse
+            monitor: PerformanceMonitor receiving checkout metrics
+            connect: Connection factory, psycopg2.connect by default
+            **connect_kwargs: Extra arguments for the connection factory
+        """
+        if minconn < 0 or maxconn < 1 or minconn > maxconn:
+            raise ValueError("Pool sizes must satisfy 0 <= minconn <= maxconn and maxconn >= 1")
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.dsn = dsn
+        self.checkout_timeout = checkout_timeout
+        self.max_waiters = max_waiters
+        self.max_age = max_age
+        self.health_check_idle = health_check_idle
+        self.monitor = monitor
+        self._connect = connect or psycopg2.connect
+        self._connect_kwargs = connect_kwargs
+
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        # Idle connections as (connection, created_at, returned_at), most recently returned last
+        self._idle: List[Tuple[Any, float, float]] = []
+        # id(connection) -> (connection, created_at, checked_out_at)
+        self._in_use: Dict[int, Tuple[Any, float, float]] = {}
+        self._opening = 0
+        self._waiting = 0
+        self.closed = False
+
+        self._stats = {
+            'checkouts': 0,
+            'timeouts': 0,
+            'rejected': 0,
+            'recycled': 0,
+            'failed_health_checks': 0,
+            'total_wait': 0.0,
+            'max_wait': 0.0,
+            'total_hold': 0.0,
+            'max_hold': 0.0,
+        }
+
+        for _ in range(minconn):
+            self._idle.append((self._new_connection(), time.monotonic(), time.monotonic()))
+
+    def _new_connection(self) -> Any:
+        return self._connect(self.dsn, **self._connect_kwargs)
+
+    def _size(self) -> int:
+        return len(self._idle) + len(self._in_use) + self._opening
+
+    def _close_quietly(self, conn: Any) -> None:
+        try:
+            conn.close()
+        except Exception as e:
+            logger.debug(f"Error closing pooled connection: {e}")
+
+    def _is_healthy(self, conn: Any, created_at: float, returned_at: float) -> bool:
+        """Decide whether an idle connection can be handed out again"""
+        if conn.closed:
+            return False
+        now = time.monotonic()
+        if self.max_age and now - created_at > self.max_age:
+            self._count('recycled')
+            return False
+        if self.health_check_idle and now - returned_at >= self.health_check_idle:
+            try:
+                cur = conn.cursor()
+                try:
+                    cur.execute("SELECT 1")
+                finally:
+                    cur.close()
+                conn.rollback()
+            except Exception as e:
+                logger.warning(f"Discarding stale pooled connection: {e}")
+                self._count('failed_health_checks')
+                return False
+        return True
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self._stats[stat] += 1
+
+    def getconn(self, timeout: Optional[float] = None) -> Any:
+        """
+        Check a connection out of the pool.
+
+        Args:
+            timeout: Seconds to wait for a free connection, checkout_timeout by default
+
+        Returns:
+            An open connection
+
+        Raises:
+            PoolExhaustedError: If max_waiters threads are already waiting
+            PoolTimeoutError: If no connection frees up in time
+        """
+        timeout = self.checkout_timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+        candidate = None
+
+        with self._available:
+            while True:
+                if self.closed:
+                    raise PoolError("connection pool is closed")
+                if self._idle:
+                    candidate, created_at, returned_at = self._idle.pop()
+                    break
+                if self._size() < self.maxconn:
+                    break
+                if self.max_waiters and self._waiting >= self.max_waiters:
+                    self._stats['rejected'] += 1
+                    raise PoolExhaustedError(f"{self._waiting} threads already waiting for a connection")
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._stats['timeouts'] += 1
+                    raise PoolTimeoutError(f"No connection available within {timeout:.1f}s")
+                self._waiting += 1
+                try:
+                    self._available.wait(remaining)
+                finally:
+                    self._waiting -= 1
+            # Hold the slot while the health check or connect runs outside the lock
+            self._opening += 1
+
+        conn = None
+        try:
+            if candidate is not None:
+                if self._is_healthy(candidate, created_at, returned_at):
+                    conn = candidate
+                else:
+                    self._close_quietly(candidate)
+            if conn is None:
+                conn = self._new_connection()
+                created_at = time.monotonic()
+        finally:
+            with self._available:
+                self._opening -= 1
+                if conn is None:
+                    self._available.notify()
+                else:
+                    checked_out = time.monotonic()
+                    wait = checked_out - started
+                    self._in_use[id(conn)] = (conn, created_at, checked_out)
+                    self._stats['checkouts'] += 1
+                    self._stats['total_wait'] += wait
+                    self._stats['max_wait'] = max(self._stats['max_wait'], wait)
+                    in_use, waiting = len(self._in_use), self._waiting
+
+        self._report('db_pool_checkout', wait, in_use, waiting)
+        return conn
+
+    def putconn(self, conn: Any, close: bool = False) -> None:
+        """
+        Return a connection to the pool.
+
+        Args:
+            conn: Connection from getconn
+            close: Close the connection instead of keeping it
+        """
+        with self._lock:
+            entry = self._in_use.pop(id(conn), None)
+        if entry is None:
+            raise PoolError("trying to put unkeyed connection")
+        _, created_at, checked_out = entry
+        hold = time.monotonic() - checked_out
+
+        if not close and not conn.closed:
+            # Same cleanup psycopg2's own pools do before keeping a connection
+            status = conn.info.transaction_status
+            if status == extensions.TRANSACTION_STATUS_UNKNOWN:
+                close = True
+            elif status != extensions.TRANSACTION_STATUS_IDLE:
+                try:
+                    conn.rollback()
+                except Exception:
+                    close = True
+        close = close or conn.closed or self.closed
+
+        with self._available:
+            self._stats['total_hold'] += hold
+            self._stats['max_hold'] = max(self._stats['max_hold'], hold)
+            if not close:
+                self._idle.append((conn, created_at, time.monotonic()))
+            self._available.notify()
+            in_use, waiting = len(self._in_use), self._waiting
+        if close:
+            self._close_quietly(conn)
+
+        self._report('db_pool_hold', hold, in_use, waiting)
+
+    def closeall(self) -> None:
+        """Close every connection and wake any waiting threads"""
+        with self._available:
+            self.closed = True
+            connections = [entry[0] for entry in self._idle] + [entry[0] for entry in self._in_use.values()]
+            self._idle.clear()
+            self._in_use.clear()
+            self._available.notify_all()
+        for conn in connections:
+            self._close_quietly(conn)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get pool size, saturation and checkout timing totals"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats.update({
+                'size': self._size(),
+                'max_size': self.maxconn,
+                'in_use': len(self._in_use),
+                'idle': len(self._idle),
+                'waiting': self._waiting,
+                'saturation': len(self._in_use) / self.maxconn,
+            })
+        checkouts = stats['checkouts']
+        stats['avg_wait'] = stats['total_wait'] / checkouts if checkouts else 0.0
+        stats['avg_hold'] = stats['total_hold'] / checkouts if checkouts else 0.0
+        return stats
+
+    def _report(self, operation: str, duration: float, in_use: int, waiting: int) -> None:
+        if self.monitor is None:
+            return
+        try:
+            self.monitor.record_operation_metrics(operation, {
+                'duration': duration,
+                'in_use': in_use,
+                'waiting': waiting,
+                'pool_size': self.maxconn,
+                'saturation': in_use / self.maxconn,
+            })
+        except Exception as e:
+            logger.debug(f"Failed to record pool metrics: {e}")
@@ -4,38 +4,233 @@ Database manager for NFL QB data with connection pooling and optimized operation
 Handles all database operations for the new schema with PFR IDs and separated tables
 """
 
+import io
 import logging
 import os
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+import re
+import threading
+import time
+import uuid
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Sequence, Tuple
+from datetime import date, datetime
 from contextlib import contextmanager
 
 import psycopg2
-from psycopg2.pool import SimpleConnectionPool
-from psycopg2.extras import RealDictCursor, execute_batch
+from psycopg2 import errors as pg_errors
+from psycopg2.extras import RealDictCursor, execute_batch, execute_values
 from psycopg2.extensions import connection
 
-from src.models.qb_models import QBBasicStats, QBAdvancedStats, QBSplitStats, QBSplitsType2, Player, Team, ScrapingLog
+from src.models.qb_models import (
+    QBBasicStats, QBAdvancedStats, QBSplitStats, QBSplitsType2, Player, Team, ScrapingLog, BulkInsertResult
+)
 from src.config.config import config
+from src.database.batch_sizer import AdaptiveBatchSizer
+from src.database.connection_pool import ThreadSafeConnectionPool
+from src.database.tables import (
+    PASSING_STATS_COLUMNS, SPLITS_COLUMNS, SPLITS_ADVANCED_COLUMNS, PASSING_STATS_KEY, SPLITS_KEY,
+    SPLITS_TABLES, CORE_TABLES, NFL_TEAMS, compute_row_hash, with_row_hash, non_key_columns,
+    last_row_per_key, stream_query
+)
 
 logger = logging.getLogger(__name__)
 
+SCHEMA_FILE = os.path.join(os.path.dirname(__file__), '..', '..', 'sql', 'schema.sql')
+
+# Materialized summaries read by monitoring paths, with the plain view each one copies
+SUMMARY_VIEWS = {
+    'mv_database_stats': 'database_stats',
+    'mv_qb_season_summary': 'qb_season_summary',
+}
+
+
+def season_partition(table: str, season: int) -> str:
+    """Name of the partition holding one season of a partitioned table"""
+    return f"{table}_{int(season)}"
+
+
+def split_sql_statements(sql: str) -> List[str]:
+    """
+    Split a SQL script into statements.
+    
+    Drops -- comments and keeps quoted strings and $$-quoted function
+    bodies whole, so semicolons inside them do not end a statement.
+    """
+    statements = []
+    current = []
+    quote = None
+    i = 0
+    while i < len(sql):
+        if quote is None and sql.startswith('--', i):
+            end = sql.find('\n', i)
+            i = len(sql) if end == -1 else end
+            continue
+        if sql.startswith('$$', i) and quote in (None, '$$'):
+            quote = None if quote else '$$'
+            current.append('$$')
+            i += 2
+            continue
+        char = sql[i]
+        if char == "'" and quote in (None, "'"):
+            quote = None if quote else "'"
+        if char == ';' and quote is None:
+            statement = ''.join(current).strip()
+            if statement:
+                statements.append(statement)
+            current = []
+        else:
+            current.append(char)
+        i += 1
+    statement = ''.join(current).strip()
+    if statement:
+        statements.append(statement)
+    return statements
+
+
+def _count_upsert_rows(result: BulkInsertResult, row_count: int, returned: Iterable[Any]) -> None:
+    """Split an upsert's RETURNING (xmax = 0) rows into inserted, updated and unchanged counts"""
+    inserted = updated = 0
+    for row in returned:
+        flag = row['inserted'] if isinstance(row, dict) else row[0]
+        if flag:
+            inserted += 1
+        else:
+            updated += 1
+    result.rows_inserted += inserted
+    result.rows_updated += updated
+    result.rows_unchanged += row_count - inserted - updated
+
+
+# Errors that mean "this batch was too big", as opposed to bad data
+BATCH_SIZE_ERRORS = (pg_errors.QueryCanceled, pg_errors.OutOfMemory, pg_errors.ProgramLimitExceeded, MemoryError)
+
+
+def _update_set(columns: Sequence[str]) -> str:
+    """SET clause that overwrites the given columns from EXCLUDED"""
+    return ',\n            '.join(f"{column} = EXCLUDED.{column}" for column in columns)
+
+
+def _conflict_update(table: str, conflict_columns: Sequence[str], update_columns: Sequence[str]) -> str:
+    """
+    ON CONFLICT clause of an upsert, returning whether each written row was inserted.
+    
+    With a row_hash column the update only happens when the hash differs, so
+    unchanged rows are neither rewritten nor returned.
+    """
+    clause = f"""
+        ON CONFLICT ({', '.join(conflict_columns)})
+        DO UPDATE SET
+            {_update_set(update_columns)}"""
+    if 'row_hash' in update_columns:
+        clause += f"""
+        WHERE {table}.row_hash IS DISTINCT FROM EXCLUDED.row_hash"""
+    return clause + """
+        RETURNING (xmax = 0) AS inserted
+        """
+
+
+def _copy_text_value(value: Any) -> str:
+    """Encode one value for COPY's text format"""
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return (str(value).replace('\\', '\\\\').replace('\t', '\\t')
+            .replace('\n', '\\n').replace('\r', '\\r'))
+
+
+class CopyRowStream(io.TextIOBase):
+    """
+    File-like view of rows in COPY text format.
+    
+    copy_expert pulls from read() in chunks, so rows are encoded as the
+    server consumes them rather than building the whole payload first.
+    """
+    
+    def __init__(self, rows: Iterable[Sequence[Any]]):
+        self._lines: Iterator[str] = (
+            '\t'.join(_copy_text_value(value) for value in row) + '\n' for row in rows
+        )
+        self._buffer = ''
+    
+    def readable(self) -> bool:
+        return True
+    
+    def read(self, size: Optional[int] = -1) -> str:
+        if size is None or size < 0:
+            data, self._buffer = self._buffer + ''.join(self._lines), ''
+            return data
+        while len(self._buffer) < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            self._buffer += line
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+class _SharedConnection:
+    """Connection handed out inside DatabaseManager.transaction(); commit waits for the block"""
+
+    def __init__(self, conn: connection):
+        self._conn = conn
+
+    def commit(self) -> None:
+        pass
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
+
+
 class DatabaseManager:
     """Handles all database operations for QB data with connection pooling"""
     
-    def __init__(self, connection_string: Optional[str] = None):
+    def __init__(self, connection_string: Optional[str] = None, monitor: Optional[Any] = None):
+        """
+        Initialize the database manager.
+
+        Args:
+            connection_string: Database URL, DATABASE_URL by default
+            monitor: PerformanceMonitor receiving connection pool metrics
+        """
         self.connection_string = connection_string or config.get_database_url()
-        self.pool: Optional[SimpleConnectionPool] = None
+        self.monitor = monitor
+        self.pool: Optional[ThreadSafeConnectionPool] = None
         self.logger = logging.getLogger(__name__)
+        # One sizer per table, so the batch size learned on this link carries over between calls
+        self._batch_sizers: Dict[str, AdaptiveBatchSizer] = {}
+        self._batch_sizers_lock = threading.Lock()
+        # Per thread: the connection of an open transaction() block and the last insert result
+        self._local = threading.local()
+        # Partitioning state per table, looked up once: is it partitioned, which seasons exist
+        self._partitioned: Dict[str, bool] = {}
+        self._partitions: Dict[str, set] = {}
+        # Set when a load changed rows the materialized summaries have not seen yet
+        self.summaries_stale = False
         self._initialize_pool()
         
+    @property
+    def last_insert_result(self) -> Optional[BulkInsertResult]:
+        """Result of the last bulk insert made on the calling thread"""
+        return getattr(self._local, 'last_insert_result', None)
+    
+    @last_insert_result.setter
+    def last_insert_result(self, result: Optional[BulkInsertResult]) -> None:
+        self._local.last_insert_result = result
+        
     def _initialize_pool(self) -> None:
         """Initialize connection pool"""
         try:
-            self.pool = SimpleConnectionPool(
+            self.pool = ThreadSafeConnectionPool(
                 minconn=1,
                 maxconn=config.database.max_connections,
                 dsn=self.connection_string,
+                checkout_timeout=config.database.connection_timeout,
+                max_waiters=config.database.pool_max_waiters,
+                max_age=config.database.pool_max_age,
+                health_check_idle=config.database.pool_health_check_idle,
+                monitor=self.monitor,
                 cursor_factory=RealDictCursor
             )
             logger.info(f"Database connection pool initialized with {config.database.max_connections} connections")
@@ -46,7 +241,13 @@ class DatabaseManager:
     @contextmanager
     def get_connection(self) -> Any:
         """Context manager for database connections"""
+        shared = getattr(self._local, 'conn', None)
+        if shared is not None:
+            # Inside transaction(): reuse its connection and leave commit/rollback to it
+            yield shared
+            return
         conn = None
+        broken = False
         try:
             if self.pool is None:
                 raise RuntimeError("Database pool not initialized")
@@ -55,12 +256,42 @@ class DatabaseManager:
             yield conn
         except Exception as e:
             if conn:
-                conn.rollback()
+                # A dropped connection must not go back into the pool
+                broken = isinstance(e, (psycopg2.OperationalError, psycopg2.InterfaceError)) or bool(conn.closed)
+                if not broken:
+                    try:
+                        conn.rollback()
+                    except psycopg2.Error:
+                        broken = True
             logger.error(f"Database connection error: {e}")
             raise
         finally:
             if conn and self.pool:
-                self.pool.putconn(conn)
+                self.pool.putconn(conn, close=broken)
+    
+    @contextmanager
+    def transaction(self) -> Any:
+        """
+        Run several writes in one transaction.
+
+        Insert methods called inside the block on this thread share its
+        connection; their commits are deferred to the end of the block and
+        an exception rolls all of them back. Nested blocks join the outer one.
+        """
+        if getattr(self._local, 'conn', None) is not None:
+            yield self._local.conn
+            return
+        with self.get_connection() as conn:
+            self._local.conn = _SharedConnection(conn)
+            try:
+                yield self._local.conn
+            finally:
+                self._local.conn = None
+            conn.commit()
+    
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Get connection pool size, saturation and checkout timings"""
+        return self.pool.stats() if self.pool else {}
     
     @contextmanager
     def get_cursor(self, conn: connection) -> Any:
@@ -136,34 +367,223 @@ class DatabaseManager:
             logger.error(f"Execute error: {e}")
             raise
     
+    def stream_rows(self, table: str, season: Optional[int] = None, columns: Optional[Sequence[str]] = None,
+                    itersize: Optional[int] = None) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Read a table in batches through a named (server-side) cursor.
+        
+        The result set stays on the server and each FETCH brings back one
+        batch, so memory holds a single batch however large the table is.
+        The connection stays checked out until the generator is exhausted
+        or closed.
+        
+        Args:
+            table: One of STREAM_TABLES
+            season: Only this season, every season if omitted
+            columns: Columns to read, all of them by default
+            itersize: Rows per batch, bulk_operations.stream_itersize by default
+            
+        Yields:
+            Lists of up to itersize row dicts, in key order
+        """
+        sql, params = stream_query(table, season, columns)
+        itersize = itersize or config.bulk_operations.stream_itersize
+        
+        with self.get_connection() as conn:
+            cur = conn.cursor(name=f"stream_{table}_{uuid.uuid4().hex[:12]}")
+            try:
+                cur.itersize = itersize
+                cur.execute(sql, params)
+                while True:
+                    rows = cur.fetchmany(itersize)
+                    if not rows:
+                        break
+                    yield [dict(row) for row in rows]
+            finally:
+                cur.close()
+    
+    def stream_qb_stats(self, season: Optional[int] = None, itersize: Optional[int] = None,
+                        columns: Optional[Sequence[str]] = None) -> Iterator[List[Dict[str, Any]]]:
+        """Stream qb_passing_stats in batches, see stream_rows"""
+        return self.stream_rows('qb_passing_stats', season, columns, itersize)
+    
+    def stream_splits(self, season: Optional[int] = None, itersize: Optional[int] = None,
+                      columns: Optional[Sequence[str]] = None) -> Iterator[List[Dict[str, Any]]]:
+        """Stream qb_splits in batches, see stream_rows"""
+        return self.stream_rows('qb_splits', season, columns, itersize)
+    
+    def stream_advanced_stats(self, season: Optional[int] = None, itersize: Optional[int] = None,
+                              columns: Optional[Sequence[str]] = None) -> Iterator[List[Dict[str, Any]]]:
+        """Stream qb_splits_advanced (where insert_qb_advanced_stats writes) in batches, see stream_rows"""
+        return self.stream_rows('qb_splits_advanced', season, columns, itersize)
+    
+    def _use_copy(self, row_count: int, method: Optional[str]) -> bool:
+        """Pick COPY + staging merge or adaptive execute_values for an upsert of row_count rows"""
+        if method not in (None, 'batch', 'copy'):
+            raise ValueError(f"Unknown insert method: {method}")
+        if method is not None:
+            return method == 'copy'
+        threshold = config.bulk_operations.copy_threshold
+        return threshold > 0 and row_count >= threshold
+    
+    def _copy_merge(self, table: str, columns: Sequence[str], conflict_columns: Sequence[str],
+                    update_columns: Sequence[str], values: List[Tuple[Any, ...]]) -> int:
+        """
+        Upsert rows by streaming them into a temp staging table and merging once.
+        
+        COPY FROM STDIN loads the staging table in one round trip; a single
+        INSERT ... SELECT ... ON CONFLICT then merges it into the target. When
+        a key repeats within the batch the last row wins, as in the batch path.
+        
+        Args:
+            table: Target table
+            columns: Columns in the order of each values tuple
+            conflict_columns: Unique key of the target table
+            update_columns: Columns overwritten on conflict
+            values: Row tuples
+            
+        Returns:
+            Number of rows merged
+        """
+        result = BulkInsertResult(table_name=table, operation_type='copy_merge')
+        self.last_insert_result = result
+        self._ensure_partitions_for_rows(table, columns, values)
+        if config.bulk_operations.skip_unchanged_rows:
+            columns, values = with_row_hash(columns, values)
+            update_columns = tuple(update_columns) + ('row_hash',)
+        
+        stage = f"{table}_stage"
+        column_list = ', '.join(columns)
+        key_list = ', '.join(conflict_columns)
+        merge_query = f"""
+        INSERT INTO {table} ({column_list})
+        SELECT DISTINCT ON ({key_list}) {column_list}
+        FROM {stage}
+        ORDER BY {key_list}, stage_row DESC{_conflict_update(table, conflict_columns, update_columns)}"""
+        
+        with self.get_connection() as conn:
+            with self.get_cursor(conn) as cur:
+                cur.execute(
+                    f"CREATE TEMP TABLE {stage} ON COMMIT DROP AS "
+                    f"SELECT {column_list} FROM {table} WITH NO DATA"
+                )
+                cur.execute(f"ALTER TABLE {stage} ADD COLUMN stage_row BIGSERIAL")
+                cur.copy_expert(f"COPY {stage} ({column_list}) FROM STDIN", CopyRowStream(values))
+                cur.execute(merge_query)
+                key_positions = [columns.index(column) for column in conflict_columns]
+                distinct_rows = len({tuple(row[i] for i in key_positions) for row in values})
+                _count_upsert_rows(result, distinct_rows, cur.fetchall())
+                # ON COMMIT DROP waits for the end of the transaction; another COPY-sized
+                # insert into this table inside transaction() would collide with it
+                cur.execute(f"DROP TABLE {stage}")
+                conn.commit()
+        
+        result.add_success(len(values))
+        result.mark_complete()
+        if result.rows_inserted or result.rows_updated:
+            self.summaries_stale = True
+        logger.info(f"Merged {len(values)} rows into {table} via COPY: {result.rows_inserted} inserted, "
+                    f"{result.rows_updated} updated, {result.rows_unchanged} unchanged")
+        return len(values)
+    
+    def _adaptive_upsert(self, table: str, columns: Sequence[str], conflict_columns: Sequence[str],
+                         update_columns: Sequence[str], values: List[Tuple[Any, ...]]) -> BulkInsertResult:
+        """
+        Upsert rows with multi-row execute_values statements of adaptive size.
+        
+        Each batch runs under a savepoint. The table's AdaptiveBatchSizer grows
+        the next batch while batches finish within bulk_operations.target_batch_seconds
+        and shrinks it when they run over; a statement timeout or memory error
+        rolls back just that batch and retries it at half the size.
+        
+        Args:
+            table: Target table
+            columns: Columns in the order of each values tuple
+            conflict_columns: Unique key of the target table
+            update_columns: Columns overwritten on conflict
+            values: Row tuples
+            
+        Returns:
+            BulkInsertResult with the size and duration of every batch
+            (also kept as last_insert_result)
+        """
+        result = BulkInsertResult(table_name=table, operation_type='upsert')
+        self.last_insert_result = result
+        self._ensure_partitions_for_rows(table, columns, values)
+        
+        # One multi-row statement cannot touch the same key twice; keep the last row per key
+        rows = last_row_per_key(columns, conflict_columns, values)
+        if config.bulk_operations.skip_unchanged_rows:
+            columns, rows = with_row_hash(columns, rows)
+            update_columns = tuple(update_columns) + ('row_hash',)
+        
+        with self._batch_sizers_lock:
+            sizer = self._batch_sizers.get(table)
+            if sizer is None:
+                sizer = AdaptiveBatchSizer.from_config(config.bulk_operations, len(rows))
+                self._batch_sizers[table] = sizer
+        
+        insert_query = f"""
+        INSERT INTO {table} ({', '.join(columns)}) VALUES %s{_conflict_update(table, conflict_columns, update_columns)}"""
+        
+        with self.get_connection() as conn:
+            with self.get_cursor(conn) as cur:
+                position = 0
+                while position < len(rows):
+                    batch = rows[position:position + sizer.size]
+                    cur.execute("SAVEPOINT adaptive_batch")
+                    started = time.perf_counter()
+                    try:
+                        returned = execute_values(cur, insert_query, batch, page_size=len(batch), fetch=True)
+                    except BATCH_SIZE_ERRORS as e:
+                        cur.execute("ROLLBACK TO SAVEPOINT adaptive_batch")
+                        if not sizer.shrink():
+                            raise
+                        result.add_warning(f"Batch of {len(batch)} rows failed ({e}); retrying at {sizer.size}")
+                        continue
+                    elapsed = time.perf_counter() - started
+                    cur.execute("RELEASE SAVEPOINT adaptive_batch")
+                    result.record_batch(len(batch), elapsed)
+                    _count_upsert_rows(result, len(batch), returned or [])
+                    sizer.record(len(batch), elapsed)
+                    position += len(batch)
+                conn.commit()
+        
+        result.mark_complete()
+        if result.rows_inserted or result.rows_updated:
+            self.summaries_stale = True
+        logger.debug(f"{table} upsert batches: {result.batch_sizes}")
+        logger.info(f"Upserted {len(rows)} rows into {table}: {result.rows_inserted} inserted, "
+                    f"{result.rows_updated} updated, {result.rows_unchanged} unchanged")
+        return result
+    
     def create_tables(self) -> None:
         """Create all necessary tables with optimized schema"""
         logger.info("Creating database tables...")
         
         # Read and execute schema file
-        schema_file = "sql/schema.sql"
+        schema_file = SCHEMA_FILE
         try:
             with open(schema_file, 'r') as f:
                 schema_sql = f.read()
             
             with self.get_connection() as conn:
                 with self.get_cursor(conn) as cur:
-                    # Split the schema into individual statements and execute them
-                    statements = schema_sql.split(';')
-                    
-                    for statement in statements:
-                        statement = statement.strip()
-                        if statement and not statement.startswith('--'):
-                            try:
-                                cur.execute(statement)
-                                logger.debug(f"Executed: {statement[:50]}...")
-                            except Exception as e:
-                                # If it's a "already exists" error, that's fine
-                                if "already exists" in str(e).lower():
-                                    logger.debug(f"Object already exists: {statement[:50]}...")
-                                else:
-                                    logger.warning(f"Error executing statement: {e}")
-                                    # Continue with other statements
+                    for statement in split_sql_statements(schema_sql):
+                        # A failed statement must not abort the statements after it
+                        cur.execute("SAVEPOINT schema_statement")
+                        try:
+                            cur.execute(statement)
+                            cur.execute("RELEASE SAVEPOINT schema_statement")
+                            logger.debug(f"Executed: {statement[:50]}...")
+                        except Exception as e:
+                            cur.execute("ROLLBACK TO SAVEPOINT schema_statement")
+                            # If it's a "already exists" error, that's fine
+                            if "already exists" in str(e).lower():
+                                logger.debug(f"Object already exists: {statement[:50]}...")
+                            else:
+                                logger.warning(f"Error executing statement: {e}")
+                                # Continue with other statements
                     
                     conn.commit()
             
@@ -176,6 +596,258 @@ class DatabaseManager:
             logger.error(f"Error creating tables: {e}")
             raise
     
+    def _is_partitioned(self, table: str) -> bool:
+        """Whether table is declaratively partitioned (tables from before partitioning are not)"""
+        if table not in self._partitioned:
+            rows = self.query(
+                "SELECT 1 FROM pg_partitioned_table pt JOIN pg_class c ON c.oid = pt.partrelid "
+                "WHERE c.relname = %s", (table,)
+            )
+            self._partitioned[table] = bool(rows)
+        return self._partitioned[table]
+    
+    def _create_partitions(self, cur: Any, table: str, seasons: Iterable[int]) -> None:
+        for season in sorted(seasons):
+            cur.execute(
+                f"CREATE TABLE IF NOT EXISTS {season_partition(table, season)} "
+                f"PARTITION OF {table} FOR VALUES FROM ({int(season)}) TO ({int(season) + 1})"
+            )
+    
+    def ensure_season_partitions(self, table: str, seasons: Iterable[int]) -> List[int]:
+        """
+        Create the partitions rows for the given seasons will land in.
+        
+        Does nothing for tables that are not partitioned. Seasons already
+        seen by this manager are skipped without a round trip.
+        
+        Args:
+            table: Partitioned table
+            seasons: Seasons about to be written
+            
+        Returns:
+            Seasons whose partitions were checked or created
+        """
+        if not self._is_partitioned(table):
+            return []
+        known = self._partitions.setdefault(table, set())
+        missing = sorted({int(season) for season in seasons} - known)
+        if missing:
+            with self.get_connection() as conn:
+                with self.get_cursor(conn) as cur:
+                    self._create_partitions(cur, table, missing)
+                    conn.commit()
+            known.update(missing)
+            logger.info(f"Ensured {table} partitions for seasons {missing}")
+        return missing
+    
+    def _ensure_partitions_for_rows(self, table: str, columns: Sequence[str], values: List[Tuple[Any, ...]]) -> None:
+        if table in SPLITS_TABLES and values:
+            position = list(columns).index('season')
+            self.ensure_season_partitions(table, {row[position] for row in values})
+    
+    def clear_season(self, season: int, tables: Sequence[str] = SPLITS_TABLES + ('qb_passing_stats',)) -> Dict[str, int]:
+        """
+        Remove one season's rows, e.g. before reloading it.
+        
+        Partitioned tables truncate the season's partition; other tables
+        fall back to DELETE ... WHERE season. Everything commits together.
+        
+        Args:
+            season: Season to clear
+            tables: Tables to clear, in order
+            
+        Returns:
+            Rows removed per table
+        """
+        partitioned = {table: self._is_partitioned(table) for table in tables}
+        removed = {}
+        with self.get_connection() as conn:
+            with self.get_cursor(conn) as cur:
+                for table in tables:
+                    partition = season_partition(table, season)
+                    if partitioned[table]:
+                        cur.execute("SELECT to_regclass(%s) IS NOT NULL AS present", (partition,))
+                        if not cur.fetchone()['present']:
+                            removed[table] = 0
+                            continue
+                        cur.execute(f"SELECT COUNT(*) AS count FROM {partition}")
+                        removed[table] = cur.fetchone()['count']
+                        cur.execute(f"TRUNCATE {partition}")
+                    else:
+                        cur.execute(f"DELETE FROM {table} WHERE season = %s", (season,))
+                        removed[table] = cur.rowcount
+                conn.commit()
+        self.summaries_stale = True
+        logger.info(f"Cleared season {season}: {removed}")
+        return removed
+    
+    def migrate_to_partitioned(self, table: str) -> int:
+        """
+        Move a splits table created before partitioning into the partitioned layout.
+        
+        In one transaction: the old table, its indexes and id sequence are
+        renamed out of the way, the table and everything schema.sql defines on
+        it (indexes, trigger, views) are created again, one partition per
+        season present is created, the rows are copied over (ids kept) and the
+        old table is dropped. Any failure rolls the whole move back.
+        
+        Args:
+            table: One of SPLITS_TABLES
+            
+        Returns:
+            Rows moved (0 when the table is already partitioned)
+        """
+        if table not in SPLITS_TABLES:
+            raise ValueError(f"{table} is not a season-partitioned table")
+        if self._is_partitioned(table):
+            logger.info(f"{table} is already partitioned")
+            return 0
+        
+        legacy = f"{table}_legacy"
+        table_pattern = re.compile(rf'\b{table}\b')
+        with open(SCHEMA_FILE, 'r') as f:
+            statements = [statement for statement in split_sql_statements(f.read())
+                          if table_pattern.search(statement)]
+        
+        with self.get_connection() as conn:
+            with self.get_cursor(conn) as cur:
+                cur.execute(f"ALTER TABLE {table} RENAME TO {legacy}")
+                cur.execute("SELECT indexname FROM pg_indexes WHERE tablename = %s", (legacy,))
+                for row in cur.fetchall():
+                    cur.execute(f"ALTER INDEX {row['indexname']} RENAME TO {row['indexname'][:55]}_legacy")
+                cur.execute("SELECT pg_get_serial_sequence(%s, 'id') AS sequence", (legacy,))
+                sequence = cur.fetchone()['sequence']
+                if sequence:
+                    cur.execute(f"ALTER SEQUENCE {sequence} RENAME TO {legacy}_id_seq")
+                
+                for statement in statements:
+                    cur.execute(statement)
+                
+                cur.execute(f"SELECT DISTINCT season FROM {legacy}")
+                seasons = {row['season'] for row in cur.fetchall()}
+                self._create_partitions(cur, table, seasons)
+                
+                cur.execute(
+                    "SELECT column_name FROM information_schema.columns WHERE table_name = %s "
+                    "ORDER BY ordinal_position", (legacy,)
+                )
+                legacy_columns = [row['column_name'] for row in cur.fetchall()]
+                cur.execute(
+                    "SELECT column_name FROM information_schema.columns WHERE table_name = %s", (table,)
+                )
+                new_columns = {row['column_name'] for row in cur.fetchall()}
+                column_list = ', '.join(column for column in legacy_columns if column in new_columns)
+                cur.execute(f"INSERT INTO {table} ({column_list}) SELECT {column_list} FROM {legacy}")
+                moved = cur.rowcount
+                
+                cur.execute(
+                    f"SELECT setval(pg_get_serial_sequence(%s, 'id'), "
+                    f"COALESCE((SELECT MAX(id) FROM {table}), 0) + 1, false)", (table,)
+                )
+                cur.execute(f"DROP TABLE {legacy}")
+                conn.commit()
+        
+        self._partitioned[table] = True
+        self._partitions[table] = seasons
+        logger.info(f"Moved {moved} rows from {legacy} into partitioned {table} ({len(seasons)} seasons)")
+        return moved
+    
+    def _recategorize_sql(self, table: str) -> str:
+        """
+        CTEs matching 'other' rows of table to their mapped split type.
+        
+        Rows whose mapped (split, value) already exists for the player-season
+        are left alone, as moving them would break the unique key.
+        """
+        return f"""
+            WITH mapping(value, new_split) AS (VALUES %s),
+            targets AS (
+                SELECT t.id, t.season, m.new_split
+                FROM {table} t
+                JOIN mapping m ON m.value = t.value
+                WHERE t.split = 'other'
+                  AND NOT EXISTS (
+                      SELECT 1 FROM {table} d
+                      WHERE d.pfr_id = t.pfr_id AND d.season = t.season
+                        AND d.split = m.new_split AND d.value = t.value
+                  )
+            )
+        """
+    
+    def recategorize_splits(self, mapping: Dict[str, str], dry_run: bool = False,
+                            tables: Sequence[str] = SPLITS_TABLES) -> Dict[str, Dict[str, Any]]:
+        """
+        Move 'other' splits to their proper split type in one set-based pass.
+        
+        The mapping is sent as a VALUES list and joined against each table, so
+        every table takes one UPDATE ... FROM instead of one UPDATE per value.
+        All tables are updated in a single transaction. A dry run runs the same
+        join as a SELECT and changes nothing.
+        
+        Args:
+            mapping: Split value -> split type, e.g. {'Home': 'place'}
+            dry_run: Only project the changes
+            tables: Splits tables to update
+            
+        Returns:
+            Per table: 'changes' as {value: (split, count)} and 'distribution'
+            as {split: count}, projected for a dry run and actual afterwards
+        """
+        if not mapping:
+            return {table: {'changes': {}, 'distribution': {}} for table in tables}
+        values = list(mapping.items())
+        
+        def project(cur: Any, table: str) -> Tuple[Dict[str, Tuple[str, int]], Dict[str, int]]:
+            rows = execute_values(cur, self._recategorize_sql(table) + f"""
+                SELECT COALESCE(targets.new_split, t.split) AS split,
+                       CASE WHEN targets.id IS NOT NULL THEN t.value END AS moved_value,
+                       COUNT(*) AS count
+                FROM {table} t
+                LEFT JOIN targets ON targets.id = t.id AND targets.season = t.season
+                GROUP BY 1, 2
+            """, values, page_size=len(values), fetch=True)
+            changes, distribution = {}, {}
+            for row in rows:
+                distribution[row['split']] = distribution.get(row['split'], 0) + row['count']
+                if row['moved_value'] is not None:
+                    changes[row['moved_value']] = (row['split'], row['count'])
+            return changes, distribution
+        
+        results = {}
+        with self.get_connection() as conn:
+            with self.get_cursor(conn) as cur:
+                for table in tables:
+                    if dry_run:
+                        changes, distribution = project(cur, table)
+                    else:
+                        rows = execute_values(cur, self._recategorize_sql(table) + f""",
+                            updated AS (
+                                UPDATE {table} t
+                                SET split = targets.new_split, row_hash = NULL, updated_at = CURRENT_TIMESTAMP
+                                FROM targets
+                                WHERE t.id = targets.id AND t.season = targets.season
+                                RETURNING t.value, t.split
+                            )
+                            SELECT value, split, COUNT(*) AS count FROM updated GROUP BY value, split
+                        """, values, page_size=len(values), fetch=True)
+                        changes = {row['value']: (row['split'], row['count']) for row in rows}
+                        # Nothing is left to move, so the projection is the new distribution
+                        _, distribution = project(cur, table)
+                    results[table] = {
+                        'changes': changes,
+                        'distribution': dict(sorted(distribution.items(), key=lambda item: -item[1]))
+                    }
+                if dry_run:
+                    conn.rollback()
+                else:
+                    conn.commit()
+        
+        moved = {table: sum(count for _, count in result['changes'].values()) for table, result in results.items()}
+        if not dry_run and any(moved.values()):
+            self.summaries_stale = True
+        logger.info(f"{'Projected' if dry_run else 'Applied'} split recategorization, rows moved: {moved}")
+        return results
+    
     def insert_player(self, player: Player) -> int:
         """
         Insert a single player with conflict resolution
@@ -215,12 +887,14 @@ class DatabaseManager:
             logger.error(f"Error inserting player: {e}")
             raise
     
-    def insert_qb_basic_stats(self, stats_list: List[QBBasicStats]) -> int:
+    def insert_qb_basic_stats(self, stats_list: List[QBBasicStats], method: Optional[str] = None) -> int:
         """
         Insert QB basic stats with conflict resolution
         
         Args:
             stats_list: List of QBBasicStats objects to insert
+            method: 'batch' (adaptive execute_values), 'copy' (COPY + staging merge), or
+                None to use COPY at or above bulk_operations.copy_threshold rows
             
         Returns:
             Number of records inserted/updated
@@ -228,54 +902,6 @@ class DatabaseManager:
         if not stats_list:
             return 0
         
-        insert_query = """
-        INSERT INTO qb_passing_stats (
-            pfr_id, player_name, player_url, season, rk, age, team, pos, g, gs, qb_rec,
-            cmp, att, cmp_pct, yds, td, td_pct, int, int_pct, first_downs, succ_pct,
-            lng, y_a, ay_a, y_c, y_g, rate, qbr, sk, sk_yds, sk_pct, ny_a, any_a,
-            four_qc, gwd, awards, player_additional, scraped_at, updated_at
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        ON CONFLICT (pfr_id, season) 
-        DO UPDATE SET
-            player_name = EXCLUDED.player_name,
-            player_url = EXCLUDED.player_url,
-            rk = EXCLUDED.rk,
-            age = EXCLUDED.age,
-            team = EXCLUDED.team,
-            pos = EXCLUDED.pos,
-            g = EXCLUDED.g,
-            gs = EXCLUDED.gs,
-            qb_rec = EXCLUDED.qb_rec,
-            cmp = EXCLUDED.cmp,
-            att = EXCLUDED.att,
-            cmp_pct = EXCLUDED.cmp_pct,
-            yds = EXCLUDED.yds,
-            td = EXCLUDED.td,
-            td_pct = EXCLUDED.td_pct,
-            int = EXCLUDED.int,
-            int_pct = EXCLUDED.int_pct,
-            first_downs = EXCLUDED.first_downs,
-            succ_pct = EXCLUDED.succ_pct,
-            lng = EXCLUDED.lng,
-            y_a = EXCLUDED.y_a,
-            ay_a = EXCLUDED.ay_a,
-            y_c = EXCLUDED.y_c,
-            y_g = EXCLUDED.y_g,
-            rate = EXCLUDED.rate,
-            qbr = EXCLUDED.qbr,
-            sk = EXCLUDED.sk,
-            sk_yds = EXCLUDED.sk_yds,
-            sk_pct = EXCLUDED.sk_pct,
-            ny_a = EXCLUDED.ny_a,
-            any_a = EXCLUDED.any_a,
-            four_qc = EXCLUDED.four_qc,
-            gwd = EXCLUDED.gwd,
-            awards = EXCLUDED.awards,
-            player_additional = EXCLUDED.player_additional,
-            scraped_at = EXCLUDED.scraped_at,
-            updated_at = EXCLUDED.updated_at
-        """
-        
         try:
             # Convert dataclass objects to tuples
             values = []
@@ -290,10 +916,12 @@ class DatabaseManager:
                     stat.player_additional, stat.scraped_at, stat.updated_at
                 ))
             
-            with self.get_connection() as conn:
-                with self.get_cursor(conn) as cur:
-                    execute_batch(cur, insert_query, values, page_size=100)
-                    conn.commit()
+            if self._use_copy(len(values), method):
+                return self._copy_merge('qb_passing_stats', PASSING_STATS_COLUMNS, PASSING_STATS_KEY,
+                                        non_key_columns(PASSING_STATS_COLUMNS, PASSING_STATS_KEY), values)
+            
+            self._adaptive_upsert('qb_passing_stats', PASSING_STATS_COLUMNS, PASSING_STATS_KEY,
+                                  non_key_columns(PASSING_STATS_COLUMNS, PASSING_STATS_KEY), values)
             
             logger.info(f"Inserted/updated {len(stats_list)} QB basic stats records")
             return len(stats_list)
@@ -302,12 +930,13 @@ class DatabaseManager:
             logger.error(f"Error inserting QB basic stats: {e}")
             raise
     
-    def insert_qb_advanced_stats(self, stats_list: List[QBAdvancedStats]) -> int:
+    def insert_qb_advanced_stats(self, stats_list: List[QBAdvancedStats], method: Optional[str] = None) -> int:
         """
         Insert QB advanced stats with conflict resolution
         
         Args:
             stats_list: List of QBAdvancedStats objects to insert
+            method: 'batch', 'copy', or None to choose by row count
             
         Returns:
             Number of records inserted/updated
@@ -315,37 +944,6 @@ class DatabaseManager:
         if not stats_list:
             return 0
         
-        insert_query = """
-        INSERT INTO qb_splits_advanced (
-            pfr_id, player_name, season, split, value, cmp, att, inc, cmp_pct,
-            yds, td, first_downs, int, rate, sk, sk_yds, y_a, ay_a,
-            rush_att, rush_yds, rush_y_a, rush_td, rush_first_downs,
-            scraped_at, updated_at
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        ON CONFLICT (pfr_id, season, split, value) 
-        DO UPDATE SET
-            cmp = EXCLUDED.cmp,
-            att = EXCLUDED.att,
-            inc = EXCLUDED.inc,
-            cmp_pct = EXCLUDED.cmp_pct,
-            yds = EXCLUDED.yds,
-            td = EXCLUDED.td,
-            first_downs = EXCLUDED.first_downs,
-            int = EXCLUDED.int,
-            rate = EXCLUDED.rate,
-            sk = EXCLUDED.sk,
-            sk_yds = EXCLUDED.sk_yds,
-            y_a = EXCLUDED.y_a,
-            ay_a = EXCLUDED.ay_a,
-            rush_att = EXCLUDED.rush_att,
-            rush_yds = EXCLUDED.rush_yds,
-            rush_y_a = EXCLUDED.rush_y_a,
-            rush_td = EXCLUDED.rush_td,
-            rush_first_downs = EXCLUDED.rush_first_downs,
-            scraped_at = EXCLUDED.scraped_at,
-            updated_at = EXCLUDED.updated_at
-        """
-        
         try:
             # Convert dataclass objects to tuples
             values = []
@@ -358,10 +956,13 @@ class DatabaseManager:
                     stat.rush_td, stat.rush_first_downs, stat.scraped_at, stat.updated_at
                 ))
             
-            with self.get_connection() as conn:
-                with self.get_cursor(conn) as cur:
-                    execute_batch(cur, insert_query, values, page_size=100)
-                    conn.commit()
+            if self._use_copy(len(values), method):
+                return self._copy_merge('qb_splits_advanced', SPLITS_ADVANCED_COLUMNS, SPLITS_KEY,
+                                        non_key_columns(SPLITS_ADVANCED_COLUMNS, SPLITS_KEY + ('player_name',)),
+                                        values)
+            
+            self._adaptive_upsert('qb_splits_advanced', SPLITS_ADVANCED_COLUMNS, SPLITS_KEY,
+                                  non_key_columns(SPLITS_ADVANCED_COLUMNS, SPLITS_KEY + ('player_name',)), values)
             
             logger.info(f"Inserted/updated {len(stats_list)} QB advanced stats records")
             return len(stats_list)
@@ -370,55 +971,14 @@ class DatabaseManager:
             logger.error(f"Error inserting QB advanced stats: {e}")
             raise
     
-    def insert_qb_splits(self, splits_list: List[QBSplitStats]) -> int:
+    def insert_qb_splits(self, splits_list: List[QBSplitStats], method: Optional[str] = None) -> int:
         """
         Insert a list of QB splits (basic)
-        """
-        insert_query = """
-        INSERT INTO qb_splits (
-            pfr_id, player_name, season, split, value, g, w, l, t, cmp, att, inc, cmp_pct, yds, td, int, rate, sk, sk_yds, y_a, ay_a, a_g, y_g, rush_att, rush_yds, rush_y_a, rush_td, rush_a_g, rush_y_g, total_td, pts, fmb, fl, ff, fr, fr_yds, fr_td, scraped_at, updated_at
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-        )
-        ON CONFLICT (pfr_id, season, split, value)
-        DO UPDATE SET
-            player_name = EXCLUDED.player_name,
-            g = EXCLUDED.g,
-            w = EXCLUDED.w,
-            l = EXCLUDED.l,
-            t = EXCLUDED.t,
-            cmp = EXCLUDED.cmp,
-            att = EXCLUDED.att,
-            inc = EXCLUDED.inc,
-            cmp_pct = EXCLUDED.cmp_pct,
-            yds = EXCLUDED.yds,
-            td = EXCLUDED.td,
-            int = EXCLUDED.int,
-            rate = EXCLUDED.rate,
-            sk = EXCLUDED.sk,
-            sk_yds = EXCLUDED.sk_yds,
-            y_a = EXCLUDED.y_a,
-            ay_a = EXCLUDED.ay_a,
-            a_g = EXCLUDED.a_g,
-            y_g = EXCLUDED.y_g,
-            rush_att = EXCLUDED.rush_att,
-            rush_yds = EXCLUDED.rush_yds,
-            rush_y_a = EXCLUDED.rush_y_a,
-            rush_td = EXCLUDED.rush_td,
-            rush_a_g = EXCLUDED.rush_a_g,
-            rush_y_g = EXCLUDED.rush_y_g,
-            total_td = EXCLUDED.total_td,
-            pts = EXCLUDED.pts,
-            fmb = EXCLUDED.fmb,
-            fl = EXCLUDED.fl,
-            ff = EXCLUDED.ff,
-            fr = EXCLUDED.fr,
-            fr_yds = EXCLUDED.fr_yds,
-            fr_td = EXCLUDED.fr_td,
-            scraped_at = EXCLUDED.scraped_at,
-            updated_at = EXCLUDED.updated_at
-        """
         
+        Args:
+            splits_list: Splits to insert
+            method: 'batch', 'copy', or None to choose by row count
+        """
         values = []
         for split in splits_list:
             values.append((
@@ -433,10 +993,12 @@ class DatabaseManager:
             ))
         
         try:
-            with self.get_connection() as conn:
-                with self.get_cursor(conn) as cur:
-                    execute_batch(cur, insert_query, values, page_size=100)
-                    conn.commit()
+            if self._use_copy(len(values), method):
+                return self._copy_merge('qb_splits', SPLITS_COLUMNS, SPLITS_KEY,
+                                        non_key_columns(SPLITS_COLUMNS, SPLITS_KEY), values)
+            
+            self._adaptive_upsert('qb_splits', SPLITS_COLUMNS, SPLITS_KEY,
+                                  non_key_columns(SPLITS_COLUMNS, SPLITS_KEY), values)
             
             logger.info(f"Inserted/updated {len(splits_list)} QB splits records")
             return len(splits_list)
@@ -445,40 +1007,14 @@ class DatabaseManager:
             logger.error(f"Error inserting QB splits: {e}")
             raise
     
-    def insert_qb_splits_advanced(self, splits_list: List[QBSplitsType2]) -> int:
+    def insert_qb_splits_advanced(self, splits_list: List[QBSplitsType2], method: Optional[str] = None) -> int:
         """
         Insert a list of QB splits (advanced)
-        """
-        insert_query = """
-        INSERT INTO qb_splits_advanced (
-            pfr_id, player_name, season, split, value, cmp, att, inc, cmp_pct, yds, td, first_downs, int, rate, sk, sk_yds, y_a, ay_a, rush_att, rush_yds, rush_y_a, rush_td, rush_first_downs, scraped_at, updated_at
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-        )
-        ON CONFLICT (pfr_id, season, split, value)
-        DO UPDATE SET
-            cmp = EXCLUDED.cmp,
-            att = EXCLUDED.att,
-            inc = EXCLUDED.inc,
-            cmp_pct = EXCLUDED.cmp_pct,
-            yds = EXCLUDED.yds,
-            td = EXCLUDED.td,
-            first_downs = EXCLUDED.first_downs,
-            int = EXCLUDED.int,
-            rate = EXCLUDED.rate,
-            sk = EXCLUDED.sk,
-            sk_yds = EXCLUDED.sk_yds,
-            y_a = EXCLUDED.y_a,
-            ay_a = EXCLUDED.ay_a,
-            rush_att = EXCLUDED.rush_att,
-            rush_yds = EXCLUDED.rush_yds,
-            rush_y_a = EXCLUDED.rush_y_a,
-            rush_td = EXCLUDED.rush_td,
-            rush_first_downs = EXCLUDED.rush_first_downs,
-            scraped_at = EXCLUDED.scraped_at,
-            updated_at = EXCLUDED.updated_at
-        """
         
+        Args:
+            splits_list: Advanced splits to insert
+            method: 'batch', 'copy', or None to choose by row count
+        """
         values = []
         for split in splits_list:
             values.append((
@@ -490,10 +1026,13 @@ class DatabaseManager:
             ))
         
         try:
-            with self.get_connection() as conn:
-                with self.get_cursor(conn) as cur:
-                    execute_batch(cur, insert_query, values, page_size=100)
-                    conn.commit()
+            if self._use_copy(len(values), method):
+                return self._copy_merge('qb_splits_advanced', SPLITS_ADVANCED_COLUMNS, SPLITS_KEY,
+                                        non_key_columns(SPLITS_ADVANCED_COLUMNS, SPLITS_KEY + ('player_name',)),
+                                        values)
+            
+            self._adaptive_upsert('qb_splits_advanced', SPLITS_ADVANCED_COLUMNS, SPLITS_KEY,
+                                  non_key_columns(SPLITS_ADVANCED_COLUMNS, SPLITS_KEY + ('player_name',)), values)
             
             logger.info(f"Inserted/updated {len(splits_list)} QB splits advanced records")
             return len(splits_list)
@@ -502,6 +1041,35 @@ class DatabaseManager:
             logger.error(f"Error inserting QB splits advanced: {e}")
             raise
     
+    def record_splits_checks(self, season: int, pfr_ids: Iterable[str], checked_at: Optional[datetime] = None) -> int:
+        """
+        Record that players' splits were fetched and parsed, whether or not any row changed
+        
+        The row-hash upsert leaves unchanged splits alone, so their scraped_at
+        does not move; the crawl planner compares stats changes against this.
+        
+        Args:
+            season: Season of the splits
+            pfr_ids: Players whose splits were checked
+            checked_at: Check time, now by default (same clock as the models' timestamps)
+            
+        Returns:
+            Number of players recorded
+        """
+        checked_at = checked_at or datetime.now()
+        values = [(pfr_id, season, checked_at) for pfr_id in dict.fromkeys(pfr_ids)]
+        if not values:
+            return 0
+        
+        with self.get_connection() as conn:
+            with self.get_cursor(conn) as cur:
+                execute_values(cur, """
+                    INSERT INTO qb_splits_checks (pfr_id, season, checked_at) VALUES %s
+                    ON CONFLICT (pfr_id, season) DO UPDATE SET checked_at = EXCLUDED.checked_at
+                """, values)
+                conn.commit()
+        return len(values)
+    
     def insert_scraping_log(self, log: ScrapingLog) -> int:
         """
         Insert scraping log entry
@@ -517,8 +1085,8 @@ class DatabaseManager:
             session_id, season, start_time, end_time, total_requests,
             successful_requests, failed_requests, total_players, total_passing_stats,
             total_splits, total_splits_advanced, errors, warnings,
-            rate_limit_violations, processing_time_seconds, created_at
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            rate_limit_violations, processing_time_seconds, scope, created_at
+        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
         """
         
         try:
@@ -527,7 +1095,7 @@ class DatabaseManager:
                 log.total_requests, log.successful_requests, log.failed_requests,
                 log.total_players, log.total_passing_stats, log.total_splits,
                 log.total_splits_advanced, log.errors, log.warnings, log.rate_limit_violations,
-                log.processing_time_seconds, log.created_at
+                log.processing_time_seconds, log.scope, log.created_at
             )]
             
             with self.get_connection() as conn:
@@ -542,22 +1110,127 @@ class DatabaseManager:
             logger.error(f"Error inserting scraping log: {e}")
             raise
     
-    def get_database_stats(self) -> Dict[str, Any]:
+    def refresh_summaries(self, concurrently: bool = True) -> Dict[str, float]:
         """
-        Get high-level database statistics for monitoring
+        Refresh the materialized summaries and record when each was refreshed.
+        
+        A concurrent refresh lets readers keep using the previous contents
+        while it runs. A summary that has never been populated cannot be
+        refreshed concurrently and gets a plain refresh instead.
+        
+        Args:
+            concurrently: Refresh without blocking readers
+            
+        Returns:
+            Seconds each refresh took, per materialized view
         """
-        try:
+        durations = {}
+        for view in SUMMARY_VIEWS:
+            started = time.perf_counter()
             with self.get_connection() as conn:
                 with self.get_cursor(conn) as cur:
+                    try:
+                        cur.execute(f"REFRESH MATERIALIZED VIEW {'CONCURRENTLY ' if concurrently else ''}{view}")
+                    except pg_errors.FeatureNotSupported:
+                        conn.rollback()
+                        cur.execute(f"REFRESH MATERIALIZED VIEW {view}")
+                    durations[view] = time.perf_counter() - started
                     cur.execute("""
-                        SELECT * FROM database_stats
-                    """)
-                    stats = cur.fetchall()
-                    return {row['table_name']: row['record_count'] for row in stats}
+                        INSERT INTO summary_refreshes (view_name, refreshed_at, duration_seconds)
+                        VALUES (%s, CURRENT_TIMESTAMP, %s)
+                        ON CONFLICT (view_name) DO UPDATE SET
+                            refreshed_at = EXCLUDED.refreshed_at,
+                            duration_seconds = EXCLUDED.duration_seconds
+                    """, (view, round(durations[view], 3)))
+                    conn.commit()
+        
+        self.summaries_stale = False
+        logger.info(f"Refreshed summaries: {', '.join(f'{view} {d:.2f}s' for view, d in durations.items())}")
+        return durations
+    
+    def refresh_summaries_if_stale(self) -> bool:
+        """
+        Refresh the materialized summaries if a load changed rows since the last refresh.
+        
+        Meant to run once at the end of a bulk load. Failures are logged, not
+        raised: the load itself already succeeded.
+        
+        Returns:
+            True if the summaries were refreshed
+        """
+        if not self.summaries_stale or not config.bulk_operations.refresh_summaries:
+            return False
+        try:
+            self.refresh_summaries()
+            return True
+        except Exception as e:
+            logger.warning(f"Could not refresh materialized summaries: {e}")
+            return False
+    
+    def _query_summary(self, view: str, sql: str, params: Optional[tuple] = None) -> List[Dict[str, Any]]:
+        """Run sql against a materialized summary, falling back to its plain view if it does not exist yet"""
+        try:
+            return self.query(sql.format(view=view), params)
+        except pg_errors.UndefinedTable:
+            logger.warning(f"{view} missing, reading {SUMMARY_VIEWS[view]} (run create_tables to add it)")
+            return self.query(sql.format(view=SUMMARY_VIEWS[view]), params)
+    
+    def get_summary_freshness(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get when each materialized summary was last refreshed.
+        
+        Returns:
+            View name -> refreshed_at, age_seconds and duration_seconds; empty if unknown
+        """
+        try:
+            rows = self.query("""
+                SELECT view_name, refreshed_at, duration_seconds,
+                       EXTRACT(EPOCH FROM CURRENT_TIMESTAMP - refreshed_at) AS age_seconds
+                FROM summary_refreshes
+            """)
+        except Exception as e:
+            logger.error(f"Error getting summary freshness: {e}")
+            return {}
+        return {
+            row['view_name']: {
+                'refreshed_at': row['refreshed_at'],
+                'age_seconds': float(row['age_seconds']),
+                'duration_seconds': float(row['duration_seconds']) if row['duration_seconds'] is not None else None
+            }
+            for row in rows if row['view_name'] in SUMMARY_VIEWS
+        }
+    
+    def get_database_stats(self) -> Dict[str, Any]:
+        """
+        Get high-level database statistics for monitoring
+        
+        Read from the mv_database_stats materialized summary, so polling it
+        does not count every table; see get_summary_freshness for its age.
+        """
+        try:
+            stats = self._query_summary('mv_database_stats', "SELECT table_name, record_count FROM {view}")
+            return {row['table_name']: row['record_count'] for row in stats}
         except Exception as e:
             logger.error(f"Error getting database stats: {e}")
             return {}
     
+    def get_season_summary(self, season: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get per-player season summaries from the mv_qb_season_summary materialized summary
+        
+        Args:
+            season: Only this season, all seasons if omitted
+            
+        Returns:
+            Summary rows, newest season first and best passer rating first within it
+        """
+        where, params = ("WHERE season = %s ", (season,)) if season is not None else ("", None)
+        return self._query_summary(
+            'mv_qb_season_summary',
+            "SELECT * FROM {view} " + where + "ORDER BY season DESC, passer_rating DESC NULLS LAST",
+            params
+        )
+    
     def validate_data_integrity(self) -> Dict[str, List[str]]:
         """Validate data integrity across tables"""
         errors = {}
@@ -625,15 +1298,21 @@ class DatabaseManager:
                             SELECT COUNT(*) as count 
                             FROM information_schema.tables 
                             WHERE table_schema = 'public' 
-                            AND table_name IN ('players', 'qb_passing_stats', 'qb_splits', 'qb_splits_advanced', 'scraping_logs')
-                        """)
+                            AND table_name IN %s
+                        """, (CORE_TABLES,))
                         table_count = cur.fetchone()['count']
-                        health['tables_exist'] = table_count == 5
+                        health['tables_exist'] = table_count == len(CORE_TABLES)
                         
-                        # Check if data is accessible
+                        # Check if data is accessible (one row, not a count of the table)
                         if health['tables_exist']:
-                            cur.execute("SELECT COUNT(*) as count FROM players LIMIT 1")
+                            cur.execute("SELECT 1 FROM players LIMIT 1")
                             health['data_accessible'] = True
+                
+                freshness = self.get_summary_freshness()
+                health['summaries_refreshed'] = len(freshness) == len(SUMMARY_VIEWS)
+                health['summary_freshness'] = {
+                    view: f"refreshed {info['age_seconds']:.0f}s ago" for view, info in freshness.items()
+                }
                             
         except Exception as e:
             logger.error(f"Health check failed: {e}")
@@ -642,55 +1321,6 @@ class DatabaseManager:
 
     def populate_teams(self) -> int:
         """Populate the teams table with all 32 NFL teams."""
-        teams_data = [
-            # AFC East
-            ('BUF', 'Buffalo Bills', 'Buffalo', 'East', 'AFC'),
-            ('MIA', 'Miami Dolphins', 'Miami', 'East', 'AFC'),
-            ('NWE', 'New England Patriots', 'Foxborough', 'East', 'AFC'),
-            ('NYJ', 'New York Jets', 'East Rutherford', 'East', 'AFC'),
-            
-            # AFC North
-            ('BAL', 'Baltimore Ravens', 'Baltimore', 'North', 'AFC'),
-            ('CIN', 'Cincinnati Bengals', 'Cincinnati', 'North', 'AFC'),
-            ('CLE', 'Cleveland Browns', 'Cleveland', 'North', 'AFC'),
-            ('PIT', 'Pittsburgh Steelers', 'Pittsburgh', 'North', 'AFC'),
-            
-            # AFC South
-            ('HOU', 'Houston Texans', 'Houston', 'South', 'AFC'),
-            ('IND', 'Indianapolis Colts', 'Indianapolis', 'South', 'AFC'),
-            ('JAX', 'Jacksonville Jaguars', 'Jacksonville', 'South', 'AFC'),
-            ('TEN', 'Tennessee Titans', 'Nashville', 'South', 'AFC'),
-            
-            # AFC West
-            ('DEN', 'Denver Broncos', 'Denver', 'West', 'AFC'),
-            ('KAN', 'Kansas City Chiefs', 'Kansas City', 'West', 'AFC'),
-            ('LVR', 'Las Vegas Raiders', 'Las Vegas', 'West', 'AFC'),
-            ('LAC', 'Los Angeles Chargers', 'Inglewood', 'West', 'AFC'),
-            
-            # NFC East
-            ('DAL', 'Dallas Cowboys', 'Arlington', 'East', 'NFC'),
-            ('NYG', 'New York Giants', 'East Rutherford', 'East', 'NFC'),
-            ('PHI', 'Philadelphia Eagles', 'Philadelphia', 'East', 'NFC'),
-            ('WAS', 'Washington Commanders', 'Landover', 'East', 'NFC'),
-            
-            # NFC North
-            ('CHI', 'Chicago Bears', 'Chicago', 'North', 'NFC'),
-            ('DET', 'Detroit Lions', 'Detroit', 'North', 'NFC'),
-            ('GNB', 'Green Bay Packers', 'Green Bay', 'North', 'NFC'),
-            ('MIN', 'Minnesota Vikings', 'Minneapolis', 'North', 'NFC'),
-            
-            # NFC South
-            ('ATL', 'Atlanta Falcons', 'Atlanta', 'South', 'NFC'),
-            ('CAR', 'Carolina Panthers', 'Charlotte', 'South', 'NFC'),
-            ('NOR', 'New Orleans Saints', 'New Orleans', 'South', 'NFC'),
-            ('TAM', 'Tampa Bay Buccaneers', 'Tampa', 'South', 'NFC'),
-            
-            # NFC West
-            ('ARI', 'Arizona Cardinals', 'Glendale', 'West', 'NFC'),
-            ('LAR', 'Los Angeles Rams', 'Inglewood', 'West', 'NFC'),
-            ('SFO', 'San Francisco 49ers', 'Santa Clara', 'West', 'NFC'),
-            ('SEA', 'Seattle Seahawks', 'Seattle', 'West', 'NFC'),
-        ]
         
         insert_query = """
         INSERT INTO teams (team_code, team_name, city, division, conference, created_at)
@@ -704,7 +1334,7 @@ class DatabaseManager:
         """
         
         now = datetime.now()
-        values = [(team_code, team_name, city, division, conference, now) for team_code, team_name, city, division, conference in teams_data]
+        values = [(team_code, team_name, city, division, conference, now) for team_code, team_name, city, division, conference in NFL_TEAMS]
         
         try:
             with self.get_connection() as conn:
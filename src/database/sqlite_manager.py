@@ -0,0 +1,710 @@
+#!/usr/bin/env python3
+"""
+Embedded SQLite storage backend for NFL QB data
+Implements the DatabaseManager interface on a local SQLite file in WAL mode,
+for offline crawls, reprocessing, tests and benchmarks without a Postgres server
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from src.config.config import config
+from src.database.tables import (
+    PASSING_STATS_COLUMNS, SPLITS_COLUMNS, SPLITS_ADVANCED_COLUMNS, PASSING_STATS_KEY, SPLITS_KEY,
+    SPLITS_TABLES, CORE_TABLES, NFL_TEAMS, with_row_hash, non_key_columns, last_row_per_key,
+    record_rows, stream_query
+)
+from src.models.qb_models import (
+    QBBasicStats, QBAdvancedStats, QBSplitStats, QBSplitsType2, Player, ScrapingLog, BulkInsertResult
+)
+
+logger = logging.getLogger(__name__)
+
+SQLITE_SCHEMA_FILE = os.path.join(os.path.dirname(__file__), '..', '..', 'sql', 'schema_sqlite.sql')
+SQLITE_URL_PREFIX = 'sqlite://'
+
+
+def is_sqlite_url(connection_string: Optional[str]) -> bool:
+    """Whether a DATABASE_URL points at the embedded backend (sqlite:///path/to/file.db)"""
+    return bool(connection_string) and connection_string.startswith(SQLITE_URL_PREFIX)
+
+
+def sqlite_path(connection_string: str) -> str:
+    """Database file of a sqlite:// URL: sqlite:///data/qb.db is data/qb.db, sqlite:////tmp/qb.db is /tmp/qb.db"""
+    path = connection_string[len(SQLITE_URL_PREFIX):]
+    return path[1:] if path.startswith('/') else path
+
+
+def _adapt(value: Any) -> Any:
+    """Bind value the way the Postgres columns would store it"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (list, tuple, dict)):
+        return json.dumps(value, default=str)
+    return value
+
+
+def _placeholders(sql: str) -> str:
+    """Turn the %s parameter markers used across the code base into SQLite's ?"""
+    return sql.replace('%s', '?')
+
+
+class _DeferredCommit:
+    """Connection handed out inside SQLiteDatabaseManager.transaction(); commit waits for the block"""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+
+    def commit(self) -> None:
+        pass
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
+
+
+class SQLiteDatabaseManager:
+    """
+    DatabaseManager on an embedded SQLite database.
+
+    Same insert, query, streaming, stats and integrity methods with the same
+    table layout (sql/schema_sqlite.sql). Each thread gets its own connection;
+    WAL mode lets readers run while one writer commits. Postgres-only features
+    have local equivalents: upserts skip unchanged rows by row_hash, summaries
+    read the plain views, and clear_season deletes instead of truncating a partition.
+    """
+
+    def __init__(self, connection_string: Optional[str] = None, monitor: Optional[Any] = None):
+        """
+        Open the database file; a new file gets the teams, and tables added since an existing file was created are added to it.
+
+        Args:
+            connection_string: sqlite:///path URL, DATABASE_URL by default
+            monitor: Accepted for interface parity; SQLite has no pool to report
+        """
+        self.connection_string = connection_string or config.get_database_url()
+        if not is_sqlite_url(self.connection_string):
+            raise ValueError(f"Not a sqlite:// URL: {self.connection_string}")
+        self.path = sqlite_path(self.connection_string)
+        self.monitor = monitor
+        self.logger = logging.getLogger(__name__)
+        self.summaries_stale = False
+        # Per thread: the connection, an open transaction() block and the last insert result
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        is_new = not os.path.exists(self.path)
+        logger.info(f"SQLite database at {self.path}")
+        # The schema only has IF NOT EXISTS statements, so this adds tables new since the file was created
+        self.create_tables()
+        if is_new:
+            self.populate_teams()
+
+    @property
+    def last_insert_result(self) -> Optional[BulkInsertResult]:
+        """Result of the last bulk insert made on the calling thread"""
+        return getattr(self._local, 'last_insert_result', None)
+
+    @last_insert_result.setter
+    def last_insert_result(self, result: Optional[BulkInsertResult]) -> None:
+        self._local.last_insert_result = result
+
+    def _thread_connection(self) -> sqlite3.Connection:
+        """This thread's connection, opened on first use"""
+        conn = getattr(self._local, 'sqlite', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=config.database.connection_timeout,
+                                   check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.sqlite = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def get_connection(self) -> Any:
+        """Context manager for database connections"""
+        shared = getattr(self._local, 'conn', None)
+        if shared is not None:
+            # Inside transaction(): reuse its connection and leave commit/rollback to it
+            yield shared
+            return
+        conn = self._thread_connection()
+        try:
+            yield conn
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Database connection error: {e}")
+            raise
+
+    @contextmanager
+    def transaction(self) -> Any:
+        """
+        Run several writes in one transaction.
+
+        Insert methods called inside the block on this thread share its
+        connection; their commits are deferred to the end of the block and
+        an exception rolls all of them back. Nested blocks join the outer one.
+        """
+        if getattr(self._local, 'conn', None) is not None:
+            yield self._local.conn
+            return
+        with self.get_connection() as conn:
+            self._local.conn = _DeferredCommit(conn)
+            try:
+                yield self._local.conn
+            finally:
+                self._local.conn = None
+            conn.commit()
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Get the number of open per-thread connections"""
+        with self._connections_lock:
+            return {'backend': 'sqlite', 'connections': len(self._connections)}
+
+    @contextmanager
+    def get_cursor(self, conn: Any) -> Any:
+        """Context manager for database cursors"""
+        cur = conn.cursor()
+        try:
+            yield cur
+        except Exception as e:
+            logger.error(f"Database cursor error: {e}")
+            raise
+        finally:
+            cur.close()
+
+    def test_connection(self) -> bool:
+        """Test database connection"""
+        try:
+            return bool(self.query("SELECT 1 AS ok"))
+        except Exception as e:
+            logger.error(f"Database connection test failed: {e}")
+            return False
+
+    def query(self, sql: str, params: Optional[tuple] = None) -> List[Dict[str, Any]]:
+        """
+        Execute a query and return results
+
+        Args:
+            sql: SQL query to execute, with %s or ? parameter markers
+            params: Optional parameters for the query
+
+        Returns:
+            List of dictionaries with query results
+        """
+        try:
+            with self.get_connection() as conn:
+                with self.get_cursor(conn) as cur:
+                    cur.execute(_placeholders(sql), tuple(_adapt(p) for p in params or ()))
+                    return [dict(row) for row in cur.fetchall()]
+        except Exception as e:
+            logger.error(f"Query error: {e}")
+            raise
+
+    def execute(self, sql: str, params: Optional[tuple] = None) -> int:
+        """
+        Execute a statement (INSERT/UPDATE/DELETE) without returning results
+
+        Args:
+            sql: SQL statement to execute, with %s or ? parameter markers
+            params: Optional parameters for the statement
+
+        Returns:
+            Number of rows affected
+        """
+        try:
+            with self.get_connection() as conn:
+                with self.get_cursor(conn) as cur:
+                    cur.execute(_placeholders(sql), tuple(_adapt(p) for p in params or ()))
+                    conn.commit()
+                    return cur.rowcount
+        except Exception as e:
+            logger.error(f"Execute error: {e}")
+            raise
+
+    def stream_rows(self, table: str, season: Optional[int] = None, columns: Optional[Sequence[str]] = None,
+                    itersize: Optional[int] = None) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Read a table in batches; SQLite steps through the result as it is fetched.
+
+        Args:
+            table: One of STREAM_TABLES
+            season: Only this season, every season if omitted
+            columns: Columns to read, all of them by default
+            itersize: Rows per batch, bulk_operations.stream_itersize by default
+
+        Yields:
+            Lists of up to itersize row dicts, in key order
+        """
+        sql, params = stream_query(table, season, columns, placeholder='?')
+        itersize = itersize or config.bulk_operations.stream_itersize
+        with self.get_connection() as conn:
+            with self.get_cursor(conn) as cur:
+                cur.execute(sql, params or ())
+                while True:
+                    rows = cur.fetchmany(itersize)
+                    if not rows:
+                        break
+                    yield [dict(row) for row in rows]
+
+    def stream_qb_stats(self, season: Optional[int] = None, itersize: Optional[int] = None,
+                        columns: Optional[Sequence[str]] = None) -> Iterator[List[Dict[str, Any]]]:
+        """Stream qb_passing_stats in batches, see stream_rows"""
+        return self.stream_rows('qb_passing_stats', season, columns, itersize)
+
+    def stream_splits(self, season: Optional[int] = None, itersize: Optional[int] = None,
+                      columns: Optional[Sequence[str]] = None) -> Iterator[List[Dict[str, Any]]]:
+        """Stream qb_splits in batches, see stream_rows"""
+        return self.stream_rows('qb_splits', season, columns, itersize)
+
+    def stream_advanced_stats(self, season: Optional[int] = None, itersize: Optional[int] = None,
+                              columns: Optional[Sequence[str]] = None) -> Iterator[List[Dict[str, Any]]]:
+        """Stream qb_splits_advanced in batches, see stream_rows"""
+        return self.stream_rows('qb_splits_advanced', season, columns, itersize)
+
+    def _upsert(self, table: str, columns: Sequence[str], conflict_columns: Sequence[str],
+                update_columns: Sequence[str], values: List[Tuple[Any, ...]],
+                method: Optional[str] = None) -> BulkInsertResult:
+        """
+        Upsert rows as an UPDATE pass followed by an INSERT ... ON CONFLICT DO NOTHING pass.
+
+        Both passes are one executemany in one transaction. Their row counts
+        are the updated and inserted rows, so the result splits rows the way
+        the Postgres backend's RETURNING (xmax = 0) does. With row hashes on,
+        the UPDATE skips rows whose hash has not changed.
+
+        Args:
+            table: Target table
+            columns: Columns in the order of each values tuple
+            conflict_columns: Unique key of the target table
+            update_columns: Columns overwritten on conflict
+            values: Row tuples
+            method: Accepted for interface parity ('batch', 'copy' or None); both take this path
+
+        Returns:
+            BulkInsertResult (also kept as last_insert_result)
+        """
+        if method not in (None, 'batch', 'copy'):
+            raise ValueError(f"Unknown insert method: {method}")
+        result = BulkInsertResult(table_name=table, operation_type='upsert')
+        self.last_insert_result = result
+
+        rows = last_row_per_key(columns, conflict_columns, values)
+        hashed = config.bulk_operations.skip_unchanged_rows
+        if hashed:
+            columns, rows = with_row_hash(columns, rows)
+            update_columns = tuple(update_columns) + ('row_hash',)
+        rows = [tuple(_adapt(value) for value in row) for row in rows]
+
+        positions = {column: index for index, column in enumerate(columns)}
+        update_order = list(update_columns) + list(conflict_columns) + (['row_hash'] if hashed else [])
+        update_query = (
+            f"UPDATE {table} SET {', '.join(f'{column} = ?' for column in update_columns)} "
+            f"WHERE {' AND '.join(f'{column} = ?' for column in conflict_columns)}"
+            + (" AND row_hash IS NOT ?" if hashed else "")
+        )
+        insert_query = (
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)}) "
+            f"ON CONFLICT ({', '.join(conflict_columns)}) DO NOTHING"
+        )
+
+        started = time.perf_counter()
+        with self.get_connection() as conn:
+            with self.get_cursor(conn) as cur:
+                cur.executemany(update_query, [tuple(row[positions[c]] for c in update_order) for row in rows])
+                updated = max(cur.rowcount, 0)
+                cur.executemany(insert_query, rows)
+                inserted = max(cur.rowcount, 0)
+                conn.commit()
+
+        result.record_batch(len(rows), time.perf_counter() - started)
+        result.rows_inserted = inserted
+        result.rows_updated = updated
+        result.rows_unchanged = len(rows) - inserted - updated
+        result.mark_complete()
+        if inserted or updated:
+            self.summaries_stale = True
+        logger.info(f"Upserted {len(rows)} rows into {table}: {inserted} inserted, "
+                    f"{updated} updated, {result.rows_unchanged} unchanged")
+        return result
+
+    def create_tables(self) -> None:
+        """Create all tables, indexes and views from sql/schema_sqlite.sql"""
+        logger.info("Creating database tables...")
+        with open(SQLITE_SCHEMA_FILE, 'r') as f:
+            schema_sql = f.read()
+        with self.get_connection() as conn:
+            conn.executescript(schema_sql)
+            # Columns added since a file was created; SQLite has no ADD COLUMN IF NOT EXISTS
+            log_columns = {row['name'] for row in conn.execute("PRAGMA table_info(scraping_logs)")}
+            if 'scope' not in log_columns:
+                conn.execute("ALTER TABLE scraping_logs ADD COLUMN scope TEXT DEFAULT 'season'")
+            conn.commit()
+        logger.info("Database tables created successfully")
+
+    def ensure_season_partitions(self, table: str, seasons: Iterable[int]) -> List[int]:
+        """SQLite tables are not partitioned; nothing to create"""
+        return []
+
+    def clear_season(self, season: int, tables: Sequence[str] = SPLITS_TABLES + ('qb_passing_stats',)) -> Dict[str, int]:
+        """
+        Remove one season's rows, e.g. before reloading it.
+
+        Args:
+            season: Season to clear
+            tables: Tables to clear, in order
+
+        Returns:
+            Rows removed per table
+        """
+        removed = {}
+        with self.get_connection() as conn:
+            with self.get_cursor(conn) as cur:
+                for table in tables:
+                    cur.execute(f"DELETE FROM {table} WHERE season = ?", (season,))
+                    removed[table] = cur.rowcount
+                conn.commit()
+        self.summaries_stale = True
+        logger.info(f"Cleared season {season}: {removed}")
+        return removed
+
+    def migrate_to_partitioned(self, table: str) -> int:
+        """SQLite has no table partitioning; the splits tables stay as they are"""
+        raise NotImplementedError("Season partitioning needs Postgres; SQLite tables are not partitioned")
+
+    def recategorize_splits(self, mapping: Dict[str, str], dry_run: bool = False,
+                            tables: Sequence[str] = SPLITS_TABLES) -> Dict[str, Dict[str, Any]]:
+        """
+        Move 'other' splits to their proper split type, see DatabaseManager.recategorize_splits.
+
+        Rows whose mapped (split, value) already exists for the player-season
+        are left alone. All tables are updated in a single transaction.
+
+        Args:
+            mapping: Split value -> split type, e.g. {'Home': 'place'}
+            dry_run: Only project the changes
+            tables: Splits tables to update
+
+        Returns:
+            Per table: 'changes' as {value: (split, count)} and 'distribution'
+            as {split: count}, projected for a dry run and actual afterwards
+        """
+        if not mapping:
+            return {table: {'changes': {}, 'distribution': {}} for table in tables}
+        values = ', '.join('(?, ?)' for _ in mapping)
+        params = tuple(item for pair in mapping.items() for item in pair)
+
+        def targets(table: str) -> str:
+            return f"""
+                WITH mapping(value, new_split) AS (VALUES {values}),
+                targets AS (
+                    SELECT t.id, t.value, m.new_split
+                    FROM {table} t
+                    JOIN mapping m ON m.value = t.value
+                    WHERE t.split = 'other'
+                      AND NOT EXISTS (
+                          SELECT 1 FROM {table} d
+                          WHERE d.pfr_id = t.pfr_id AND d.season = t.season
+                            AND d.split = m.new_split AND d.value = t.value
+                      )
+                )
+            """
+
+        results = {}
+        with self.get_connection() as conn:
+            with self.get_cursor(conn) as cur:
+                for table in tables:
+                    cur.execute(targets(table) + """
+                        SELECT value, new_split, COUNT(*) AS count FROM targets GROUP BY value, new_split
+                    """, params)
+                    changes = {row['value']: (row['new_split'], row['count']) for row in cur.fetchall()}
+                    if not dry_run and changes:
+                        cur.execute(targets(table) + f"""
+                            UPDATE {table}
+                            SET split = (SELECT new_split FROM targets WHERE targets.id = {table}.id),
+                                row_hash = NULL, updated_at = ?
+                            WHERE id IN (SELECT id FROM targets)
+                        """, params + (_adapt(datetime.now()),))
+                    cur.execute(targets(table) + f"""
+                        SELECT COALESCE(targets.new_split, t.split) AS split, COUNT(*) AS count
+                        FROM {table} t
+                        LEFT JOIN targets ON targets.id = t.id
+                        GROUP BY 1
+                    """, params)
+                    distribution = {row['split']: row['count'] for row in cur.fetchall()}
+                    results[table] = {
+                        'changes': changes,
+                        'distribution': dict(sorted(distribution.items(), key=lambda item: -item[1]))
+                    }
+                if dry_run:
+                    conn.rollback()
+                else:
+                    conn.commit()
+
+        moved = {table: sum(count for _, count in result['changes'].values()) for table, result in results.items()}
+        if not dry_run and any(moved.values()):
+            self.summaries_stale = True
+        logger.info(f"{'Projected' if dry_run else 'Applied'} split recategorization, rows moved: {moved}")
+        return results
+
+    def insert_player(self, player: Player) -> int:
+        """
+        Insert a single player with conflict resolution
+
+        Args:
+            player: Player object to insert
+
+        Returns:
+            Number of records inserted/updated
+        """
+        self.execute("""
+            INSERT INTO players (pfr_id, player_name, pfr_url, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (pfr_id) DO UPDATE SET
+                player_name = excluded.player_name,
+                pfr_url = excluded.pfr_url,
+                updated_at = excluded.updated_at
+        """, (player.pfr_id, player.player_name, player.pfr_url, player.created_at, player.updated_at))
+        logger.info(f"Inserted/updated player: {player.player_name}")
+        return 1
+
+    def insert_qb_basic_stats(self, stats_list: List[QBBasicStats], method: Optional[str] = None) -> int:
+        """
+        Insert QB basic stats with conflict resolution
+
+        Args:
+            stats_list: List of QBBasicStats objects to insert
+            method: Accepted for interface parity
+
+        Returns:
+            Number of records inserted/updated
+        """
+        if not stats_list:
+            return 0
+        self._upsert('qb_passing_stats', PASSING_STATS_COLUMNS, PASSING_STATS_KEY,
+                     non_key_columns(PASSING_STATS_COLUMNS, PASSING_STATS_KEY),
+                     record_rows(PASSING_STATS_COLUMNS, stats_list), method)
+        return len(stats_list)
+
+    def insert_qb_advanced_stats(self, stats_list: List[QBAdvancedStats], method: Optional[str] = None) -> int:
+        """
+        Insert QB advanced stats (qb_splits_advanced) with conflict resolution
+
+        Args:
+            stats_list: List of QBAdvancedStats objects to insert
+            method: Accepted for interface parity
+
+        Returns:
+            Number of records inserted/updated
+        """
+        if not stats_list:
+            return 0
+        self._upsert('qb_splits_advanced', SPLITS_ADVANCED_COLUMNS, SPLITS_KEY,
+                     non_key_columns(SPLITS_ADVANCED_COLUMNS, SPLITS_KEY + ('player_name',)),
+                     record_rows(SPLITS_ADVANCED_COLUMNS, stats_list), method)
+        return len(stats_list)
+
+    def insert_qb_splits(self, splits_list: List[QBSplitStats], method: Optional[str] = None) -> int:
+        """
+        Insert a list of QB splits (basic)
+
+        Args:
+            splits_list: Splits to insert
+            method: Accepted for interface parity
+        """
+        if not splits_list:
+            return 0
+        self._upsert('qb_splits', SPLITS_COLUMNS, SPLITS_KEY, non_key_columns(SPLITS_COLUMNS, SPLITS_KEY),
+                     record_rows(SPLITS_COLUMNS, splits_list), method)
+        return len(splits_list)
+
+    def insert_qb_splits_advanced(self, splits_list: List[QBSplitsType2], method: Optional[str] = None) -> int:
+        """
+        Insert a list of QB splits (advanced)
+
+        Args:
+            splits_list: Advanced splits to insert
+            method: Accepted for interface parity
+        """
+        return self.insert_qb_advanced_stats(splits_list, method)
+
+    def record_splits_checks(self, season: int, pfr_ids: Iterable[str], checked_at: Optional[datetime] = None) -> int:
+        """
+        Record that players' splits were fetched and parsed, whether or not any row changed
+
+        Args:
+            season: Season of the splits
+            pfr_ids: Players whose splits were checked
+            checked_at: Check time, now by default (same clock as the models' timestamps)
+
+        Returns:
+            Number of players recorded
+        """
+        checked_at = _adapt(checked_at or datetime.now())
+        rows = [(pfr_id, season, checked_at) for pfr_id in dict.fromkeys(pfr_ids)]
+        if not rows:
+            return 0
+        with self.get_connection() as conn:
+            conn.executemany("""
+                INSERT INTO qb_splits_checks (pfr_id, season, checked_at) VALUES (?, ?, ?)
+                ON CONFLICT (pfr_id, season) DO UPDATE SET checked_at = excluded.checked_at
+            """, rows)
+            conn.commit()
+        return len(rows)
+
+    def insert_scraping_log(self, log: ScrapingLog) -> int:
+        """
+        Insert scraping log entry; errors and warnings are stored as JSON arrays
+
+        Args:
+            log: ScrapingLog object to insert
+
+        Returns:
+            Number of records inserted
+        """
+        self.execute("""
+            INSERT INTO scraping_logs (
+                session_id, season, start_time, end_time, total_requests,
+                successful_requests, failed_requests, total_players, total_passing_stats,
+                total_splits, total_splits_advanced, errors, warnings,
+                rate_limit_violations, processing_time_seconds, scope, created_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            log.session_id, log.season, log.start_time, log.end_time,
+            log.total_requests, log.successful_requests, log.failed_requests,
+            log.total_players, log.total_passing_stats, log.total_splits,
+            log.total_splits_advanced, log.errors, log.warnings, log.rate_limit_violations,
+            log.processing_time_seconds, log.scope, log.created_at
+        ))
+        logger.info(f"Inserted scraping log: {log.session_id}")
+        return 1
+
+    def refresh_summaries(self, concurrently: bool = True) -> Dict[str, float]:
+        """No materialized summaries here: the views are read directly"""
+        self.summaries_stale = False
+        return {}
+
+    def refresh_summaries_if_stale(self) -> bool:
+        """No materialized summaries here: nothing to refresh"""
+        self.summaries_stale = False
+        return False
+
+    def get_summary_freshness(self) -> Dict[str, Dict[str, Any]]:
+        """No materialized summaries here: the views are always current"""
+        return {}
+
+    def get_database_stats(self) -> Dict[str, Any]:
+        """Get record counts per table from the database_stats view"""
+        try:
+            return {row['table_name']: row['record_count']
+                    for row in self.query("SELECT table_name, record_count FROM database_stats")}
+        except Exception as e:
+            logger.error(f"Error getting database stats: {e}")
+            return {}
+
+    def get_season_summary(self, season: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get per-player season summaries from the qb_season_summary view
+
+        Args:
+            season: Only this season, all seasons if omitted
+
+        Returns:
+            Summary rows, newest season first and best passer rating first within it
+        """
+        where, params = ("WHERE season = ? ", (season,)) if season is not None else ("", None)
+        return self.query(
+            "SELECT * FROM qb_season_summary " + where + "ORDER BY season DESC, passer_rating DESC NULLS LAST",
+            params
+        )
+
+    def validate_data_integrity(self) -> Dict[str, List[str]]:
+        """Validate data integrity across tables"""
+        errors = {}
+        try:
+            for table in ('qb_passing_stats',) + SPLITS_TABLES:
+                orphaned = self.query(f"""
+                    SELECT COUNT(*) AS count
+                    FROM {table} t
+                    LEFT JOIN players p ON t.pfr_id = p.pfr_id
+                    WHERE p.pfr_id IS NULL
+                """)[0]['count']
+                if orphaned > 0:
+                    errors[table] = [f"{orphaned} records without matching player"]
+        except Exception as e:
+            logger.error(f"Error validating data integrity: {e}")
+            errors['validation_error'] = [str(e)]
+        return errors
+
+    def health_check(self) -> Dict[str, Any]:
+        """Perform health check on database"""
+        health = {
+            'connection_ok': False,
+            'tables_exist': False,
+            'data_accessible': False
+        }
+        try:
+            health['connection_ok'] = self.test_connection()
+            if health['connection_ok']:
+                placeholders = ', '.join('?' for _ in CORE_TABLES)
+                table_count = self.query(
+                    f"SELECT COUNT(*) AS count FROM sqlite_master WHERE type = 'table' AND name IN ({placeholders})",
+                    CORE_TABLES
+                )[0]['count']
+                health['tables_exist'] = table_count == len(CORE_TABLES)
+                if health['tables_exist']:
+                    self.query("SELECT 1 FROM players LIMIT 1")
+                    health['data_accessible'] = True
+        except Exception as e:
+            logger.error(f"Health check failed: {e}")
+        return health
+
+    def populate_teams(self) -> int:
+        """Populate the teams table with all 32 NFL teams."""
+        now = datetime.now().isoformat()
+        with self.get_connection() as conn:
+            conn.executemany("""
+                INSERT INTO teams (team_code, team_name, city, division, conference, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (team_code) DO UPDATE SET
+                    team_name = excluded.team_name,
+                    city = excluded.city,
+                    division = excluded.division,
+                    conference = excluded.conference
+            """, [team + (now,) for team in NFL_TEAMS])
+            conn.commit()
+        return len(NFL_TEAMS)
+
+    def close(self) -> None:
+        """Close every thread's connection"""
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+        logger.info("SQLite connections closed")
+
+    def __enter__(self) -> 'SQLiteDatabaseManager':
+        """Context manager entry"""
+        return self
+
+    def __exit__(self, exc_type: Optional[type], exc_val: Optional[Exception], exc_tb: Optional[Any]) -> None:
+        """Context manager exit"""
+        self.close()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Table layout shared by the storage backends
+Column lists, unique keys and row helpers that do not depend on a database driver
+"""
+
+import hashlib
+import json
+import re
+from operator import attrgetter
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+PASSING_STATS_COLUMNS = (
+    'pfr_id', 'player_name', 'player_url', 'season', 'rk', 'age', 'team', 'pos', 'g', 'gs', 'qb_rec',
+    'cmp', 'att', 'cmp_pct', 'yds', 'td', 'td_pct', 'int', 'int_pct', 'first_downs', 'succ_pct',
+    'lng', 'y_a', 'ay_a', 'y_c', 'y_g', 'rate', 'qbr', 'sk', 'sk_yds', 'sk_pct', 'ny_a', 'any_a',
+    'four_qc', 'gwd', 'awards', 'player_additional', 'scraped_at', 'updated_at'
+)
+SPLITS_COLUMNS = (
+    'pfr_id', 'player_name', 'season', 'split', 'value', 'g', 'w', 'l', 't', 'cmp', 'att', 'inc',
+    'cmp_pct', 'yds', 'td', 'int', 'rate', 'sk', 'sk_yds', 'y_a', 'ay_a', 'a_g', 'y_g', 'rush_att',
+    'rush_yds', 'rush_y_a', 'rush_td', 'rush_a_g', 'rush_y_g', 'total_td', 'pts', 'fmb', 'fl', 'ff',
+    'fr', 'fr_yds', 'fr_td', 'scraped_at', 'updated_at'
+)
+SPLITS_ADVANCED_COLUMNS = (
+    'pfr_id', 'player_name', 'season', 'split', 'value', 'cmp', 'att', 'inc', 'cmp_pct', 'yds', 'td',
+    'first_downs', 'int', 'rate', 'sk', 'sk_yds', 'y_a', 'ay_a', 'rush_att', 'rush_yds', 'rush_y_a',
+    'rush_td', 'rush_first_downs', 'scraped_at', 'updated_at'
+)
+PASSING_STATS_KEY = ('pfr_id', 'season')
+SPLITS_KEY = ('pfr_id', 'season', 'split', 'value')
+
+# Tables range partitioned by season in sql/schema.sql, one partition per season
+SPLITS_TABLES = ('qb_splits', 'qb_splits_advanced')
+
+# Tables the bulk read APIs stream, with the key each one is read in order of
+STREAM_TABLES = {
+    'qb_passing_stats': PASSING_STATS_KEY,
+    'qb_splits': SPLITS_KEY,
+    'qb_splits_advanced': SPLITS_KEY,
+}
+
+# Tables every backend's health check expects
+CORE_TABLES = ('players', 'qb_passing_stats', 'qb_splits', 'qb_splits_advanced', 'scraping_logs')
+
+# Columns left out of the row hash: they change on every scrape without the data changing
+ROW_HASH_EXCLUDED_COLUMNS = ('scraped_at', 'updated_at')
+
+# team_code, team_name, city, division, conference for the 32 NFL teams
+NFL_TEAMS = (
+    # AFC East
+    ('BUF', 'Buffalo Bills', 'Buffalo', 'East', 'AFC'),
+    ('MIA', 'Miami Dolphins', 'Miami', 'East', 'AFC'),
+    ('NWE', 'New England Patriots', 'Foxborough', 'East', 'AFC'),
+    ('NYJ', 'New York Jets', 'East Rutherford', 'East', 'AFC'),
+
+    # AFC North
+    ('BAL', 'Baltimore Ravens', 'Baltimore', 'North', 'AFC'),
+    ('CIN', 'Cincinnati Bengals', 'Cincinnati', 'North', 'AFC'),
+    ('CLE', 'Cleveland Browns', 'Cleveland', 'North', 'AFC'),
+    ('PIT', 'Pittsburgh Steelers', 'Pittsburgh', 'North', 'AFC'),
+
+    # AFC South
+    ('HOU', 'Houston Texans', 'Houston', 'South', 'AFC'),
+    ('IND', 'Indianapolis Colts', 'Indianapolis', 'South', 'AFC'),
+    ('JAX', 'Jacksonville Jaguars', 'Jacksonville', 'South', 'AFC'),
+    ('TEN', 'Tennessee Titans', 'Nashville', 'South', 'AFC'),
+
+    # AFC West
+    ('DEN', 'Denver Broncos', 'Denver', 'West', 'AFC'),
+    ('KAN', 'Kansas City Chiefs', 'Kansas City', 'West', 'AFC'),
+    ('LVR', 'Las Vegas Raiders', 'Las Vegas', 'West', 'AFC'),
+    ('LAC', 'Los Angeles Chargers', 'Inglewood', 'West', 'AFC'),
+
+    # NFC East
+    ('DAL', 'Dallas Cowboys', 'Arlington', 'East', 'NFC'),
+    ('NYG', 'New York Giants', 'East Rutherford', 'East', 'NFC'),
+    ('PHI', 'Philadelphia Eagles', 'Philadelphia', 'East', 'NFC'),
+    ('WAS', 'Washington Commanders', 'Landover', 'East', 'NFC'),
+
+    # NFC North
+    ('CHI', 'Chicago Bears', 'Chicago', 'North', 'NFC'),
+    ('DET', 'Detroit Lions', 'Detroit', 'North', 'NFC'),
+    ('GNB', 'Green Bay Packers', 'Green Bay', 'North', 'NFC'),
+    ('MIN', 'Minnesota Vikings', 'Minneapolis', 'North', 'NFC'),
+
+    # NFC South
+    ('ATL', 'Atlanta Falcons', 'Atlanta', 'South', 'NFC'),
+    ('CAR', 'Carolina Panthers', 'Charlotte', 'South', 'NFC'),
+    ('NOR', 'New Orleans Saints', 'New Orleans', 'South', 'NFC'),
+    ('TAM', 'Tampa Bay Buccaneers', 'Tampa', 'South', 'NFC'),
+
+    # NFC West
+    ('ARI', 'Arizona Cardinals', 'Glendale', 'West', 'NFC'),
+    ('LAR', 'Los Angeles Rams', 'Inglewood', 'West', 'NFC'),
+    ('SFO', 'San Francisco 49ers', 'Santa Clara', 'West', 'NFC'),
+    ('SEA', 'Seattle Seahawks', 'Seattle', 'West', 'NFC'),
+)
+
+
+def compute_row_hash(columns: Sequence[str], row: Sequence[Any]) -> str:
+    """
+    Content hash of one row, used to skip upserts that would change nothing.
+
+    Args:
+        columns: Column names in the order of row
+        row: Row values
+
+    Returns:
+        Hex digest over every column except ROW_HASH_EXCLUDED_COLUMNS
+    """
+    content = [[column, value] for column, value in zip(columns, row) if column not in ROW_HASH_EXCLUDED_COLUMNS]
+    payload = json.dumps(content, default=str, separators=(',', ':'))
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def with_row_hash(columns: Sequence[str], values: List[Tuple[Any, ...]]) -> Tuple[Tuple[str, ...], List[Tuple[Any, ...]]]:
+    """Append a row_hash column to the column list and every row"""
+    return tuple(columns) + ('row_hash',), [tuple(row) + (compute_row_hash(columns, row),) for row in values]
+
+
+def non_key_columns(columns: Sequence[str], exclude: Sequence[str]) -> Tuple[str, ...]:
+    """Columns an upsert overwrites: everything but the key (and any extra exclusions)"""
+    return tuple(column for column in columns if column not in exclude)
+
+
+def last_row_per_key(columns: Sequence[str], key: Sequence[str], values: Iterable[Tuple[Any, ...]]) -> List[Tuple[Any, ...]]:
+    """Drop rows whose key repeats later in values, so the last row per key wins"""
+    key_positions = [list(columns).index(column) for column in key]
+    return list({tuple(row[i] for i in key_positions): row for row in values}.values())
+
+
+def record_rows(columns: Sequence[str], records: Iterable[Any]) -> List[Tuple[Any, ...]]:
+    """Row tuples of the given model records, one value per column"""
+    getter = attrgetter(*columns)
+    return [getter(record) for record in records]
+
+
+def stream_query(table: str, season: Optional[int], columns: Optional[Sequence[str]],
+                 placeholder: str = '%s') -> Tuple[str, Optional[tuple]]:
+    """
+    SELECT behind the streaming reads: one table, optionally one season, in key order.
+
+    Args:
+        table: One of STREAM_TABLES
+        season: Only this season, every season if omitted
+        columns: Columns to read, all of them by default
+        placeholder: Parameter marker of the driver
+
+    Returns:
+        SQL and its parameters
+    """
+    if table not in STREAM_TABLES:
+        raise ValueError(f"Cannot stream table: {table}")
+    if columns and not all(re.fullmatch(r'[a-z_][a-z0-9_]*', column) for column in columns):
+        raise ValueError(f"Invalid column list: {columns}")
+    select = ', '.join(columns) if columns else '*'
+    where, params = (f"WHERE season = {placeholder} ", (season,)) if season is not None else ("", None)
+    return f"SELECT {select} FROM {table} {where}ORDER BY {', '.join(STREAM_TABLES[table])}", params
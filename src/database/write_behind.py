@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Write-behind writer for NFL QB Data Scraping System
+Buffers scraped records on a bounded queue and flushes them to the database
+from a background thread
+"""
+
+import logging
+import queue
+import threading
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from typing import Any, Callable, ContextManager, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WriteBehindStats:
+    """Counters for a write-behind writer"""
+    queued: int = 0
+    written: Dict[str, int] = field(default_factory=dict)
+    flushes: int = 0
+    failed_flushes: int = 0
+    failed_records: int = 0
+    flush_time: float = 0.0
+    max_queue_depth: int = 0
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def total_written(self) -> int:
+        return sum(self.written.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return {
+            'queued': self.queued,
+            'written': dict(self.written),
+            'total_written': self.total_written,
+            'flushes': self.flushes,
+            'failed_flushes': self.failed_flushes,
+            'failed_records': self.failed_records,
+            'flush_time': self.flush_time,
+            'max_queue_depth': self.max_queue_depth,
+            'errors': list(self.errors)
+        }
+
+
+class _FlushRequest:
+    """Queue marker asking the writer to flush everything queued before it"""
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+_STOP = object()
+
+
+class WriteBehindWriter:
+    """
+    Background writer fed by a bounded queue.
+
+    Producers put records as they are scraped; put blocks while the queue is
+    full, so memory stays bounded however large the backfill. The writer
+    thread flushes once flush_size records are buffered or the oldest
+    buffered record has waited flush_interval seconds. Each flush hands the
+    records to their handler grouped by type, in handler order (so players'
+    passing stats land before their splits), inside one transaction.
+
+    A failed flush is logged and counted, and the writer carries on with the
+    next one.
+    """
+
+    def __init__(self, handlers: Dict[type, Callable[[List[Any]], int]], flush_size: int = 500,
+                 flush_interval: float = 5.0, queue_size: int = 5000,
+                 transaction: Optional[Callable[[], ContextManager]] = None):
+        """
+        Initialize the writer.
+
+        Args:
+            handlers: Record type -> insert callable returning rows written, in flush order
+            flush_size: Buffered records that trigger a flush
+            flush_interval: Seconds the oldest buffered record may wait before a flush
+            queue_size: Records allowed on the queue before put blocks
+            transaction: Context manager factory wrapping each flush in one transaction
+        """
+        if flush_size < 1 or queue_size < 1 or flush_interval <= 0:
+            raise ValueError("flush_size and queue_size must be at least 1 and flush_interval positive")
+        self.handlers = dict(handlers)
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.transaction = transaction or nullcontext
+        self.stats = WriteBehindStats()
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    @classmethod
+    def from_config(cls, handlers: Dict[type, Callable[[List[Any]], int]], bulk_config: Any,
+                    transaction: Optional[Callable[[], ContextManager]] = None) -> 'WriteBehindWriter':
+        """Create a writer from BulkOperationConfig"""
+        return cls(
+            handlers,
+            flush_size=bulk_config.write_behind_flush_size,
+            flush_interval=bulk_config.write_behind_flush_seconds,
+            queue_size=bulk_config.write_behind_queue_size,
+            transaction=transaction
+        )
+
+    def start(self) -> 'WriteBehindWriter':
+        """Start the writer thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='write-behind', daemon=True)
+            self._thread.start()
+        return self
+
+    def put(self, record: Any) -> None:
+        """Queue one record, blocking while the queue is full"""
+        if self._closed:
+            raise RuntimeError("Write-behind writer is closed")
+        if not any(isinstance(record, record_type) for record_type in self.handlers):
+            raise TypeError(f"No write-behind handler for {type(record).__name__}")
+        self.start()
+        self._queue.put(record)
+        self.stats.queued += 1
+        self.stats.max_queue_depth = max(self.stats.max_queue_depth, self._queue.qsize())
+
+    def put_many(self, records: Iterable[Any]) -> None:
+        """Queue several records"""
+        for record in records:
+            self.put(record)
+
+    def flush(self) -> None:
+        """Block until everything queued so far has been flushed"""
+        if self._thread is None:
+            return
+        request = _FlushRequest()
+        self._queue.put(request)
+        request.done.wait()
+
+    def close(self) -> WriteBehindStats:
+        """Flush what is left, stop the writer thread and return its stats"""
+        if not self._closed:
+            self._closed = True
+            if self._thread is not None:
+                self._queue.put(_STOP)
+                self._thread.join()
+        return self.stats
+
+    def __enter__(self) -> 'WriteBehindWriter':
+        return self.start()
+
+    def __exit__(self, exc_type: Optional[type], exc_val: Optional[Exception], exc_tb: Optional[Any]) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        pending: List[Any] = []
+        deadline = 0.0
+        while True:
+            timeout = max(0.0, deadline - time.monotonic()) if pending else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self._flush(pending)
+                pending = []
+                continue
+
+            if item is _STOP:
+                self._flush(pending)
+                return
+            if isinstance(item, _FlushRequest):
+                self._flush(pending)
+                pending = []
+                item.done.set()
+                continue
+
+            if not pending:
+                deadline = time.monotonic() + self.flush_interval
+            pending.append(item)
+            if len(pending) >= self.flush_size:
+                self._flush(pending)
+                pending = []
+
+    def _flush(self, records: List[Any]) -> None:
+        if not records:
+            return
+        groups: Dict[type, List[Any]] = {record_type: [] for record_type in self.handlers}
+        for record in records:
+            for record_type in groups:
+                if isinstance(record, record_type):
+                    groups[record_type].append(record)
+                    break
+
+        started = time.monotonic()
+        written: Dict[str, int] = {}
+        try:
+            with self.transaction():
+                for record_type, group in groups.items():
+                    if group:
+                        written[record_type.__name__] = self.handlers[record_type](group)
+        except Exception as e:
+            logger.error(f"Write-behind flush of {len(records)} records failed: {e}")
+            self.stats.failed_flushes += 1
+            self.stats.failed_records += len(records)
+            self.stats.errors.append(str(e))
+            return
+        finally:
+            self.stats.flush_time += time.monotonic() - started
+
+        self.stats.flushes += 1
+        for name, count in written.items():
+            self.stats.written[name] = self.stats.written.get(name, 0) + count
+        logger.debug(f"Write-behind flushed {len(records)} records: {written}")
@@ -31,9 +31,14 @@ class BulkInsertResult:
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
     
+    # Adaptive batching: size and duration of each batch, in order
+    batch_sizes: List[int] = field(default_factory=list)
+    batch_timings: List[float] = field(default_factory=list)
+    
     # Database metrics
     rows_inserted: int = 0
     rows_updated: int = 0
+    rows_unchanged: int = 0  # Conflicting rows skipped because their row_hash matched
     conflicts_resolved: int = 0
     
     # Operation context
@@ -65,6 +70,14 @@ class BulkInsertResult:
         """Add successful insertions."""
         self.success_count += count
     
+    def record_batch(self, size: int, seconds: float) -> None:
+        """Record a completed batch's size and duration."""
+        self.batch_sizes.append(size)
+        self.batch_timings.append(seconds)
+        self.batches_processed += 1
+        self.batch_size = size
+        self.add_success(size)
+    
     @property
     def success_rate(self) -> float:
         """Calculate success rate as percentage."""
@@ -88,10 +101,13 @@ class BulkInsertResult:
             'execution_time': self.execution_time,
             'batch_size': self.batch_size,
             'batches_processed': self.batches_processed,
+            'batch_sizes': list(self.batch_sizes),
+            'batch_timings': [round(t, 4) for t in self.batch_timings],
             'success_rate': self.success_rate,
             'records_per_second': self.records_per_second,
             'rows_inserted': self.rows_inserted,
             'rows_updated': self.rows_updated,
+            'rows_unchanged': self.rows_unchanged,
             'conflicts_resolved': self.conflicts_resolved,
             'table_name': self.table_name,
             'operation_type': self.operation_type,
@@ -617,6 +633,7 @@ class ScrapingLog:
     warnings: List[str] = field(default_factory=list)
     rate_limit_violations: int = 0
     processing_time_seconds: Optional[float] = None
+    scope: str = 'season'  # 'season' for whole-season crawls, 'players' for selected players
     created_at: datetime = field(default_factory=datetime.now)
 
     def validate(self) -> List[str]:
@@ -15,18 +15,24 @@ from dataclasses import dataclass, asdict
 from pathlib import Path
 from enum import Enum
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from src.operations.batch_scheduler import BatchScheduler, as_utc, item_priority, retry_delay, utc_now
 
 try:
-    from src.core.scraper import CoreScraper
-    from src.database.db_manager import DatabaseManager
+    from src.database.backends import open_database
     from src.config.config import config
 except ImportError:
     # Fallback for testing
-    CoreScraper = None
-    DatabaseManager = None
+    open_database = None
     config = None
 
+try:
+    from src.operations.scraping_operation import ScrapingOperation
+except ImportError:
+    # Scraping dependencies (Selenium, requests) not installed
+    ScrapingOperation = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -135,29 +141,35 @@ class BatchSession:
         self.session_dir = Path(session_dir)
         self.session_dir.mkdir(exist_ok=True)
         
+        # Snapshot of the whole session, rewritten only by compact()
         self.session_file = self.session_dir / f"{session_id}.json"
+        # Append-only log of changes since the snapshot, one JSON object per line
+        self.journal_file = self.session_dir / f"{session_id}.journal.jsonl"
         self.items: Dict[str, BatchItem] = {}
         self.progress = BatchProgress()
         self.status = BatchStatus.PENDING
         self.config: Dict[str, Any] = {}
+        self._lock = threading.RLock()
         
         # Load existing session if it exists
         self.load_session()
     
     def add_item(self, item: BatchItem):
         """Add item to batch session"""
-        self.items[item.id] = item
-        self.progress.total_items = len(self.items)
-        self.save_session()
+        with self._lock:
+            self.items[item.id] = item
+            self.progress.total_items = len(self.items)
+            self._append_journal({'type': 'item', 'item': item.to_dict()})
     
     def update_item(self, item_id: str, **kwargs):
         """Update item in batch session"""
-        if item_id in self.items:
-            item = self.items[item_id]
-            for key, value in kwargs.items():
-                if hasattr(item, key):
-                    setattr(item, key, value)
-            self.save_session()
+        with self._lock:
+            if item_id in self.items:
+                item = self.items[item_id]
+                for key, value in kwargs.items():
+                    if hasattr(item, key):
+                        setattr(item, key, value)
+                self._append_journal({'type': 'item', 'item': item.to_dict()})
     
     def get_item(self, item_id: str) -> Optional[BatchItem]:
         """Get item by ID"""
@@ -177,56 +189,92 @@ class BatchSession:
     
     def mark_item_started(self, item_id: str):
         """Mark item as started"""
-        self.update_item(item_id, status=BatchStatus.RUNNING, started_at=datetime.now())
-        self.progress.running_items += 1
+        with self._lock:
+            self.update_item(item_id, status=BatchStatus.RUNNING, started_at=datetime.now())
+            self.progress.running_items += 1
     
     def mark_item_completed(self, item_id: str, result: Dict[str, Any] = None):
         """Mark item as completed"""
-        self.update_item(item_id, status=BatchStatus.COMPLETED, completed_at=datetime.now(), result=result)
-        self.progress.completed_items += 1
-        self.progress.running_items -= 1
+        with self._lock:
+            self.update_item(item_id, status=BatchStatus.COMPLETED, completed_at=datetime.now(), result=result)
+            self.progress.completed_items += 1
+            self.progress.running_items -= 1
     
     def mark_item_failed(self, item_id: str, error_message: str):
         """Mark item as failed"""
-        item = self.items.get(item_id)
-        if item:
-            item.retry_count += 1
-            if item.retry_count >= item.max_retries:
-                self.update_item(item_id, status=BatchStatus.FAILED, error_message=error_message)
-                self.progress.failed_items += 1
-                self.progress.running_items -= 1
-            else:
-                # Retry
-                self.update_item(item_id, status=BatchStatus.PENDING, error_message=error_message)
-                self.progress.running_items -= 1
-    
-    def save_session(self):
-        """Save session to file"""
-        session_data = {
-            'session_id': self.session_id,
+        with self._lock:
+            item = self.items.get(item_id)
+            if item:
+                item.retry_count += 1
+                if item.retry_count >= item.max_retries:
+                    self.update_item(item_id, status=BatchStatus.FAILED, error_message=error_message)
+                    self.progress.failed_items += 1
+                    self.progress.running_items -= 1
+                else:
+                    # Retry
+                    self.update_item(item_id, status=BatchStatus.PENDING, error_message=error_message)
+                    self.progress.running_items -= 1
+    
+    def _session_state(self) -> Dict[str, Any]:
+        """Session-level fields: everything but the items"""
+        return {
             'status': self.status.value,
             'config': self.config,
             'progress': asdict(self.progress),
-            'items': {item_id: item.to_dict() for item_id, item in self.items.items()},
             'last_updated': datetime.now().isoformat()
         }
-        
-        with open(self.session_file, 'w') as f:
-            json.dump(session_data, f, indent=2, default=str)
+    
+    def _append_journal(self, entry: Dict[str, Any]):
+        """Append one change to the journal and flush it to disk"""
+        line = json.dumps(entry, default=str) + '\n'
+        with self._lock:
+            with open(self.journal_file, 'a') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+    
+    def save_session(self):
+        """Record the session status, config and progress in the journal"""
+        with self._lock:
+            self._append_journal({'type': 'session', **self._session_state()})
+    
+    def compact(self):
+        """Write the full session snapshot and start an empty journal"""
+        with self._lock:
+            session_data = {
+                'session_id': self.session_id,
+                **self._session_state(),
+                'items': {item_id: item.to_dict() for item_id, item in self.items.items()}
+            }
+            
+            # Replace the snapshot atomically, then drop the entries it now contains
+            tmp_file = self.session_file.with_suffix('.json.tmp')
+            with open(tmp_file, 'w') as f:
+                json.dump(session_data, f, indent=2, default=str)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.session_file)
+            if self.journal_file.exists():
+                self.journal_file.unlink()
+    
+    def exists(self) -> bool:
+        """Whether the session has anything on disk"""
+        return self.session_file.exists() or self.journal_file.exists()
+    
+    def _apply_session_state(self, session_data: Dict[str, Any]):
+        """Set status, config and progress from a snapshot or journal entry"""
+        self.status = BatchStatus(session_data['status'])
+        self.config = session_data.get('config', {})
+        self.progress = BatchProgress(**session_data.get('progress', {}))
     
     def load_session(self):
-        """Load session from file"""
+        """Load the snapshot, then replay the journal written since"""
         if self.session_file.exists():
             try:
                 with open(self.session_file, 'r') as f:
                     session_data = json.load(f)
                 
-                self.status = BatchStatus(session_data['status'])
-                self.config = session_data.get('config', {})
-                
-                # Load progress
-                progress_data = session_data.get('progress', {})
-                self.progress = BatchProgress(**progress_data)
+                self._apply_session_state(session_data)
                 
                 # Load items
                 items_data = session_data.get('items', {})
@@ -237,6 +285,67 @@ class BatchSession:
                 
             except Exception as e:
                 logger.error(f"Failed to load session {self.session_id}: {e}")
+        
+        if self.journal_file.exists():
+            try:
+                self._replay_journal()
+            except Exception as e:
+                logger.error(f"Failed to replay journal of session {self.session_id}: {e}")
+    
+    def requeue_interrupted(self):
+        """Put items a crashed run left running back in the queue so a resume redoes them"""
+        with self._lock:
+            for item in list(self.items.values()):
+                if item.status == BatchStatus.RUNNING:
+                    self.update_item(item.id, status=BatchStatus.PENDING, started_at=None)
+                    self.progress.running_items -= 1
+            if self.status == BatchStatus.RUNNING:
+                self.status = BatchStatus.PAUSED
+                self.save_session()
+    
+    def _replay_journal(self):
+        """Apply journal entries in order; a torn last line from a crash is dropped"""
+        with open(self.journal_file, 'rb') as f:
+            lines = f.readlines()
+        
+        good_bytes = 0
+        for line_number, line in enumerate(lines, 1):
+            try:
+                entry = json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                if line_number == len(lines):
+                    logger.warning(f"Dropping incomplete last journal entry of session {self.session_id}")
+                    break
+                raise
+            good_bytes += len(line)
+            
+            if entry['type'] == 'item':
+                item = BatchItem.from_dict(entry['item'])
+                self.items[item.id] = item
+            elif entry['type'] == 'session':
+                self._apply_session_state(entry)
+        
+        # Cut a torn tail off the file so the next append starts on a fresh line
+        # instead of extending the partial one; a complete entry whose newline
+        # never made it to disk just gets its newline back
+        if lines and not lines[-1].endswith(b'\n'):
+            with open(self.journal_file, 'r+b') as f:
+                f.truncate(good_bytes)
+                if good_bytes == sum(len(line) for line in lines):
+                    f.seek(good_bytes)
+                    f.write(b'\n')
+                f.flush()
+                os.fsync(f.fileno())
+
+        # Counters come from the item states, which the journal records exactly
+        counts = {status: 0 for status in BatchStatus}
+        for item in self.items.values():
+            counts[item.status] += 1
+        self.progress.total_items = len(self.items)
+        self.progress.completed_items = counts[BatchStatus.COMPLETED]
+        self.progress.failed_items = counts[BatchStatus.FAILED]
+        self.progress.running_items = counts[BatchStatus.RUNNING]
+        self.progress.pending_items = counts[BatchStatus.PENDING]
     
     def get_summary(self) -> Dict[str, Any]:
         """Get session summary"""
@@ -258,21 +367,26 @@ class BatchSession:
 class BatchOperationManager:
     """Manager for batch scraping operations"""
     
-    def __init__(self, config=None, max_workers: int = 3):
-        """Initialize batch operation manager"""
+    def __init__(self, config=None, max_workers: int = 3, monitor=None):
+        """Initialize batch operation manager
+
+        Args:
+            config: Configuration object
+            max_workers: Worker threads processing batch items
+            monitor: Optional PerformanceMonitor receiving connection pool metrics
+        """
         self.config = config or self._create_mock_config()
         self.max_workers = max_workers
         self.sessions: Dict[str, BatchSession] = {}
         self.active_operations: Dict[str, threading.Event] = {}
         
-        # Initialize scraper and database manager
-        if CoreScraper is not None:
-            self.scraper = CoreScraper(rate_limit_delay=2.0)
-        else:
-            self.scraper = None
+        # One ScrapingOperation per worker thread; the process-wide host scheduler
+        # keeps their combined requests within the per-host budget
+        self._local = threading.local()
         
-        if DatabaseManager is not None:
-            self.db_manager = DatabaseManager()
+        # Initialize database manager; items are scraped through ScrapingOperation
+        if open_database is not None:
+            self.db_manager = open_database(monitor=monitor)
         else:
             self.db_manager = None
     
@@ -292,7 +406,7 @@ class BatchOperationManager:
             **kwargs
         }
         session.status = BatchStatus.PENDING
-        session.save_session()
+        session.compact()
         
         self.sessions[session_id] = session
         return session
@@ -302,14 +416,19 @@ class BatchOperationManager:
         if session_id not in self.sessions:
             # Try to load from file
             session = BatchSession(session_id)
-            if session.session_file.exists():
+            if session.exists():
                 self.sessions[session_id] = session
                 return session
         return self.sessions.get(session_id)
     
     def batch_scrape_season(self, season: int, session_id: str = None, 
-                          resume: bool = False) -> BatchSession:
-        """Scrape all QBs for a season with batch processing"""
+                          resume: bool = False, queue: Any = None) -> BatchSession:
+        """
+        Scrape all QBs for a season with batch processing.
+        
+        With a work queue the items are put on the queue for ``batch worker``
+        processes instead of being run by this process.
+        """
         if not session_id:
             session_id = f"season_{season}_{int(time.time())}"
         
@@ -318,6 +437,8 @@ class BatchOperationManager:
             session = self.get_session(session_id)
             if not session:
                 raise ValueError(f"Session {session_id} not found for resume")
+            if session_id not in self.active_operations:
+                session.requeue_interrupted()
         else:
             session = self.create_session(session_id, "season_scrape", season=season)
         
@@ -334,13 +455,16 @@ class BatchOperationManager:
                 session.add_item(item)
         
         # Start batch processing
-        self._start_batch_processing(session)
+        if queue is not None:
+            self.enqueue_session(session, queue)
+        else:
+            self._start_batch_processing(session)
         
         return session
     
     def batch_scrape_players(self, player_names: List[str], session_id: str = None,
-                           season: int = 2024) -> BatchSession:
-        """Scrape specific players with batch processing"""
+                           season: int = 2024, queue: Any = None) -> BatchSession:
+        """Scrape specific players with batch processing, or queue them for workers"""
         if not session_id:
             session_id = f"players_{int(time.time())}"
         
@@ -358,13 +482,66 @@ class BatchOperationManager:
             session.add_item(item)
         
         # Start batch processing
-        self._start_batch_processing(session)
+        if queue is not None:
+            self.enqueue_session(session, queue)
+        else:
+            self._start_batch_processing(session)
         
         return session
     
+    def enqueue_session(self, session: BatchSession, queue: Any) -> int:
+        """
+        Put a session's pending items on a shared work queue.
+        
+        Args:
+            session: Session whose items to queue
+            queue: SQLiteWorkQueue or PostgresWorkQueue the workers pull from
+            
+        Returns:
+            Number of items added to the queue
+        """
+        # Queue order is claim order, so the most valuable items are claimed first
+        pending = session.get_pending_items()
+        priorities = self._item_priorities(session, pending)
+        pending.sort(key=lambda item: priorities[item.id], reverse=True)
+        max_attempts = max((item.max_retries for item in pending), default=3)
+        added = queue.enqueue(
+            session.session_id,
+            [(item.id, item.name) for item in pending],
+            payload={'season': session.config.get('season', 2024)},
+            max_attempts=max_attempts
+        )
+        session.config['queued'] = True
+        session.save_session()
+        logger.info(f"Queued {added} items of session {session.session_id}")
+        return added
+    
+    def run_worker(self, queue: Any, session_id: str, worker_id: str = None,
+                   stop_event: threading.Event = None, poll_interval: float = 5.0) -> Dict[str, int]:
+        """
+        Pull items of a queued session and scrape them until the session is drained.
+        
+        Any number of workers, in any process, can run against the same queue and session.
+        
+        Returns:
+            Items completed, retried, failed and lost by this worker
+        """
+        from src.operations.work_queue import QueueWorker
+        
+        worker = QueueWorker(
+            queue, session_id,
+            handler=lambda item: self._scrape_item(item.name, item.payload.get('season', 2024)),
+            worker_id=worker_id,
+            poll_interval=poll_interval
+        )
+        try:
+            return worker.run(stop_event=stop_event)
+        finally:
+            self._refresh_summaries()
+    
     def _get_season_qb_list(self, season: int) -> List[str]:
         """Get list of QBs for a season"""
-        if self.scraper is None:
+        if ScrapingOperation is None or self.db_manager is None:
             # Mock data for testing
             return ["Joe Burrow", "Patrick Mahomes", "Josh Allen"]
         
@@ -395,33 +572,49 @@ class BatchOperationManager:
         thread.start()
     
     def _process_batch_session(self, session: BatchSession, stop_event: threading.Event):
-        """Process batch session items"""
+        """Process batch session items, most valuable first"""
         try:
+            priorities = self._item_priorities(session, session.get_pending_items())
+            scheduler = BatchScheduler()
+            for item_id, priority in priorities.items():
+                scheduler.push(item_id, priority)
+            
             with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                # Submit all pending items
-                future_to_item = {}
-                for item in session.get_pending_items():
-                    if stop_event.is_set():
-                        break
+                in_flight = {}
+                while not stop_event.is_set():
+                    # Keep every worker busy with the highest-priority item that may run now
+                    while len(in_flight) < self.max_workers:
+                        item_id = scheduler.pop()
+                        if item_id is None:
+                            break
+                        item = session.get_item(item_id)
+                        in_flight[executor.submit(self._process_batch_item, session, item)] = item
                     
-                    future = executor.submit(self._process_batch_item, session, item)
-                    future_to_item[future] = item
-                
-                # Process completed futures
-                for future in as_completed(future_to_item):
-                    if stop_event.is_set():
-                        break
+                    if not in_flight:
+                        # Only retries still backing off are left, or nothing at all
+                        wait_seconds = scheduler.next_ready_in()
+                        if wait_seconds is None:
+                            break
+                        stop_event.wait(wait_seconds)
+                        continue
                     
-                    item = future_to_item[future]
-                    try:
-                        result = future.result()
-                        session.mark_item_completed(item.id, result)
-                    except Exception as e:
-                        session.mark_item_failed(item.id, str(e))
+                    # Wake up for a finished item, or for a retry whose backoff ends while a worker is free
+                    timeout = scheduler.next_ready_in() if len(in_flight) < self.max_workers else None
+                    done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
                     
-                    # Update progress
-                    session.progress.estimated_completion = session.progress.calculate_eta()
-                    session.save_session()
+                    # Each finished item journals its change; failures go back on the heap after a backoff
+                    for future in done:
+                        item = in_flight.pop(future)
+                        try:
+                            result = future.result()
+                            session.mark_item_completed(item.id, result)
+                        except Exception as e:
+                            session.mark_item_failed(item.id, str(e))
+                            if item.status == BatchStatus.PENDING:
+                                scheduler.defer(item.id, priorities[item.id], retry_delay(item.retry_count))
+                        
+                        # Update progress
+                        session.progress.estimated_completion = session.progress.calculate_eta()
             
             # Mark session as completed
             if not stop_event.is_set():
@@ -429,52 +622,105 @@ class BatchOperationManager:
             else:
                 session.status = BatchStatus.CANCELLED
             
-            session.save_session()
+            session.compact()
             
         except Exception as e:
             logger.error(f"Batch processing failed for session {session.session_id}: {e}")
             session.status = BatchStatus.FAILED
-            session.save_session()
+            session.compact()
         finally:
+            self._refresh_summaries()
             # Clean up
             if session.session_id in self.active_operations:
                 del self.active_operations[session.session_id]
     
+    def _item_priorities(self, session: BatchSession, items: List[BatchItem]) -> Dict[str, float]:
+        """Priority of each item from the stored data's age and the player's games started"""
+        season = session.config.get('season', 2024)
+        stored = self._stored_player_stats(season)
+        now = utc_now()
+        return {
+            item.id: item_priority(season, *stored.get(item.name, (None, None)), now=now)
+            for item in items
+        }
+    
+    def _stored_player_stats(self, season: int) -> Dict[str, Tuple[Optional[datetime], Optional[int]]]:
+        """Last scrape time and games started per player already stored for a season"""
+        if self.db_manager is None:
+            return {}
+        try:
+            rows = self.db_manager.query(
+                "SELECT player_name, MAX(scraped_at) AS last_scraped, MAX(gs) AS games_started "
+                "FROM qb_passing_stats WHERE season = %s GROUP BY player_name",
+                (season,)
+            )
+        except Exception as e:
+            logger.warning(f"Could not read stored stats for season {season}, scheduling without them: {e}")
+            return {}
+        
+        stored = {}
+        for row in rows:
+            stored[row['player_name']] = (as_utc(row['last_scraped']), row['games_started'])
+        return stored
+    
     def _process_batch_item(self, session: BatchSession, item: BatchItem) -> Dict[str, Any]:
         """Process a single batch item"""
         session.mark_item_started(item.id)
         
         try:
-            if self.scraper is None:
-                # Mock processing for testing
-                time.sleep(1)  # Simulate processing time
-                return {
-                    'success': True,
-                    'player_name': item.name,
-                    'processed_at': datetime.now().isoformat()
-                }
-            
             # Get season from session config
-            season = session.config.get('season', 2024)
-            
-            # Scrape player data
-            result = self.scraper.scrape_player_season(item.name, season)
-            
-            if result and result.get('success'):
-                return {
-                    'success': True,
-                    'player_name': item.name,
-                    'main_stats': result.get('main_stats'),
-                    'splits_count': len(result.get('splits_data', [])),
-                    'processed_at': datetime.now().isoformat()
-                }
-            else:
-                raise Exception(f"Failed to scrape data for {item.name}")
-                
+            return self._scrape_item(item.name, session.config.get('season', 2024))
         except Exception as e:
             logger.error(f"Error processing item {item.id}: {e}")
             raise
     
+    def _scraping_operation(self) -> Optional[Any]:
+        """This worker thread's ScrapingOperation, or None without a scraper or database"""
+        if ScrapingOperation is None or self.db_manager is None:
+            return None
+        operation = getattr(self._local, 'scraping_operation', None)
+        if operation is None:
+            # The mock config used for tests has no database URL; scraping needs the application config
+            operation_config = self.config if hasattr(self.config, 'get_database_url') else config
+            delay = getattr(getattr(operation_config, 'scraping', None), 'rate_limit_delay', 7.0)
+            operation = ScrapingOperation(operation_config, self.db_manager, min_delay=delay,
+                                          max_delay=delay + 5.0)
+            self._local.scraping_operation = operation
+        return operation
+    
+    def _scrape_item(self, player_name: str, season: int) -> Dict[str, Any]:
+        """Scrape one player's season and store it; raises if the scrape did not succeed"""
+        operation = self._scraping_operation()
+        if operation is None:
+            # Mock processing for testing
+            time.sleep(1)  # Simulate processing time
+            return {
+                'success': True,
+                'player_name': player_name,
+                'processed_at': datetime.now().isoformat()
+            }
+        
+        # Leaderboard row, splits and the database writes in one call; the summaries
+        # are refreshed once the whole session has drained, not after every player
+        result = operation.execute(season, player_names=[player_name], refresh_summaries=False)
+        
+        if result.success and result.scraped_records:
+            return {
+                'success': True,
+                'player_name': player_name,
+                'scraped_records': result.scraped_records,
+                'saved_records': result.saved_records,
+                'processed_at': datetime.now().isoformat()
+            }
+        else:
+            raise Exception(f"Failed to scrape data for {player_name}: {result.message}")
+    
+    def _refresh_summaries(self):
+        """Bring the materialized summaries up to date after a batch run"""
+        refresh = getattr(self.db_manager, 'refresh_summaries_if_stale', None)
+        if refresh is not None:
+            refresh()
+    
     def stop_session(self, session_id: str) -> bool:
         """Stop a running batch session"""
         if session_id in self.active_operations:
@@ -508,10 +754,11 @@ class BatchOperationManager:
             if session_id in self.sessions:
                 del self.sessions[session_id]
             
-            # Remove session file
-            session_file = Path("batch_sessions") / f"{session_id}.json"
-            if session_file.exists():
-                session_file.unlink()
+            # Remove session snapshot and journal
+            for session_file in (Path("batch_sessions") / f"{session_id}.json",
+                                 Path("batch_sessions") / f"{session_id}.journal.jsonl"):
+                if session_file.exists():
+                    session_file.unlink()
             
             return True
         except Exception as e:
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Priority Scheduling for Batch Operations
+Orders batch items so the most valuable data is refreshed first.
+
+An item's priority grows with how stale its stored data is relative to how
+fast that data changes (a live season goes stale in a week, a finished one
+over a year), with the player's games started and with the season being in
+progress. Failed items come back after an exponential backoff instead of
+immediately. Items are served from a heap, so the order follows priorities
+as they are updated while results arrive.
+"""
+
+import heapq
+import itertools
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+# Days after which stored data counts as fully stale
+LIVE_SEASON_STALE_DAYS = 7.0
+FINAL_SEASON_STALE_DAYS = 365.0
+
+# Games started at which a player counts as a full-time starter
+STARTER_GAMES = 17
+
+# A live season's items weigh this much more than a finished season's
+LIVE_SEASON_WEIGHT = 2.0
+
+RETRY_BASE_SECONDS = 30.0
+RETRY_MAX_SECONDS = 15 * 60.0
+
+
+def as_utc(value: Any) -> Optional[datetime]:
+    """
+    Timestamp as an aware UTC datetime so stored and current times compare.
+
+    Postgres returns TIMESTAMP WITH TIME ZONE columns as aware datetimes,
+    SQLite returns ISO text and the models use naive datetimes; naive values
+    are taken to be UTC.
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def utc_now() -> datetime:
+    """Current time as an aware UTC datetime"""
+    return datetime.now(timezone.utc)
+
+
+def current_nfl_season(now: Optional[datetime] = None) -> int:
+    """Season the calendar date belongs to: January and February games finish the previous year's season"""
+    now = as_utc(now) or utc_now()
+    return now.year if now.month >= 3 else now.year - 1
+
+
+def is_live_season(season: int, now: Optional[datetime] = None) -> bool:
+    """Whether a season's stats can still change: it is the current one and games are still being played"""
+    now = as_utc(now) or utc_now()
+    return season >= current_nfl_season(now) and (now.month >= 9 or now.month <= 2)
+
+
+def item_priority(season: int, last_scraped: Optional[datetime] = None, games_started: Optional[int] = None,
+                  now: Optional[datetime] = None) -> float:
+    """
+    Value of refreshing one player's season now; higher goes first.
+
+    Args:
+        season: Season of the item
+        last_scraped: When the stored data was scraped, None if it never was (naive means UTC)
+        games_started: Player's games started in that season, if known
+        now: Reference time (naive means UTC)
+
+    Returns:
+        Staleness (0-1) times player importance (1-2) times season weight
+    """
+    now = as_utc(now) or utc_now()
+    last_scraped = as_utc(last_scraped)
+    live = is_live_season(season, now)
+    if last_scraped is None:
+        staleness = 1.0
+    else:
+        age_days = max((now - last_scraped).total_seconds(), 0.0) / 86400
+        staleness = min(age_days / (LIVE_SEASON_STALE_DAYS if live else FINAL_SEASON_STALE_DAYS), 1.0)
+    importance = 1.0 + min(games_started or 0, STARTER_GAMES) / STARTER_GAMES
+    return staleness * importance * (LIVE_SEASON_WEIGHT if live else 1.0)
+
+
+def retry_delay(retry_count: int) -> float:
+    """Seconds a failed item waits before its next attempt: doubles per failure, capped"""
+    return min(RETRY_BASE_SECONDS * 2 ** max(retry_count - 1, 0), RETRY_MAX_SECONDS)
+
+
+class BatchScheduler:
+    """Heap of batch item ids by priority, with failed items held back until their backoff ends"""
+
+    def __init__(self, clock=None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            clock: Returns the current time in seconds (injectable for tests)
+        """
+        self.clock = clock or time.monotonic
+        self._ready: List[Tuple[float, int, str]] = []
+        self._delayed: List[Tuple[float, float, int, str]] = []
+        self._entries: Dict[str, int] = {}
+        self._counter = itertools.count()
+
+    def push(self, item_id: str, priority: float):
+        """Queue an item, or change the priority of one already queued"""
+        seq = next(self._counter)
+        self._entries[item_id] = seq
+        heapq.heappush(self._ready, (-priority, seq, item_id))
+
+    def defer(self, item_id: str, priority: float, delay: float):
+        """Queue an item that must not run for another delay seconds"""
+        seq = next(self._counter)
+        self._entries[item_id] = seq
+        heapq.heappush(self._delayed, (self.clock() + delay, -priority, seq, item_id))
+
+    def remove(self, item_id: str):
+        """Drop an item; its heap entries are skipped when they surface"""
+        self._entries.pop(item_id, None)
+
+    def _release_due(self):
+        # Move deferred items whose backoff has ended onto the ready heap
+        now = self.clock()
+        while self._delayed and self._delayed[0][0] <= now:
+            _, neg_priority, seq, item_id = heapq.heappop(self._delayed)
+            heapq.heappush(self._ready, (neg_priority, seq, item_id))
+
+    def pop(self) -> Optional[str]:
+        """Highest-priority item that may run now, None if every queued item is backing off"""
+        self._release_due()
+        while self._ready:
+            _, seq, item_id = heapq.heappop(self._ready)
+            # Entries replaced by a later push/defer, or removed, are stale
+            if self._entries.get(item_id) == seq:
+                del self._entries[item_id]
+                return item_id
+        return None
+
+    def next_ready_in(self) -> Optional[float]:
+        """Seconds until a deferred item can run, 0 if one can run now, None if nothing is queued"""
+        self._release_due()
+        if any(self._entries.get(item_id) == seq for _, seq, item_id in self._ready):
+            return 0.0
+        live = [entry for entry in self._delayed if self._entries.get(entry[3]) == entry[2]]
+        if not live:
+            return None
+        return max(min(entry[0] for entry in live) - self.clock(), 0.0)
+
+    def __len__(self) -> int:
+        return len(self._entries)
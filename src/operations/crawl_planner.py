@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Incremental Crawl Planner for NFL QB Data
+Decides which seasons and players actually need fetching.
+
+A season is final once the Super Bowl has been played. A final season
+that was scraped after that point, with splits stored for every player,
+is complete and costs no requests. Any other season gets its leaderboard
+pages, which are cheap and serve as the change detector: upserting them
+only touches a player's row (and its updated_at) when the stats changed.
+Splits pages, one request per player, are then fetched only for players
+whose stats changed after their splits were last checked or who have no
+splits stored. A weekly refresh therefore touches the live season and the
+players who played that week.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from src.operations.batch_scheduler import as_utc, is_live_season, utc_now
+
+logger = logging.getLogger(__name__)
+
+# Month of the year after a season by which its stats are final (the Super Bowl is in February)
+SEASON_FINAL_MONTH = 3
+
+# Players with passing stats in a typical season, for estimates when nothing is stored yet
+TYPICAL_SEASON_PLAYERS = 100
+
+
+def season_final_date(season: int) -> datetime:
+    """When a season's stats stop changing, in UTC"""
+    return datetime(season + 1, SEASON_FINAL_MONTH, 1, tzinfo=timezone.utc)
+
+
+@dataclass
+class SeasonPlan:
+    """What one season needs fetched"""
+    season: int
+    state: str  # 'upcoming', 'live', 'final' or 'complete'
+    leaderboard_requests: int = 0
+    stale_players: List[str] = field(default_factory=list)  # pfr_ids already known to need splits
+    estimated_splits_requests: int = 0  # stale players plus those the leaderboard may show changed
+    reason: str = ''
+
+    @property
+    def requests(self) -> int:
+        """Estimated requests for the season"""
+        return self.leaderboard_requests + self.estimated_splits_requests
+
+    @property
+    def skip(self) -> bool:
+        """Whether the season can be left alone"""
+        return self.requests == 0
+
+
+@dataclass
+class CrawlPlan:
+    """Plan over several seasons with its estimated cost"""
+    seasons: List[SeasonPlan]
+    seconds_per_request: float
+
+    @property
+    def total_requests(self) -> int:
+        return sum(plan.requests for plan in self.seasons)
+
+    @property
+    def estimated_seconds(self) -> float:
+        return self.total_requests * self.seconds_per_request
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for reporting"""
+        return {
+            'total_requests': self.total_requests,
+            'estimated_seconds': self.estimated_seconds,
+            'seconds_per_request': self.seconds_per_request,
+            'seasons': [
+                {'season': plan.season, 'state': plan.state, 'requests': plan.requests, 'reason': plan.reason}
+                for plan in self.seasons
+            ]
+        }
+
+
+class CrawlPlanner:
+    """Plans incremental crawls from scraping_logs and the stored row timestamps"""
+
+    def __init__(self, db_manager: Any, scraping_config: Any = None, min_delay: float = 7.0,
+                 max_delay: float = 12.0, now: Optional[datetime] = None):
+        """
+        Initialize the planner.
+
+        Args:
+            db_manager: DatabaseManager or SQLiteDatabaseManager holding earlier crawls
+            scraping_config: ScrapingConfig with the shared request rate and leaderboard settings
+            min_delay: Minimum delay between requests in seconds
+            max_delay: Maximum delay between requests in seconds
+            now: Reference time (injectable for tests, naive means UTC)
+        """
+        self.db_manager = db_manager
+        self.now = as_utc(now) or utc_now()
+        include_advanced = getattr(scraping_config, 'advanced_leaderboard_enabled', False)
+        self.leaderboard_requests = 2 if include_advanced else 1
+
+        # The slower of the per-request delay and the shared per-host budget sets the pace
+        requests_per_minute = getattr(scraping_config, 'requests_per_minute', 0) or 0
+        budget_seconds = 60.0 / requests_per_minute if requests_per_minute > 0 else 0.0
+        self.seconds_per_request = max((min_delay + max_delay) / 2, budget_seconds)
+
+    def plan(self, seasons: Iterable[int], player_names: Optional[List[str]] = None) -> CrawlPlan:
+        """Plan every season in seasons"""
+        return CrawlPlan(
+            seasons=[self.plan_season(season, player_names) for season in seasons],
+            seconds_per_request=self.seconds_per_request
+        )
+
+    def plan_season(self, season: int, player_names: Optional[List[str]] = None) -> SeasonPlan:
+        """
+        Plan one season.
+
+        Args:
+            season: Season to plan
+            player_names: Only these players (default: everyone with passing stats)
+
+        Returns:
+            SeasonPlan with its state and estimated requests
+        """
+        if self.now < datetime(season, 9, 1, tzinfo=timezone.utc):
+            return SeasonPlan(season, 'upcoming', reason='season has not started')
+
+        stored = self._stored_players(season, player_names)
+        stale = [row['pfr_id'] for row in stored if self._needs_splits(row)]
+
+        if is_live_season(season, self.now):
+            # Any player may have played since the last crawl; the leaderboard tells which did
+            expected = len(player_names) if player_names else (len(stored) or TYPICAL_SEASON_PLAYERS)
+            return SeasonPlan(season, 'live', self.leaderboard_requests, stale, max(expected, len(stale)),
+                              reason='in progress: leaderboard plus players whose stats changed')
+
+        if player_names and len(stored) < len(player_names):
+            # Requested players with no stored stats at all have never been crawled
+            expected = len(player_names)
+            return SeasonPlan(season, 'final', self.leaderboard_requests, stale, max(expected, len(stale)),
+                              reason=f'{len(player_names) - len(stored)} requested players not stored')
+
+        last_run = self._last_full_run(season, include_player_runs=bool(player_names))
+        if last_run is not None and last_run >= season_final_date(season):
+            if not stale:
+                return SeasonPlan(season, 'complete', reason=f'final and fully stored (last crawl {last_run:%Y-%m-%d})')
+            return SeasonPlan(season, 'final', self.leaderboard_requests, stale, len(stale),
+                              reason=f'final, {len(stale)} players missing splits')
+
+        expected = len(player_names) if player_names else (len(stored) or TYPICAL_SEASON_PLAYERS)
+        reason = 'never crawled' if last_run is None else f'last crawled {last_run:%Y-%m-%d}, before the season was final'
+        return SeasonPlan(season, 'final', self.leaderboard_requests, stale, max(expected, len(stale)), reason=reason)
+
+    def players_needing_splits(self, season: int, pfr_ids: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Players whose splits are missing or older than their stats, after the leaderboard was stored.
+
+        Args:
+            season: Season to check
+            pfr_ids: Only consider these players
+
+        Returns:
+            pfr_ids to fetch splits for
+        """
+        wanted = set(pfr_ids) if pfr_ids is not None else None
+        return [
+            row['pfr_id'] for row in self._stored_players(season)
+            if (wanted is None or row['pfr_id'] in wanted) and self._needs_splits(row)
+        ]
+
+    def _needs_splits(self, row: Dict[str, Any]) -> bool:
+        # Unchanged stats are skipped by the row-hash upsert, so updated_at is the last real change.
+        # Unchanged splits are skipped too, so a refetch that changed nothing only shows in the checks
+        if row['last_splits'] is None:
+            return True
+        checked = [as_utc(value) for value in (row['last_splits'], row['last_checked']) if value is not None]
+        updated_at = as_utc(row['updated_at'])
+        return updated_at is not None and updated_at > max(checked)
+
+    def _stored_players(self, season: int, player_names: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Stored passing stats rows of a season with the times their splits were last scraped and checked"""
+        rows = self.db_manager.query("""
+            SELECT ps.pfr_id, ps.player_name, ps.updated_at, s.last_splits, c.checked_at AS last_checked
+            FROM qb_passing_stats ps
+            LEFT JOIN (
+                SELECT pfr_id, MAX(scraped_at) AS last_splits
+                FROM qb_splits
+                WHERE season = %s
+                GROUP BY pfr_id
+            ) s ON s.pfr_id = ps.pfr_id
+            LEFT JOIN qb_splits_checks c ON c.pfr_id = ps.pfr_id AND c.season = ps.season
+            WHERE ps.season = %s
+            ORDER BY ps.pfr_id
+        """, (season, season))
+        if player_names:
+            rows = [row for row in rows if row['player_name'] in player_names]
+        return rows
+
+    def _last_full_run(self, season: int, include_player_runs: bool = False) -> Optional[datetime]:
+        """
+        End of the latest logged crawl that stored the season's passing stats.
+
+        Runs over selected players only cover a whole season's leaderboard when
+        planning for selected players too; logs from before the scope column count as season runs.
+        """
+        scopes = ('season', 'players') if include_player_runs else ('season',)
+        rows = self.db_manager.query(
+            "SELECT MAX(COALESCE(end_time, start_time)) AS last_run FROM scraping_logs "
+            f"WHERE season = %s AND total_passing_stats > 0 AND COALESCE(scope, 'season') IN ({', '.join(['%s'] * len(scopes))})",
+            (season, *scopes)
+        )
+        return as_utc(rows[0]['last_run']) if rows else None
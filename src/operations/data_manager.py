@@ -6,16 +6,26 @@ Handles data validation, export/import, integrity checking, and quality monitori
 
 import json
 import csv
+import gzip
+import io
 import logging
 import sys
 import os
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Union, Tuple
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Union, Tuple
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import hashlib
 import sqlite3
-from contextlib import contextmanager
+from contextlib import contextmanager, ExitStack
+
+from src.database.tables import PASSING_STATS_COLUMNS, SPLITS_ADVANCED_COLUMNS, SPLITS_COLUMNS
+
+try:
+    import zstandard
+except ImportError:
+    # Optional: only needed for zstd-compressed exports
+    zstandard = None
 
 try:
     from src.database.db_manager import DatabaseManager
@@ -32,6 +42,53 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Datasets read by export, validation and summaries, with the DatabaseManager method streaming each
+DATASET_STREAMS = {
+    'qb_stats': 'stream_qb_stats',
+    'splits_data': 'stream_splits',
+    'advanced_stats': 'stream_advanced_stats',
+}
+
+# Columns each dataset can be exported with
+DATASET_COLUMNS = {
+    'qb_stats': PASSING_STATS_COLUMNS + ('row_hash',),
+    'splits_data': SPLITS_COLUMNS + ('row_hash',),
+    'advanced_stats': SPLITS_ADVANCED_COLUMNS + ('row_hash',),
+}
+
+# Export compressions with the suffix each adds to file names
+COMPRESSION_SUFFIXES = {
+    'gzip': '.gz',
+    'zstd': '.zst',
+}
+
+
+@contextmanager
+def open_export_file(path: str, compression: Optional[str] = None):
+    """
+    Open a text file for writing, compressed on the fly if requested
+    
+    Args:
+        path: File to write
+        compression: None, 'gzip' or 'zstd' (needs the zstandard package)
+        
+    Yields:
+        Text file object
+    """
+    if compression is None:
+        f = open(path, 'w', newline='', encoding='utf-8')
+    elif compression == 'gzip':
+        f = gzip.open(path, 'wt', newline='', encoding='utf-8')
+    elif compression == 'zstd':
+        if zstandard is None:
+            raise ValueError("zstd compression requires the zstandard package (pip install zstandard)")
+        writer = zstandard.ZstdCompressor().stream_writer(open(path, 'wb'))
+        f = io.TextIOWrapper(writer, newline='', encoding='utf-8')
+    else:
+        raise ValueError(f"Unsupported compression: {compression}")
+    with f:
+        yield f
+
 
 @dataclass
 class DataQualityMetrics:
@@ -243,31 +300,37 @@ class DataValidationEngine:
     
     def validate_dataset(self, records: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Validate entire dataset and return quality report"""
-        total_records = len(records)
+        return self.validate_batches([records])
+    
+    def validate_batches(self, batches: Iterable[List[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Validate a dataset arriving in batches, keeping only the counts between batches"""
+        total_records = 0
         valid_records = 0
         invalid_records = 0
         total_issues = 0
         issues_by_severity = {'error': 0, 'warning': 0, 'info': 0}
         field_issues = {}
         
-        for record in records:
-            record_issues = self.validate_record(record)
-            
-            if not record_issues:
-                valid_records += 1
-            else:
-                invalid_records += 1
-                total_issues += len(record_issues)
+        for records in batches:
+            total_records += len(records)
+            for record in records:
+                record_issues = self.validate_record(record)
                 
-                for issue in record_issues:
-                    # Count by severity
-                    issues_by_severity[issue['severity']] += 1
+                if not record_issues:
+                    valid_records += 1
+                else:
+                    invalid_records += 1
+                    total_issues += len(record_issues)
                     
-                    # Count by field
-                    field = issue['field']
-                    if field not in field_issues:
-                        field_issues[field] = 0
-                    field_issues[field] += 1
+                    for issue in record_issues:
+                        # Count by severity
+                        issues_by_severity[issue['severity']] += 1
+                        
+                        # Count by field
+                        field = issue['field']
+                        if field not in field_issues:
+                            field_issues[field] = 0
+                        field_issues[field] += 1
         
         # Calculate quality metrics
         quality_metrics = DataQualityMetrics(
@@ -300,32 +363,54 @@ class DataManager:
     def _create_mock_db_manager(self):
         """Create mock database manager for testing"""
         class MockDBManager:
-            def get_all_qb_stats(self, season=None):
-                return []
-            def get_all_splits(self, season=None):
-                return []
-            def get_all_advanced_stats(self, season=None):
-                return []
+            def stream_qb_stats(self, season=None, itersize=None, columns=None):
+                return iter(())
+            def stream_splits(self, season=None, itersize=None, columns=None):
+                return iter(())
+            def stream_advanced_stats(self, season=None, itersize=None, columns=None):
+                return iter(())
         return MockDBManager()
     
+    def _stream_records(self, dataset: str, season: Optional[int] = None,
+                        columns: Optional[List[str]] = None) -> Iterator[List[Dict[str, Any]]]:
+        """Yield one dataset from the database as batches of record dicts"""
+        stream = getattr(self.db_manager, DATASET_STREAMS[dataset])
+        for batch in (stream(season, columns=columns) if columns else stream(season)):
+            if batch:
+                yield [self._record_to_dict(record) for record in batch]
+    
+    def _stream_export(self, dataset: str, seasons: List[Optional[int]],
+                       columns: Optional[List[str]]) -> Iterator[List[Dict[str, Any]]]:
+        """Yield one dataset for each season in turn"""
+        for season in seasons:
+            yield from self._stream_records(dataset, season, columns)
+    
+    def _export_columns(self, columns: Optional[List[str]]) -> Dict[str, Optional[List[str]]]:
+        """
+        Columns to export per dataset; datasets with none of the requested columns are left out
+        
+        Raises:
+            ValueError: If a column is in no dataset
+        """
+        if not columns:
+            return {dataset: None for dataset in DATASET_STREAMS}
+        unknown = [c for c in columns if not any(c in known for known in DATASET_COLUMNS.values())]
+        if unknown:
+            raise ValueError(f"Unknown export columns: {', '.join(unknown)}")
+        selected = {
+            dataset: [c for c in columns if c in DATASET_COLUMNS[dataset]]
+            for dataset in DATASET_STREAMS
+        }
+        return {dataset: cols for dataset, cols in selected.items() if cols}
+    
     def validate_data(self, season: Optional[int] = None) -> Dict[str, Any]:
         """Validate data quality for a season or all data"""
         logger.info(f"Validating data for season: {season}")
         
-        # Get data from database
-        qb_stats = self.db_manager.get_all_qb_stats(season)
-        splits_data = self.db_manager.get_all_splits(season)
-        advanced_stats = self.db_manager.get_all_advanced_stats(season)
-        
-        # Convert to dictionaries for validation
-        qb_records = [self._record_to_dict(stat) for stat in qb_stats]
-        splits_records = [self._record_to_dict(stat) for stat in splits_data]
-        advanced_records = [self._record_to_dict(stat) for stat in advanced_stats]
-        
-        # Validate each dataset
-        qb_validation = self.validation_engine.validate_dataset(qb_records)
-        splits_validation = self.validation_engine.validate_dataset(splits_records)
-        advanced_validation = self.validation_engine.validate_dataset(advanced_records)
+        # Validate each dataset as it streams out of the database
+        qb_validation = self.validation_engine.validate_batches(self._stream_records('qb_stats', season))
+        splits_validation = self.validation_engine.validate_batches(self._stream_records('splits_data', season))
+        advanced_validation = self.validation_engine.validate_batches(self._stream_records('advanced_stats', season))
         
         return {
             'qb_stats': qb_validation,
@@ -359,98 +444,148 @@ class DataManager:
         
         return total_score / total_weight if total_weight > 0 else 0
     
-    def export_data(self, format: str = 'json', season: Optional[int] = None, 
-                   output_file: Optional[str] = None) -> str:
-        """Export data in specified format"""
+    def export_data(self, format: str = 'json', season: Optional[Union[int, List[int]]] = None,
+                   output_file: Optional[str] = None, columns: Optional[List[str]] = None,
+                   compression: Optional[str] = None) -> str:
+        """
+        Export data in specified format
+        
+        Rows are read in batches from the database's server-side cursors and
+        written as they arrive, so memory use does not grow with the export.
+        
+        Args:
+            format: 'json', 'jsonl', 'csv' or 'sqlite'
+            season: One season, a list of seasons, or every season if omitted
+            output_file: Output path; jsonl and csv write one file per dataset next to it
+            columns: Only these columns; datasets without any of them are skipped
+            compression: None, 'gzip' or 'zstd' (not for sqlite)
+            
+        Returns:
+            Output path
+        """
+        format = format.lower()
         logger.info(f"Exporting data in {format} format for season: {season}")
+        if format not in ('json', 'jsonl', 'csv', 'sqlite'):
+            raise ValueError(f"Unsupported export format: {format}")
+        if compression is not None and compression not in COMPRESSION_SUFFIXES:
+            raise ValueError(f"Unsupported compression: {compression}")
+        if compression and format == 'sqlite':
+            raise ValueError("SQLite exports cannot be compressed")
         
-        # Get data
-        qb_stats = self.db_manager.get_all_qb_stats(season)
-        splits_data = self.db_manager.get_all_splits(season)
-        advanced_stats = self.db_manager.get_all_advanced_stats(season)
-        
-        # Convert to dictionaries
-        data = {
-            'qb_stats': [self._record_to_dict(stat) for stat in qb_stats],
-            'splits_data': [self._record_to_dict(stat) for stat in splits_data],
-            'advanced_stats': [self._record_to_dict(stat) for stat in advanced_stats],
-            'export_metadata': {
-                'export_timestamp': datetime.now().isoformat(),
-                'season': season,
-                'format': format,
-                'total_records': len(qb_stats) + len(splits_data) + len(advanced_stats)
-            }
-        }
+        seasons = sorted(set(season)) if isinstance(season, (list, tuple, set, range)) else [season]
+        dataset_columns = self._export_columns(columns)
         
         # Generate output filename
         if not output_file:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            season_suffix = f"_season_{season}" if season else "_all"
+            if seasons == [None]:
+                season_suffix = "_all"
+            elif len(seasons) == 1:
+                season_suffix = f"_season_{seasons[0]}"
+            else:
+                season_suffix = f"_seasons_{seasons[0]}-{seasons[-1]}"
             output_file = f"qb_data_export_{timestamp}{season_suffix}.{format}"
+            if compression:
+                output_file += COMPRESSION_SUFFIXES[compression]
         
         # Export based on format
-        if format.lower() == 'json':
-            self._export_json(data, output_file)
-        elif format.lower() == 'csv':
-            self._export_csv(data, output_file)
-        elif format.lower() == 'sqlite':
-            self._export_sqlite(data, output_file)
+        if format == 'json':
+            total_records = self._export_json(seasons, output_file, format, dataset_columns, compression)
+        elif format in ('jsonl', 'csv'):
+            total_records = self._export_per_dataset(seasons, output_file, format, dataset_columns, compression)
         else:
-            raise ValueError(f"Unsupported export format: {format}")
+            total_records = self._export_sqlite(seasons, output_file, dataset_columns)
         
-        logger.info(f"Data exported to: {output_file}")
+        logger.info(f"Exported {total_records} records to: {output_file}")
         return output_file
     
-    def _export_json(self, data: Dict[str, Any], output_file: str):
-        """Export data as JSON"""
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, default=str)
-    
-    def _export_csv(self, data: Dict[str, Any], output_file: str):
-        """Export data as CSV files"""
-        base_name = output_file.replace('.csv', '')
-        
-        for table_name, records in data.items():
-            if table_name == 'export_metadata':
-                continue
+    def _export_json(self, seasons: List[Optional[int]], output_file: str, format: str = 'json',
+                     dataset_columns: Optional[Dict[str, Optional[List[str]]]] = None,
+                     compression: Optional[str] = None) -> int:
+        """Export data as one JSON document, one record per line within each dataset"""
+        dataset_columns = dataset_columns or {dataset: None for dataset in DATASET_STREAMS}
+        total_records = 0
+        with open_export_file(output_file, compression) as f:
+            f.write('{\n')
+            for dataset, columns in dataset_columns.items():
+                f.write(f'  "{dataset}": [')
+                separator = '\n    '
+                for batch in self._stream_export(dataset, seasons, columns):
+                    for record in batch:
+                        f.write(separator + json.dumps(record, default=str))
+                        separator = ',\n    '
+                    total_records += len(batch)
+                f.write('\n  ],\n' if separator != '\n    ' else '],\n')
             
-            if not records:
-                continue
-            
-            csv_file = f"{base_name}_{table_name}.csv"
-            with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-                if records:
-                    writer = csv.DictWriter(f, fieldnames=records[0].keys())
-                    writer.writeheader()
-                    writer.writerows(records)
-    
-    def _export_sqlite(self, data: Dict[str, Any], output_file: str):
+            # Metadata goes last, once the record count is known
+            metadata = {
+                'export_timestamp': datetime.now().isoformat(),
+                'season': seasons[0] if len(seasons) == 1 else seasons,
+                'format': format,
+                'total_records': total_records
+            }
+            f.write('  "export_metadata": ')
+            f.write(json.dumps(metadata, indent=2, default=str).replace('\n', '\n  '))
+            f.write('\n}\n')
+        return total_records
+    
+    def _export_per_dataset(self, seasons: List[Optional[int]], output_file: str, format: str,
+                            dataset_columns: Dict[str, Optional[List[str]]],
+                            compression: Optional[str] = None) -> int:
+        """
+        Export data as JSON Lines or CSV, one file per dataset named after output_file
+        
+        export.csv.gz becomes export_qb_stats.csv.gz and so on. A dataset
+        without rows gets no file.
+        """
+        suffix = f".{format}" + (COMPRESSION_SUFFIXES[compression] if compression else '')
+        base_name = output_file[:-len(suffix)] if output_file.endswith(suffix) else output_file
+        total_records = 0
+        
+        for dataset, columns in dataset_columns.items():
+            with ExitStack() as stack:
+                f = writer = None
+                for batch in self._stream_export(dataset, seasons, columns):
+                    if f is None:
+                        f = stack.enter_context(open_export_file(f"{base_name}_{dataset}{suffix}", compression))
+                        if format == 'csv':
+                            writer = csv.DictWriter(f, fieldnames=columns or list(batch[0].keys()))
+                            writer.writeheader()
+                    if writer is not None:
+                        writer.writerows(batch)
+                    else:
+                        f.writelines(json.dumps(record, default=str) + '\n' for record in batch)
+                    total_records += len(batch)
+        
+        return total_records
+    
+    def _export_sqlite(self, seasons: List[Optional[int]], output_file: str,
+                       dataset_columns: Optional[Dict[str, Optional[List[str]]]] = None) -> int:
         """Export data as SQLite database"""
+        dataset_columns = dataset_columns or {dataset: None for dataset in DATASET_STREAMS}
+        total_records = 0
         with sqlite3.connect(output_file) as conn:
-            for table_name, records in data.items():
-                if table_name == 'export_metadata':
-                    continue
-                
-                if not records:
-                    continue
-                
-                # Create table
-                if records:
-                    columns = list(records[0].keys())
-                    create_sql = f"CREATE TABLE IF NOT EXISTS {table_name} ("
-                    create_sql += ", ".join([f"{col} TEXT" for col in columns])
-                    create_sql += ")"
-                    conn.execute(create_sql)
+            for dataset, selected in dataset_columns.items():
+                columns = None
+                for batch in self._stream_export(dataset, seasons, selected):
+                    if columns is None:
+                        # Create table
+                        columns = list(batch[0].keys())
+                        create_sql = f"CREATE TABLE IF NOT EXISTS {dataset} ("
+                        create_sql += ", ".join([f"{col} TEXT" for col in columns])
+                        create_sql += ")"
+                        conn.execute(create_sql)
+                        placeholders = ", ".join(["?" for _ in columns])
+                        insert_sql = f"INSERT INTO {dataset} VALUES ({placeholders})"
                     
                     # Insert data
-                    placeholders = ", ".join(["?" for _ in columns])
-                    insert_sql = f"INSERT INTO {table_name} VALUES ({placeholders})"
-                    
-                    for record in records:
-                        values = [str(record.get(col, '')) for col in columns]
-                        conn.execute(insert_sql, values)
+                    conn.executemany(insert_sql, (
+                        [str(record.get(col, '')) for col in columns] for record in batch
+                    ))
+                    total_records += len(batch)
             
             conn.commit()
+        return total_records
     
     def import_data(self, input_file: str, format: str = None) -> Dict[str, Any]:
         """Import data from file"""
@@ -589,53 +724,56 @@ class DataManager:
     
     def get_data_summary(self, season: Optional[int] = None) -> Dict[str, Any]:
         """Get summary statistics for data"""
-        qb_stats = self.db_manager.get_all_qb_stats(season)
-        splits_data = self.db_manager.get_all_splits(season)
-        advanced_stats = self.db_manager.get_all_advanced_stats(season)
+        qb_summary = self._calculate_stats_summary(self._stream_records('qb_stats', season))
+        splits_summary = self._calculate_stats_summary(self._stream_records('splits_data', season))
+        advanced_summary = self._calculate_stats_summary(self._stream_records('advanced_stats', season))
         
         return {
             'summary': {
-                'total_qb_stats': len(qb_stats),
-                'total_splits': len(splits_data),
-                'total_advanced_stats': len(advanced_stats),
+                'total_qb_stats': qb_summary['count'],
+                'total_splits': splits_summary['count'],
+                'total_advanced_stats': advanced_summary['count'],
                 'season': season,
                 'generated_at': datetime.now().isoformat()
             },
-            'qb_stats_summary': self._calculate_stats_summary(qb_stats),
-            'splits_summary': self._calculate_stats_summary(splits_data),
-            'advanced_summary': self._calculate_stats_summary(advanced_stats)
+            'qb_stats_summary': qb_summary,
+            'splits_summary': splits_summary,
+            'advanced_summary': advanced_summary
         }
     
-    def _calculate_stats_summary(self, records: List[Any]) -> Dict[str, Any]:
-        """Calculate summary statistics for a dataset"""
-        if not records:
+    def _calculate_stats_summary(self, batches: Iterable[List[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Calculate summary statistics for a dataset arriving in batches of record dicts"""
+        count = 0
+        fields: List[str] = []
+        numeric_fields: Dict[str, Dict[str, Any]] = {}
+        
+        for records in batches:
+            if not fields:
+                fields = list(records[0].keys())
+            count += len(records)
+            
+            # Keep running min/max/sum per numeric field
+            for record in records:
+                for field, value in record.items():
+                    if not isinstance(value, (int, float)) or isinstance(value, bool):
+                        continue
+                    stats = numeric_fields.get(field)
+                    if stats is None:
+                        numeric_fields[field] = {'min': value, 'max': value, 'sum': value, 'count': 1}
+                    else:
+                        stats['min'] = min(stats['min'], value)
+                        stats['max'] = max(stats['max'], value)
+                        stats['sum'] += value
+                        stats['count'] += 1
+        
+        if not count:
             return {'count': 0}
         
-        # Convert to dictionaries
-        dict_records = [self._record_to_dict(record) for record in records]
+        for stats in numeric_fields.values():
+            stats['avg'] = stats.pop('sum') / stats['count']
         
-        # Calculate basic stats
-        summary = {
-            'count': len(dict_records),
-            'fields': list(dict_records[0].keys()) if dict_records else []
+        return {
+            'count': count,
+            'fields': fields,
+            'numeric_fields': numeric_fields
         }
-        
-        # Calculate numeric field statistics
-        numeric_fields = {}
-        for field in summary['fields']:
-            values = []
-            for record in dict_records:
-                value = record.get(field)
-                if isinstance(value, (int, float)) and value is not None:
-                    values.append(value)
-            
-            if values:
-                numeric_fields[field] = {
-                    'min': min(values),
-                    'max': max(values),
-                    'avg': sum(values) / len(values),
-                    'count': len(values)
-                }
-        
-        summary['numeric_fields'] = numeric_fields
-        return summary 
\ No newline at end of file
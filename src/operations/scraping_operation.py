@@ -5,21 +5,35 @@ Orchestrates comprehensive scraping operations with enhanced splits extraction
 """
 
 import logging
+import re
 import time
 from datetime import datetime
 from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 
 from src.database.db_manager import DatabaseManager
+from src.database.write_behind import WriteBehindWriter
 from src.scrapers.nfl_qb_scraper import NFLQBDataPipeline
 from src.scrapers.enhanced_scraper import EnhancedPFRScraper
 from src.core.splits_manager import SplitsManager
 from src.core.selenium_manager import SeleniumManager, SeleniumConfig
-from src.models.qb_models import QBBasicStats, QBSplitsType1, QBSplitsType2
+from src.core.page_cache import PageCache
+from src.core.request_manager import RequestManager
+from src.core.async_pipeline import AsyncPipeline, PipelineStats
+from src.core.html_parser import HTMLParser
+from src.core.pfr_data_extractor import PFRDataExtractor
+from src.core.scraper import CoreScraper
+from src.operations.crawl_planner import CrawlPlanner
+from src.models.qb_models import Player, QBBasicStats, QBSplitsType1, QBSplitsType2
 from src.config.config import config
 
 logger = logging.getLogger(__name__)
 
+PFR_ID_PATTERN = re.compile(r'^[A-Za-z.\'-]{2,6}\d{2}$')
+
+# Default for ScrapingOperation's page_cache: build the cache from config.cache
+_FROM_CONFIG = object()
+
 
 @dataclass
 class ScrapingResult:
@@ -43,35 +57,60 @@ class ScrapingResult:
 class ScrapingOperation:
     """Orchestrates scraping operations with enhanced splits extraction"""
     
-    def __init__(self, config, db_manager: DatabaseManager, min_delay: float = 7.0, max_delay: float = 12.0):
+    def __init__(self, config, db_manager: DatabaseManager, min_delay: float = 7.0, max_delay: float = 12.0,
+                 page_cache: Any = _FROM_CONFIG):
         self.config = config
         self.db_manager = db_manager
         self.min_delay = min_delay
         self.max_delay = max_delay
         
+        # Raw page cache shared by every fetcher so re-extraction never refetches;
+        # an explicit None (scrape --no-cache) disables it
+        if page_cache is _FROM_CONFIG:
+            page_cache = PageCache.from_config(config.cache) if hasattr(config, 'cache') else None
+        self.page_cache = page_cache
+        
         # Initialize enhanced components with Selenium manager
         selenium_config = SeleniumConfig(
             headless=True,
             human_behavior_delay=(min_delay, max_delay)
         )
-        self.selenium_manager = SeleniumManager(selenium_config)
+        self.selenium_manager = SeleniumManager(selenium_config, page_cache=self.page_cache)
+        
+        # Plain HTTP fetcher for splits pages; the browser is only a fallback
+        self.request_manager = RequestManager(
+            rate_limit_delay=min_delay,
+            jitter_range=max(0.0, max_delay - min_delay),
+            page_cache=self.page_cache
+        )
         
         # Initialize splits manager first
-        self.splits_manager = SplitsManager(self.selenium_manager)
+        self.splits_manager = SplitsManager(self.selenium_manager, request_manager=self.request_manager)
         
         # Initialize enhanced scraper with the splits manager
-        self.enhanced_scraper = EnhancedPFRScraper(rate_limit_delay=min_delay, splits_manager=self.splits_manager)
+        self.enhanced_scraper = EnhancedPFRScraper(
+            rate_limit_delay=min_delay,
+            splits_manager=self.splits_manager,
+            page_cache=self.page_cache
+        )
+        
+        # Career harvests fetch and parse player pages through the core scraper
+        self.career_scraper = CoreScraper(
+            self.request_manager, HTMLParser(), PFRDataExtractor(), db_manager, config,
+            selenium_manager=self.selenium_manager
+        )
         
         # Initialize legacy pipeline for backwards compatibility
         self.legacy_pipeline = NFLQBDataPipeline(
-            connection_string=config.get_database_url(),
             min_delay=min_delay,
-            max_delay=max_delay
+            max_delay=max_delay,
+            db_manager=db_manager
         )
         
         logger.info(f"Initialized ScrapingOperation with enhanced splits extraction")
     
-    def execute(self, season: int, player_names: Optional[List[str]] = None, splits_only: bool = False) -> ScrapingResult:
+    def execute(self, season: int, player_names: Optional[List[str]] = None, splits_only: bool = False,
+                incremental: bool = False, refresh_summaries: bool = True) -> ScrapingResult:
         """
         Execute the scraping operation for a given season with enhanced splits extraction.
 
@@ -79,6 +118,10 @@ class ScrapingOperation:
             season: The season to scrape.
             player_names: Optional list of player names to scrape.
             splits_only: If True, only scrape splits data (skip main stats).
+            incremental: If True, skip complete seasons and fetch splits only for players
+                whose stats changed since their splits were scraped.
+            refresh_summaries: If False, leave the materialized summaries for the caller
+                to refresh once its whole load has finished.
 
         Returns:
             A ScrapingResult object with the outcome.
@@ -88,12 +131,22 @@ class ScrapingOperation:
         try:
             logger.info(f"Starting enhanced scraping operation for season {season}")
             
+            if incremental and not splits_only:
+                plan = self.create_planner().plan_season(season, player_names)
+                logger.info(f"Crawl plan for {season}: {plan.state}, {plan.reason}")
+                if plan.skip:
+                    return ScrapingResult(
+                        success=True,
+                        season=season,
+                        message=f"Season {season} skipped: {plan.reason}"
+                    )
+            
             if splits_only:
                 return self._execute_splits_only(season, player_names)
             elif player_names:
-                return self._execute_specific_players(season, player_names)
+                return self._execute_specific_players(season, player_names, incremental)
             else:
-                return self._execute_full_season(season)
+                return self._execute_full_season(season, incremental)
                 
         except Exception as e:
             logger.error(f"Scraping operation failed: {e}", exc_info=True)
@@ -105,13 +158,108 @@ class ScrapingOperation:
                 processing_time=time.time() - start_time
             )
         finally:
+            if refresh_summaries:
+                self._refresh_summaries()
             processing_time = time.time() - start_time
             logger.info(f"Scraping operation completed in {processing_time:.2f} seconds")
     
-    def _execute_full_season(self, season: int) -> ScrapingResult:
+    def execute_career(self, players: List[str], seasons: Optional[List[int]] = None) -> ScrapingResult:
+        """
+        Harvest every season of each player's passing stats from their player page.
+        
+        A player page carries the whole career, so backfilling a veteran costs
+        one request instead of one per season. All seasons are upserted into
+        qb_passing_stats in a single batch.
+        
+        Args:
+            players: Player names or PFR IDs (e.g. 'BurrJo01')
+            seasons: Optional seasons to keep (default: the whole career)
+            
+        Returns:
+            A ScrapingResult; season is the latest season harvested
+        """
+        start_time = time.time()
+        logger.info(f"Executing career harvest for {len(players)} players")
+        
+        passing_stats: List[QBBasicStats] = []
+        errors: List[str] = []
+        warnings: List[str] = []
+        
+        try:
+            for player in players:
+                if PFR_ID_PATTERN.match(player):
+                    pfr_id, player_name = player, None
+                else:
+                    pfr_id, player_name = self._get_pfr_id_for_player(player), player
+                if not pfr_id:
+                    # Only names already stored from a season crawl resolve; anything else needs its PFR ID
+                    errors.append(f"Could not find PFR ID for {player}")
+                    continue
+                
+                career = self.career_scraper.scrape_player_career(pfr_id, player_name, seasons)
+                if career['errors']:
+                    errors.extend(f"{player}: {error}" for error in career['errors'])
+                    continue
+                warnings.extend(career['warnings'])
+                if not career['seasons']:
+                    continue
+                
+                scraped_at = datetime.now()
+                for row in career['seasons']:
+                    stats = QBBasicStats.from_dict(row)
+                    stats.scraped_at = scraped_at
+                    stats.updated_at = scraped_at
+                    passing_stats.append(stats)
+                logger.info(f"Harvested {len(career['seasons'])} seasons for {career['player_name']} from one page")
+            
+            # One upsert for every player's seasons
+            inserted_stats = self._insert_passing_stats(passing_stats)
+            self._refresh_summaries()
+            
+            return ScrapingResult(
+                success=bool(passing_stats) and not errors,
+                season=max((stats.season for stats in passing_stats), default=0),
+                message=f"Harvested {len(passing_stats)} player-seasons from {len(players)} player pages",
+                scraped_records=len(passing_stats),
+                saved_records=inserted_stats,
+                errors=errors,
+                warnings=warnings,
+                processing_time=time.time() - start_time
+            )
+            
+        except Exception as e:
+            logger.error(f"Career harvest failed: {e}", exc_info=True)
+            return ScrapingResult(
+                success=False,
+                season=0,
+                message=f"Career harvest failed: {str(e)}",
+                errors=errors + [str(e)],
+                processing_time=time.time() - start_time
+            )
+    
+    def create_planner(self) -> CrawlPlanner:
+        """Crawl planner over this operation's database and rate limit settings"""
+        return CrawlPlanner(self.db_manager, getattr(self.config, 'scraping', None),
+                            min_delay=self.min_delay, max_delay=self.max_delay)
+    
+    def _changed_players(self, season: int, passing_stats: List[QBBasicStats]) -> List[QBBasicStats]:
+        """Stored passing stats whose player's splits are missing or older than the stats"""
+        needed = set(self.create_planner().players_needing_splits(
+            season, [stat.pfr_id for stat in passing_stats]
+        ))
+        changed = [stat for stat in passing_stats if stat.pfr_id in needed]
+        logger.info(f"{len(changed)} of {len(passing_stats)} players need splits for {season}")
+        return changed
+    
+    def _execute_full_season(self, season: int, incremental: bool = False) -> ScrapingResult:
         """Execute full season scraping with enhanced splits extraction"""
         logger.info(f"Executing full season scraping for {season}")
         
+        scraping_config = getattr(self.config, 'scraping', None)
+        # The one-shot scraper fetches every player's splits, so incremental runs use the pipeline
+        if incremental or getattr(scraping_config, 'pipeline_enabled', False):
+            return self._execute_full_season_pipelined(season, incremental)
+        
         try:
             # Use enhanced scraper for comprehensive data extraction with context manager
             with self.enhanced_scraper as scraper:
@@ -132,6 +280,7 @@ class ScrapingOperation:
             inserted_stats = self._insert_passing_stats(passing_stats)
             inserted_basic_splits = self._insert_basic_splits(basic_splits)
             inserted_advanced_splits = self._insert_advanced_splits(advanced_splits)
+            self._record_splits_checks(season, [s.pfr_id for s in basic_splits + advanced_splits])
             
             # Get comprehensive metrics
             splits_summary = self.splits_manager.get_extraction_summary()
@@ -158,33 +307,156 @@ class ScrapingOperation:
                 errors=[str(e)]
             )
     
-    def _execute_specific_players(self, season: int, player_names: List[str]) -> ScrapingResult:
+    def _execute_full_season_pipelined(self, season: int, incremental: bool = False) -> ScrapingResult:
+        """
+        Execute full season scraping with splits fetched, parsed and stored in a pipeline.
+        
+        Passing stats are scraped and inserted first (splits reference the
+        players). Splits pages then flow through AsyncPipeline, so parsing and
+        inserting one player's splits overlaps the rate-limit wait for the next.
+        """
+        logger.info(f"Executing pipelined full season scraping for {season}")
+        
+        try:
+            with self.enhanced_scraper as scraper:
+                players, passing_stats = self._get_season_passing_stats(scraper, season)
+                if not passing_stats:
+                    return ScrapingResult(
+                        success=False,
+                        season=season,
+                        message="No QB passing stats found for the season",
+                        errors=["No data found"]
+                    )
+                
+                inserted_stats = self._insert_passing_stats(passing_stats)
+                splits_targets = self._changed_players(season, passing_stats) if incremental else passing_stats
+                stats, basic_count, advanced_count = self._run_splits_pipeline(splits_targets)
+            
+            splits_summary = self.splits_manager.get_extraction_summary()
+            self._create_scraping_log(season, len(passing_stats), basic_count, advanced_count)
+            
+            return ScrapingResult(
+                success=True,
+                season=season,
+                message=f"Successfully scraped {len(passing_stats)} QB records with pipelined splits extraction",
+                scraped_records=len(passing_stats),
+                saved_records=inserted_stats,
+                errors=stats.errors,
+                warnings=splits_summary.get('warnings', [])
+            )
+            
+        except Exception as e:
+            logger.error(f"Pipelined full season scraping failed: {e}", exc_info=True)
+            return ScrapingResult(
+                success=False,
+                season=season,
+                message=f"Pipelined full season scraping failed: {str(e)}",
+                errors=[str(e)]
+            )
+    
+    def _get_season_passing_stats(self, scraper, season: int,
+                                  player_names: Optional[List[str]] = None) -> Tuple[List[Any], List[QBBasicStats]]:
+        """
+        Get passing stats for a season from the season-wide leaderboard pages.
+        
+        With advanced_leaderboard_enabled the advanced passing page fills any
+        fields the main table lacks; otherwise only the main table is read.
+        """
+        scraping_config = getattr(self.config, 'scraping', None)
+        include_advanced = getattr(scraping_config, 'advanced_leaderboard_enabled', False)
+        return scraper.get_season_leaderboard(season, player_names, include_advanced=include_advanced)
+    
+    def _run_splits_pipeline(self, qb_stats: List[QBBasicStats]) -> Tuple[PipelineStats, int, int]:
+        """
+        Fetch, parse and store splits for every player through AsyncPipeline.
+        
+        Returns:
+            Tuple of (pipeline stats, basic splits stored, advanced splits stored)
+        """
+        extractor = self.splits_manager.splits_extractor
+        metrics = self.splits_manager.metrics
+        metrics.total_players = len(qb_stats)
+        stored = {'basic': 0, 'advanced': 0}
+        checked: Dict[int, List[str]] = {}
+        
+        def fetch(qb_stat) -> Optional[str]:
+            url = extractor._build_enhanced_splits_url(qb_stat.pfr_id, qb_stat.season)
+            result = self.request_manager.get_page(url)
+            if not result['success']:
+                # Returning None makes the pipeline count the player as a failed fetch
+                logger.warning(f"Static splits fetch failed for {qb_stat.player_name}: {result['error']}")
+                return None
+            return result['content']
+        
+        def parse(qb_stat, content: str) -> List[Any]:
+            scraped_at = datetime.now()
+            result = extractor.parse_splits_page(
+                content, qb_stat.pfr_id, qb_stat.player_name, qb_stat.season, scraped_at
+            )
+            if result is None:
+                # Tables missing from the static page: hand it over so only the browser load is added
+                result = extractor.extract_player_splits(
+                    qb_stat.pfr_id, qb_stat.player_name, qb_stat.season, scraped_at, static_content=content
+                )
+            metrics.add_extraction_result(result)
+            if result.errors:
+                logger.warning(f"Errors extracting splits for {qb_stat.player_name}: {result.errors}")
+            elif result.tables_processed:
+                checked.setdefault(qb_stat.season, []).append(qb_stat.pfr_id)
+            return result.basic_splits + result.advanced_splits
+        
+        def store(records: List[Any]) -> int:
+            basic = [r for r in records if isinstance(r, QBSplitsType1)]
+            advanced = [r for r in records if isinstance(r, QBSplitsType2)]
+            basic_count = self._insert_basic_splits(basic)
+            advanced_count = self._insert_advanced_splits(advanced)
+            stored['basic'] += basic_count
+            stored['advanced'] += advanced_count
+            return basic_count + advanced_count
+        
+        scraping_config = self.config.scraping
+        pipeline = AsyncPipeline(
+            fetch, parse, store,
+            queue_size=scraping_config.pipeline_queue_size,
+            batch_size=scraping_config.pipeline_batch_size,
+            describe=lambda qb_stat: f"{qb_stat.player_name} ({qb_stat.pfr_id})"
+        )
+        stats = pipeline.run(qb_stats)
+        logger.info(f"Splits pipeline stats: {stats.to_dict()}")
+        for season, pfr_ids in checked.items():
+            self._record_splits_checks(season, pfr_ids)
+        return stats, stored['basic'], stored['advanced']
+    
+    def _execute_specific_players(self, season: int, player_names: List[str],
+                                  incremental: bool = False) -> ScrapingResult:
         """Execute scraping for specific players with enhanced splits extraction"""
         logger.info(f"Executing specific player scraping for {len(player_names)} players")
         
         try:
-            # First get basic stats for the specified players
-            passing_stats = []
-            basic_splits = []
-            advanced_splits = []
-            
-            # Use enhanced scraper with context manager
-            with self.enhanced_scraper as scraper:
-                for player_name in player_names:
-                    logger.info(f"Processing player: {player_name}")
+            # Records go to the write-behind writer as they are scraped, so
+            # inserts overlap the rate-limit waits for the next player
+            with self._create_writer() as writer:
+                with self.enhanced_scraper as scraper:
+                    # One season-wide request covers every requested player's passing stats
+                    players, passing_stats = self._get_season_passing_stats(scraper, season, player_names)
+                    writer.put_many(passing_stats)
+                    
+                    splits_targets = passing_stats
+                    if incremental:
+                        # The planner compares against the stored rows, so they must be written first
+                        writer.flush()
+                        splits_targets = self._changed_players(season, passing_stats)
                     
-                    # Get basic stats for this player
-                    players, player_stats = scraper.get_qb_main_stats(season, [player_name])
-                    if player_stats:
-                        passing_stats.extend(player_stats)
-                        
-                        # Extract splits for this player
-                        for stat in player_stats:
-                            splits_result = self.splits_manager.extract_player_splits_by_name(
-                                stat.player_name, stat.pfr_id, season
-                            )
-                            basic_splits.extend(splits_result.basic_splits)
-                            advanced_splits.extend(splits_result.advanced_splits)
+                    # Splits only exist on the per-player pages
+                    checked = []
+                    for stat in splits_targets:
+                        logger.info(f"Processing player: {stat.player_name}")
+                        splits_result = self.splits_manager.extract_player_splits_by_name(
+                            stat.player_name, stat.pfr_id, season
+                        )
+                        writer.put_many(splits_result.basic_splits + splits_result.advanced_splits)
+                        if not splits_result.errors and splits_result.tables_processed:
+                            checked.append(stat.pfr_id)
             
             if not passing_stats:
                 return ScrapingResult(
@@ -194,17 +466,24 @@ class ScrapingOperation:
                     errors=["No data found for specified players"]
                 )
             
-            # Insert data into database
-            inserted_stats = self._insert_passing_stats(passing_stats)
-            inserted_basic_splits = self._insert_basic_splits(basic_splits)
-            inserted_advanced_splits = self._insert_advanced_splits(advanced_splits)
+            write_stats = writer.stats
+            logger.info(f"Write-behind stats: {write_stats.to_dict()}")
+            if write_stats.failed_flushes == 0:
+                self._record_splits_checks(season, checked)
+                self._create_scraping_log(
+                    season, write_stats.written.get(QBBasicStats.__name__, 0),
+                    write_stats.written.get(QBSplitsType1.__name__, 0),
+                    write_stats.written.get(QBSplitsType2.__name__, 0),
+                    scope='players'
+                )
             
             return ScrapingResult(
-                success=True,
+                success=write_stats.failed_flushes == 0,
                 season=season,
                 message=f"Successfully scraped {len(passing_stats)} QB records for specified players",
                 scraped_records=len(passing_stats),
-                saved_records=inserted_stats,
+                saved_records=write_stats.written.get(QBBasicStats.__name__, 0),
+                errors=write_stats.errors,
                 processing_time=time.time() - time.time()  # Will be set by caller
             )
             
@@ -223,7 +502,7 @@ class ScrapingOperation:
         
         try:
             # Get existing QB stats from database for splits extraction
-            existing_stats = self.db_manager.get_qb_stats_for_season(season)
+            existing_stats = self._stored_passing_stats(season)
             
             # If no existing stats and no specific players requested, return error
             if not existing_stats and not player_names:
@@ -251,7 +530,7 @@ class ScrapingOperation:
                 for player_name in missing_players:
                     # Try to extract PFR ID from the player name or use a default pattern
                     # This is a simplified approach - in production you might want to look up PFR IDs
-                    pfr_id = self._get_pfr_id_for_player(player_name, season)
+                    pfr_id = self._get_pfr_id_for_player(player_name)
                     if pfr_id:
                         placeholder_stat = type('obj', (object,), {
                             'pfr_id': pfr_id,
@@ -272,24 +551,32 @@ class ScrapingOperation:
                     errors=["No data available for splits extraction"]
                 )
             
-            # Extract splits using enhanced splits manager
-            basic_splits, advanced_splits = self.splits_manager.extract_all_player_splits(
-                existing_stats, use_concurrent=False
-            )
+            # Extract splits using enhanced splits manager; each player's splits
+            # go to the write-behind writer as soon as they are extracted
+            extracted = {'basic': 0, 'advanced': 0}
             
-            # Insert splits data
-            inserted_basic_splits = self._insert_basic_splits(basic_splits)
-            inserted_advanced_splits = self._insert_advanced_splits(advanced_splits)
+            def hand_off(result) -> None:
+                extracted['basic'] += len(result.basic_splits)
+                extracted['advanced'] += len(result.advanced_splits)
+                writer.put_many(result.basic_splits + result.advanced_splits)
+            
+            with self._create_writer() as writer:
+                self.splits_manager.extract_all_player_splits(
+                    existing_stats, use_concurrent=False, on_player=hand_off
+                )
+            write_stats = writer.stats
+            logger.info(f"Write-behind stats: {write_stats.to_dict()}")
             
             # Get splits manager summary
             splits_summary = self.splits_manager.get_extraction_summary()
             
             return ScrapingResult(
-                success=True,
+                success=write_stats.failed_flushes == 0,
                 season=season,
-                message=f"Successfully extracted {len(basic_splits)} basic and {len(advanced_splits)} advanced splits",
-                scraped_records=len(basic_splits) + len(advanced_splits),
-                saved_records=inserted_basic_splits + inserted_advanced_splits,
+                message=f"Successfully extracted {extracted['basic']} basic and {extracted['advanced']} advanced splits",
+                scraped_records=extracted['basic'] + extracted['advanced'],
+                saved_records=write_stats.total_written,
+                errors=write_stats.errors,
                 processing_time=time.time() - time.time(),  # Will be set by caller
                 warnings=splits_summary.get('warnings', [])
             )
@@ -303,27 +590,46 @@ class ScrapingOperation:
                 errors=[str(e)]
             )
     
+    def _stored_passing_stats(self, season: int) -> List[QBBasicStats]:
+        """Players with passing stats stored for a season, one per PFR ID, as splits targets"""
+        columns = ('pfr_id', 'player_name', 'player_url', 'season')
+        stats: Dict[str, QBBasicStats] = {}
+        for batch in self.db_manager.stream_qb_stats(season, columns=columns):
+            for row in batch:
+                stats.setdefault(row['pfr_id'], QBBasicStats(**row))
+        return list(stats.values())
+    
+    def _refresh_summaries(self) -> None:
+        """Bring the materialized summaries up to date once a load has finished"""
+        refresh = getattr(self.db_manager, 'refresh_summaries_if_stale', None)
+        if refresh is not None:
+            refresh()
+    
+    def _create_writer(self) -> WriteBehindWriter:
+        """Create a write-behind writer feeding the bulk insert paths, one transaction per flush"""
+        handlers = {
+            QBBasicStats: self._insert_passing_stats,
+            QBSplitsType1: self._insert_basic_splits,
+            QBSplitsType2: self._insert_advanced_splits,
+        }
+        bulk_config = getattr(self.config, 'bulk_operations', config.bulk_operations)
+        return WriteBehindWriter.from_config(
+            handlers, bulk_config, transaction=getattr(self.db_manager, 'transaction', None)
+        )
+    
     def _insert_passing_stats(self, passing_stats: List[QBBasicStats]) -> int:
         """Insert passing stats into database"""
         if not passing_stats:
             return 0
         
         try:
-            # Insert players first to satisfy foreign key constraints
-            players = []
-            for stat in passing_stats:
-                # Create player object from QB stats
-                player = type('obj', (object,), {
-                    'pfr_id': stat.pfr_id,
-                    'player_name': stat.player_name,
-                    'position': 'QB',
-                    'pfr_url': stat.player_url,
-                    'created_at': datetime.now(),
-                    'updated_at': datetime.now()
-                })()
-                players.append(player)
-            
-            self.db_manager.insert_players(players)
+            # Upsert players first to satisfy foreign key constraints; traded players have one row per team
+            players = {
+                stat.pfr_id: Player(pfr_id=stat.pfr_id, player_name=stat.player_name, pfr_url=stat.player_url or '')
+                for stat in passing_stats
+            }
+            for player in players.values():
+                self.db_manager.insert_player(player)
             
             # Insert QB stats
             inserted_count = self.db_manager.insert_qb_basic_stats(passing_stats)
@@ -362,10 +668,20 @@ class ScrapingOperation:
             logger.error(f"Failed to insert advanced splits: {e}")
             raise
     
-    def _create_scraping_log(self, season: int, stats_count: int, basic_splits_count: int, advanced_splits_count: int):
-        """Create and insert scraping log"""
+    def _record_splits_checks(self, season: int, pfr_ids: List[str]) -> None:
+        """Record whose splits were fetched and parsed, so incremental runs skip them until their stats change"""
+        if not pfr_ids:
+            return
         try:
-            from models.qb_models import ScrapingLog
+            self.db_manager.record_splits_checks(season, pfr_ids)
+        except Exception as e:
+            logger.warning(f"Failed to record splits checks: {e}")
+    
+    def _create_scraping_log(self, season: int, stats_count: int, basic_splits_count: int, advanced_splits_count: int,
+                             scope: str = 'season'):
+        """Create and insert scraping log; scope is 'players' when only selected players were crawled"""
+        try:
+            from src.models.qb_models import ScrapingLog
             from src.utils.data_utils import generate_session_id
             
             log = ScrapingLog(
@@ -380,7 +696,8 @@ class ScrapingOperation:
                 errors=[],
                 warnings=[],
                 rate_limit_violations=0,
-                processing_time_seconds=0.0
+                processing_time_seconds=0.0,
+                scope=scope
             )
             
             self.db_manager.insert_scraping_log(log)
@@ -411,23 +728,25 @@ class ScrapingOperation:
         except AttributeError:
             pass 
 
-    def _get_pfr_id_for_player(self, player_name: str, season: int) -> Optional[str]:
-        """Get PFR ID for a player by name and season"""
-        # This is a simplified lookup - in production you might want a more robust approach
-        # For now, we'll use some common patterns for known players
+    def _get_pfr_id_for_player(self, player_name: str) -> Optional[str]:
+        """
+        Get the PFR ID of a player stored from an earlier crawl.
         
-        # Common PFR ID patterns for well-known players
-        pfr_id_mapping = {
-            "Joe Burrow": "burrjo01",
-            "Patrick Mahomes": "mahompa00",
-            "Josh Allen": "allenjo02",
-            "Lamar Jackson": "jackla00",
-            "Justin Herbert": "herbju00",
-            "Dak Prescott": "prescda01",
-            "Jalen Hurts": "hurtja00",
-            "Tua Tagovailoa": "tagovtu00",
-            "Kirk Cousins": "couski01",
-            "Aaron Rodgers": "rodgaar00"
-        }
+        Looks in players rather than a season's passing stats, so players
+        with no stats stored for the season being scraped still resolve.
+        A name resolves only when exactly one stored player has it;
+        otherwise callers need the PFR ID itself.
+        """
+        try:
+            rows = self.db_manager.query(
+                "SELECT pfr_id FROM players WHERE player_name = %s", (player_name,)
+            )
+        except Exception as e:
+            logger.warning(f"Could not look up PFR ID for {player_name}: {e}")
+            return None
         
-        return pfr_id_mapping.get(player_name) 
\ No newline at end of file
+        pfr_ids = sorted({row['pfr_id'] for row in rows})
+        if len(pfr_ids) > 1:
+            logger.warning(f"{player_name} matches several players ({', '.join(pfr_ids)}); pass the PFR ID instead")
+            return None
+        return pfr_ids[0] if pfr_ids else None
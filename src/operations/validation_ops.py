@@ -8,18 +8,18 @@ import logging
 import sys
 import os
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Union, Tuple
+from typing import List, Dict, Any, Iterable, Optional, Union, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 import json
 
 try:
-    from src.database.db_manager import DatabaseManager
+    from src.database.backends import open_database
     from src.models.qb_models import QBBasicStats, QBAdvancedStats, QBSplitStats, Player
     from src.config.config import config
 except ImportError:
     # Fallback for testing
-    DatabaseManager = None
+    open_database = None
     QBBasicStats = None
     QBAdvancedStats = None
     QBSplitStats = None
@@ -168,8 +168,8 @@ class ValidationEngine:
         self.rules = self._create_validation_rules()
         self.db_manager = None
         
-        if DatabaseManager is not None:
-            self.db_manager = DatabaseManager()
+        if open_database is not None:
+            self.db_manager = open_database()
     
     def _create_validation_rules(self) -> List[Dict[str, Any]]:
         """Create comprehensive validation rules"""
@@ -535,26 +535,31 @@ class ValidationEngine:
     
     def validate_dataset(self, records: List[Dict[str, Any]], record_type: str) -> ValidationReport:
         """Validate entire dataset"""
+        return self.validate_batches([records], record_type)
+    
+    def validate_batches(self, batches: Iterable[List[Any]], record_type: str) -> ValidationReport:
+        """Validate a dataset arriving in batches, holding one batch at a time"""
         validation_id = f"validation_{int(datetime.now().timestamp())}"
         report = ValidationReport(
             validation_id=validation_id,
             timestamp=datetime.now(),
-            total_records=len(records),
             validation_rules=[rule['name'] for rule in self.rules]
         )
         
         valid_records = 0
         invalid_records = 0
         
-        for record in records:
-            issues = self.validate_record(record, record_type)
-            
-            if not issues:
-                valid_records += 1
-            else:
-                invalid_records += 1
-                for issue in issues:
-                    report.add_issue(issue)
+        for records in batches:
+            report.total_records += len(records)
+            for record in records:
+                issues = self.validate_record(self._record_to_dict(record), record_type)
+                
+                if not issues:
+                    valid_records += 1
+                else:
+                    invalid_records += 1
+                    for issue in issues:
+                        report.add_issue(issue)
         
         report.valid_records = valid_records
         report.invalid_records = invalid_records
@@ -571,27 +576,23 @@ class ValidationEngine:
         reports = {}
         
         try:
-            # Validate QB stats
-            if hasattr(self.db_manager, 'get_all_qb_stats'):
-                qb_stats = self.db_manager.get_all_qb_stats(season)
-                qb_records = [self._record_to_dict(stat) for stat in qb_stats]
-                reports['qb_stats'] = self.validate_dataset(qb_records, 'qb_stats')
+            # Validate QB stats, streamed from a server-side cursor in batches
+            if hasattr(self.db_manager, 'stream_qb_stats'):
+                reports['qb_stats'] = self.validate_batches(self.db_manager.stream_qb_stats(season), 'qb_stats')
             else:
                 reports['qb_stats'] = self._create_mock_validation_report('qb_stats')
             
             # Validate splits data
-            if hasattr(self.db_manager, 'get_all_splits'):
-                splits_data = self.db_manager.get_all_splits(season)
-                splits_records = [self._record_to_dict(stat) for stat in splits_data]
-                reports['splits'] = self.validate_dataset(splits_records, 'splits')
+            if hasattr(self.db_manager, 'stream_splits'):
+                reports['splits'] = self.validate_batches(self.db_manager.stream_splits(season), 'splits')
             else:
                 reports['splits'] = self._create_mock_validation_report('splits')
             
             # Validate advanced stats
-            if hasattr(self.db_manager, 'get_all_advanced_stats'):
-                advanced_stats = self.db_manager.get_all_advanced_stats(season)
-                advanced_records = [self._record_to_dict(stat) for stat in advanced_stats]
-                reports['advanced_stats'] = self.validate_dataset(advanced_records, 'advanced_stats')
+            if hasattr(self.db_manager, 'stream_advanced_stats'):
+                reports['advanced_stats'] = self.validate_batches(
+                    self.db_manager.stream_advanced_stats(season), 'advanced_stats'
+                )
             else:
                 reports['advanced_stats'] = self._create_mock_validation_report('advanced_stats')
                 
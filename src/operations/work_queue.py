@@ -0,0 +1,531 @@
+#!/usr/bin/env python3
+"""
+Durable Work Queue for Batch Scraping
+Batch items stored in a database table that any number of worker processes
+claim from, so one backfill can be spread across processes and machines.
+
+A claim takes the oldest pending item of a session and leases it to the
+worker for ``lease_seconds``. The worker heartbeats to extend the lease
+while it scrapes and then completes or fails the item. Leases that run
+out (a worker crashed or lost its connection) are reclaimed by the next
+claim: the item goes back to pending, or to failed once its attempts are
+used up. Postgres claims with ``FOR UPDATE SKIP LOCKED`` so workers never
+wait on each other; the SQLite stand-in serializes claims with
+``BEGIN IMMEDIATE`` on a shared file.
+"""
+
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Tuple, Union
+
+from src.database.sqlite_manager import is_sqlite_url, sqlite_path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEASE_SECONDS = 120.0
+
+QUEUE_STATUSES = ('pending', 'running', 'completed', 'failed')
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS batch_queue (
+    id TEXT PRIMARY KEY,
+    session_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    payload TEXT NOT NULL DEFAULT '{}',
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 3,
+    lease_owner TEXT,
+    lease_expires_at REAL,
+    error_message TEXT,
+    result TEXT,
+    enqueued_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_batch_queue_session_status ON batch_queue(session_id, status, enqueued_at);
+"""
+
+_POSTGRES_SCHEMA = """
+CREATE TABLE IF NOT EXISTS batch_queue (
+    id VARCHAR(200) PRIMARY KEY,
+    session_id VARCHAR(100) NOT NULL,
+    name VARCHAR(200) NOT NULL,
+    payload JSONB NOT NULL DEFAULT '{}',
+    status VARCHAR(20) NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 3,
+    lease_owner VARCHAR(200),
+    lease_expires_at TIMESTAMPTZ,
+    error_message TEXT,
+    result JSONB,
+    enqueued_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_batch_queue_session_status ON batch_queue(session_id, status, enqueued_at);
+"""
+
+
+@dataclass
+class QueueItem:
+    """Batch item leased to a worker"""
+    id: str
+    session_id: str
+    name: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+    attempts: int = 0
+    max_attempts: int = 3
+    lease_owner: Optional[str] = None
+
+    @classmethod
+    def from_row(cls, row: Any) -> 'QueueItem':
+        """Create from a batch_queue row"""
+        payload = row['payload']
+        return cls(
+            id=row['id'],
+            session_id=row['session_id'],
+            name=row['name'],
+            payload=json.loads(payload) if isinstance(payload, str) else (payload or {}),
+            attempts=row['attempts'],
+            max_attempts=row['max_attempts'],
+            lease_owner=row['lease_owner']
+        )
+
+
+def default_worker_id() -> str:
+    """Worker name unique across machines and processes: host:pid:random"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+class SQLiteWorkQueue:
+    """Work queue in a SQLite file shared by the worker processes of one machine"""
+
+    def __init__(self, path: Union[str, os.PathLike], lease_seconds: float = DEFAULT_LEASE_SECONDS,
+                 clock: Callable[[], float] = time.time, busy_timeout: float = 30.0):
+        """
+        Initialize the queue.
+
+        Args:
+            path: SQLite file all workers point at
+            lease_seconds: How long a claim or heartbeat keeps an item leased
+            clock: Wall clock shared by every process (injectable for tests)
+            busy_timeout: Seconds to wait for another process's lock
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lease_seconds = lease_seconds
+        self.clock = clock
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        with self._transaction() as conn:
+            for statement in _SQLITE_SCHEMA.split(';'):
+                if statement.strip():
+                    conn.execute(statement)
+
+    def _connection(self) -> sqlite3.Connection:
+        # One connection per thread and per process (connections must not cross a fork)
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or getattr(self._local, 'pid', None) != os.getpid():
+            conn = sqlite3.connect(str(self.path), timeout=self.busy_timeout, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        # IMMEDIATE takes the write lock up front so concurrent claims serialize
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield conn
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+
+    def enqueue(self, session_id: str, items: Sequence[Tuple[str, str]], payload: Optional[Dict[str, Any]] = None,
+                max_attempts: int = 3) -> int:
+        """
+        Add items to a session; items already queued are left as they are.
+
+        Args:
+            session_id: Session the items belong to
+            items: (item_id, name) pairs
+            payload: Parameters every worker needs for these items, e.g. the season
+            max_attempts: Claims allowed per item before it is marked failed
+
+        Returns:
+            Number of items added
+        """
+        now = self.clock()
+        payload_json = json.dumps(payload or {}, default=str)
+        with self._transaction() as conn:
+            cur = conn.executemany(
+                'INSERT OR IGNORE INTO batch_queue (id, session_id, name, payload, max_attempts, enqueued_at, updated_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                [(item_id, session_id, name, payload_json, max_attempts, now + i * 1e-6, now)
+                 for i, (item_id, name) in enumerate(items)]
+            )
+            return cur.rowcount
+
+    def _reclaim(self, conn: sqlite3.Connection, session_id: str, now: float) -> int:
+        cur = conn.execute(
+            "UPDATE batch_queue SET "
+            "status = CASE WHEN attempts >= max_attempts THEN 'failed' ELSE 'pending' END, "
+            "lease_owner = NULL, lease_expires_at = NULL, "
+            "error_message = COALESCE(error_message, 'lease expired'), updated_at = ? "
+            "WHERE session_id = ? AND status = 'running' AND lease_expires_at < ?",
+            (now, session_id, now)
+        )
+        return cur.rowcount
+
+    def reclaim_expired(self, session_id: str) -> int:
+        """Put items whose lease ran out back to pending (or failed); returns how many"""
+        with self._transaction() as conn:
+            return self._reclaim(conn, session_id, self.clock())
+
+    def claim(self, session_id: str, worker_id: str) -> Optional[QueueItem]:
+        """Lease the oldest pending item of a session to worker_id, None if there is none"""
+        now = self.clock()
+        with self._transaction() as conn:
+            reclaimed = self._reclaim(conn, session_id, now)
+            if reclaimed:
+                logger.warning(f"Reclaimed {reclaimed} expired leases in session {session_id}")
+            row = conn.execute(
+                "SELECT id FROM batch_queue WHERE session_id = ? AND status = 'pending' "
+                "ORDER BY enqueued_at, id LIMIT 1",
+                (session_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE batch_queue SET status = 'running', lease_owner = ?, lease_expires_at = ?, "
+                "attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                (worker_id, now + self.lease_seconds, now, row['id'])
+            )
+            return QueueItem.from_row(conn.execute('SELECT * FROM batch_queue WHERE id = ?', (row['id'],)).fetchone())
+
+    def heartbeat(self, item_id: str, worker_id: str) -> bool:
+        """Extend worker_id's lease on an item; False if the lease was lost"""
+        now = self.clock()
+        with self._transaction() as conn:
+            cur = conn.execute(
+                "UPDATE batch_queue SET lease_expires_at = ?, updated_at = ? "
+                "WHERE id = ? AND lease_owner = ? AND status = 'running'",
+                (now + self.lease_seconds, now, item_id, worker_id)
+            )
+            return cur.rowcount == 1
+
+    def complete(self, item_id: str, worker_id: str, result: Optional[Dict[str, Any]] = None) -> bool:
+        """Mark a leased item completed; False if the lease was lost in the meantime"""
+        with self._transaction() as conn:
+            cur = conn.execute(
+                "UPDATE batch_queue SET status = 'completed', result = ?, lease_owner = NULL, "
+                "lease_expires_at = NULL, error_message = NULL, updated_at = ? "
+                "WHERE id = ? AND lease_owner = ? AND status = 'running'",
+                (json.dumps(result, default=str), self.clock(), item_id, worker_id)
+            )
+            return cur.rowcount == 1
+
+    def fail(self, item_id: str, worker_id: str, error_message: str) -> Optional[str]:
+        """
+        Release a leased item after an error.
+
+        Returns:
+            'pending' if it will be retried, 'failed' if its attempts are used up,
+            None if the lease was lost in the meantime
+        """
+        with self._transaction() as conn:
+            row = conn.execute(
+                "UPDATE batch_queue SET "
+                "status = CASE WHEN attempts >= max_attempts THEN 'failed' ELSE 'pending' END, "
+                "error_message = ?, lease_owner = NULL, lease_expires_at = NULL, updated_at = ? "
+                "WHERE id = ? AND lease_owner = ? AND status = 'running' RETURNING status",
+                (error_message, self.clock(), item_id, worker_id)
+            ).fetchone()
+            return row['status'] if row else None
+
+    def counts(self, session_id: str) -> Dict[str, int]:
+        """Number of items per status in a session"""
+        rows = self._connection().execute(
+            'SELECT status, COUNT(*) AS n FROM batch_queue WHERE session_id = ? GROUP BY status', (session_id,)
+        ).fetchall()
+        counts = {status: 0 for status in QUEUE_STATUSES}
+        counts.update({row['status']: row['n'] for row in rows})
+        return counts
+
+    def close(self):
+        """Close this thread's connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class PostgresWorkQueue:
+    """Work queue in the Postgres database, shared by workers on any machine"""
+
+    def __init__(self, db_manager: Any, lease_seconds: float = DEFAULT_LEASE_SECONDS):
+        """
+        Initialize the queue, creating batch_queue if it does not exist.
+
+        Args:
+            db_manager: DatabaseManager of the shared database
+            lease_seconds: How long a claim or heartbeat keeps an item leased
+        """
+        self.db_manager = db_manager
+        self.lease_seconds = lease_seconds
+        self.db_manager.execute(_POSTGRES_SCHEMA)
+
+    def enqueue(self, session_id: str, items: Sequence[Tuple[str, str]], payload: Optional[Dict[str, Any]] = None,
+                max_attempts: int = 3) -> int:
+        """
+        Add items to a session; items already queued are left as they are.
+
+        Args:
+            session_id: Session the items belong to
+            items: (item_id, name) pairs
+            payload: Parameters every worker needs for these items, e.g. the season
+            max_attempts: Claims allowed per item before it is marked failed
+
+        Returns:
+            Number of items added
+        """
+        from psycopg2.extras import execute_values
+
+        payload_json = json.dumps(payload or {}, default=str)
+        with self.db_manager.get_connection() as conn:
+            with self.db_manager.get_cursor(conn) as cur:
+                # Timestamps a microsecond apart keep the claim order equal to the list order
+                added = execute_values(
+                    cur,
+                    "INSERT INTO batch_queue (id, session_id, name, payload, max_attempts, enqueued_at) VALUES %s "
+                    "ON CONFLICT (id) DO NOTHING RETURNING id",
+                    [(item_id, session_id, name, payload_json, max_attempts, i) for i, (item_id, name) in enumerate(items)],
+                    template="(%s, %s, %s, %s::jsonb, %s, clock_timestamp() + %s * interval '1 microsecond')",
+                    page_size=1000,
+                    fetch=True
+                )
+                conn.commit()
+        return len(added)
+
+    _RECLAIM_SQL = (
+        "UPDATE batch_queue SET "
+        "status = CASE WHEN attempts >= max_attempts THEN 'failed' ELSE 'pending' END, "
+        "lease_owner = NULL, lease_expires_at = NULL, "
+        "error_message = COALESCE(error_message, 'lease expired'), updated_at = now() "
+        "WHERE session_id = %s AND status = 'running' AND lease_expires_at < now()"
+    )
+
+    def reclaim_expired(self, session_id: str) -> int:
+        """Put items whose lease ran out back to pending (or failed); returns how many"""
+        return self.db_manager.execute(self._RECLAIM_SQL, (session_id,))
+
+    def claim(self, session_id: str, worker_id: str) -> Optional[QueueItem]:
+        """Lease the oldest pending item of a session to worker_id, None if there is none"""
+        with self.db_manager.get_connection() as conn:
+            with self.db_manager.get_cursor(conn) as cur:
+                cur.execute(self._RECLAIM_SQL, (session_id,))
+                if cur.rowcount:
+                    logger.warning(f"Reclaimed {cur.rowcount} expired leases in session {session_id}")
+                # SKIP LOCKED: concurrent workers each take a different row instead of queueing on one
+                cur.execute("""
+                    WITH next AS (
+                        SELECT id FROM batch_queue
+                        WHERE session_id = %s AND status = 'pending'
+                        ORDER BY enqueued_at, id
+                        FOR UPDATE SKIP LOCKED
+                        LIMIT 1
+                    )
+                    UPDATE batch_queue q SET
+                        status = 'running',
+                        lease_owner = %s,
+                        lease_expires_at = now() + %s * interval '1 second',
+                        attempts = q.attempts + 1,
+                        updated_at = now()
+                    FROM next
+                    WHERE q.id = next.id
+                    RETURNING q.*
+                """, (session_id, worker_id, self.lease_seconds))
+                row = cur.fetchone()
+                conn.commit()
+        return QueueItem.from_row(row) if row else None
+
+    def heartbeat(self, item_id: str, worker_id: str) -> bool:
+        """Extend worker_id's lease on an item; False if the lease was lost"""
+        return self.db_manager.execute(
+            "UPDATE batch_queue SET lease_expires_at = now() + %s * interval '1 second', updated_at = now() "
+            "WHERE id = %s AND lease_owner = %s AND status = 'running'",
+            (self.lease_seconds, item_id, worker_id)
+        ) == 1
+
+    def complete(self, item_id: str, worker_id: str, result: Optional[Dict[str, Any]] = None) -> bool:
+        """Mark a leased item completed; False if the lease was lost in the meantime"""
+        return self.db_manager.execute(
+            "UPDATE batch_queue SET status = 'completed', result = %s::jsonb, lease_owner = NULL, "
+            "lease_expires_at = NULL, error_message = NULL, updated_at = now() "
+            "WHERE id = %s AND lease_owner = %s AND status = 'running'",
+            (json.dumps(result, default=str), item_id, worker_id)
+        ) == 1
+
+    def fail(self, item_id: str, worker_id: str, error_message: str) -> Optional[str]:
+        """
+        Release a leased item after an error.
+
+        Returns:
+            'pending' if it will be retried, 'failed' if its attempts are used up,
+            None if the lease was lost in the meantime
+        """
+        with self.db_manager.get_connection() as conn:
+            with self.db_manager.get_cursor(conn) as cur:
+                cur.execute(
+                    "UPDATE batch_queue SET "
+                    "status = CASE WHEN attempts >= max_attempts THEN 'failed' ELSE 'pending' END, "
+                    "error_message = %s, lease_owner = NULL, lease_expires_at = NULL, updated_at = now() "
+                    "WHERE id = %s AND lease_owner = %s AND status = 'running' RETURNING status",
+                    (error_message, item_id, worker_id)
+                )
+                row = cur.fetchone()
+                conn.commit()
+        return row['status'] if row else None
+
+    def counts(self, session_id: str) -> Dict[str, int]:
+        """Number of items per status in a session"""
+        rows = self.db_manager.query(
+            "SELECT status, COUNT(*) AS n FROM batch_queue WHERE session_id = %s GROUP BY status", (session_id,)
+        )
+        counts = {status: 0 for status in QUEUE_STATUSES}
+        counts.update({row['status']: row['n'] for row in rows})
+        return counts
+
+    def close(self):
+        """Nothing to close: connections belong to the DatabaseManager pool"""
+
+
+def open_work_queue(location: Optional[str] = None, lease_seconds: float = DEFAULT_LEASE_SECONDS) -> Any:
+    """
+    Open the work queue at location.
+
+    Args:
+        location: sqlite:///path URL or plain file path for the SQLite queue, a
+            Postgres URL for the shared database; DATABASE_URL by default
+        lease_seconds: How long a claim or heartbeat keeps an item leased
+
+    Returns:
+        SQLiteWorkQueue or PostgresWorkQueue
+    """
+    from src.database.backends import open_database
+    from src.config.config import config
+
+    location = location or config.get_database_url()
+    if is_sqlite_url(location):
+        return SQLiteWorkQueue(sqlite_path(location), lease_seconds=lease_seconds)
+    if '://' not in location:
+        return SQLiteWorkQueue(location, lease_seconds=lease_seconds)
+    return PostgresWorkQueue(open_database(location), lease_seconds=lease_seconds)
+
+
+class QueueWorker:
+    """Claims items of one session, runs them and reports back until the session is drained"""
+
+    def __init__(self, queue: Any, session_id: str, handler: Callable[[QueueItem], Dict[str, Any]],
+                 worker_id: Optional[str] = None, heartbeat_interval: Optional[float] = None,
+                 poll_interval: float = 5.0):
+        """
+        Initialize the worker.
+
+        Args:
+            queue: SQLiteWorkQueue or PostgresWorkQueue
+            session_id: Session to pull items from
+            handler: Runs one item and returns its result; an exception fails the item
+            worker_id: Name the leases are taken under, host:pid:random by default
+            heartbeat_interval: Seconds between lease extensions, a third of the lease by default
+            poll_interval: Seconds to wait while other workers still hold the remaining items
+        """
+        self.queue = queue
+        self.session_id = session_id
+        self.handler = handler
+        self.worker_id = worker_id or default_worker_id()
+        self.heartbeat_interval = heartbeat_interval or queue.lease_seconds / 3
+        self.poll_interval = poll_interval
+        self.stats = {'completed': 0, 'retried': 0, 'failed': 0, 'lost': 0}
+
+    @contextmanager
+    def _heartbeat(self, item: QueueItem) -> Iterator[threading.Event]:
+        # Extends the lease in the background; the yielded event is set if the lease was lost
+        lost = threading.Event()
+        done = threading.Event()
+
+        def beat():
+            while not done.wait(self.heartbeat_interval):
+                try:
+                    if not self.queue.heartbeat(item.id, self.worker_id):
+                        logger.warning(f"Worker {self.worker_id} lost its lease on {item.id}")
+                        lost.set()
+                        return
+                except Exception as e:
+                    logger.error(f"Heartbeat for {item.id} failed: {e}")
+
+        thread = threading.Thread(target=beat, daemon=True)
+        thread.start()
+        try:
+            yield lost
+        finally:
+            done.set()
+            thread.join()
+
+    def run_one(self, item: QueueItem) -> None:
+        """Run one claimed item under a heartbeat and record the outcome"""
+        with self._heartbeat(item) as lost:
+            try:
+                result = self.handler(item)
+                error = None
+            except Exception as e:
+                result, error = None, str(e)
+                logger.error(f"Worker {self.worker_id} failed {item.id}: {e}")
+
+        if lost.is_set():
+            self.stats['lost'] += 1
+        elif error is None:
+            self.stats['completed' if self.queue.complete(item.id, self.worker_id, result) else 'lost'] += 1
+        else:
+            outcome = self.queue.fail(item.id, self.worker_id, error)
+            self.stats['lost' if outcome is None else ('retried' if outcome == 'pending' else 'failed')] += 1
+
+    def run(self, stop_event: Optional[threading.Event] = None, exit_when_idle: bool = True) -> Dict[str, int]:
+        """
+        Process items until the session has nothing pending or running (or stop_event is set).
+
+        Args:
+            stop_event: Set to stop after the current item
+            exit_when_idle: Return once the session is drained instead of waiting for new items
+
+        Returns:
+            Items completed, retried, failed and lost by this worker
+        """
+        stop_event = stop_event or threading.Event()
+        logger.info(f"Worker {self.worker_id} pulling from session {self.session_id}")
+        while not stop_event.is_set():
+            item = self.queue.claim(self.session_id, self.worker_id)
+            if item is not None:
+                self.run_one(item)
+                continue
+
+            counts = self.queue.counts(self.session_id)
+            if exit_when_idle and counts['pending'] == 0 and counts['running'] == 0:
+                break
+            # Other workers hold the rest; their leases may still expire and come back
+            stop_event.wait(self.poll_interval)
+
+        logger.info(f"Worker {self.worker_id} finished: {self.stats}")
+        return dict(self.stats)
@@ -25,11 +25,14 @@ from src.models.qb_models import (
 from src.utils.data_utils import (
     safe_int, safe_float, safe_percentage, clean_player_name,
     extract_pfr_id, build_splits_url, generate_session_id,
-    calculate_processing_time, normalize_pfr_team_code
+    calculate_processing_time, normalize_pfr_team_code, build_season_passing_url
 )
 from src.config.config import config, SplitTypes, SplitCategories
 from src.core.selenium_manager import SeleniumManager, SeleniumConfig
 from src.core.splits_manager import SplitsManager
+from src.core.page_cache import PageCache
+from src.core.html_parser import HTMLParser, make_soup
+from src.core.row_decoder import RowDecoder
 
 logger = logging.getLogger(__name__)
 
@@ -58,7 +61,8 @@ class ScrapingMetrics:
 class EnhancedPFRScraper:
     """Enhanced Pro Football Reference scraper with automatic split discovery"""
     
-    def __init__(self, rate_limit_delay: float = None, splits_manager: Optional['SplitsManager'] = None):
+    def __init__(self, rate_limit_delay: float = None, splits_manager: Optional['SplitsManager'] = None,
+                 page_cache: Optional[PageCache] = None):
         self.base_url = "https://www.pro-football-reference.com"
         self.rate_limit_delay = rate_limit_delay or config.get_rate_limit_delay()
         
@@ -67,7 +71,7 @@ class EnhancedPFRScraper:
             headless=True,
             human_behavior_delay=(self.rate_limit_delay, self.rate_limit_delay + 3.0)
         )
-        self.selenium_manager = SeleniumManager(selenium_config)
+        self.selenium_manager = SeleniumManager(selenium_config, page_cache=page_cache)
         
         # Use injected SplitsManager if provided, otherwise create default one
         if splits_manager is not None:
@@ -81,6 +85,14 @@ class EnhancedPFRScraper:
         # Metrics tracking
         self.metrics = ScrapingMetrics(start_time=datetime.now())
         
+        # Single-pass decoder for season passing table rows
+        self.passing_row_decoder = RowDecoder.for_table_type(
+            'enhanced_passing',
+            {'int': safe_int, 'float': safe_float, 'percentage': safe_percentage, 'str': lambda value: value},
+            strip_text=True,
+            missing_text=None
+        )
+        
         # Known split patterns for automatic discovery - updated based on actual PFR structure
         self.split_patterns = {
             'down': [r'down', r'1st', r'2nd', r'3rd', r'4th'],
@@ -347,7 +359,7 @@ class EnhancedPFRScraper:
         if not page_source:
             return {}
         
-        soup = BeautifulSoup(page_source, 'html.parser')
+        soup = make_soup(page_source)
         discovered_splits = {}
         
         # Find all tables on the page
@@ -590,7 +602,7 @@ class EnhancedPFRScraper:
         Returns:
             A tuple containing a list of Player objects and a list of QBBasicStats objects.
         """
-        url = f"{self.base_url}/years/{season}/passing.htm"
+        url = build_season_passing_url(season)
         logger.info(f"Scraping QB main stats for {season} season")
         
         # Set realistic referer to simulate coming from search engines or Reddit
@@ -610,7 +622,7 @@ class EnhancedPFRScraper:
         if not page_source:
             return [], []
         
-        soup = BeautifulSoup(page_source, 'html.parser')
+        soup = make_soup(page_source, table_ids=['passing'])
         
         player_rows = defaultdict(list)
         
@@ -725,56 +737,54 @@ class EnhancedPFRScraper:
         logger.info(f"Successfully scraped {len(players_list)} QB players with basic stats for {season}")
         return players_list, basic_stats_list
     
+    def get_season_leaderboard(self, season: int, player_names: Optional[List[str]] = None,
+                               include_advanced: bool = False) -> Tuple[List[Player], List[QBBasicStats]]:
+        """
+        Scrape QB passing stats for a season from the season-wide pages only.
+        
+        One request for passing.htm covers every QB; with include_advanced a
+        second request for passing_advanced.htm fills any qb_passing_stats
+        fields the main table left empty. No per-player pages are fetched.
+        
+        Args:
+            season: Season year
+            player_names: Optional list of player names to filter for
+            include_advanced: Whether to fill gaps from the advanced passing page
+            
+        Returns:
+            A tuple containing a list of Player objects and a list of QBBasicStats objects.
+        """
+        players, passing_stats = self.get_qb_main_stats(season, player_names)
+        if not passing_stats or not include_advanced:
+            return players, passing_stats
+        
+        page_source = self.make_request_with_retry(build_season_passing_url(season, advanced=True))
+        if not page_source:
+            self.metrics.add_warning(f"Advanced passing page unavailable for {season}; using main table only")
+            return players, passing_stats
+        
+        html_parser = HTMLParser()
+        soup = html_parser.parse_html(page_source)
+        if soup is None:
+            self.metrics.add_warning(f"Advanced passing page for {season} could not be parsed; using main table only")
+            return players, passing_stats
+        advanced = html_parser.parse_advanced_passing_tables(soup, season)
+        filled = HTMLParser.merge_advanced_passing_stats(passing_stats, advanced)
+        logger.info(f"Filled {filled} passing stats fields from the {season} advanced passing page")
+        return players, passing_stats
+    
     def _extract_stats_from_row(self, row: Any) -> Dict[str, Any]:
         """Helper to extract stats from a BeautifulSoup row tag into a dictionary."""
-        
-        def get_stat(stat_name):
-            cell = row.find('td', {'data-stat': stat_name})
-            return cell.get_text(strip=True) if cell else None
-
-        # Extract basic stats
-        cmp_val = safe_int(get_stat('pass_cmp'))
-        att_val = safe_int(get_stat('pass_att'))
+        stats = self.passing_row_decoder.decode(row)
+        stats['pos'] = stats['pos'] or 'QB'
         
         # Calculate incompletions (not directly available in main table)
         inc_val = None
-        if cmp_val is not None and att_val is not None:
-            inc_val = att_val - cmp_val
-
-        return {
-            'rk': safe_int(get_stat('rank')),
-            'age': safe_int(get_stat('age')),
-            'pos': get_stat('pos') or 'QB',
-            'g': safe_int(get_stat('g')),
-            'gs': safe_int(get_stat('gs')),
-            'qb_rec': get_stat('qb_rec'),
-            'cmp': cmp_val,
-            'att': att_val,
-            'inc': inc_val,  # Calculated field
-            'cmp_pct': safe_percentage(get_stat('pass_cmp_pct')),
-            'yds': safe_int(get_stat('pass_yds')),
-            'td': safe_int(get_stat('pass_td')),
-            'td_pct': safe_percentage(get_stat('pass_td_pct')),
-            'int': safe_int(get_stat('pass_int')),
-            'int_pct': safe_percentage(get_stat('pass_int_pct')),
-            'first_downs': safe_int(get_stat('pass_first_down')),
-            'succ_pct': safe_percentage(get_stat('pass_succ_pct')),
-            'lng': safe_int(get_stat('pass_long')),
-            'y_a': safe_float(get_stat('pass_yds_per_att')),
-            'ay_a': safe_float(get_stat('pass_adj_yds_per_att')),
-            'y_c': safe_float(get_stat('pass_yds_per_cmp')),
-            'y_g': safe_float(get_stat('pass_yds_per_g')),
-            'rate': safe_float(get_stat('pass_rating')),
-            'qbr': safe_float(get_stat('qbr')),
-            'sk': safe_int(get_stat('pass_sacked')),
-            'sk_yds': safe_int(get_stat('pass_sacked_yds')),
-            'sk_pct': safe_percentage(get_stat('pass_sacked_pct')),
-            'ny_a': safe_float(get_stat('pass_net_yds_per_att')),
-            'any_a': safe_float(get_stat('pass_adj_net_yds_per_att')),
-            'four_qc': safe_int(get_stat('pass_4qc')),
-            'gwd': safe_int(get_stat('pass_gwd')),
-            'awards': get_stat('awards')
-        }
+        if stats['cmp'] is not None and stats['att'] is not None:
+            inc_val = stats['att'] - stats['cmp']
+        stats['inc'] = inc_val  # Calculated field
+        
+        return stats
 
     def find_player_url(self, player_name: str) -> Optional[str]:
         """
@@ -818,7 +828,7 @@ class EnhancedPFRScraper:
         logger.info(f"Starting comprehensive QB data scraping for {season} season")
         
         # Scrape basic passing stats
-        players, passing_stats = self.get_qb_main_stats(season)
+        players, passing_stats = self.get_season_leaderboard(season)
         if not passing_stats:
             logger.error("Failed to scrape basic passing stats")
             return [], [], []
@@ -1552,7 +1562,7 @@ class EnhancedPFRScraper:
         if not page_source:
             return {}
         
-        soup = BeautifulSoup(page_source, 'html.parser')
+        soup = make_soup(page_source)
         return self.discover_splits_from_page(soup)
     
     def close(self):
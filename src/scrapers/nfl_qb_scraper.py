@@ -12,7 +12,7 @@ from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 
 from src.scrapers.selenium_enhanced_scraper import SeleniumEnhancedPFRScraper
-from src.database.db_manager import DatabaseManager
+from src.database.backends import open_database
 from src.models.qb_models import QBBasicStats, QBAdvancedStats, QBSplitStats, Player, Team, ScrapingLog
 from src.utils.data_utils import (
     safe_int, safe_float, safe_percentage, clean_player_name,
@@ -43,8 +43,9 @@ logger = logging.getLogger(__name__)
 class NFLQBDataPipeline:
     """Main pipeline orchestrating the entire scraping and database process"""
     
-    def __init__(self, connection_string: Optional[str] = None, min_delay: float = 7.0, max_delay: float = 12.0):
-        self.db_manager = DatabaseManager(connection_string or config.get_database_url())
+    def __init__(self, connection_string: Optional[str] = None, min_delay: float = 7.0, max_delay: float = 12.0,
+                 db_manager: Optional[Any] = None):
+        self.db_manager = db_manager or open_database(connection_string)
         self.min_delay = min_delay
         self.max_delay = max_delay
         self.session_id = generate_session_id()
@@ -21,6 +21,8 @@ from models.qb_models import Player, QBPassingStats, QBSplitsType1, QBSplitsType
 from utils.data_utils import (
     safe_int, safe_float, safe_percentage, clean_player_name
 )
+from core.html_parser import make_soup
+from core.row_decoder import RowDecoder
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +37,18 @@ class RawDataScraper:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
         
+        # Single-pass decoder for passing table rows (empty cells become None)
+        self.passing_row_decoder = RowDecoder.for_table_type(
+            'raw_passing',
+            {
+                'int': lambda value: safe_int(value) if value else None,
+                'float': lambda value: safe_float(value) if value else None,
+                'str': lambda value: value if value else None
+            },
+            strip_text=True,
+            skip_missing=True
+        )
+        
     def make_request_with_retry(self, url: str, max_retries: int = 3) -> Optional[requests.Response]:
         """Make HTTP request with retry logic"""
         for attempt in range(max_retries):
@@ -71,7 +85,7 @@ class RawDataScraper:
         if not response:
             return []
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = make_soup(response.content, table_ids=['passing'])
         
         # Find the main passing table
         table = soup.find('table', {'id': 'passing'})
@@ -146,60 +160,8 @@ class RawDataScraper:
     
     def _extract_passing_stats_from_row(self, row: Tag) -> Dict[str, Any]:
         """Extract all passing stats from a row matching CSV structure exactly"""
-        stats = {}
-        
-        # Mapping of data-stat attributes to CSV column names
-        stat_mapping = {
-            'ranker': 'rk',
-            'age': 'age',
-            'team_name_abbr': 'team',
-            'pos': 'pos',
-            'games': 'g',
-            'games_started': 'gs',
-            'qb_rec': 'qb_rec',
-            'pass_cmp': 'cmp',
-            'pass_att': 'att',
-            'pass_cmp_pct': 'cmp_pct',
-            'pass_yds': 'yds',
-            'pass_td': 'td',
-            'pass_td_pct': 'td_pct',
-            'pass_int': 'int',
-            'pass_int_pct': 'int_pct',
-            'pass_first_down': 'first_downs',
-            'pass_success': 'succ_pct',
-            'pass_long': 'lng',
-            'pass_yds_per_att': 'y_a',
-            'pass_adj_yds_per_att': 'ay_a',
-            'pass_yds_per_cmp': 'y_c',
-            'pass_yds_per_g': 'y_g',
-            'pass_rating': 'rate',
-            'qbr': 'qbr',
-            'pass_sacked': 'sk',
-            'pass_sacked_yds': 'sk_yds',
-            'pass_sacked_pct': 'sk_pct',
-            'pass_net_yds_per_att': 'ny_a',
-            'pass_adj_net_yds_per_att': 'any_a',
-            'comebacks': 'four_qc',
-            'game_winning_drives': 'gwd',
-            'awards': 'awards',
-            'player_additional': 'player_additional'
-        }
-        
-        # Extract each stat
-        for data_stat, csv_col in stat_mapping.items():
-            cell = row.find('td', {'data-stat': data_stat})
-            if cell and isinstance(cell, Tag):
-                value = cell.get_text(strip=True)
-                
-                # Convert to appropriate type based on CSV column
-                if csv_col in ['rk', 'age', 'g', 'gs', 'cmp', 'att', 'yds', 'td', 'int', 'first_downs', 'lng', 'sk', 'sk_yds', 'four_qc', 'gwd']:
-                    stats[csv_col] = safe_int(value) if value else None
-                elif csv_col in ['cmp_pct', 'td_pct', 'int_pct', 'succ_pct', 'y_a', 'ay_a', 'y_c', 'y_g', 'rate', 'qbr', 'sk_pct', 'ny_a', 'any_a']:
-                    stats[csv_col] = safe_float(value) if value else None
-                else:
-                    stats[csv_col] = value if value else None
-        
-        return stats
+        # Data-stat -> CSV column mapping lives in PFRStructureAnalyzer ('raw_passing')
+        return self.passing_row_decoder.decode(row)
     
     def scrape_splits_data(self, qb_passing_stats: List[QBPassingStats]) -> Tuple[List[QBSplitsType1], List[QBSplitsType2]]:
         """
@@ -248,7 +210,7 @@ class RawDataScraper:
         if not response:
             return [], []
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = make_soup(response.content)
         
         # Find splits tables
         splits_type1 = self._extract_splits_type1(soup, pfr_id, player_name, season)
@@ -11,7 +11,6 @@ from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 import re
 
-from bs4 import BeautifulSoup
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -27,6 +26,7 @@ from ..utils.data_utils import (
 )
 from ..config.config import config, SplitTypes, SplitCategories
 from ..core.selenium_manager import SeleniumManager, SeleniumConfig
+from ..core.html_parser import make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -192,7 +192,7 @@ class SeleniumEnhancedPFRScraper:
             True if this is the correct player's page
         """
         # Look for player name in title or main content
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # Check title
         title = soup.find('title')
@@ -236,7 +236,7 @@ class SeleniumEnhancedPFRScraper:
             f.write(response[:50000])  # First 50K chars
         logger.info(f"Saved debug sample to pfr_passing_debug_{season}.html")
         
-        soup = BeautifulSoup(response, 'html.parser')
+        soup = make_soup(response)
         
         # Find the main passing stats table
         table = soup.find('table', {'id': 'passing'})
@@ -454,7 +454,7 @@ class SeleniumEnhancedPFRScraper:
             logger.warning(f"Could not load splits page for {player_name}")
             return basic_splits, advanced_splits
 
-        soup = BeautifulSoup(response, 'html.parser')
+        soup = make_soup(response)
         
         # Process splits data (simplified for now)
         # TODO: Implement full splits processing logic
@@ -25,6 +25,9 @@ from src.utils.data_utils import (
     safe_int, safe_float, safe_percentage, clean_player_name, build_splits_url
 )
 from src.core.selenium_manager import SeleniumManager, SeleniumConfig
+from src.core.request_manager import RequestManager
+from src.core.html_parser import HTMLParser, make_soup
+from src.core.row_decoder import RowDecoder
 from src.config.config import config
 
 logger = logging.getLogger(__name__)
@@ -71,10 +74,25 @@ class SplitsExtractor:
     ]
     # Note: split, value, pfr_id, player_name, season, scraped_at, updated_at are always set
     
-    def __init__(self, selenium_manager: SeleniumManager):
+    # Table ids that must be present before a static (non-browser) page is accepted
+    REQUIRED_SPLITS_TABLE_IDS = ['stats', 'advanced_splits']
+    
+    def __init__(self, selenium_manager: SeleniumManager, request_manager: Optional[RequestManager] = None):
         self.selenium_manager = selenium_manager
+        self.request_manager = request_manager  # Static fetch path; Selenium is only the fallback when set
         self.base_url = "https://www.pro-football-reference.com"
         self.missing_fields_log = []  # Collect missing field logs for summary
+        self.static_page_loads = 0
+        self.selenium_fallbacks = 0
+        
+        # Single-pass row decoders compiled from the analyzer's field mappings
+        converters = {
+            'int': self._safe_int, 'float': self._safe_float,
+            'percentage': self._safe_percentage, 'str': str
+        }
+        decoder_options = dict(cell_tags=('td', 'th'), strip_text=True, skip_missing=True, skip_empty=True)
+        self.basic_row_decoder = RowDecoder.for_table_type('splits_basic', converters, **decoder_options)
+        self.advanced_row_decoder = RowDecoder.for_table_type('splits_advanced', converters, **decoder_options)
         
         # Enhanced split table patterns based on actual PFR structure
         self.split_table_patterns = {
@@ -134,7 +152,8 @@ class SplitsExtractor:
             'rush_first_down': '1D'
         }
     
-    def extract_player_splits(self, pfr_id: str, player_name: str, season: int, scraped_at: datetime) -> SplitsExtractionResult:
+    def extract_player_splits(self, pfr_id: str, player_name: str, season: int, scraped_at: datetime,
+                              static_content: Optional[str] = None) -> SplitsExtractionResult:
         """
         Extract splits data for a specific player and season.
 
@@ -143,6 +162,7 @@ class SplitsExtractor:
             player_name: Player's name
             season: Season year
             scraped_at: Timestamp of extraction
+            static_content: Static HTML already fetched for the page, used instead of fetching it again
 
         Returns:
             SplitsExtractionResult with extracted data, errors, warnings, and extraction metadata.
@@ -151,10 +171,7 @@ class SplitsExtractor:
         """
         logger.debug(f"[DEBUG] extract_player_splits called for {player_name} ({pfr_id}), season {season}")
         start_time = time.time()
-        basic_splits = []
-        advanced_splits = []
         errors = []
-        warnings = []
         self.missing_fields_log = []  # Reset for each extraction
         
         try:
@@ -171,10 +188,10 @@ class SplitsExtractor:
                 )
             logger.info(f"Extracting splits for {player_name} from {splits_url}")
             
-            # Get page content - ENABLE JavaScript to load the splits tables
-            result = self.selenium_manager.get_page(splits_url, enable_js=True)
-            if not result['success']:
-                error_msg = f"Failed to load splits page for {player_name}: {result['error']}"
+            # Get page content - static response first, Selenium only if tables are missing
+            soup, load_error = self._load_splits_page(splits_url, static_content)
+            if soup is None:
+                error_msg = f"Failed to load splits page for {player_name}: {load_error}"
                 errors.append(error_msg)
                 logger.error(error_msg)
                 return SplitsExtractionResult(
@@ -183,78 +200,7 @@ class SplitsExtractor:
                     tables_discovered=0, tables_processed=0, extraction_time=0.0
                 )
             
-            response = result['content']
-            
-            # Parse HTML
-            soup = BeautifulSoup(response, 'html.parser')
-            
-            # Discover splits tables
-            discovered_tables = self._discover_splits_tables(soup)
-            tables_discovered = len(discovered_tables)
-            logger.info(f"Discovered {tables_discovered} splits tables for {player_name}")
-            
-            # Process tables in priority order
-            priority_tables = self._get_priority_tables(discovered_tables)
-            tables_processed = 0
-            
-            for table_info in priority_tables:
-                try:
-                    table = self._find_table_by_info(soup, table_info)
-                    if not table:
-                        continue
-                    
-                    table_type = table_info.get('type', 'unknown')
-                    logger.info(f"Processing {table_type} table: {table_info.get('id', 'unknown')}")
-                    
-                    if table_type == 'basic_splits':
-                        extracted_basic = self._extract_basic_splits_table(table, pfr_id, player_name, season, scraped_at)
-                        basic_splits.extend(extracted_basic)
-                        logger.info(f"Extracted {len(extracted_basic)} basic splits rows")
-                        
-                    elif table_type == 'advanced_splits':
-                        extracted_advanced = self._extract_advanced_splits_table(table, pfr_id, player_name, season, scraped_at)
-                        advanced_splits.extend(extracted_advanced)
-                        logger.info(f"Extracted {len(extracted_advanced)} advanced splits rows")
-                    
-                    tables_processed += 1
-                    
-                except Exception as e:
-                    error_msg = f"Error processing table {table_info.get('id', 'unknown')}: {e}"
-                    errors.append(error_msg)
-                    logger.error(error_msg)
-            
-            # Log summary of missing fields
-            if self.missing_fields_log:
-                logger.warning(f"Missing fields summary for {player_name} season {season}:")
-                for missing in self.missing_fields_log:
-                    logger.warning(f"  {missing['split']} -> {missing['value']}: missing {missing['field']}")
-                
-                # Group missing fields by type for summary
-                missing_by_field = {}
-                for missing in self.missing_fields_log:
-                    field = missing['field']
-                    if field not in missing_by_field:
-                        missing_by_field[field] = 0
-                    missing_by_field[field] += 1
-                
-                logger.warning("Missing field counts:")
-                for field, count in missing_by_field.items():
-                    logger.warning(f"  {field}: {count} times")
-            
-            extraction_time = time.time() - start_time
-            logger.info(f"Splits extraction complete for {player_name}. "
-                       f"Basic: {len(basic_splits)}, Advanced: {len(advanced_splits)}, "
-                       f"Time: {extraction_time:.2f}s")
-            
-            return SplitsExtractionResult(
-                basic_splits=basic_splits,
-                advanced_splits=advanced_splits,
-                errors=errors,
-                warnings=warnings,
-                tables_discovered=tables_discovered,
-                tables_processed=tables_processed,
-                extraction_time=extraction_time
-            )
+            return self._extract_from_soup(soup, pfr_id, player_name, season, scraped_at, start_time)
             
         except Exception as e:
             error_msg = f"Unexpected error extracting splits for {player_name}: {e}"
@@ -266,6 +212,177 @@ class SplitsExtractor:
                 tables_discovered=0, tables_processed=0, extraction_time=time.time() - start_time
             )
     
+    def parse_splits_page(self, content: str, pfr_id: str, player_name: str, season: int,
+                          scraped_at: datetime) -> Optional[SplitsExtractionResult]:
+        """
+        Extract splits from an already fetched static splits page.
+        
+        Lets callers fetch and parse in separate stages (see AsyncPipeline).
+        
+        Args:
+            content: Static HTML of the splits page
+            pfr_id: Player's PFR ID
+            player_name: Player's name
+            season: Season year
+            scraped_at: Timestamp of extraction
+            
+        Returns:
+            SplitsExtractionResult, or None if required tables are missing and
+            the page has to be loaded with the browser instead
+        """
+        start_time = time.time()
+        self.missing_fields_log = []
+        soup = self._parse_page(content)
+        missing_tables = self._missing_required_tables(soup)
+        if missing_tables:
+            logger.info(f"Static page for {player_name} missing tables {missing_tables}")
+            return None
+        self.static_page_loads += 1
+        return self._extract_from_soup(soup, pfr_id, player_name, season, scraped_at, start_time)
+    
+    def _extract_from_soup(self, soup: BeautifulSoup, pfr_id: str, player_name: str, season: int,
+                           scraped_at: datetime, start_time: float) -> SplitsExtractionResult:
+        """Discover and extract the splits tables of a loaded page"""
+        basic_splits = []
+        advanced_splits = []
+        errors = []
+        warnings = []
+        
+        # Discover splits tables
+        discovered_tables = self._discover_splits_tables(soup)
+        tables_discovered = len(discovered_tables)
+        logger.info(f"Discovered {tables_discovered} splits tables for {player_name}")
+        
+        # Process tables in priority order
+        priority_tables = self._get_priority_tables(discovered_tables)
+        tables_processed = 0
+        
+        for table_info in priority_tables:
+            try:
+                table = self._find_table_by_info(soup, table_info)
+                if not table:
+                    continue
+                
+                table_type = table_info.get('type', 'unknown')
+                logger.info(f"Processing {table_type} table: {table_info.get('id', 'unknown')}")
+                
+                if table_type == 'basic_splits':
+                    extracted_basic = self._extract_basic_splits_table(table, pfr_id, player_name, season, scraped_at)
+                    basic_splits.extend(extracted_basic)
+                    logger.info(f"Extracted {len(extracted_basic)} basic splits rows")
+                    
+                elif table_type == 'advanced_splits':
+                    extracted_advanced = self._extract_advanced_splits_table(table, pfr_id, player_name, season, scraped_at)
+                    advanced_splits.extend(extracted_advanced)
+                    logger.info(f"Extracted {len(extracted_advanced)} advanced splits rows")
+                
+                tables_processed += 1
+                
+            except Exception as e:
+                error_msg = f"Error processing table {table_info.get('id', 'unknown')}: {e}"
+                errors.append(error_msg)
+                logger.error(error_msg)
+        
+        # Log summary of missing fields
+        if self.missing_fields_log:
+            logger.warning(f"Missing fields summary for {player_name} season {season}:")
+            for missing in self.missing_fields_log:
+                logger.warning(f"  {missing['split']} -> {missing['value']}: missing {missing['field']}")
+            
+            # Group missing fields by type for summary
+            missing_by_field = {}
+            for missing in self.missing_fields_log:
+                field = missing['field']
+                if field not in missing_by_field:
+                    missing_by_field[field] = 0
+                missing_by_field[field] += 1
+            
+            logger.warning("Missing field counts:")
+            for field, count in missing_by_field.items():
+                logger.warning(f"  {field}: {count} times")
+        
+        extraction_time = time.time() - start_time
+        logger.info(f"Splits extraction complete for {player_name}. "
+                   f"Basic: {len(basic_splits)}, Advanced: {len(advanced_splits)}, "
+                   f"Time: {extraction_time:.2f}s")
+        
+        return SplitsExtractionResult(
+            basic_splits=basic_splits,
+            advanced_splits=advanced_splits,
+            errors=errors,
+            warnings=warnings,
+            tables_discovered=tables_discovered,
+            tables_processed=tables_processed,
+            extraction_time=extraction_time
+        )
+    
+    def _parse_page(self, content: str) -> BeautifulSoup:
+        """Parse a splits page, keeping only the splits tables and expanding commented ones"""
+        soup = make_soup(content, table_ids=self.REQUIRED_SPLITS_TABLE_IDS)
+        HTMLParser.expand_commented_tables(soup, self.REQUIRED_SPLITS_TABLE_IDS)
+        return soup
+    
+    def _load_splits_page(self, splits_url: str,
+                          static_content: Optional[str] = None) -> Tuple[Optional[BeautifulSoup], Optional[str]]:
+        """
+        Load and parse a splits page, preferring the static HTML response.
+        
+        PFR ships the splits tables in the static response, some of them
+        inside HTML comments. Those are expanded in place, and the browser is
+        only used when a required table is genuinely absent.
+        
+        Args:
+            splits_url: URL of the splits page
+            static_content: Static HTML already fetched by the caller, if any
+            
+        Returns:
+            Tuple of (parsed page or None, error message or None)
+        """
+        if static_content is not None:
+            result = {'success': True, 'content': static_content}
+        elif self.request_manager is not None:
+            result = self.request_manager.get_page(splits_url)
+        else:
+            result = None
+        
+        if result is not None:
+            if result['success']:
+                soup = self._parse_page(result['content'])
+                missing_tables = self._missing_required_tables(soup)
+                if not missing_tables:
+                    self.static_page_loads += 1
+                    logger.info(f"Loaded splits page statically: {splits_url}")
+                    return soup, None
+                logger.info(f"Static page missing tables {missing_tables}, falling back to Selenium: {splits_url}")
+            else:
+                logger.warning(f"Static fetch failed ({result['error']}), falling back to Selenium: {splits_url}")
+        
+        if result is not None:
+            self.selenium_fallbacks += 1
+        
+        # ENABLE JavaScript so client-side tables are rendered
+        result = self.selenium_manager.get_page(splits_url, enable_js=True)
+        if not result['success']:
+            return None, result['error']
+        
+        return self._parse_page(result['content']), None
+    
+    def _missing_required_tables(self, soup: BeautifulSoup) -> List[str]:
+        """
+        List required splits tables that are absent from a parsed page.
+        
+        A table only counts as missing when the page has a placeholder for it
+        (or it is the basic stats table); seasons without advanced splits
+        have no placeholder and don't need a browser.
+        """
+        missing = []
+        for table_id in self.REQUIRED_SPLITS_TABLE_IDS:
+            if soup.find('table', id=table_id):
+                continue
+            if table_id == 'stats' or soup.find(id=f'all_{table_id}') or soup.find(id=f'div_{table_id}'):
+                missing.append(table_id)
+        return missing
+    
     def _build_enhanced_splits_url(self, pfr_id: str, season: int) -> Optional[str]:
         """Build enhanced splits URL with fallback mechanisms"""
         if not pfr_id:
@@ -866,83 +983,8 @@ class SplitsExtractor:
                 'updated_at': scraped_at
             }
             
-            # Extract all cells using data-stat attributes
-            for cell in cells:
-                if not isinstance(cell, Tag):
-                    continue
-                data_stat = cell.get('data-stat')
-                cell_text = cell.get_text(strip=True)
-                
-                if data_stat and cell_text:
-                    # Map data-stat attributes to model fields
-                    if data_stat == 'split_id':  # Split category (League, Place, etc.)
-                        row_data['split'] = cell_text
-                    elif data_stat == 'split_value':  # Split value (NFL, Home, etc.)
-                        row_data['value'] = cell_text
-                    elif data_stat == 'g':
-                        row_data['g'] = self._safe_int(cell_text)
-                    elif data_stat == 'wins':
-                        row_data['w'] = self._safe_int(cell_text)
-                    elif data_stat == 'losses':
-                        row_data['l'] = self._safe_int(cell_text)
-                    elif data_stat == 'ties':
-                        row_data['t'] = self._safe_int(cell_text)
-                    elif data_stat == 'pass_cmp':
-                        row_data['cmp'] = self._safe_int(cell_text)
-                    elif data_stat == 'pass_att':
-                        row_data['att'] = self._safe_int(cell_text)
-                    elif data_stat == 'pass_inc':
-                        row_data['inc'] = self._safe_int(cell_text)
-                    elif data_stat == 'pass_cmp_perc':
-                        row_data['cmp_pct'] = self._safe_percentage(cell_text)
-                    elif data_stat == 'pass_yds':
-                        row_data['yds'] = self._safe_int(cell_text)
-                    elif data_stat == 'pass_td':
-                        row_data['td'] = self._safe_int(cell_text)
-                    elif data_stat == 'pass_int':
-                        row_data['int'] = self._safe_int(cell_text)
-                    elif data_stat == 'pass_rating':
-                        row_data['rate'] = self._safe_float(cell_text)
-                    elif data_stat == 'pass_sacked':
-                        row_data['sk'] = self._safe_int(cell_text)
-                    elif data_stat == 'pass_sacked_yds':
-                        row_data['sk_yds'] = self._safe_int(cell_text)
-                    elif data_stat == 'pass_yds_per_att':
-                        row_data['y_a'] = self._safe_float(cell_text)
-                    elif data_stat == 'pass_adj_yds_per_att':
-                        row_data['ay_a'] = self._safe_float(cell_text)
-                    elif data_stat == 'pass_att_per_g':
-                        row_data['a_g'] = self._safe_float(cell_text)
-                    elif data_stat == 'pass_yds_per_g':
-                        row_data['y_g'] = self._safe_float(cell_text)
-                    elif data_stat == 'rush_att':
-                        row_data['rush_att'] = self._safe_int(cell_text)
-                    elif data_stat == 'rush_yds':
-                        row_data['rush_yds'] = self._safe_int(cell_text)
-                    elif data_stat == 'rush_yds_per_att':
-                        row_data['rush_y_a'] = self._safe_float(cell_text)
-                    elif data_stat == 'rush_td':
-                        row_data['rush_td'] = self._safe_int(cell_text)
-                    elif data_stat == 'rush_att_per_g':
-                        row_data['rush_a_g'] = self._safe_float(cell_text)
-                    elif data_stat == 'rush_yds_per_g':
-                        row_data['rush_y_g'] = self._safe_float(cell_text)
-                    elif data_stat == 'all_td':
-                        row_data['total_td'] = self._safe_int(cell_text)
-                    elif data_stat == 'scoring':
-                        row_data['pts'] = self._safe_int(cell_text)
-                    elif data_stat == 'fumbles':
-                        row_data['fmb'] = self._safe_int(cell_text)
-                    elif data_stat == 'fumbles_lost':
-                        row_data['fl'] = self._safe_int(cell_text)
-                    elif data_stat == 'fumbles_forced':
-                        row_data['ff'] = self._safe_int(cell_text)
-                    elif data_stat == 'fumbles_rec':
-                        row_data['fr'] = self._safe_int(cell_text)
-                    elif data_stat == 'fumbles_rec_yds':
-                        row_data['fr_yds'] = self._safe_int(cell_text)
-                    elif data_stat == 'fumbles_rec_td':
-                        row_data['fr_td'] = self._safe_int(cell_text)
+            # Map data-stat attributes to model fields in one pass over the cells
+            row_data.update(self.basic_row_decoder.decode(cells=self.basic_row_decoder.index_cells(cells)))
             
             # Validate required fields - allow rows with at least split OR value
             if not row_data.get('split') and not row_data.get('value'):
@@ -997,55 +1039,8 @@ class SplitsExtractor:
                 'updated_at': scraped_at
             }
             
-            # Extract all cells using data-stat attributes for advanced splits
-            for cell in cells:
-                if not isinstance(cell, Tag):
-                    continue
-                data_stat = cell.get('data-stat')
-                cell_text = cell.get_text(strip=True)
-                
-                if data_stat and cell_text:
-                    # Map data-stat attributes to model fields for advanced splits
-                    if data_stat == 'split_type':  # Split category (Down, Field Position, etc.)
-                        row_data['split'] = cell_text
-                    elif data_stat == 'split_value':  # Split value (1st, 2nd, Red Zone, etc.)
-                        row_data['value'] = cell_text
-                    elif data_stat == 'pass_cmp':
-                        row_data['cmp'] = self._safe_int(cell_text)
-                    elif data_stat == 'pass_att':
-                        row_data['att'] = self._safe_int(cell_text)
-                    elif data_stat == 'pass_inc':
-                        row_data['inc'] = self._safe_int(cell_text)
-                    elif data_stat == 'pass_cmp_perc':
-                        row_data['cmp_pct'] = self._safe_percentage(cell_text)
-                    elif data_stat == 'pass_yds':
-                        row_data['yds'] = self._safe_int(cell_text)
-                    elif data_stat == 'pass_td':
-                        row_data['td'] = self._safe_int(cell_text)
-                    elif data_stat == 'pass_first_down':
-                        row_data['first_downs'] = self._safe_int(cell_text)
-                    elif data_stat == 'pass_int':
-                        row_data['int'] = self._safe_int(cell_text)
-                    elif data_stat == 'pass_rating':
-                        row_data['rate'] = self._safe_float(cell_text)
-                    elif data_stat == 'pass_sacked':
-                        row_data['sk'] = self._safe_int(cell_text)
-                    elif data_stat == 'pass_sacked_yds':
-                        row_data['sk_yds'] = self._safe_int(cell_text)
-                    elif data_stat == 'pass_yds_per_att':
-                        row_data['y_a'] = self._safe_float(cell_text)
-                    elif data_stat == 'pass_adj_yds_per_att':
-                        row_data['ay_a'] = self._safe_float(cell_text)
-                    elif data_stat == 'rush_att':
-                        row_data['rush_att'] = self._safe_int(cell_text)
-                    elif data_stat == 'rush_yds':
-                        row_data['rush_yds'] = self._safe_int(cell_text)
-                    elif data_stat == 'rush_yds_per_att':
-                        row_data['rush_y_a'] = self._safe_float(cell_text)
-                    elif data_stat == 'rush_td':
-                        row_data['rush_td'] = self._safe_int(cell_text)
-                    elif data_stat == 'rush_first_down':
-                        row_data['rush_first_downs'] = self._safe_int(cell_text)
+            # Map data-stat attributes to model fields in one pass over the cells
+            row_data.update(self.advanced_row_decoder.decode(cells=self.advanced_row_decoder.index_cells(cells)))
             
             # Validate required fields - allow rows with at least split OR value 
             if not row_data.get('split') and not row_data.get('value'):
@@ -136,6 +136,20 @@ def build_splits_url(pfr_id: str, season: int) -> str:
     return f"https://www.pro-football-reference.com/players/{first_letter}/{player_code}/splits/{season}/"
 
 
+def build_season_passing_url(season: int, advanced: bool = False) -> str:
+    """Construct the Pro-Football-Reference season passing leaderboard URL.
+
+    Args:
+        season: Season year.
+        advanced: Return the advanced passing page (``passing_advanced.htm``) instead.
+
+    Returns:
+        Full https URL to the season-wide passing page.
+    """
+    page = 'passing_advanced' if advanced else 'passing'
+    return f"https://www.pro-football-reference.com/years/{season}/{page}.htm"
+
+
 def build_enhanced_splits_url(pfr_id: str, season: int, fallback_methods: bool = True) -> Optional[str]:
     """
     Enhanced splits URL construction with multiple fallback mechanisms
@@ -450,7 +464,38 @@ def format_duration(seconds: float) -> str:
 def calculate_processing_time(start_time: datetime, end_time: datetime) -> float:
     """Calculate processing time in seconds"""
     delta = end_time - start_time
-    return delta.total_seconds() 
+    return delta.total_seconds()
+
+def parse_season_range(value: str) -> List[int]:
+    """
+    Parse a season list such as "2024", "2019-2024" or "2018,2020-2022"
+
+    Args:
+        value: Comma-separated seasons and inclusive ranges
+
+    Returns:
+        Sorted list of distinct seasons
+
+    Raises:
+        ValueError: If a part is not a season or a range runs backwards
+    """
+    seasons = set()
+    for part in value.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        start, _, end = part.partition('-')
+        try:
+            first = int(start)
+            last = int(end) if end else first
+        except ValueError:
+            raise ValueError(f"Invalid season range: {part}")
+        if last < first:
+            raise ValueError(f"Invalid season range: {part} (end before start)")
+        seasons.update(range(first, last + 1))
+    if not seasons:
+        raise ValueError(f"No seasons in: {value!r}")
+    return sorted(seasons) 
 
 def parse_qb_splits_csv_by_position(csv_content: str) -> List[Dict[str, Any]]:
     """
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Adaptive Batching Tests
+Checks that insert batch sizes grow on fast links, back off on slow ones,
+and shrink after timeouts
+"""
+
+import sys
+import os
+import threading
+import unittest
+from contextlib import contextmanager
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from psycopg2 import errors as pg_errors
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.config.config import BulkOperationConfig, config
+from src.database.batch_sizer import AdaptiveBatchSizer
+from src.database.db_manager import DatabaseManager
+from src.models.qb_models import QBPassingStats
+
+
+class FakeClock:
+    """perf_counter replacement advanced by the fake database"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestAdaptiveBatchSizer(unittest.TestCase):
+    """Test the batch size controller"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.sizer = AdaptiveBatchSizer(initial_size=100, min_size=10, max_size=1000, target_seconds=1.0)
+
+    def test_grows_while_under_target(self):
+        """Fast full batches double the size, but not past the projected target"""
+        self.assertEqual(self.sizer.record(100, 0.2), 200)
+        self.assertEqual(self.sizer.record(200, 0.4), 400)
+        self.assertEqual(self.sizer.record(400, 0.8), 500)
+        self.assertEqual(self.sizer.record(500, 0.01), 1000)
+
+    def test_short_tail_batch_does_not_grow(self):
+        """A final partial batch is no evidence the link can take more"""
+        self.assertEqual(self.sizer.record(30, 0.01), 100)
+
+    def test_slow_batch_scales_down(self):
+        """A batch over target scales the size to fit the target"""
+        self.assertEqual(self.sizer.record(100, 4.0), 25)
+        self.assertEqual(self.sizer.record(25, 100.0), 10)
+
+    def test_shrink_stops_at_minimum(self):
+        """Halving stops at min_size and then reports failure"""
+        self.assertTrue(self.sizer.shrink())
+        self.assertEqual(self.sizer.size, 50)
+        self.sizer.size = 10
+        self.assertFalse(self.sizer.shrink())
+
+    def test_from_config(self):
+        """The starting size comes from optimize_batch_size"""
+        bulk_config = BulkOperationConfig(batch_size=200, min_batch_size=10, max_batch_size=2000)
+        self.assertEqual(AdaptiveBatchSizer.from_config(bulk_config, 5000).size, 200)
+        self.assertEqual(AdaptiveBatchSizer.from_config(bulk_config, 80).size, 20)
+
+
+class TestAdaptiveUpsert(unittest.TestCase):
+    """Test DatabaseManager's adaptive execute_values path"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        with patch.object(DatabaseManager, '_initialize_pool'):
+            self.db = DatabaseManager('postgresql://test')
+        self.conn = MagicMock()
+        self.cursor = MagicMock()
+
+        @contextmanager
+        def get_connection():
+            yield self.conn
+
+        @contextmanager
+        def get_cursor(conn):
+            yield self.cursor
+
+        self.db.get_connection = get_connection
+        self.db.get_cursor = get_cursor
+        self.clock = FakeClock()
+        self.executed = []
+        self.saved = (config.bulk_operations.copy_threshold, config.bulk_operations.target_batch_seconds)
+        config.bulk_operations.copy_threshold = 0
+        config.bulk_operations.target_batch_seconds = 1.0
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        config.bulk_operations.copy_threshold, config.bulk_operations.target_batch_seconds = self.saved
+
+    def _stats(self, count, season=2024):
+        return [QBPassingStats(pfr_id=f"TestQb{i:04d}", player_name=f"Test QB {i}", player_url='',
+                               season=season, scraped_at=datetime(2024, 12, 1)) for i in range(count)]
+
+    def _insert(self, stats, seconds_per_row=0.0, fail_above=None):
+        def execute_values(cur, sql, batch, page_size, fetch=False):
+            if fail_above and len(batch) > fail_above:
+                raise pg_errors.QueryCanceled("canceling statement due to statement timeout")
+            self.clock.now += len(batch) * seconds_per_row
+            self.executed.append(len(batch))
+
+        with patch('src.database.db_manager.execute_values', side_effect=execute_values), \
+                patch('src.database.db_manager.time.perf_counter', self.clock):
+            return self.db.insert_qb_basic_stats(stats)
+
+    def test_sizes_converge_on_target_latency(self):
+        """At 5ms a row the 1s target settles batches around 200 rows"""
+        self.assertEqual(self._insert(self._stats(5000), seconds_per_row=0.005), 5000)
+
+        result = self.db.last_insert_result
+        self.assertEqual(sum(result.batch_sizes), 5000)
+        self.assertEqual(result.batch_sizes, self.executed)
+        self.assertEqual(len(result.batch_timings), len(result.batch_sizes))
+        self.assertEqual(result.batch_sizes[:3], [100, 200, 200])
+        self.assertTrue(all(timing <= 1.0 + 1e-9 for timing in result.batch_timings))
+        self.assertEqual(result.to_dict()['batch_sizes'], result.batch_sizes)
+
+    def test_timeout_shrinks_and_retries(self):
+        """A statement timeout rolls back that batch and retries it smaller"""
+        config.bulk_operations.target_batch_seconds = 60.0
+        self.assertEqual(self._insert(self._stats(1000), fail_above=150), 1000)
+
+        result = self.db.last_insert_result
+        self.assertEqual(sum(result.batch_sizes), 1000)
+        self.assertTrue(all(size <= 150 for size in result.batch_sizes))
+        self.assertTrue(result.warnings)
+        statements = [call.args[0] for call in self.cursor.execute.call_args_list]
+        self.assertIn('ROLLBACK TO SAVEPOINT adaptive_batch', statements)
+        self.conn.commit.assert_called_once()
+
+    def test_learned_size_carries_over(self):
+        """The next call for the same table starts from the learned size"""
+        self._insert(self._stats(3000), seconds_per_row=0.001)
+        learned = self.db._batch_sizers['qb_passing_stats'].size
+        self.executed.clear()
+
+        self._insert(self._stats(3000, season=2023), seconds_per_row=0.001)
+
+        self.assertEqual(self.executed[0], learned)
+
+    def test_concurrent_inserts_keep_their_own_result(self):
+        """Threads share one sizer per table but each reads back its own insert result"""
+        barrier = threading.Barrier(2)
+        results = {}
+
+        def execute_values(cur, sql, batch, page_size, fetch=False):
+            pass
+
+        def insert(count):
+            barrier.wait()
+            self.db.insert_qb_basic_stats(self._stats(count))
+            results[count] = self.db.last_insert_result
+
+        with patch('src.database.db_manager.execute_values', side_effect=execute_values):
+            threads = [threading.Thread(target=insert, args=(count,)) for count in (30, 70)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(sum(results[30].batch_sizes), 30)
+        self.assertEqual(sum(results[70].batch_sizes), 70)
+        self.assertIsNone(self.db.last_insert_result)
+        self.assertEqual(list(self.db._batch_sizers), ['qb_passing_stats'])
+
+    def test_duplicate_keys_keep_last_row(self):
+        """One statement never touches the same key twice"""
+        first, second = self._stats(1), self._stats(1)
+        second[0].att = 99
+        rows = []
+
+        def execute_values(cur, sql, batch, page_size, fetch=False):
+            rows.extend(batch)
+
+        with patch('src.database.db_manager.execute_values', side_effect=execute_values):
+            self.db.insert_qb_basic_stats(first + second)
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0][12], 99)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Async Pipeline Tests
+Checks stage overlap, batching, failure accounting and the pipelined
+full-season splits path
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.async_pipeline import AsyncPipeline
+from src.core.page_cache import PageCache
+from src.config.config import config
+from src.models.qb_models import QBSplitsType1, QBSplitsType2
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+class TestAsyncPipeline(unittest.TestCase):
+    """Test the generic fetch/parse/store pipeline"""
+
+    def test_every_item_stored(self):
+        """All records reach the store stage, in batches no larger than batch_size"""
+        batches = []
+        pipeline = AsyncPipeline(
+            fetch=lambda item: item * 10,
+            parse=lambda item, page: [page + i for i in range(3)],
+            store=lambda records: batches.append(list(records)) or len(records),
+            batch_size=4
+        )
+
+        stats = pipeline.run(range(5))
+
+        stored = sorted(record for batch in batches for record in batch)
+        self.assertEqual(stored, sorted(i * 10 + j for i in range(5) for j in range(3)))
+        self.assertTrue(all(len(batch) <= 4 for batch in batches))
+        self.assertEqual(stats.items, 5)
+        self.assertEqual(stats.records_parsed, 15)
+        self.assertEqual(stats.records_stored, 15)
+        self.assertEqual(stats.batches_stored, len(batches))
+
+    def test_failures_are_counted_not_fatal(self):
+        """A failing fetch, parse or store skips that work and keeps going"""
+        def fetch(item):
+            if item == 1:
+                raise IOError("HTTP 500")
+            return item
+
+        def parse(item, page):
+            if item == 2:
+                raise ValueError("bad table")
+            return [item]
+
+        def store(records):
+            if 3 in records:
+                raise RuntimeError("deadlock")
+            return len(records)
+
+        stats = AsyncPipeline(fetch, parse, store, batch_size=1).run(range(5))
+
+        self.assertEqual((stats.fetch_failures, stats.parse_failures, stats.store_failures), (1, 1, 1))
+        self.assertEqual(stats.records_stored, 2)
+        self.assertEqual(len(stats.errors), 3)
+        self.assertIn('HTTP 500', stats.errors[0])
+
+    def test_fetch_returning_none_is_a_failure(self):
+        """An item whose fetch returns no page is counted as a failed fetch and never parsed"""
+        parsed = []
+        stats = AsyncPipeline(
+            fetch=lambda item: None if item == 1 else item,
+            parse=lambda item, page: parsed.append(item) or [item],
+            store=len
+        ).run(range(3))
+
+        self.assertEqual((stats.fetched, stats.fetch_failures), (2, 1))
+        self.assertEqual(sorted(parsed), [0, 2])
+
+    def test_stages_overlap(self):
+        """Parse and store time hides behind the fetch waits"""
+        fetch_delay, parse_delay, store_delay, items = 0.05, 0.04, 0.04, 10
+        pipeline = AsyncPipeline(
+            fetch=lambda item: time.sleep(fetch_delay) or item,
+            parse=lambda item, page: time.sleep(parse_delay) or [item],
+            store=lambda records: time.sleep(store_delay) or len(records)
+        )
+
+        stats = pipeline.run(range(items))
+
+        sequential = items * (fetch_delay + parse_delay + store_delay)
+        self.assertLess(stats.wall_seconds, sequential * 0.7)
+        self.assertGreater(stats.overlapped_seconds, 0)
+
+    def test_bounded_queue_limits_fetch_ahead(self):
+        """Fetching stalls while the slower downstream stages are full"""
+        fetched, parsed = [], []
+        lock = threading.Lock()
+        max_ahead = [0]
+
+        def fetch(item):
+            with lock:
+                fetched.append(item)
+                max_ahead[0] = max(max_ahead[0], len(fetched) - len(parsed))
+            return item
+
+        def parse(item, page):
+            time.sleep(0.01)
+            with lock:
+                parsed.append(item)
+            return []
+
+        AsyncPipeline(fetch, parse, lambda records: len(records), queue_size=2).run(range(20))
+
+        # queue_size waiting + one being parsed + one fetched and waiting to enqueue
+        self.assertLessEqual(max_ahead[0], 2 + 2)
+
+    def test_invalid_sizes(self):
+        """Queue, batch and worker sizes must be positive"""
+        with self.assertRaises(ValueError):
+            AsyncPipeline(Mock(), Mock(), Mock(), queue_size=0)
+
+
+class TestPipelinedSeason(unittest.TestCase):
+    """Test ScrapingOperation's pipelined full-season path"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        with open(os.path.join(FIXTURES_DIR, 'pfr_splits_2024_sample.html'), 'r', encoding='utf-8') as f:
+            self.splits_html = f.read()
+
+        with patch('src.operations.scraping_operation.NFLQBDataPipeline'):
+            from src.operations.scraping_operation import ScrapingOperation
+            self.db_manager = Mock()
+            self.db_manager.insert_qb_basic_stats.side_effect = len
+            self.db_manager.insert_qb_splits.side_effect = len
+            self.db_manager.insert_qb_splits_advanced.side_effect = len
+            self.operation = ScrapingOperation(config, self.db_manager,
+                                               page_cache=PageCache(cache_dir=self.temp_dir))
+
+        self.operation.request_manager.get_page = Mock(
+            return_value={'success': True, 'content': self.splits_html, 'error': None}
+        )
+        self.passing_stats = [
+            SimpleNamespace(pfr_id='BurrJo01', player_name='Joe Burrow', season=2024,
+                            player_url='https://www.pro-football-reference.com/players/B/BurrJo01.htm'),
+            SimpleNamespace(pfr_id='GoffJa00', player_name='Jared Goff', season=2024,
+                            player_url='https://www.pro-football-reference.com/players/G/GoffJa00.htm'),
+        ]
+        scraper = MagicMock()
+        scraper.__enter__.return_value = scraper
+        scraper.get_season_leaderboard.return_value = ([], self.passing_stats)
+        self.operation.enhanced_scraper = scraper
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_splits_parsed_and_stored_per_player(self):
+        """Passing stats go in first; every player's splits are stored"""
+        result = self.operation._execute_full_season_pipelined(2024)
+
+        self.assertTrue(result.success, result.errors)
+        self.assertEqual(result.errors, [])
+        self.assertEqual(self.operation.request_manager.get_page.call_count, 2)
+        self.db_manager.insert_qb_basic_stats.assert_called_once_with(self.passing_stats)
+
+        basic = [r for call in self.db_manager.insert_qb_splits.call_args_list for r in call.args[0]]
+        advanced = [r for call in self.db_manager.insert_qb_splits_advanced.call_args_list for r in call.args[0]]
+        self.assertEqual(len(basic), 12)
+        self.assertEqual(len(advanced), 12)
+        self.assertTrue(all(isinstance(r, QBSplitsType1) for r in basic))
+        self.assertTrue(all(isinstance(r, QBSplitsType2) for r in advanced))
+        self.assertEqual({r.pfr_id for r in basic}, {'BurrJo01', 'GoffJa00'})
+        self.assertEqual(self.operation.splits_manager.metrics.successful_extractions, 2)
+
+    def test_fallback_reuses_fetched_page(self):
+        """A static page missing its tables goes straight to the browser, without a second static request"""
+        self.operation.request_manager.get_page.return_value = {
+            'success': True, 'content': '<html><body></body></html>', 'error': None
+        }
+        selenium_get = Mock(return_value={'success': True, 'content': self.splits_html, 'error': None})
+        self.operation.splits_manager.splits_extractor.selenium_manager.get_page = selenium_get
+
+        stats, basic, advanced = self.operation._run_splits_pipeline(self.passing_stats)
+
+        self.assertEqual(self.operation.request_manager.get_page.call_count, 2)
+        self.assertEqual(selenium_get.call_count, 2)
+        self.assertEqual((stats.fetched, basic, advanced), (2, 12, 12))
+
+    def test_failed_fetch_counted(self):
+        """Players whose page could not be fetched are fetch failures, not parsed"""
+        self.operation.request_manager.get_page.return_value = {'success': False, 'content': None, 'error': 'HTTP 404'}
+
+        stats, basic, advanced = self.operation._run_splits_pipeline(self.passing_stats)
+
+        self.assertEqual((stats.fetched, stats.fetch_failures, stats.parsed), (0, 2, 0))
+        self.assertEqual((basic, advanced), (0, 0))
+
+    def test_parse_matches_sequential_extractor(self):
+        """The parse stage yields the same records as the one-shot extractor"""
+        extractor = self.operation.splits_manager.splits_extractor
+        scraped_at = datetime(2024, 12, 1)
+        staged = extractor.parse_splits_page(self.splits_html, 'BurrJo01', 'Joe Burrow', 2024, scraped_at)
+        one_shot = extractor.extract_player_splits('BurrJo01', 'Joe Burrow', 2024, scraped_at)
+
+        self.assertEqual(staged.basic_splits, one_shot.basic_splits)
+        self.assertEqual(staged.advanced_splits, one_shot.advanced_splits)
+
+
+if __name__ == '__main__':
+    unittest.main()
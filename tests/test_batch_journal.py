@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Batch Session Journal Tests
+Checks that session progress is appended to a journal, replayed on load
+and folded into the snapshot by compaction
+"""
+
+import sys
+import os
+import json
+import tempfile
+import unittest
+from datetime import datetime
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.operations.batch_manager import BatchItem, BatchSession, BatchStatus
+
+
+def _item(session_id, name):
+    return BatchItem(id=f"{session_id}_{name}", name=name, status=BatchStatus.PENDING, created_at=datetime.now())
+
+
+class TestBatchJournal(unittest.TestCase):
+    """Test BatchSession journaling and replay"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.session = BatchSession('s1', session_dir=self.tmp.name)
+        self.session.config = {'season': 2024}
+        self.session.compact()
+        for name in ('a', 'b', 'c'):
+            self.session.add_item(_item('s1', name))
+
+    def _reload(self):
+        return BatchSession('s1', session_dir=self.tmp.name)
+
+    def test_one_line_per_change(self):
+        """Each item change appends one journal line and leaves the snapshot alone"""
+        snapshot = self.session.session_file.read_text()
+
+        self.session.mark_item_started('s1_a')
+        self.session.mark_item_completed('s1_a', {'success': True})
+
+        with open(self.session.journal_file) as f:
+            self.assertEqual(len(f.readlines()), 5)
+        self.assertEqual(self.session.session_file.read_text(), snapshot)
+
+    def test_replay_restores_state(self):
+        """Loading replays the journal over the snapshot, counters included"""
+        self.session.mark_item_started('s1_a')
+        self.session.mark_item_completed('s1_a', {'success': True})
+        self.session.mark_item_started('s1_b')
+
+        loaded = self._reload()
+
+        self.assertEqual(loaded.config, {'season': 2024})
+        self.assertEqual(loaded.items['s1_a'].status, BatchStatus.COMPLETED)
+        self.assertEqual(loaded.items['s1_a'].result, {'success': True})
+        self.assertEqual(loaded.progress.total_items, 3)
+        self.assertEqual(loaded.progress.completed_items, 1)
+        self.assertEqual(loaded.progress.running_items, 1)
+
+    def test_torn_last_line_ignored(self):
+        """A partial line left by a crash mid-write is dropped"""
+        self.session.mark_item_started('s1_a')
+        with open(self.session.journal_file, 'a') as f:
+            f.write('{"type": "item", "item": {"id": "s1_')
+
+        loaded = self._reload()
+
+        self.assertEqual(len(loaded.items), 3)
+        self.assertEqual(loaded.items['s1_a'].status, BatchStatus.RUNNING)
+
+    def test_second_crash_after_torn_line(self):
+        """Entries appended after a dropped torn line survive another crash"""
+        self.session.mark_item_started('s1_a')
+        with open(self.session.journal_file, 'a') as f:
+            f.write('{"type": "item", "item": {"id": "s1_')
+
+        resumed = self._reload()
+        resumed.mark_item_completed('s1_a', {'success': True})
+        resumed.mark_item_started('s1_b')
+        with open(resumed.journal_file, 'a') as f:
+            f.write('{"type": "ite')
+
+        loaded = self._reload()
+
+        self.assertEqual(loaded.items['s1_a'].status, BatchStatus.COMPLETED)
+        self.assertEqual(loaded.items['s1_b'].status, BatchStatus.RUNNING)
+        with open(loaded.journal_file) as f:
+            self.assertTrue(all(json.loads(line) for line in f))
+
+    def test_missing_newline_restored(self):
+        """A complete entry cut before its newline is kept and the next append gets its own line"""
+        self.session.mark_item_started('s1_a')
+        with open(self.session.journal_file, 'rb+') as f:
+            f.seek(-1, os.SEEK_END)
+            f.truncate()
+
+        resumed = self._reload()
+        self.assertEqual(resumed.items['s1_a'].status, BatchStatus.RUNNING)
+        resumed.mark_item_completed('s1_a', {'success': True})
+
+        self.assertEqual(self._reload().items['s1_a'].status, BatchStatus.COMPLETED)
+
+    def test_requeue_interrupted(self):
+        """Items left running by a crash go back to pending on resume"""
+        self.session.status = BatchStatus.RUNNING
+        self.session.save_session()
+        self.session.mark_item_started('s1_a')
+
+        loaded = self._reload()
+        loaded.requeue_interrupted()
+
+        self.assertEqual(len(loaded.get_pending_items()), 3)
+        self.assertEqual(loaded.status, BatchStatus.PAUSED)
+        self.assertEqual(self._reload().items['s1_a'].status, BatchStatus.PENDING)
+
+    def test_compact(self):
+        """Compaction writes every item to the snapshot and removes the journal"""
+        self.session.mark_item_started('s1_c')
+        self.session.mark_item_failed('s1_c', 'timeout')
+
+        self.session.compact()
+
+        self.assertFalse(self.session.journal_file.exists())
+        with open(self.session.session_file) as f:
+            snapshot = json.load(f)
+        self.assertEqual(set(snapshot['items']), {'s1_a', 's1_b', 's1_c'})
+        self.assertEqual(self._reload().items['s1_c'].error_message, 'timeout')
+
+
+if __name__ == '__main__':
+    unittest.main()
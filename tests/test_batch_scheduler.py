@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Batch Scheduler Tests
+Checks item priorities, the priority heap with retry backoff, and that
+batch sessions run their items most valuable first
+"""
+
+import sys
+import os
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.operations.batch_manager import BatchItem, BatchOperationManager, BatchSession, BatchStatus
+from src.operations.batch_scheduler import BatchScheduler, is_live_season, item_priority, retry_delay
+
+IN_SEASON = datetime(2024, 11, 15)
+
+
+class FakeClock:
+    """Monotonic clock the tests move by hand"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestItemPriority(unittest.TestCase):
+    """Test item_priority and the season helpers"""
+
+    def test_live_season(self):
+        """A season is live from September through February"""
+        self.assertTrue(is_live_season(2024, IN_SEASON))
+        self.assertTrue(is_live_season(2024, datetime(2025, 2, 1)))
+        self.assertFalse(is_live_season(2024, datetime(2025, 6, 1)))
+        self.assertFalse(is_live_season(2023, IN_SEASON))
+
+    def test_ordering(self):
+        """Never scraped beats stale beats fresh; starters and the live season weigh more"""
+        never = item_priority(2024, None, 17, now=IN_SEASON)
+        stale = item_priority(2024, IN_SEASON - timedelta(days=3), 17, now=IN_SEASON)
+        fresh = item_priority(2024, IN_SEASON - timedelta(hours=1), 17, now=IN_SEASON)
+        backup = item_priority(2024, IN_SEASON - timedelta(days=3), 0, now=IN_SEASON)
+        old_season = item_priority(2020, IN_SEASON - timedelta(days=3), 17, now=IN_SEASON)
+
+        self.assertGreater(never, stale)
+        self.assertGreater(stale, fresh)
+        self.assertGreater(stale, backup)
+        self.assertGreater(stale, old_season)
+
+    def test_aware_timestamps(self):
+        """Aware timestamps, as Postgres returns them, mix with naive ones taken as UTC"""
+        aware = datetime(2024, 11, 12, 9, 0, tzinfo=timezone(timedelta(hours=-5)))
+        naive = datetime(2024, 11, 12, 14, 0)
+
+        self.assertEqual(item_priority(2024, aware, 17, now=IN_SEASON),
+                         item_priority(2024, naive, 17, now=IN_SEASON))
+        self.assertGreater(item_priority(2024, aware, 17), 0)
+
+    def test_retry_delay(self):
+        """Backoff doubles per failure up to a cap"""
+        self.assertEqual(retry_delay(2), 2 * retry_delay(1))
+        self.assertEqual(retry_delay(50), retry_delay(60))
+
+
+class TestBatchScheduler(unittest.TestCase):
+    """Test BatchScheduler"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.clock = FakeClock()
+        self.scheduler = BatchScheduler(clock=self.clock)
+
+    def test_pop_by_priority(self):
+        """Items come out highest priority first; a re-push changes an item's place"""
+        for item_id, priority in (('a', 1.0), ('b', 3.0), ('c', 2.0)):
+            self.scheduler.push(item_id, priority)
+        self.scheduler.push('a', 5.0)
+
+        self.assertEqual([self.scheduler.pop() for _ in range(4)], ['a', 'b', 'c', None])
+        self.assertEqual(len(self.scheduler), 0)
+
+    def test_deferred_until_backoff_ends(self):
+        """A deferred item is held back until its delay has passed"""
+        self.scheduler.defer('a', 10.0, 30)
+        self.scheduler.push('b', 1.0)
+
+        self.assertEqual(self.scheduler.pop(), 'b')
+        self.assertIsNone(self.scheduler.pop())
+        self.assertEqual(self.scheduler.next_ready_in(), 30)
+
+        self.clock.now = 30
+        self.assertEqual(self.scheduler.next_ready_in(), 0)
+        self.assertEqual(self.scheduler.pop(), 'a')
+        self.assertIsNone(self.scheduler.next_ready_in())
+
+
+class TestPrioritizedSession(unittest.TestCase):
+    """Test that BatchOperationManager runs items in priority order"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.manager = BatchOperationManager.__new__(BatchOperationManager)
+        self.manager.max_workers = 1
+        self.manager.active_operations = {}
+        self.manager.db_manager = MagicMock()
+        recent = (datetime.now() - timedelta(minutes=5)).isoformat()
+        self.manager.db_manager.query.return_value = [
+            {'player_name': 'Backup', 'last_scraped': None, 'games_started': 0},
+            {'player_name': 'Fresh Starter', 'last_scraped': recent, 'games_started': 17},
+        ]
+        self.session = BatchSession('s1', session_dir=self.tmp.name)
+        self.session.config = {'season': datetime.now().year}
+        for name in ('Fresh Starter', 'Backup', 'Unknown Starter'):
+            self.session.add_item(BatchItem(id=f"s1_{name}", name=name, status=BatchStatus.PENDING,
+                                            created_at=datetime.now()))
+
+    def test_runs_most_valuable_first(self):
+        """Unscraped players run before the freshly scraped one"""
+        order = []
+        self.manager._scrape_item = lambda name, season: order.append(name) or {'success': True}
+
+        self.manager._process_batch_session(self.session, threading.Event())
+
+        self.assertEqual(order[-1], 'Fresh Starter')
+        self.assertEqual(self.session.status, BatchStatus.COMPLETED)
+        self.assertEqual(len(self.session.get_completed_items()), 3)
+        self.manager.db_manager.refresh_summaries_if_stale.assert_called_once_with()
+
+    def test_aware_stored_timestamps(self):
+        """Priorities come out of stored TIMESTAMP WITH TIME ZONE values without a TypeError"""
+        recent = datetime.now(timezone.utc) - timedelta(minutes=5)
+        self.manager.db_manager.query.return_value = [
+            {'player_name': 'Fresh Starter', 'last_scraped': recent, 'games_started': 17},
+        ]
+
+        priorities = self.manager._item_priorities(self.session, self.session.get_pending_items())
+
+        self.assertLess(priorities['s1_Fresh Starter'], priorities['s1_Backup'])
+
+    def test_failed_item_retried_after_backoff(self):
+        """A failure is retried once its backoff ends, in the same run"""
+        attempts = []
+
+        def scrape(name, season):
+            attempts.append(name)
+            if name == 'Backup' and attempts.count(name) == 1:
+                raise RuntimeError("timeout")
+            return {'success': True}
+
+        self.manager._scrape_item = scrape
+        with patch('src.operations.batch_manager.retry_delay', return_value=0.01):
+            self.manager._process_batch_session(self.session, threading.Event())
+
+        self.assertEqual(attempts.count('Backup'), 2)
+        self.assertEqual(self.session.get_item('s1_Backup').status, BatchStatus.COMPLETED)
+
+
+if __name__ == '__main__':
+    unittest.main()
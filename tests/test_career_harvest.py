@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Career Harvest Tests
+Checks that every season of a player's passing stats comes from one
+player page fetch
+"""
+
+import sys
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.html_parser import HTMLParser
+from src.core.scraper import CoreScraper, Config, DatabaseManager
+from src.config.config import config
+from src.database.sqlite_manager import SQLiteDatabaseManager
+from src.models.qb_models import Player, QBBasicStats
+
+PLAYER_URL = 'https://www.pro-football-reference.com/players/F/FlacJo00.htm'
+
+# Career passing table as served on a player page: one row per season, a
+# multi-team season listed as a total row plus per-team rows, and career
+# totals in the footer
+PLAYER_HTML = """
+<html><body>
+<div id="meta"><h1><span>Joe Flacco</span></h1></div>
+<div id="all_passing">
+<table id="passing">
+<thead><tr><th data-stat="year_id">Season</th></tr></thead>
+<tbody>
+<tr id="passing.2008">
+  <th data-stat="year_id"><a href="/years/2008/">2008</a></th>
+  <td data-stat="age">23</td><td data-stat="team">BAL</td><td data-stat="pos">QB</td>
+  <td data-stat="g">16</td><td data-stat="pass_att">428</td><td data-stat="pass_yds">2971</td>
+  <td data-stat="pass_td">14</td>
+</tr>
+<tr class="thead"><th data-stat="year_id">Season</th></tr>
+<tr id="passing.2014">
+  <th data-stat="year_id"><a href="/years/2014/">2014*</a></th>
+  <td data-stat="age">29</td><td data-stat="team">BAL</td><td data-stat="pos">QB</td>
+  <td data-stat="g">16</td><td data-stat="pass_att">554</td><td data-stat="pass_yds">3986</td>
+  <td data-stat="pass_td">27</td>
+</tr>
+<tr id="passing.2020">
+  <th data-stat="year_id"><a href="/years/2020/">2020</a></th>
+  <td data-stat="age">35</td><td data-stat="team">2TM</td><td data-stat="pos">QB</td>
+  <td data-stat="g">5</td><td data-stat="pass_att">134</td><td data-stat="pass_yds">864</td>
+  <td data-stat="pass_td">6</td>
+</tr>
+<tr class="partial_table">
+  <th data-stat="year_id"><a href="/years/2020/">2020</a></th>
+  <td data-stat="age">35</td><td data-stat="team">NYJ</td><td data-stat="pos">QB</td>
+  <td data-stat="g">4</td><td data-stat="pass_att">134</td><td data-stat="pass_yds">864</td>
+  <td data-stat="pass_td">6</td>
+</tr>
+</tbody>
+<tfoot>
+<tr><th data-stat="year_id">Career</th><td data-stat="pass_att">7000</td></tr>
+</tfoot>
+</table>
+</div>
+</body></html>
+"""
+
+
+class TestCareerPassingParser(unittest.TestCase):
+    """Test parsing the career passing table"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        parser = HTMLParser()
+        self.seasons = parser.parse_player_career_passing(
+            parser.parse_html(PLAYER_HTML), 'FlacJo00', 'Joe Flacco', PLAYER_URL
+        )
+
+    def test_one_record_per_season(self):
+        """Header and footer rows are skipped; award marks are stripped from the year"""
+        self.assertEqual([s['season'] for s in self.seasons], [2008, 2014, 2020])
+        self.assertEqual(self.seasons[1]['att'], 554)
+        self.assertTrue(all(s['pfr_id'] == 'FlacJo00' for s in self.seasons))
+
+    def test_multi_team_total_row_kept(self):
+        """The 2TM total wins over the per-team row"""
+        self.assertEqual(self.seasons[2]['team'], '2TM')
+        self.assertEqual(self.seasons[2]['g'], 5)
+
+    def test_records_build_passing_stats(self):
+        """Parsed seasons load straight into QBBasicStats"""
+        stats = QBBasicStats.from_dict(self.seasons[0])
+        self.assertEqual((stats.season, stats.yds, stats.player_url), (2008, 2971, PLAYER_URL))
+
+
+class TestCoreScraperCareer(unittest.TestCase):
+    """Test CoreScraper's career harvest"""
+
+    def test_single_fetch_for_all_seasons(self):
+        """Every season comes from one request; seasons can be filtered"""
+        request_manager = Mock()
+        request_manager.get_page.return_value = {'success': True, 'content': PLAYER_HTML, 'error': None}
+        scraper = CoreScraper(request_manager, HTMLParser(), Mock(), DatabaseManager(), Config())
+
+        result = scraper.scrape_player_career('FlacJo00', 'Joe Flacco', seasons=[2014, 2020])
+
+        request_manager.get_page.assert_called_once_with(PLAYER_URL)
+        self.assertTrue(result['success'])
+        self.assertEqual([s['season'] for s in result['seasons']], [2014, 2020])
+
+    def test_name_read_from_page(self):
+        """Without a name the page heading supplies it, on every parser backend"""
+        for backend in ('html.parser', 'lxml', 'lxml-strained'):
+            request_manager = Mock()
+            request_manager.get_page.return_value = {'success': True, 'content': PLAYER_HTML, 'error': None}
+            scraper = CoreScraper(request_manager, HTMLParser(backend), Mock(), DatabaseManager(), Config())
+
+            result = scraper.scrape_player_career('FlacJo00')
+
+            self.assertEqual(result['player_name'], 'Joe Flacco', backend)
+            self.assertTrue(all(s['player_name'] == 'Joe Flacco' for s in result['seasons']), backend)
+
+
+class TestCareerOperation(unittest.TestCase):
+    """Test ScrapingOperation.execute_career"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        with patch('src.operations.scraping_operation.NFLQBDataPipeline'):
+            from src.operations.scraping_operation import ScrapingOperation
+            self.db_manager = Mock()
+            self.db_manager.query.return_value = []
+            self.db_manager.insert_qb_basic_stats.side_effect = len
+            self.operation = ScrapingOperation(config, self.db_manager)
+        self.operation.request_manager.get_page = Mock(
+            return_value={'success': True, 'content': PLAYER_HTML, 'error': None}
+        )
+
+    def test_one_request_one_upsert(self):
+        """A PFR ID costs one request and every season goes in one upsert"""
+        result = self.operation.execute_career(['FlacJo00'])
+
+        self.assertTrue(result.success, result.errors)
+        self.operation.request_manager.get_page.assert_called_once_with(PLAYER_URL)
+        self.db_manager.insert_qb_basic_stats.assert_called_once()
+        stored = self.db_manager.insert_qb_basic_stats.call_args.args[0]
+        self.assertEqual([s.season for s in stored], [2008, 2014, 2020])
+        self.assertTrue(all(s.player_name == 'Joe Flacco' for s in stored))
+        self.assertEqual((result.scraped_records, result.saved_records, result.season), (3, 3, 2020))
+
+    def test_unknown_player_reported(self):
+        """Names without a known PFR ID are reported, not fetched"""
+        result = self.operation.execute_career(['Nobody Atall'])
+
+        self.assertFalse(result.success)
+        self.assertIn('Could not find PFR ID for Nobody Atall', result.errors)
+        self.operation.request_manager.get_page.assert_not_called()
+
+
+class TestCareerOperationSQLite(unittest.TestCase):
+    """Test execute_career against a real database manager"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.db_manager = SQLiteDatabaseManager(f"sqlite:///{self.tmp.name}/qb.db")
+        self.addCleanup(self.db_manager.close)
+        from src.operations.scraping_operation import ScrapingOperation
+        self.operation = ScrapingOperation(config, self.db_manager)
+        self.operation.request_manager.get_page = Mock(
+            return_value={'success': True, 'content': PLAYER_HTML, 'error': None}
+        )
+
+    def test_player_and_seasons_stored(self):
+        """The player row is upserted before the seasons that reference it"""
+        # Multi-team totals (2TM) are not in the teams table, so keep single-team seasons
+        result = self.operation.execute_career(['FlacJo00'], seasons=[2008, 2014])
+
+        self.assertTrue(result.success, result.errors)
+        players = self.db_manager.query("SELECT pfr_id, player_name, pfr_url FROM players")
+        self.assertEqual([dict(row) for row in players],
+                         [{'pfr_id': 'FlacJo00', 'player_name': 'Joe Flacco', 'pfr_url': PLAYER_URL}])
+        seasons = self.db_manager.query("SELECT season FROM qb_passing_stats ORDER BY season")
+        self.assertEqual([row['season'] for row in seasons], [2008, 2014])
+
+    def test_name_resolved_from_stored_players(self):
+        """A name already stored from a season crawl resolves to its PFR ID"""
+        self.db_manager.insert_player(Player(pfr_id='FlacJo00', player_name='Joe Flacco', pfr_url=PLAYER_URL))
+
+        result = self.operation.execute_career(['Joe Flacco'], seasons=[2014])
+
+        self.assertTrue(result.success, result.errors)
+        self.operation.request_manager.get_page.assert_called_once_with(PLAYER_URL)
+        self.assertEqual(result.scraped_records, 1)
+
+    def test_unknown_and_ambiguous_names_rejected(self):
+        """Names with no stored player, or several, are rejected before any request"""
+        for pfr_id in ('AlleJo00', 'AlleJo02'):
+            self.db_manager.insert_player(Player(pfr_id=pfr_id, player_name='Josh Allen', pfr_url=''))
+
+        result = self.operation.execute_career(['Josh Allen', 'Patrick Mahomes'])
+
+        self.assertFalse(result.success)
+        self.assertEqual(result.errors, ['Could not find PFR ID for Josh Allen',
+                                         'Could not find PFR ID for Patrick Mahomes'])
+        self.operation.request_manager.get_page.assert_not_called()
+
+    def test_splits_only_resolves_players_missing_from_season(self):
+        """--splits-only --players finds stored players with no passing stats for that season"""
+        self.db_manager.insert_player(Player(pfr_id='FlacJo00', player_name='Joe Flacco', pfr_url=PLAYER_URL))
+        self.operation.splits_manager.extract_all_player_splits = Mock()
+
+        result = self.operation.execute(2024, player_names=['Joe Flacco'], splits_only=True)
+
+        self.assertTrue(result.success, result.errors)
+        targets = self.operation.splits_manager.extract_all_player_splits.call_args.args[0]
+        self.assertEqual([(t.pfr_id, t.player_name, t.season) for t in targets], [('FlacJo00', 'Joe Flacco', 2024)])
+
+        unknown = self.operation.execute(2024, player_names=['Patrick Mahomes'], splits_only=True)
+        self.assertFalse(unknown.success)
+
+    def test_splits_only_uses_stored_season_stats(self):
+        """Without --players every player stored for the season is a splits target"""
+        self.operation.execute_career(['FlacJo00'], seasons=[2014])
+        self.operation.splits_manager.extract_all_player_splits = Mock()
+
+        result = self.operation.execute(2014, splits_only=True)
+
+        self.assertTrue(result.success, result.errors)
+        targets = self.operation.splits_manager.extract_all_player_splits.call_args.args[0]
+        self.assertEqual([(t.pfr_id, t.player_url, t.season) for t in targets], [('FlacJo00', PLAYER_URL, 2014)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Connection Pool Tests
+Checks the thread-safe pool's wait queue, health checks, recycling and
+checkout metrics
+"""
+
+import sys
+import os
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+import psycopg2
+from psycopg2 import extensions
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.database.connection_pool import ThreadSafeConnectionPool, PoolExhaustedError, PoolTimeoutError
+from src.database.db_manager import DatabaseManager
+from src.operations.performance_monitor import PerformanceMonitor
+
+
+class FakeConnection:
+    """Stand-in for a psycopg2 connection"""
+
+    def __init__(self, dead: bool = False):
+        self.closed = 0
+        self.dead = dead
+        self.rollbacks = 0
+        self.info = MagicMock(transaction_status=extensions.TRANSACTION_STATUS_IDLE)
+
+    def cursor(self):
+        cur = MagicMock()
+        if self.dead:
+            cur.execute.side_effect = psycopg2.OperationalError("server closed the connection unexpectedly")
+        return cur
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.info.transaction_status = extensions.TRANSACTION_STATUS_IDLE
+
+    def close(self):
+        self.closed = 1
+
+
+class TestThreadSafeConnectionPool(unittest.TestCase):
+    """Test the connection pool"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.opened = []
+
+        def connect(dsn, **kwargs):
+            conn = FakeConnection()
+            self.opened.append(conn)
+            return conn
+
+        self.connect = connect
+
+    def _pool(self, **kwargs):
+        options = {'minconn': 1, 'maxconn': 2, 'dsn': 'postgresql://test', 'checkout_timeout': 1.0,
+                   'connect': self.connect}
+        options.update(kwargs)
+        return ThreadSafeConnectionPool(**options)
+
+    def test_reuses_returned_connections(self):
+        """A returned connection is handed out again instead of opening a new one"""
+        pool = self._pool()
+        conn = pool.getconn()
+        pool.putconn(conn)
+        self.assertIs(pool.getconn(), conn)
+        self.assertEqual(len(self.opened), 1)
+
+    def test_waiter_gets_released_connection(self):
+        """A checkout at maxconn blocks until another thread returns a connection"""
+        pool = self._pool()
+        held = [pool.getconn(), pool.getconn()]
+        got = []
+        waiter = threading.Thread(target=lambda: got.append(pool.getconn()))
+        waiter.start()
+        while pool.stats()['waiting'] == 0:
+            time.sleep(0.001)
+
+        pool.putconn(held[0])
+        waiter.join(1.0)
+
+        self.assertEqual(got, [held[0]])
+        self.assertEqual(pool.stats()['saturation'], 1.0)
+
+    def test_timeout_and_bounded_queue(self):
+        """Checkouts time out, and the wait queue rejects threads past max_waiters"""
+        pool = self._pool(maxconn=1, max_waiters=1)
+        pool.getconn()
+        with self.assertRaises(PoolTimeoutError):
+            pool.getconn(timeout=0.01)
+
+        waiter = threading.Thread(target=lambda: self.assertRaises(PoolTimeoutError, pool.getconn, 0.5))
+        waiter.start()
+        while pool.stats()['waiting'] == 0:
+            time.sleep(0.001)
+        with self.assertRaises(PoolExhaustedError):
+            pool.getconn()
+        waiter.join()
+
+        stats = pool.stats()
+        self.assertEqual((stats['timeouts'], stats['rejected']), (2, 1))
+
+    def test_stale_connection_replaced(self):
+        """A long-idle connection failing its health check is closed and replaced"""
+        pool = self._pool(health_check_idle=30)
+        stale = self.opened[0]
+        stale.dead = True
+
+        self.assertIs(pool.getconn(), stale)
+        pool.putconn(stale)
+        with patch('src.database.connection_pool.time.monotonic', return_value=time.monotonic() + 60):
+            conn = pool.getconn()
+
+        self.assertIsNot(conn, stale)
+        self.assertTrue(stale.closed)
+        self.assertEqual(pool.stats()['failed_health_checks'], 1)
+
+    def test_old_connections_recycled(self):
+        """Connections past max_age are closed instead of reused"""
+        pool = self._pool(max_age=60)
+        conn = pool.getconn()
+        pool.putconn(conn)
+        with patch('src.database.connection_pool.time.monotonic', return_value=time.monotonic() + 120):
+            fresh = pool.getconn()
+        self.assertIsNot(fresh, conn)
+        self.assertTrue(conn.closed)
+        self.assertEqual(pool.stats()['recycled'], 1)
+
+    def test_broken_and_dirty_connections_on_return(self):
+        """Open transactions are rolled back; closed or unknown-state connections are dropped"""
+        pool = self._pool()
+        conn = pool.getconn()
+        conn.info.transaction_status = extensions.TRANSACTION_STATUS_INERROR
+        pool.putconn(conn)
+        self.assertEqual(conn.rollbacks, 1)
+        self.assertEqual(pool.stats()['idle'], 1)
+
+        conn = pool.getconn()
+        conn.info.transaction_status = extensions.TRANSACTION_STATUS_UNKNOWN
+        pool.putconn(conn)
+        self.assertTrue(conn.closed)
+        self.assertEqual(pool.stats()['size'], 0)
+
+    def test_metrics_reach_performance_monitor(self):
+        """Wait time, hold time and saturation are recorded per checkout"""
+        monitor = PerformanceMonitor()
+        pool = self._pool(monitor=monitor)
+        conn = pool.getconn()
+        pool.putconn(conn)
+
+        summaries = monitor.metrics.get_operation_summaries()
+        self.assertEqual(summaries['db_pool_checkout']['count'], 1)
+        self.assertEqual(summaries['db_pool_hold']['count'], 1)
+        checkout = monitor.metrics.get_recent_metrics()[0]
+        self.assertEqual(checkout.metadata['saturation'], 0.5)
+        self.assertEqual(pool.stats()['checkouts'], 1)
+
+
+class TestDatabaseManagerPool(unittest.TestCase):
+    """Test DatabaseManager's use of the pool"""
+
+    def test_broken_connection_not_returned(self):
+        """A connection that dropped mid-query is closed rather than pooled"""
+        opened = []
+
+        def connect(dsn, **kwargs):
+            opened.append(FakeConnection())
+            return opened[-1]
+
+        with patch('src.database.connection_pool.psycopg2.connect', side_effect=connect):
+            db = DatabaseManager('postgresql://test')
+
+        with self.assertRaises(psycopg2.OperationalError):
+            with db.get_connection():
+                raise psycopg2.OperationalError("server closed the connection unexpectedly")
+
+        self.assertTrue(opened[0].closed)
+        self.assertEqual(db.get_pool_stats()['size'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
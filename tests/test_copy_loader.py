@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+COPY Bulk Loader Tests
+Checks the COPY + staging merge upsert path and when DatabaseManager picks it
+"""
+
+import sys
+import os
+import unittest
+from contextlib import contextmanager
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.config.config import config
+from src.database.db_manager import DatabaseManager, CopyRowStream
+from src.models.qb_models import QBPassingStats, QBSplitsType2
+
+
+def _passing_stats(count):
+    return [
+        QBPassingStats(pfr_id=f"TestQb{i:02d}", player_name=f"Test QB {i}", player_url='', season=2024,
+                       att=100 + i, scraped_at=datetime(2024, 12, 1), updated_at=datetime(2024, 12, 1))
+        for i in range(count)
+    ]
+
+
+class TestCopyRowStream(unittest.TestCase):
+    """Test COPY text encoding"""
+
+    def test_encoding(self):
+        """NULLs, booleans, dates and control characters follow COPY's text format"""
+        stream = CopyRowStream([(None, True, 'a\tb\\c\nd', datetime(2024, 12, 1, 8, 30), 7.5)])
+        self.assertEqual(stream.read(), '\\N\tt\ta\\tb\\\\c\\nd\t2024-12-01T08:30:00\t7.5\n')
+
+    def test_chunked_reads(self):
+        """Chunked reads return the same payload as one read"""
+        rows = [(i, f"player {i}") for i in range(50)]
+        whole = CopyRowStream(rows).read()
+        stream = CopyRowStream(rows)
+        chunks = []
+        while True:
+            chunk = stream.read(64)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        self.assertEqual(''.join(chunks), whole)
+        self.assertEqual(whole.count('\n'), 50)
+
+
+class TestCopyUpsert(unittest.TestCase):
+    """Test how DatabaseManager upserts large batches"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        with patch.object(DatabaseManager, '_initialize_pool'):
+            self.db = DatabaseManager('postgresql://test')
+        self.conn = MagicMock()
+        self.cursor = MagicMock()
+        self.copied = []
+        self.cursor.copy_expert.side_effect = lambda sql, stream: self.copied.append((sql, stream.read()))
+
+        @contextmanager
+        def get_connection():
+            yield self.conn
+
+        @contextmanager
+        def get_cursor(conn):
+            yield self.cursor
+
+        self.db.get_connection = get_connection
+        self.db.get_cursor = get_cursor
+        self.original_threshold = config.bulk_operations.copy_threshold
+        config.bulk_operations.copy_threshold = 10
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        config.bulk_operations.copy_threshold = self.original_threshold
+
+    def _statements(self):
+        return [call.args[0] for call in self.cursor.execute.call_args_list]
+
+    def test_small_batches_use_batch_path(self):
+        """Below the threshold rows go through the multi-row insert path"""
+        with patch('src.database.db_manager.execute_values') as execute_values:
+            self.assertEqual(self.db.insert_qb_basic_stats(_passing_stats(9)), 9)
+        execute_values.assert_called()
+        self.cursor.copy_expert.assert_not_called()
+
+    def test_large_batches_copy_then_merge(self):
+        """At the threshold rows stream into a staging table and merge in one statement"""
+        with patch('src.database.db_manager.execute_values') as execute_values:
+            self.assertEqual(self.db.insert_qb_basic_stats(_passing_stats(10)), 10)
+        execute_values.assert_not_called()
+
+        create, alter, merge, drop = self._statements()
+        self.assertIn('CREATE TEMP TABLE qb_passing_stats_stage ON COMMIT DROP', create)
+        self.assertIn('BIGSERIAL', alter)
+        copy_sql, payload = self.copied[0]
+        self.assertTrue(copy_sql.startswith('COPY qb_passing_stats_stage (pfr_id, player_name'))
+        self.assertEqual(payload.count('\n'), 10)
+        self.assertIn('DISTINCT ON (pfr_id, season)', merge)
+        self.assertIn('ON CONFLICT (pfr_id, season)', merge)
+        self.assertIn('player_name = EXCLUDED.player_name', merge)
+        self.assertNotIn('pfr_id = EXCLUDED.pfr_id', merge)
+        self.assertEqual(drop, 'DROP TABLE qb_passing_stats_stage')
+        self.conn.commit.assert_called_once()
+
+    def test_repeated_copy_in_one_transaction(self):
+        """Each merge drops its staging table, so a second load of the table can create it again"""
+        with self.db.transaction():
+            self.db.insert_qb_basic_stats(_passing_stats(10), method='copy')
+            self.db.insert_qb_basic_stats(_passing_stats(12), method='copy')
+
+        stage_statements = [sql.split(' AS ')[0] for sql in self._statements()
+                            if 'stage' in sql and 'INSERT' not in sql]
+        self.assertEqual(stage_statements, [
+            'CREATE TEMP TABLE qb_passing_stats_stage ON COMMIT DROP',
+            'ALTER TABLE qb_passing_stats_stage ADD COLUMN stage_row BIGSERIAL',
+            'DROP TABLE qb_passing_stats_stage',
+        ] * 2)
+
+    def test_advanced_splits_keep_player_name(self):
+        """The merge updates the same columns as the batch upsert"""
+        splits = [QBSplitsType2(pfr_id='TestQb00', player_name='Test QB', season=2024,
+                                split='Down', value=str(i)) for i in range(3)]
+
+        self.db.insert_qb_splits_advanced(splits, method='copy')
+
+        merge = self._statements()[-2]
+        self.assertIn('ON CONFLICT (pfr_id, season, split, value)', merge)
+        self.assertIn('rush_first_downs = EXCLUDED.rush_first_downs', merge)
+        self.assertNotIn('player_name = EXCLUDED', merge)
+
+    def test_method_override(self):
+        """An explicit method wins over the threshold; unknown methods are rejected"""
+        with patch('src.database.db_manager.execute_values') as execute_values:
+            self.db.insert_qb_basic_stats(_passing_stats(20), method='batch')
+        execute_values.assert_called()
+        self.cursor.copy_expert.assert_not_called()
+
+        config.bulk_operations.copy_threshold = 0
+        self.assertFalse(self.db._use_copy(10 ** 6, None))
+        with self.assertRaises(ValueError):
+            self.db.insert_qb_basic_stats(_passing_stats(1), method='bulk')
+
+
+if __name__ == '__main__':
+    unittest.main()
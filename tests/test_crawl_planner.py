@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Crawl Planner Tests
+Checks that the planner skips complete seasons, picks out players whose
+stats changed after their splits were scraped, estimates the crawl time,
+and that incremental scrapes follow the plan
+"""
+
+import sys
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.database.sqlite_manager import SQLiteDatabaseManager
+from src.models.qb_models import Player, QBPassingStats, QBSplitsType1, ScrapingLog
+from src.operations.crawl_planner import TYPICAL_SEASON_PLAYERS, CrawlPlanner
+from src.operations.scraping_operation import ScrapingOperation
+from src.utils.data_utils import parse_season_range
+
+NOW = datetime(2024, 11, 15)
+PLAYERS = (('burrjo01', 'Joe Burrow'), ('mahopa00', 'Patrick Mahomes'))
+
+
+def _stats(pfr_id, name, season, updated_at, att=20):
+    return QBPassingStats(pfr_id=pfr_id, player_name=name, player_url='u', season=season, team='CIN',
+                          att=att, scraped_at=updated_at, updated_at=updated_at)
+
+
+def _splits(pfr_id, name, season, scraped_at):
+    return QBSplitsType1(pfr_id=pfr_id, player_name=name, season=season, split='place', value='Home',
+                         cmp=1, scraped_at=scraped_at, updated_at=scraped_at)
+
+
+class TestCrawlPlanner(unittest.TestCase):
+    """Test CrawlPlanner against a temporary SQLite database"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.db = SQLiteDatabaseManager(f"sqlite:///{self.tmp.name}/qb.db")
+        self.addCleanup(self.db.close)
+        for pfr_id, name in PLAYERS:
+            self.db.insert_player(Player(pfr_id=pfr_id, player_name=name, pfr_url=f"https://example.com/{pfr_id}.htm"))
+        self.planner = CrawlPlanner(self.db, SimpleNamespace(requests_per_minute=4.0,
+                                                             advanced_leaderboard_enabled=True), now=NOW)
+
+    def _crawl(self, season, at, splits_for=('burrjo01', 'mahopa00'), scope='season'):
+        """Store a crawl of season finished at the given time"""
+        self.db.insert_qb_basic_stats([_stats(pfr_id, name, season, at) for pfr_id, name in PLAYERS])
+        self.db.insert_qb_splits([_splits(pfr_id, name, season, at + timedelta(minutes=5))
+                                  for pfr_id, name in PLAYERS if pfr_id in splits_for])
+        self.db.insert_scraping_log(ScrapingLog(session_id=f"s{season}", season=season, start_time=at,
+                                                end_time=at + timedelta(minutes=10), total_passing_stats=2,
+                                                scope=scope))
+
+    def test_complete_final_season_skipped(self):
+        """A season crawled after it was final, with every player's splits, needs nothing"""
+        self._crawl(2022, datetime(2023, 6, 1))
+
+        plan = self.planner.plan_season(2022)
+
+        self.assertEqual(plan.state, 'complete')
+        self.assertTrue(plan.skip)
+
+    def test_final_season_missing_splits(self):
+        """A final season only fetches its leaderboard and the players without splits"""
+        self._crawl(2022, datetime(2023, 6, 1), splits_for=('burrjo01',))
+
+        plan = self.planner.plan_season(2022)
+
+        self.assertEqual((plan.state, plan.stale_players), ('final', ['mahopa00']))
+        self.assertEqual(plan.requests, 3)
+
+    def test_season_crawled_before_final_refetched(self):
+        """A crawl from during the season does not make the season complete"""
+        self._crawl(2023, datetime(2023, 12, 1))
+
+        plan = self.planner.plan_season(2023)
+
+        self.assertEqual(plan.state, 'final')
+        self.assertEqual(plan.requests, 2 + 2)
+
+    def test_player_crawl_not_full_season(self):
+        """A crawl of selected players completes those players but not the whole season"""
+        self._crawl(2022, datetime(2023, 6, 1), scope='players')
+
+        self.assertEqual(self.planner.plan_season(2022).state, 'final')
+        self.assertEqual(self.planner.plan_season(2022, ['Joe Burrow']).state, 'complete')
+        self.assertEqual(self.planner.plan_season(2022, ['Joe Burrow', 'Josh Allen']).state, 'final')
+
+    def test_live_season_changed_players(self):
+        """Only players whose stats changed after their splits were scraped need splits"""
+        self._crawl(2024, datetime(2024, 11, 1))
+        self.db.insert_qb_basic_stats([_stats('burrjo01', 'Joe Burrow', 2024, datetime(2024, 11, 10), att=30)])
+        self.db.insert_qb_basic_stats([_stats('mahopa00', 'Patrick Mahomes', 2024, datetime(2024, 11, 10))])
+
+        self.assertEqual(self.planner.plan_season(2024).state, 'live')
+        self.assertEqual(self.planner.players_needing_splits(2024), ['burrjo01'])
+
+    def test_unchanged_splits_refetch_recorded(self):
+        """A refetch whose splits did not change is remembered, so the player is not fetched again"""
+        self._crawl(2024, datetime(2024, 11, 1))
+        self.db.insert_qb_basic_stats([_stats('burrjo01', 'Joe Burrow', 2024, datetime(2024, 11, 10), att=30)])
+        self.db.insert_qb_splits([_splits('burrjo01', 'Joe Burrow', 2024, datetime(2024, 11, 11))])
+        self.assertEqual(self.db.last_insert_result.rows_unchanged, 1)
+        self.assertEqual(self.planner.players_needing_splits(2024), ['burrjo01'])
+
+        self.db.record_splits_checks(2024, ['burrjo01'], datetime(2024, 11, 11))
+
+        self.assertEqual(self.planner.players_needing_splits(2024), [])
+
+    def test_aware_timestamps(self):
+        """Aware log and stats timestamps, as Postgres returns them, compare with the season dates"""
+        db = MagicMock()
+        aware = datetime(2023, 6, 1, tzinfo=timezone(timedelta(hours=-4)))
+        db.query.side_effect = lambda sql, params: (
+            [{'last_run': aware}] if 'scraping_logs' in sql else
+            [{'pfr_id': 'burrjo01', 'player_name': 'Joe Burrow', 'updated_at': aware,
+              'last_splits': aware + timedelta(minutes=5), 'last_checked': None}]
+        )
+        planner = CrawlPlanner(db, now=datetime(2024, 11, 15, tzinfo=timezone.utc))
+
+        self.assertEqual(planner.plan_season(2022).state, 'complete')
+
+    def test_estimate(self):
+        """Unknown seasons are estimated from a typical roster; the slower of delay and budget sets the pace"""
+        plan = self.planner.plan([2021, 2030])
+
+        self.assertEqual([season.state for season in plan.seasons], ['final', 'upcoming'])
+        self.assertEqual(plan.total_requests, 2 + TYPICAL_SEASON_PLAYERS)
+        self.assertEqual(plan.seconds_per_request, 15.0)
+        self.assertEqual(plan.estimated_seconds, plan.total_requests * 15.0)
+
+
+class TestIncrementalScrape(unittest.TestCase):
+    """Test that ScrapingOperation follows the crawl plan"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.operation = ScrapingOperation.__new__(ScrapingOperation)
+        self.operation.db_manager = MagicMock()
+        self.operation._refresh_summaries = MagicMock()
+        self.operation._execute_full_season = MagicMock()
+        self.planner = MagicMock()
+        self.operation.create_planner = MagicMock(return_value=self.planner)
+
+    def test_complete_season_not_fetched(self):
+        """A season the plan skips makes no requests and succeeds"""
+        self.planner.plan_season.return_value = SimpleNamespace(state='complete', reason='final', skip=True)
+
+        result = self.operation.execute(2022, incremental=True)
+
+        self.assertTrue(result.success)
+        self.operation._execute_full_season.assert_not_called()
+
+    def test_changed_players_only(self):
+        """Splits targets are narrowed to the players the planner reports"""
+        stats = [_stats(pfr_id, name, 2024, NOW) for pfr_id, name in PLAYERS]
+        self.planner.players_needing_splits.return_value = ['mahopa00']
+
+        changed = self.operation._changed_players(2024, stats)
+
+        self.assertEqual([stat.pfr_id for stat in changed], ['mahopa00'])
+
+
+class TestParseSeasonRange(unittest.TestCase):
+    """Test parse_season_range"""
+
+    def test_ranges(self):
+        """Single seasons, ranges and lists combine into sorted distinct seasons"""
+        self.assertEqual(parse_season_range("2024"), [2024])
+        self.assertEqual(parse_season_range("2022-2024"), [2022, 2023, 2024])
+        self.assertEqual(parse_season_range("2024, 2018,2020-2021"), [2018, 2020, 2021, 2024])
+
+    def test_invalid(self):
+        """Non-numeric parts and backwards ranges are rejected"""
+        for value in ("20x4", "2024-2020", ""):
+            with self.assertRaises(ValueError):
+                parse_season_range(value)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Host Scheduler Tests
+Checks per-host token bucket pacing, Retry-After handling, and that every
+fetcher acquires from the shared scheduler
+"""
+
+import sys
+import os
+import threading
+import time
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.host_scheduler import HostRateScheduler, TokenBucket, host_of, parse_retry_after
+from src.core.request_manager import RequestManager
+from src.core.selenium_manager import SeleniumManager, SeleniumConfig
+
+SPLITS_URL = 'https://www.pro-football-reference.com/players/B/BurrJo01/splits/2024/'
+PLAYER_URL = 'https://www.pro-football-reference.com/players/B/BurrJo01.htm'
+
+
+class FakeClock:
+    """Manual clock whose sleep advances time"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test token bucket pacing and pauses"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.clock = FakeClock()
+
+    def test_requests_spaced_by_budget(self):
+        """Back-to-back reservations queue one refill interval apart"""
+        bucket = TokenBucket(requests_per_minute=6, clock=self.clock)
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0.0, 10.0, 20.0])
+
+        self.clock.now += 60
+        self.assertEqual(bucket.reserve(), 0.0)
+
+    def test_burst(self):
+        """An idle bucket allows up to ``burst`` requests immediately"""
+        bucket = TokenBucket(requests_per_minute=60, burst=3, clock=self.clock)
+        self.assertEqual([bucket.reserve() for _ in range(4)], [0.0, 0.0, 0.0, 1.0])
+
+    def test_pause_delays_next_token(self):
+        """A pause holds the next reservation until it ends, without a burst after"""
+        bucket = TokenBucket(requests_per_minute=60, burst=5, clock=self.clock)
+        bucket.pause(30)
+        self.assertEqual(bucket.reserve(), 30.0)
+        self.assertEqual(bucket.reserve(), 31.0)
+
+    def test_invalid_rate(self):
+        """A non-positive budget is rejected"""
+        with self.assertRaises(ValueError):
+            TokenBucket(requests_per_minute=0)
+
+
+class TestHostRateScheduler(unittest.TestCase):
+    """Test the per-host scheduler"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.clock = FakeClock()
+        self.scheduler = HostRateScheduler(requests_per_minute=12, clock=self.clock, sleep=self.clock.sleep)
+
+    def test_hosts_have_independent_buckets(self):
+        """Different hosts do not share a budget; URLs and bare hosts share a key"""
+        self.assertEqual(self.scheduler.acquire(SPLITS_URL), 0.0)
+        self.assertEqual(self.scheduler.acquire('https://example.com/'), 0.0)
+        self.assertEqual(self.scheduler.acquire('WWW.Pro-Football-Reference.com'), 5.0)
+        self.assertEqual(self.clock.sleeps, [5.0])
+
+        stats = self.scheduler.stats()['www.pro-football-reference.com']
+        self.assertEqual(stats['acquired'], 2)
+        self.assertEqual(stats['waited_seconds'], 5.0)
+
+    def test_pause_for_response(self):
+        """Retry-After wins over the default pause and applies to the whole host"""
+        self.scheduler.acquire(SPLITS_URL)
+        self.assertEqual(self.scheduler.pause_for_response(SPLITS_URL, '120', 60), 120.0)
+        self.assertEqual(self.scheduler.acquire(PLAYER_URL), 120.0)
+        self.assertEqual(self.scheduler.pause_for_response(SPLITS_URL, None, 60), 60.0)
+        self.assertEqual(self.scheduler.stats()['www.pro-football-reference.com']['pauses'], 2)
+
+    def test_pause_holds_queued_reservations(self):
+        """A worker already queued when the pause starts waits it out too"""
+        self.scheduler.acquire(SPLITS_URL)
+        bucket = self.scheduler._buckets['www.pro-football-reference.com']
+        self.assertEqual(bucket.reserve(), 5.0)  # queued worker
+        bucket.pause(30)
+        self.clock.now += 5.0
+        self.assertEqual(bucket.pause_remaining(), 25.0)
+
+    def test_set_rate(self):
+        """A host's budget can be overridden"""
+        self.scheduler.set_rate(SPLITS_URL, 60)
+        self.scheduler.acquire(SPLITS_URL)
+        self.assertEqual(self.scheduler.acquire(SPLITS_URL), 1.0)
+
+    def test_threads_share_budget(self):
+        """Concurrent workers are spaced by the budget, not released together"""
+        scheduler = HostRateScheduler(requests_per_minute=1200)  # one request per 50ms
+        times = []
+        lock = threading.Lock()
+
+        def worker():
+            scheduler.acquire(SPLITS_URL)
+            with lock:
+                times.append(time.monotonic())
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        start = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        times.sort()
+        self.assertGreaterEqual(times[-1] - start, 5 * 0.05 - 0.01)
+        self.assertEqual(scheduler.stats()['www.pro-football-reference.com']['acquired'], 6)
+
+
+class TestRetryAfter(unittest.TestCase):
+    """Test Retry-After parsing"""
+
+    def test_seconds(self):
+        """Delay-seconds values"""
+        self.assertEqual(parse_retry_after('30'), 30.0)
+        self.assertEqual(parse_retry_after(' 0 '), 0.0)
+
+    def test_http_date(self):
+        """HTTP-date values are measured from now and never negative"""
+        now = datetime(2024, 12, 1, 12, 0, 0, tzinfo=timezone.utc)
+        self.assertEqual(parse_retry_after('Sun, 01 Dec 2024 12:01:30 GMT', now=now), 90.0)
+        self.assertEqual(parse_retry_after('Sun, 01 Dec 2024 11:00:00 GMT', now=now), 0.0)
+
+    def test_missing_or_malformed(self):
+        """Missing and unparseable values give None"""
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after(''))
+        self.assertIsNone(parse_retry_after('soon'))
+
+    def test_host_of(self):
+        """Host keys are lower-cased netlocs"""
+        self.assertEqual(host_of(SPLITS_URL), 'www.pro-football-reference.com')
+        self.assertEqual(host_of('Example.COM'), 'example.com')
+
+
+class TestFetcherIntegration(unittest.TestCase):
+    """Test that the fetchers acquire from the shared scheduler"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.scheduler = Mock(spec=HostRateScheduler)
+        self.scheduler.pause_for_response.return_value = 0.0
+
+    def _request_manager(self):
+        manager = RequestManager(rate_limit_delay=0.0, jitter_range=0.0, host_scheduler=self.scheduler)
+        manager.rate_limiter.wait = Mock()
+        manager._simulate_human_behavior = Mock()
+        return manager
+
+    def test_request_manager_honors_retry_after(self):
+        """A 429 pauses the host for Retry-After instead of sleeping privately"""
+        manager = self._request_manager()
+        throttled = Mock(status_code=429, text='', headers={'Retry-After': '45'})
+        ok = Mock(status_code=200, text='<html>' + 'x' * 2000 + '</html>', headers={})
+        manager.session.get = Mock(side_effect=[throttled, ok])
+        manager._check_for_soft_block = Mock(return_value=False)
+
+        response = manager.get(SPLITS_URL)
+
+        self.assertIs(response, ok)
+        self.assertEqual(self.scheduler.acquire.call_count, 2)
+        self.scheduler.pause_for_response.assert_called_once_with(SPLITS_URL, '45', 60)
+        self.assertEqual(manager.metrics.rate_limit_violations, 1)
+
+    def test_request_manager_get_page_acquires(self):
+        """get_page acquires once per attempt and pauses the host on 429"""
+        manager = self._request_manager()
+        throttled = Mock(status_code=429, reason='Too Many Requests', headers={'Retry-After': '5'})
+        ok = Mock(status_code=200, text='<html></html>')
+        manager.session.get = Mock(side_effect=[throttled, ok])
+
+        result = manager.get_page(SPLITS_URL)
+
+        self.assertTrue(result['success'])
+        self.assertEqual(self.scheduler.acquire.call_count, 2)
+        self.scheduler.pause_for_response.assert_called_once_with(SPLITS_URL, '5', 7.0)
+
+    def test_instance_limiter_skipped_with_scheduler(self):
+        """Only the shared scheduler paces requests; the manager's own limiter is a fallback without one"""
+        manager = self._request_manager()
+        manager.session.get = Mock(return_value=Mock(status_code=200, text='<html></html>'))
+
+        manager.get_page(SPLITS_URL)
+        manager.host_scheduler = None
+        manager.get_page(SPLITS_URL)
+
+        self.scheduler.acquire.assert_called_once_with(SPLITS_URL)
+        manager.rate_limiter.wait.assert_called_once_with()
+
+    def test_selenium_manager_acquires_before_navigation(self):
+        """The browser waits for a token before each page load"""
+        manager = SeleniumManager(SeleniumConfig(max_retries=1), host_scheduler=self.scheduler)
+        manager.driver = Mock(page_source='<html>' + 'x' * 2000 + '</html>')
+        manager.wait = Mock()
+        manager._should_rotate_session = Mock(return_value=False)
+        manager._is_blocked = Mock(return_value=False)
+        calls = []
+        self.scheduler.acquire.side_effect = lambda url: calls.append(('acquire', url))
+        manager.driver.get.side_effect = lambda url: calls.append(('get', url))
+
+        result = manager.get_page(SPLITS_URL)
+
+        self.assertTrue(result['success'])
+        self.assertEqual(calls, [('acquire', SPLITS_URL), ('get', SPLITS_URL)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Page Cache Tests
+Tests for the persistent raw-page cache and replay mode in the fetchers
+"""
+
+import sys
+import os
+import time
+import shutil
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.page_cache import PageCache
+from src.core.request_manager import RequestManager
+from src.core.selenium_manager import SeleniumManager
+
+SAMPLE_HTML = "<html><body>" + "<table id='stats'><tr><td>row</td></tr></table>" * 50 + "</body></html>"
+SPLITS_URL = "https://www.pro-football-reference.com/players/B/BurrJo01/splits/2024/"
+
+
+class TestPageCache(unittest.TestCase):
+    """Test the content-addressed page store"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = PageCache(cache_dir=self.temp_dir, ttl_hours=1.0, max_size_mb=10.0)
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_put_and_get_round_trip(self):
+        """Stored pages come back byte-for-byte"""
+        self.assertIsNone(self.cache.get(SPLITS_URL))
+        self.cache.put(SPLITS_URL, SAMPLE_HTML)
+        self.assertEqual(self.cache.get(SPLITS_URL), SAMPLE_HTML)
+
+        stats = self.cache.stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['entries'], 1)
+
+    def test_identical_content_is_stored_once(self):
+        """Two URLs with the same body share one blob"""
+        hash_a = self.cache.put(SPLITS_URL, SAMPLE_HTML)
+        hash_b = self.cache.put(SPLITS_URL + "?x=1", SAMPLE_HTML)
+        self.assertEqual(hash_a, hash_b)
+
+        stats = self.cache.stats()
+        self.assertEqual(stats['entries'], 2)
+        self.assertEqual(stats['blobs'], 1)
+
+    def test_variants_are_independent(self):
+        """A JS-rendered page does not satisfy a plain fetch"""
+        self.cache.put(SPLITS_URL, SAMPLE_HTML, variant='selenium_js')
+        self.assertIsNone(self.cache.get(SPLITS_URL, variant='requests'))
+        self.assertEqual(self.cache.get(SPLITS_URL, variant='selenium_js'), SAMPLE_HTML)
+
+    def test_ttl_expiry_and_replay_serves_stale(self):
+        """Expired entries miss normally but are still served in replay mode"""
+        self.cache.put(SPLITS_URL, SAMPLE_HTML)
+        with patch('src.core.page_cache.time.time', return_value=time.time() + 7200):
+            self.assertIsNone(self.cache.get(SPLITS_URL))
+
+            replay_cache = PageCache(cache_dir=self.temp_dir, ttl_hours=1.0, replay=True)
+            self.assertEqual(replay_cache.get(SPLITS_URL), SAMPLE_HTML)
+
+            self.assertEqual(self.cache.evict(), 1)
+        self.assertEqual(self.cache.stats()['blobs'], 0)
+
+    def test_size_eviction_drops_least_recently_used(self):
+        """Exceeding the size budget evicts the oldest-accessed pages"""
+        small_cache = PageCache(cache_dir=self.temp_dir, ttl_hours=0, max_size_mb=0.002)
+        pages = {f"{SPLITS_URL}{i}": os.urandom(800).hex() for i in range(4)}
+        for url, body in pages.items():
+            small_cache.put(url, body)
+            time.sleep(0.01)
+
+        self.assertGreater(small_cache.evictions, 0)
+        self.assertLessEqual(small_cache.stats()['size_mb'] * 1024 * 1024, small_cache.max_size_bytes)
+        last_url = list(pages)[-1]
+        self.assertEqual(small_cache.get(last_url), pages[last_url])
+        self.assertIsNone(small_cache.get(list(pages)[0]))
+
+    def test_clear(self):
+        """Clearing removes every entry and blob"""
+        self.cache.put(SPLITS_URL, SAMPLE_HTML)
+        self.cache.clear()
+        stats = self.cache.stats()
+        self.assertEqual(stats['entries'], 0)
+        self.assertEqual(stats['blobs'], 0)
+
+
+class TestFetcherCacheIntegration(unittest.TestCase):
+    """Test that the fetchers read through the cache and honor replay"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _request_manager(self, cache):
+        manager = RequestManager(rate_limit_delay=0.0, jitter_range=0.0, page_cache=cache)
+        manager.rate_limiter.wait = Mock()
+        manager._simulate_human_behavior = Mock()
+        return manager
+
+    def test_request_manager_caches_successful_fetch(self):
+        """The second fetch of a page is served without a network call"""
+        cache = PageCache(cache_dir=self.temp_dir)
+        manager = self._request_manager(cache)
+        response = Mock(status_code=200, text=SAMPLE_HTML, headers={'content-type': 'text/html'})
+        manager.session.get = Mock(return_value=response)
+
+        first = manager.get_page(SPLITS_URL)
+        second = manager.get_page(SPLITS_URL)
+
+        self.assertTrue(first['success'])
+        self.assertEqual(second['content'], SAMPLE_HTML)
+        self.assertEqual(manager.session.get.call_count, 1)
+
+        cached_response = manager.get(SPLITS_URL)
+        self.assertEqual(cached_response.status_code, 200)
+        self.assertEqual(cached_response.text, SAMPLE_HTML)
+        self.assertEqual(manager.session.get.call_count, 1)
+
+    def test_request_manager_replay_never_touches_network(self):
+        """Replay misses fail fast instead of fetching"""
+        manager = self._request_manager(PageCache(cache_dir=self.temp_dir, replay=True))
+        manager.session.get = Mock()
+
+        result = manager.get_page(SPLITS_URL)
+
+        self.assertFalse(result['success'])
+        self.assertIn('Replay mode', result['error'])
+        self.assertIsNone(manager.get(SPLITS_URL))
+        manager.session.get.assert_not_called()
+        manager.rate_limiter.wait.assert_not_called()
+
+    def test_selenium_manager_serves_cache_without_browser(self):
+        """Cached pages skip session rotation and the browser entirely"""
+        cache = PageCache(cache_dir=self.temp_dir, replay=True)
+        cache.put(SPLITS_URL, SAMPLE_HTML, variant='selenium_js')
+        manager = SeleniumManager(page_cache=cache)
+        manager.start_session = Mock()
+
+        with manager:
+            hit = manager.get_page(SPLITS_URL, enable_js=True)
+            miss = manager.get_page(SPLITS_URL, enable_js=False)
+
+        self.assertTrue(hit['success'])
+        self.assertEqual(hit['content'], SAMPLE_HTML)
+        self.assertFalse(miss['success'])
+        manager.start_session.assert_not_called()
+
+    def test_scraping_operation_honors_disabled_cache(self):
+        """page_cache=None (scrape --no-cache) disables the cache; omitting it builds one from config"""
+        from src.config.config import config
+        from src.operations.scraping_operation import ScrapingOperation
+
+        with patch.object(config.cache, 'enabled', True), patch.object(config.cache, 'cache_dir', self.temp_dir):
+            disabled = ScrapingOperation(config, Mock(), page_cache=None)
+            default = ScrapingOperation(config, Mock())
+
+        self.assertIsNone(disabled.page_cache)
+        self.assertIsNone(disabled.request_manager.page_cache)
+        self.assertIsNone(disabled.selenium_manager.page_cache)
+        self.assertIsInstance(default.page_cache, PageCache)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Season Partitioning Tests
+Checks schema statement splitting, on-demand season partitions, partition
+truncation and the move of existing splits tables into partitions
+"""
+
+import sys
+import os
+import unittest
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.database.db_manager import DatabaseManager, SCHEMA_FILE, season_partition, split_sql_statements
+
+
+class FakeCursor:
+    """Records statements and answers the catalog queries the partition code runs"""
+
+    def __init__(self, responses=None):
+        self.statements = []
+        self.responses = responses or {}
+        self.rowcount = 0
+        self._rows = []
+
+    def execute(self, sql, params=None):
+        self.statements.append(sql)
+        self._rows = []
+        for marker, rows in self.responses.items():
+            if marker in sql:
+                self._rows = rows(params) if callable(rows) else rows
+                break
+        self.rowcount = 3 if sql.startswith(('INSERT', 'DELETE')) else len(self._rows)
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self):
+        return list(self._rows)
+
+
+class TestSplitSqlStatements(unittest.TestCase):
+    """Test the schema statement splitter"""
+
+    def test_comments_and_function_bodies(self):
+        """Comments are dropped and semicolons inside $$ bodies or strings do not split"""
+        sql = """
+        -- leading comment; with a semicolon
+        CREATE TABLE t (id INT); -- trailing
+        CREATE FUNCTION f() RETURNS INT AS $$
+        BEGIN
+            RETURN 1;
+        END;
+        $$ LANGUAGE plpgsql;
+        INSERT INTO t VALUES (';')
+        """
+        statements = split_sql_statements(sql)
+
+        self.assertEqual(len(statements), 3)
+        self.assertEqual(statements[0], 'CREATE TABLE t (id INT)')
+        self.assertIn('RETURN 1;', statements[1])
+        self.assertTrue(statements[1].endswith('LANGUAGE plpgsql'))
+        self.assertEqual(statements[2], "INSERT INTO t VALUES (';')")
+
+    def test_schema_partitions_splits_tables(self):
+        """The schema file declares both splits tables partitioned by season"""
+        with open(SCHEMA_FILE) as f:
+            statements = split_sql_statements(f.read())
+        for table in ('qb_splits', 'qb_splits_advanced'):
+            create = next(s for s in statements if s.startswith(f'CREATE TABLE IF NOT EXISTS {table} ('))
+            self.assertIn('PARTITION BY RANGE (season)', create)
+            self.assertIn('PRIMARY KEY (id, season)', create)
+
+
+class TestSeasonPartitions(unittest.TestCase):
+    """Test DatabaseManager's partition handling"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        with patch.object(DatabaseManager, '_initialize_pool'):
+            self.db = DatabaseManager('postgresql://test')
+        self.conn = MagicMock()
+        self.cursor = FakeCursor()
+
+        @contextmanager
+        def get_connection():
+            yield self.conn
+
+        @contextmanager
+        def get_cursor(conn):
+            yield self.cursor
+
+        self.db.get_connection = get_connection
+        self.db.get_cursor = get_cursor
+
+    def test_partitions_created_once(self):
+        """Each season's partition is created on first use and not asked for again"""
+        self.db._partitioned = {'qb_splits': True}
+
+        self.assertEqual(self.db.ensure_season_partitions('qb_splits', [2024, 2023, 2024]), [2023, 2024])
+        self.assertEqual(self.db.ensure_season_partitions('qb_splits', [2024]), [])
+
+        self.assertEqual(self.cursor.statements, [
+            'CREATE TABLE IF NOT EXISTS qb_splits_2023 PARTITION OF qb_splits FOR VALUES FROM (2023) TO (2024)',
+            'CREATE TABLE IF NOT EXISTS qb_splits_2024 PARTITION OF qb_splits FOR VALUES FROM (2024) TO (2025)',
+        ])
+        self.assertEqual(season_partition('qb_splits', 2024), 'qb_splits_2024')
+
+    def test_unpartitioned_table_left_alone(self):
+        """Tables created before partitioning get no partition DDL"""
+        self.db._partitioned = {'qb_splits': False}
+        self.assertEqual(self.db.ensure_season_partitions('qb_splits', [2024]), [])
+        self.assertEqual(self.cursor.statements, [])
+
+    def test_clear_season_truncates_partition(self):
+        """Partitioned tables truncate the season's partition; others delete by season"""
+        self.db._partitioned = {'qb_splits': True, 'qb_splits_advanced': True, 'qb_passing_stats': False}
+        self.cursor.responses = {
+            'to_regclass': lambda params: [{'present': params[0] == 'qb_splits_2024'}],
+            'COUNT(*)': [{'count': 17}],
+        }
+
+        removed = self.db.clear_season(2024)
+
+        self.assertEqual(removed, {'qb_splits': 17, 'qb_splits_advanced': 0, 'qb_passing_stats': 3})
+        self.assertIn('TRUNCATE qb_splits_2024', self.cursor.statements)
+        self.assertNotIn('TRUNCATE qb_splits_advanced_2024', self.cursor.statements)
+        self.assertIn('DELETE FROM qb_passing_stats WHERE season = %s', self.cursor.statements)
+        self.conn.commit.assert_called_once()
+
+    def test_migrate_to_partitioned(self):
+        """The old table is renamed, recreated partitioned, copied into and dropped in one commit"""
+        self.db._partitioned = {'qb_splits': False}
+        self.cursor.responses = {
+            'pg_indexes': [{'indexname': 'qb_splits_pkey'}, {'indexname': 'idx_qb_splits_season'}],
+            'pg_get_serial_sequence(%s, \'id\') AS sequence': [{'sequence': 'public.qb_splits_id_seq'}],
+            'SELECT DISTINCT season': [{'season': 2023}, {'season': 2024}],
+            'ORDER BY ordinal_position': [{'column_name': 'id'}, {'column_name': 'season'},
+                                          {'column_name': 'legacy_only'}],
+            'information_schema.columns': [{'column_name': 'id'}, {'column_name': 'season'},
+                                           {'column_name': 'row_hash'}],
+        }
+
+        self.assertEqual(self.db.migrate_to_partitioned('qb_splits'), 3)
+
+        statements = self.cursor.statements
+        self.assertEqual(statements[0], 'ALTER TABLE qb_splits RENAME TO qb_splits_legacy')
+        self.assertIn('ALTER INDEX qb_splits_pkey RENAME TO qb_splits_pkey_legacy', statements)
+        self.assertIn('ALTER SEQUENCE public.qb_splits_id_seq RENAME TO qb_splits_legacy_id_seq', statements)
+        create = next(i for i, s in enumerate(statements) if s.startswith('CREATE TABLE IF NOT EXISTS qb_splits ('))
+        partition = statements.index('CREATE TABLE IF NOT EXISTS qb_splits_2024 PARTITION OF qb_splits '
+                                     'FOR VALUES FROM (2024) TO (2025)')
+        copy = statements.index('INSERT INTO qb_splits (id, season) SELECT id, season FROM qb_splits_legacy')
+        self.assertLess(create, partition)
+        self.assertLess(partition, copy)
+        self.assertEqual(statements[-1], 'DROP TABLE qb_splits_legacy')
+        self.conn.commit.assert_called_once()
+        self.assertTrue(self.db._is_partitioned('qb_splits'))
+
+    def test_migrate_rejects_other_tables(self):
+        """Only the splits tables are partitioned"""
+        with self.assertRaises(ValueError):
+            self.db.migrate_to_partitioned('qb_passing_stats')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Split Recategorization Tests
+Checks that fix-splits moves 'other' splits with one set-based statement per
+table in one transaction, and that the dry run projects from the same join
+"""
+
+import sys
+import os
+import unittest
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.database.db_manager import DatabaseManager
+
+
+MAPPING = {'Home': 'place', 'Road': 'place', 'Win': 'result'}
+
+
+class TestRecategorizeSplits(unittest.TestCase):
+    """Test DatabaseManager.recategorize_splits"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        with patch.object(DatabaseManager, '_initialize_pool'):
+            self.db = DatabaseManager('postgresql://test')
+        self.conn = MagicMock()
+        self.calls = []
+
+        @contextmanager
+        def get_connection():
+            yield self.conn
+
+        @contextmanager
+        def get_cursor(conn):
+            yield MagicMock()
+
+        self.db.get_connection = get_connection
+        self.db.get_cursor = get_cursor
+
+    def _execute_values(self, cur, sql, values, page_size, fetch=False):
+        self.calls.append((sql, values, page_size))
+        if 'UPDATE' in sql:
+            return [{'value': 'Home', 'split': 'place', 'count': 40}]
+        return [
+            {'split': 'place', 'moved_value': 'Home', 'count': 40},
+            {'split': 'place', 'moved_value': None, 'count': 10},
+            {'split': 'other', 'moved_value': None, 'count': 5},
+        ]
+
+    def test_dry_run_projects_without_changes(self):
+        """A dry run runs one projecting SELECT per table and rolls back"""
+        with patch('src.database.db_manager.execute_values', side_effect=self._execute_values):
+            results = self.db.recategorize_splits(MAPPING, dry_run=True)
+
+        self.assertEqual(len(self.calls), 2)
+        for sql, values, page_size in self.calls:
+            self.assertIn('WITH mapping(value, new_split) AS (VALUES %s)', sql)
+            self.assertNotIn('UPDATE', sql)
+            self.assertEqual(values, list(MAPPING.items()))
+            self.assertEqual(page_size, len(MAPPING))
+        self.assertIn('FROM qb_splits_advanced t', self.calls[1][0])
+
+        self.assertEqual(results['qb_splits']['changes'], {'Home': ('place', 40)})
+        self.assertEqual(results['qb_splits']['distribution'], {'place': 50, 'other': 5})
+        self.conn.rollback.assert_called_once()
+        self.conn.commit.assert_not_called()
+        self.assertFalse(self.db.summaries_stale)
+
+    def test_apply_updates_each_table_once(self):
+        """Applying runs one UPDATE ... FROM per table and commits both together"""
+        with patch('src.database.db_manager.execute_values', side_effect=self._execute_values):
+            results = self.db.recategorize_splits(MAPPING)
+
+        updates = [sql for sql, _, _ in self.calls if 'UPDATE' in sql]
+        self.assertEqual(len(updates), 2)
+        self.assertIn('UPDATE qb_splits t', updates[0])
+        self.assertIn('FROM targets', updates[0])
+        self.assertIn('row_hash = NULL', updates[0])
+        self.assertIn('UPDATE qb_splits_advanced t', updates[1])
+        self.assertEqual(results['qb_splits_advanced']['changes'], {'Home': ('place', 40)})
+        self.conn.commit.assert_called_once()
+        self.assertTrue(self.db.summaries_stale)
+
+    def test_existing_target_rows_are_skipped(self):
+        """Rows whose recategorized key already exists stay 'other' instead of breaking the unique key"""
+        sql = self.db._recategorize_sql('qb_splits')
+        self.assertIn("WHERE t.split = 'other'", sql)
+        self.assertIn('AND NOT EXISTS', sql)
+        self.assertIn('d.split = m.new_split AND d.value = t.value', sql)
+
+
+if __name__ == '__main__':
+    unittest.main()
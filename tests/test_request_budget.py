@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Shared Request Budget Tests
+Checks that scheduler instances and processes sharing a budget file are
+paced as one
+"""
+
+import sys
+import os
+import multiprocessing
+import shutil
+import tempfile
+import time
+import unittest
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.host_scheduler import HostRateScheduler
+from src.core.request_budget import SharedRequestBudget
+
+SPLITS_URL = 'https://www.pro-football-reference.com/players/B/BurrJo01/splits/2024/'
+HOST = 'www.pro-football-reference.com'
+
+
+class FakeClock:
+    """Manual wall clock"""
+
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _lease_slots(budget_path: str, count: int, queue):
+    """Child process: lease slots from the shared budget and report when each was granted"""
+    scheduler = HostRateScheduler(requests_per_minute=600, budget=SharedRequestBudget(budget_path))
+    for _ in range(count):
+        scheduler.acquire(SPLITS_URL)
+        queue.put(time.time())
+
+
+class TestSharedRequestBudget(unittest.TestCase):
+    """Test the SQLite-backed buckets"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'budget.db')
+        self.clock = FakeClock()
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_handles_share_one_bucket(self):
+        """Two budget handles on one file queue behind each other"""
+        first = SharedRequestBudget(self.path, clock=self.clock).bucket(HOST, 6)
+        second = SharedRequestBudget(self.path, clock=self.clock).bucket(HOST, 6)
+
+        self.assertEqual([first.reserve(), second.reserve(), first.reserve()], [0.0, 10.0, 20.0])
+
+        self.clock.now += 60
+        self.assertEqual(second.reserve(), 0.0)
+
+    def test_first_budget_wins_until_set_rate(self):
+        """Later processes adopt the stored rate; set_rate changes it for everyone"""
+        budget = SharedRequestBudget(self.path, clock=self.clock)
+        first = budget.bucket(HOST, 6)
+        second = SharedRequestBudget(self.path, clock=self.clock).bucket(HOST, 60)
+        self.assertEqual([second.reserve(), second.reserve()], [0.0, 10.0])
+
+        first.set_rate(60)
+        self.clock.now += 20
+        self.assertEqual([first.reserve(), first.reserve()], [0.0, 1.0])
+
+    def test_pause_is_shared(self):
+        """A pause recorded by one process holds the others"""
+        first = SharedRequestBudget(self.path, clock=self.clock).bucket(HOST, 60)
+        second = SharedRequestBudget(self.path, clock=self.clock).bucket(HOST, 60)
+
+        first.pause(45)
+        self.assertEqual(second.pause_remaining(), 45.0)
+        self.assertEqual(second.reserve(), 45.0)
+
+        snapshot = SharedRequestBudget(self.path).snapshot()
+        self.assertEqual([row['host'] for row in snapshot], [HOST])
+        self.assertEqual(snapshot[0]['leases'], 1)
+
+    def test_processes_share_total_rate(self):
+        """Three processes at 10 req/s each together stay at 10 req/s"""
+        queue = multiprocessing.Queue()
+        workers = [multiprocessing.Process(target=_lease_slots, args=(self.path, 4, queue)) for _ in range(3)]
+        for worker in workers:
+            worker.start()
+        grants = sorted(queue.get(timeout=30) for _ in range(12))
+        for worker in workers:
+            worker.join(timeout=30)
+
+        # 12 slots at 0.1s apart need at least 1.1s, however many processes ask
+        self.assertGreaterEqual(grants[-1] - grants[0], 1.1 - 0.05)
+        self.assertEqual(SharedRequestBudget(self.path).snapshot()[0]['leases'], 12)
+
+
+class TestSchedulerConfiguration(unittest.TestCase):
+    """Test building a shared scheduler from config"""
+
+    def test_from_config_with_budget_path(self):
+        """A budget path switches the scheduler to shared buckets"""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            scraping = type('ScrapingConfig', (), {
+                'requests_per_minute': 8.0, 'request_burst': 1, 'request_budget_path': ''
+            })()
+            self.assertIsNone(HostRateScheduler.from_config(scraping).budget)
+
+            scheduler = HostRateScheduler.from_config(scraping, budget_path=os.path.join(temp_dir, 'budget.db'))
+            self.assertIsNotNone(scheduler.budget)
+            self.assertEqual(scheduler.acquire(SPLITS_URL), 0.0)
+            self.assertEqual(scheduler.budget.snapshot()[0]['host'], HOST)
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Row Decoder Tests
+Checks that single-pass row decoding matches per-field row.find() lookups
+"""
+
+import sys
+import os
+import unittest
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.html_parser import HTMLParser, make_soup
+from src.core.pfr_structure_analyzer import DataStatMapping, PFRStructureAnalyzer
+from src.core.row_decoder import RowDecoder
+from src.utils.data_utils import safe_int, safe_float, safe_percentage
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+CONVERTERS = {'int': safe_int, 'float': safe_float, 'percentage': safe_percentage, 'str': str}
+
+
+def load_rows(name: str, table_id: str):
+    with open(os.path.join(FIXTURES_DIR, name), 'r', encoding='utf-8') as f:
+        soup = make_soup(f.read(), 'html.parser')
+    HTMLParser.expand_commented_tables(soup)
+    return soup.find('table', id=table_id).find('tbody').find_all('tr')
+
+
+def find_per_field(table_type: str, row, tags):
+    """Reference decoding with one row.find() per field, mapped by the structure analyzer"""
+    record = {}
+    for mapping in PFRStructureAnalyzer().get_field_mappings(table_type):
+        cell = row.find(tags, {'data-stat': mapping.pfr_attribute})
+        if cell is not None and cell.get_text(strip=True):
+            record[mapping.database_field] = CONVERTERS[mapping.data_type](cell.get_text(strip=True))
+    return record
+
+
+# First row of each fixture table, read off the HTML by hand
+EXPECTED_FIRST_ROWS = {
+    'enhanced_passing': {
+        'age': 27, 'pos': 'QB', 'g': 17, 'gs': 17, 'qb_rec': '9-8-0', 'cmp': 460, 'att': 652,
+        'yds': 4918, 'td': 43, 'int': 9, 'first_downs': 253, 'lng': 70, 'y_a': 7.5, 'ay_a': 8.3,
+        'y_c': 10.7, 'y_g': 289.3, 'rate': 108.5, 'qbr': 74.6, 'awards': 'PB AP MVP-2',
+    },
+    'splits_basic': {
+        'split': 'League', 'value': 'NFL', 'g': 17, 'w': 9, 'l': 8, 't': 0, 'cmp': 460, 'att': 652,
+        'inc': 192, 'cmp_pct': 70.6, 'yds': 4918, 'td': 43, 'int': 9, 'rate': 108.5, 'sk': 48,
+        'sk_yds': 278, 'y_a': 7.5, 'ay_a': 8.3, 'a_g': 38.4, 'y_g': 289.3, 'rush_att': 42,
+        'rush_yds': 201, 'rush_y_a': 4.8, 'rush_td': 2, 'rush_a_g': 2.5, 'rush_y_g': 11.8,
+        'total_td': 2, 'pts': 12, 'fmb': 5, 'fl': 3, 'ff': 0, 'fr': 1, 'fr_yds': 0, 'fr_td': 0,
+    },
+    'splits_advanced': {
+        'split': 'Down', 'value': '1st', 'cmp': 180, 'att': 250, 'inc': 70, 'cmp_pct': 72.0,
+        'yds': 1890, 'td': 15, 'first_downs': 88, 'int': 3, 'rate': 107.9, 'sk': 15, 'sk_yds': 90,
+        'y_a': 7.6, 'ay_a': 8.3, 'rush_att': 20, 'rush_yds': 95, 'rush_y_a': 4.8, 'rush_td': 1,
+        'rush_first_downs': 6,
+    },
+}
+
+
+class TestRowDecoderParity(unittest.TestCase):
+    """Test that decoding a row once gives the same record as per-field lookups"""
+
+    def _assert_parity(self, fixture, table_id, table_type, tags):
+        decoder = RowDecoder.for_table_type(table_type, CONVERTERS, cell_tags=tags, strip_text=True,
+                                            skip_missing=True, skip_empty=True)
+        rows = load_rows(fixture, table_id)
+        self.assertTrue(rows)
+        self.assertEqual(decoder.decode(rows[0]), EXPECTED_FIRST_ROWS[table_type])
+        for row in rows:
+            self.assertEqual(decoder.decode(row), find_per_field(table_type, row, list(tags)))
+
+    def test_passing_rows(self):
+        """Season passing rows"""
+        self._assert_parity('pfr_passing_2024_sample.html', 'passing', 'enhanced_passing', ('td',))
+
+    def test_basic_splits_rows(self):
+        """Basic splits rows, including th split labels and empty cells"""
+        self._assert_parity('pfr_splits_2024_sample.html', 'stats', 'splits_basic', ('td', 'th'))
+
+    def test_advanced_splits_rows(self):
+        """Advanced splits rows from the comment-wrapped table"""
+        self._assert_parity('pfr_splits_2024_sample.html', 'advanced_splits', 'splits_advanced', ('td', 'th'))
+
+
+class TestRowDecoderOptions(unittest.TestCase):
+    """Test missing/empty cell handling and plan compilation"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.mappings = [
+            DataStatMapping('pass_cmp', 'cmp', 'int', True, 'Completions'),
+            DataStatMapping('pass_yds', 'yds', 'int', False, 'Yards'),
+            DataStatMapping('team', 'team', 'str', False, 'Team'),
+        ]
+        self.row = make_soup(
+            '<table><tr><td data-stat="pass_cmp"> 21 </td><td data-stat="pass_yds"></td>'
+            '<td data-stat="pass_cmp">99</td></tr></table>', 'html.parser'
+        ).find('tr')
+
+    def test_missing_cells_use_missing_text(self):
+        """Absent cells are converted from missing_text by default"""
+        decoder = RowDecoder(self.mappings, {'int': safe_int, 'str': lambda value: value}, missing_text=None)
+        self.assertEqual(decoder.decode(self.row), {'cmp': 21, 'yds': None, 'team': None})
+
+    def test_skip_missing_and_empty(self):
+        """Absent and empty cells can be left out of the record"""
+        decoder = RowDecoder(self.mappings, {'int': safe_int, 'str': str}, skip_missing=True, skip_empty=True)
+        self.assertEqual(decoder.decode(self.row), {'cmp': 21})
+
+    def test_first_cell_wins(self):
+        """Duplicate data-stat cells resolve like row.find()"""
+        decoder = RowDecoder(self.mappings, {'int': safe_int, 'str': str})
+        self.assertEqual(decoder.index_row(self.row)['pass_cmp'], '21')
+
+    def test_missing_converter_rejected(self):
+        """Every mapped data type needs a converter"""
+        with self.assertRaises(ValueError):
+            RowDecoder(self.mappings, {'int': safe_int})
+
+    def test_mappings_follow_schema_mappings(self):
+        """Decoder mappings are derived from the schema mappings, so a schema column change reaches them"""
+        analyzer = PFRStructureAnalyzer()
+        analyzer.qb_basic_stats_mappings[1:1] = [DataStatMapping('pass_new', 'new_stat', 'int', True, 'New')]
+        mappings = analyzer._create_row_decoder_mappings()
+
+        for table_type in ('html_passing', 'enhanced_passing', 'raw_passing'):
+            self.assertIn(('pass_new', 'new_stat'),
+                          [(m.pfr_attribute, m.database_field) for m in mappings[table_type]], table_type)
+        enhanced_types = {m.database_field: m.data_type for m in mappings['enhanced_passing']}
+        self.assertEqual(enhanced_types['cmp_pct'], 'percentage')
+        self.assertEqual(enhanced_types['y_a'], 'float')
+
+        del analyzer.qb_basic_stats_mappings[-1]
+        with self.assertRaises(ValueError):
+            analyzer._create_row_decoder_mappings()
+
+
+if __name__ == '__main__':
+    unittest.main()
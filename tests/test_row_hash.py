@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Row Hash Change Detection Tests
+Checks that upserts carry a content hash, skip rows whose hash is unchanged
+and report inserted/updated/unchanged counts
+"""
+
+import sys
+import os
+import unittest
+from contextlib import contextmanager
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.config.config import config
+from src.database.db_manager import DatabaseManager, compute_row_hash, PASSING_STATS_COLUMNS
+from src.models.qb_models import QBPassingStats
+
+
+def _stats(count, att=100, scraped_at=datetime(2024, 12, 1)):
+    return [QBPassingStats(pfr_id=f"TestQb{i:02d}", player_name=f"Test QB {i}", player_url='', season=2024,
+                           att=att, scraped_at=scraped_at, updated_at=scraped_at) for i in range(count)]
+
+
+class TestComputeRowHash(unittest.TestCase):
+    """Test the row content hash"""
+
+    def test_ignores_scrape_timestamps(self):
+        """Re-scraping the same numbers later gives the same hash"""
+        columns = ('pfr_id', 'att', 'scraped_at', 'updated_at')
+        first = compute_row_hash(columns, ('TestQb00', 100, datetime(2024, 12, 1), datetime(2024, 12, 1)))
+        later = compute_row_hash(columns, ('TestQb00', 100, datetime(2025, 1, 5), datetime(2025, 1, 5)))
+        self.assertEqual(first, later)
+        self.assertEqual(len(first), 32)
+
+    def test_changes_with_content(self):
+        """Any stat change, including to or from NULL, changes the hash"""
+        columns = ('pfr_id', 'att', 'rate')
+        base = compute_row_hash(columns, ('TestQb00', 100, 95.5))
+        self.assertNotEqual(base, compute_row_hash(columns, ('TestQb00', 101, 95.5)))
+        self.assertNotEqual(base, compute_row_hash(columns, ('TestQb00', 100, None)))
+
+
+class TestHashedUpsert(unittest.TestCase):
+    """Test how DatabaseManager upserts with row hashes"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        with patch.object(DatabaseManager, '_initialize_pool'):
+            self.db = DatabaseManager('postgresql://test')
+        self.conn = MagicMock()
+        self.cursor = MagicMock()
+
+        @contextmanager
+        def get_connection():
+            yield self.conn
+
+        @contextmanager
+        def get_cursor(conn):
+            yield self.cursor
+
+        self.db.get_connection = get_connection
+        self.db.get_cursor = get_cursor
+        self.saved = (config.bulk_operations.copy_threshold, config.bulk_operations.skip_unchanged_rows)
+        config.bulk_operations.copy_threshold = 0
+        config.bulk_operations.skip_unchanged_rows = True
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        config.bulk_operations.copy_threshold, config.bulk_operations.skip_unchanged_rows = self.saved
+
+    def test_upsert_skips_unchanged_rows(self):
+        """The update only fires when the stored hash differs, and the hash is the last value"""
+        calls = []
+
+        def execute_values(cur, sql, batch, page_size, fetch=False):
+            calls.append((sql, batch, fetch))
+            return [{'inserted': True}, {'inserted': False}]
+
+        with patch('src.database.db_manager.execute_values', side_effect=execute_values):
+            self.assertEqual(self.db.insert_qb_basic_stats(_stats(3)), 3)
+
+        sql, batch, fetch = calls[0]
+        self.assertIn('row_hash = EXCLUDED.row_hash', sql)
+        self.assertIn('WHERE qb_passing_stats.row_hash IS DISTINCT FROM EXCLUDED.row_hash', sql)
+        self.assertIn('RETURNING (xmax = 0) AS inserted', sql)
+        self.assertTrue(fetch)
+        self.assertEqual(batch[0][-1], compute_row_hash(PASSING_STATS_COLUMNS, batch[0][:-1]))
+
+        result = self.db.last_insert_result
+        self.assertEqual((result.rows_inserted, result.rows_updated, result.rows_unchanged), (1, 1, 1))
+        self.assertEqual(result.to_dict()['rows_unchanged'], 1)
+
+    def test_rescrape_sends_same_hashes(self):
+        """A later scrape of identical numbers produces identical hashes"""
+        batches = []
+
+        def execute_values(cur, sql, batch, page_size, fetch=False):
+            batches.append([row[-1] for row in batch])
+            return []
+
+        with patch('src.database.db_manager.execute_values', side_effect=execute_values):
+            self.db.insert_qb_basic_stats(_stats(2))
+            self.db.insert_qb_basic_stats(_stats(2, scraped_at=datetime(2025, 1, 5)))
+            self.db.insert_qb_basic_stats(_stats(2, att=120))
+
+        self.assertEqual(batches[0], batches[1])
+        self.assertNotEqual(batches[0], batches[2])
+
+    def test_copy_merge_counts(self):
+        """The COPY merge uses the same hash guard and counts from its RETURNING rows"""
+        self.cursor.fetchall.return_value = [{'inserted': False}]
+
+        self.db.insert_qb_basic_stats(_stats(4), method='copy')
+
+        copy_sql = self.cursor.copy_expert.call_args.args[0]
+        self.assertIn('row_hash)', copy_sql)
+        merge = self.cursor.execute.call_args_list[-2].args[0]
+        self.assertIn('IS DISTINCT FROM EXCLUDED.row_hash', merge)
+        result = self.db.last_insert_result
+        self.assertEqual((result.rows_inserted, result.rows_updated, result.rows_unchanged), (0, 1, 3))
+
+    def test_hashing_can_be_disabled(self):
+        """With skip_unchanged_rows off every conflicting row is overwritten"""
+        config.bulk_operations.skip_unchanged_rows = False
+        with patch('src.database.db_manager.execute_values', return_value=[]) as execute_values:
+            self.db.insert_qb_basic_stats(_stats(1))
+
+        sql = execute_values.call_args.args[1]
+        self.assertNotIn('row_hash', sql)
+        self.assertEqual(len(execute_values.call_args.args[2][0]), len(PASSING_STATS_COLUMNS))
+
+
+if __name__ == '__main__':
+    unittest.main()
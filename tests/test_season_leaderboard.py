@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Season Leaderboard Tests
+Checks that passing stats come from the season-wide pages in one or two
+requests instead of one player page per QB
+"""
+
+import sys
+import os
+import unittest
+from unittest.mock import MagicMock, Mock, patch
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.html_parser import HTMLParser
+from src.core.scraper import CoreScraper, Config, DatabaseManager
+from src.config.config import config
+from src.models.qb_models import QBBasicStats
+from src.utils.data_utils import build_season_passing_url
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+# passing_advanced.htm keeps its tables in HTML comments, one table per column group
+ADVANCED_HTML = """
+<html><body>
+<div id="all_passing_advanced"><!--
+<table id="passing_advanced"><tbody>
+<tr>
+  <td data-stat="name_display"><a href="/players/B/BurrJo01.htm">Joe Burrow</a></td>
+  <td data-stat="team">CIN</td>
+  <td data-stat="pass_first_down">214</td>
+  <td data-stat="qbr">99.9</td>
+</tr>
+<tr>
+  <td data-stat="name_display"><a href="/players/M/MahoPa00.htm">Patrick Mahomes</a></td>
+  <td data-stat="team">KAN</td>
+  <td data-stat="pass_first_down">100</td>
+</tr>
+<tr>
+  <td data-stat="name_display"><a href="/players/M/MahoPa00.htm">Patrick Mahomes</a></td>
+  <td data-stat="team">2TM</td>
+  <td data-stat="pass_first_down">180</td>
+</tr>
+</tbody></table>
+--></div>
+<div id="all_advanced_accuracy"><!--
+<table id="advanced_accuracy"><tbody>
+<tr class="thead"><td data-stat="name_display">Player</td></tr>
+<tr>
+  <td data-stat="name_display"><a href="/players/B/BurrJo01.htm">Joe Burrow</a></td>
+  <td data-stat="pass_success_perc">53.1</td>
+  <td data-stat="sacked">48</td>
+</tr>
+</tbody></table>
+--></div>
+</body></html>
+"""
+
+
+class TestAdvancedPassingTables(unittest.TestCase):
+    """Test parsing and merging the season advanced passing page"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.parser = HTMLParser()
+        self.advanced = self.parser.parse_advanced_passing_tables(self.parser.parse_html(ADVANCED_HTML), 2024)
+
+    def test_columns_gathered_across_commented_tables(self):
+        """Every comment-wrapped table contributes to the same player"""
+        self.assertEqual(self.advanced['BurrJo01']['first_downs'], 214)
+        self.assertEqual(self.advanced['BurrJo01']['succ_pct'], 53.1)
+        self.assertEqual(self.advanced['BurrJo01']['sk'], 48)
+
+    def test_multi_team_total_row_wins(self):
+        """The 2TM row replaces the per-team row"""
+        self.assertEqual(self.advanced['MahoPa00']['first_downs'], 180)
+
+    def test_merge_fills_only_missing_fields(self):
+        """The main passing table stays authoritative"""
+        stats = [
+            {'pfr_id': 'BurrJo01', 'team': 'CIN', 'first_downs': None, 'qbr': 74.6, 'sk': None},
+            QBBasicStats(pfr_id='MahoPa00', player_name='Patrick Mahomes', player_url='', season=2024,
+                         team='2TM', first_downs=None),
+        ]
+
+        filled = HTMLParser.merge_advanced_passing_stats(stats, self.advanced)
+
+        self.assertEqual(stats[0]['first_downs'], 214)
+        self.assertEqual(stats[0]['qbr'], 74.6)
+        self.assertEqual(stats[0]['sk'], 48)
+        self.assertEqual(stats[0]['succ_pct'], 53.1)
+        self.assertEqual(stats[1].first_downs, 180)
+        self.assertEqual(stats[1].team, '2TM')
+        self.assertEqual(filled, 4)
+
+
+class TestCoreScraperLeaderboard(unittest.TestCase):
+    """Test CoreScraper's season leaderboard mode"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        with open(os.path.join(FIXTURES_DIR, 'pfr_passing_2024_sample.html'), 'r', encoding='utf-8') as f:
+            self.passing_html = f.read()
+        self.request_manager = Mock()
+        self.request_manager.get_page.side_effect = self._get_page
+        self.scraper = CoreScraper(self.request_manager, HTMLParser(), Mock(), DatabaseManager(), Config(),
+                                   include_advanced_leaderboard=True)
+        # Splits still come from the player pages; keep those out of the request count
+        self.scraper._scrape_splits_data = Mock(return_value={'success': True, 'data': {}, 'errors': [], 'warnings': []})
+        self.scraper._scrape_advanced_splits_data = Mock(
+            return_value={'success': True, 'data': {}, 'errors': [], 'warnings': []}
+        )
+
+    def _get_page(self, url):
+        if url == build_season_passing_url(2024):
+            return {'success': True, 'content': self.passing_html, 'error': None}
+        if url == build_season_passing_url(2024, advanced=True):
+            return {'success': True, 'content': ADVANCED_HTML, 'error': None}
+        return {'success': False, 'content': None, 'error': f"unexpected request for {url}"}
+
+    def test_two_requests_for_every_qb(self):
+        """The whole season's basic stats cost two requests, not one per QB"""
+        results = self.scraper.scrape_season_qbs(2024)
+
+        requested = [call.args[0] for call in self.request_manager.get_page.call_args_list]
+        self.assertEqual(requested, [build_season_passing_url(2024), build_season_passing_url(2024, advanced=True)])
+        self.assertEqual(results['total_players'], 4)
+        self.assertEqual(results['successful_scrapes'], 4)
+
+        burrow = results['player_results'][0]['extracted_data']['basic_stats']
+        self.assertEqual((burrow['pfr_id'], burrow['att'], burrow['qbr']), ('BurrJo01', 652, 74.6))
+
+    def test_named_players_use_leaderboard_ids(self):
+        """Requested players get their PFR ID from the leaderboard"""
+        results = self.scraper.scrape_season_qbs(2024, player_names=['Jared Goff'])
+
+        self.assertEqual(self.request_manager.get_page.call_count, 2)
+        self.scraper._scrape_splits_data.assert_called_once_with('GoffJa00', 'Jared Goff', 2024)
+        self.assertTrue(results['player_results'][0]['success'])
+
+    def test_advanced_page_opt_in(self):
+        """By default only the main leaderboard page is fetched"""
+        scraper = CoreScraper(self.request_manager, HTMLParser(), Mock(), DatabaseManager(), Config())
+        scraper._scrape_splits_data = self.scraper._scrape_splits_data
+        scraper._scrape_advanced_splits_data = self.scraper._scrape_advanced_splits_data
+
+        scraper.scrape_season_qbs(2024)
+
+        requested = [call.args[0] for call in self.request_manager.get_page.call_args_list]
+        self.assertEqual(requested, [build_season_passing_url(2024)])
+
+    def test_leaderboard_mode_off(self):
+        """Without leaderboards nothing season-wide is fetched"""
+        scraper = CoreScraper(self.request_manager, HTMLParser(), Mock(), DatabaseManager(), Config(),
+                              use_season_leaderboards=False)
+        scraper._get_pfr_id = Mock(return_value=None)
+
+        scraper.scrape_season_qbs(2024, player_names=['Jared Goff'])
+
+        self.request_manager.get_page.assert_not_called()
+
+
+class TestEnhancedScraperLeaderboard(unittest.TestCase):
+    """Test EnhancedPFRScraper.get_season_leaderboard"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        from src.scrapers.enhanced_scraper import EnhancedPFRScraper
+        self.scraper = EnhancedPFRScraper(rate_limit_delay=0.1, splits_manager=Mock())
+        self.stats = [QBBasicStats(pfr_id='BurrJo01', player_name='Joe Burrow', player_url='', season=2024)]
+        self.scraper.get_qb_main_stats = Mock(return_value=([], self.stats))
+        self.scraper.make_request_with_retry = Mock(return_value=ADVANCED_HTML)
+
+    def test_advanced_page_opt_in(self):
+        """Only the main page is read unless the advanced page is asked for"""
+        _, stats = self.scraper.get_season_leaderboard(2024)
+
+        self.assertIs(stats, self.stats)
+        self.scraper.make_request_with_retry.assert_not_called()
+
+    def test_unparseable_advanced_page(self):
+        """An advanced page that does not parse leaves the main table's stats as they are"""
+        with patch.object(HTMLParser, 'parse_html', return_value=None):
+            _, stats = self.scraper.get_season_leaderboard(2024, include_advanced=True)
+
+        self.assertEqual(stats, self.stats)
+        self.assertIsNone(stats[0].qbr)
+        self.assertEqual(len(self.scraper.metrics.warnings), 1)
+
+
+class TestSpecificPlayersOperation(unittest.TestCase):
+    """Test ScrapingOperation's specific-player path"""
+
+    def test_one_leaderboard_call_for_all_players(self):
+        """Passing stats for several players come from one leaderboard call"""
+        with patch('src.operations.scraping_operation.NFLQBDataPipeline'):
+            from src.operations.scraping_operation import ScrapingOperation
+            db_manager = MagicMock()
+            db_manager.insert_qb_basic_stats.side_effect = len
+            operation = ScrapingOperation(config, db_manager)
+
+        passing_stats = [
+            QBBasicStats(pfr_id='BurrJo01', player_name='Joe Burrow', player_url='', season=2024),
+            QBBasicStats(pfr_id='GoffJa00', player_name='Jared Goff', player_url='', season=2024),
+        ]
+        scraper = MagicMock()
+        scraper.__enter__.return_value = scraper
+        scraper.get_season_leaderboard.return_value = ([], passing_stats)
+        operation.enhanced_scraper = scraper
+        operation.splits_manager.extract_player_splits_by_name = Mock(
+            return_value=Mock(basic_splits=[], advanced_splits=[])
+        )
+
+        result = operation._execute_specific_players(2024, ['Joe Burrow', 'Jared Goff'])
+
+        self.assertTrue(result.success, result.errors)
+        scraper.get_season_leaderboard.assert_called_once_with(
+            2024, ['Joe Burrow', 'Jared Goff'], include_advanced=config.scraping.advanced_leaderboard_enabled
+        )
+        scraper.get_qb_main_stats.assert_not_called()
+        self.assertEqual(operation.splits_manager.extract_player_splits_by_name.call_count, 2)
+        db_manager.insert_qb_basic_stats.assert_called_once_with(passing_stats)
+
+
+if __name__ == '__main__':
+    unittest.main()
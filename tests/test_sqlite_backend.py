@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+SQLite Backend Tests
+Checks that the embedded SQLite manager creates its schema, upserts with
+row hashes, streams in batches and is picked for sqlite:// URLs
+"""
+
+import sys
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.config.config import config
+from src.database.backends import open_database
+from src.database.sqlite_manager import SQLiteDatabaseManager, sqlite_path
+from src.models.qb_models import Player, QBPassingStats, QBSplitsType1
+
+
+def _stats(att=20):
+    return QBPassingStats(pfr_id='burrjo01', player_name='Joe Burrow', player_url='u',
+                          season=2024, team='CIN', cmp=10, att=att)
+
+
+def _splits(values=('Home', 'Road')):
+    return [QBSplitsType1(pfr_id='burrjo01', player_name='Joe Burrow', season=2024,
+                          split='place', value=value, cmp=1) for value in values]
+
+
+class TestSQLiteDatabaseManager(unittest.TestCase):
+    """Test SQLiteDatabaseManager against a temporary database file"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.db = SQLiteDatabaseManager(f"sqlite:///{self.tmp.name}/qb.db")
+        self.addCleanup(self.db.close)
+        self.db.insert_player(Player(pfr_id='burrjo01', player_name='Joe Burrow',
+                                     pfr_url='https://www.pro-football-reference.com/players/B/BurrJo01.htm'))
+
+    def test_new_file_gets_schema(self):
+        """Opening a new file creates the tables and the teams"""
+        self.assertEqual(self.db.health_check(),
+                         {'connection_ok': True, 'tables_exist': True, 'data_accessible': True})
+        self.assertEqual(self.db.query("SELECT COUNT(*) AS n FROM teams")[0]['n'], 32)
+
+    def test_upsert_skips_unchanged_rows(self):
+        """Same row again is unchanged, a changed row is updated in place"""
+        self.db.insert_qb_basic_stats([_stats()])
+        self.assertEqual(self.db.last_insert_result.rows_inserted, 1)
+
+        self.db.insert_qb_basic_stats([_stats()])
+        self.assertEqual(self.db.last_insert_result.rows_unchanged, 1)
+
+        self.db.insert_qb_basic_stats([_stats(att=25)])
+        self.assertEqual(self.db.last_insert_result.rows_updated, 1)
+        self.assertEqual(self.db.get_season_summary(2024)[0]['attempts'], 25)
+
+    def test_transaction_rolls_back(self):
+        """An exception inside transaction() undoes every insert in the block"""
+        with self.assertRaises(RuntimeError):
+            with self.db.transaction():
+                self.db.insert_qb_splits(_splits())
+                raise RuntimeError("abort")
+
+        self.assertEqual(self.db.get_database_stats()['qb_splits'], 0)
+
+    def test_stream_and_clear_season(self):
+        """Rows stream in key order batches; clear_season removes the season"""
+        self.db.insert_qb_splits(_splits())
+
+        batches = list(self.db.stream_splits(2024, itersize=1))
+
+        self.assertEqual([[row['value'] for row in batch] for batch in batches], [['Home'], ['Road']])
+        self.assertEqual(self.db.clear_season(2024)['qb_splits'], 2)
+        self.assertEqual(list(self.db.stream_splits(2024)), [])
+
+    def test_recategorize_splits(self):
+        """'other' splits move to their mapped type unless that would duplicate a row"""
+        self.db.insert_qb_splits(_splits(('Road',)) + [
+            QBSplitsType1(pfr_id='burrjo01', player_name='Joe Burrow', season=2024, split='other', value=value)
+            for value in ('Home', 'Road', 'Win')
+        ])
+        mapping = {'Home': 'place', 'Road': 'place', 'Win': 'result'}
+
+        preview = self.db.recategorize_splits(mapping, dry_run=True)['qb_splits']
+        self.assertEqual(preview['changes'], {'Home': ('place', 1), 'Win': ('result', 1)})
+        self.assertEqual(self.db.query("SELECT COUNT(*) AS n FROM qb_splits WHERE split = 'other'")[0]['n'], 3)
+
+        applied = self.db.recategorize_splits(mapping)['qb_splits']
+        self.assertEqual(applied['changes'], preview['changes'])
+        self.assertEqual(applied['distribution'], {'place': 2, 'other': 1, 'result': 1})
+        rows = self.db.query("SELECT split, value FROM qb_splits ORDER BY value, split")
+        self.assertEqual([(row['split'], row['value']) for row in rows],
+                         [('place', 'Home'), ('other', 'Road'), ('place', 'Road'), ('result', 'Win')])
+
+    def test_partitioning_rejected(self):
+        """Partitioning is Postgres-only and says so"""
+        with self.assertRaises(NotImplementedError):
+            self.db.migrate_to_partitioned('qb_splits')
+
+
+class TestOpenDatabase(unittest.TestCase):
+    """Test backend selection from the connection string"""
+
+    def test_sqlite_url(self):
+        """sqlite:// URLs open the embedded backend"""
+        with tempfile.TemporaryDirectory() as tmp:
+            db = open_database(f"sqlite:///{tmp}/qb.db")
+            self.assertIsInstance(db, SQLiteDatabaseManager)
+            db.close()
+
+    def test_sqlite_url_reaches_every_consumer(self):
+        """With a sqlite:// DATABASE_URL nothing builds a Postgres manager"""
+        from src.cli.commands.fix_splits_command import FixSplitsCommand
+        from src.operations.scraping_operation import ScrapingOperation
+        from src.operations.validation_ops import ValidationEngine
+
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch.object(config, 'get_database_url', return_value=f"sqlite:///{tmp}/qb.db"):
+            db = open_database()
+            operation = ScrapingOperation(config, db)
+            self.assertIs(operation.legacy_pipeline.db_manager, db)
+            for manager in (FixSplitsCommand().db_manager, ValidationEngine().db_manager):
+                self.assertIsInstance(manager, SQLiteDatabaseManager)
+                manager.close()
+            db.close()
+
+    def test_sqlite_path(self):
+        """Three slashes are a relative path, four an absolute one"""
+        self.assertEqual(sqlite_path('sqlite:///data/qb.db'), 'data/qb.db')
+        self.assertEqual(sqlite_path('sqlite:////tmp/qb.db'), '/tmp/qb.db')
+
+    def test_rejects_other_urls(self):
+        """The SQLite manager refuses Postgres URLs"""
+        with self.assertRaises(ValueError):
+            SQLiteDatabaseManager('postgresql://test')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Static Splits Extraction Tests
+Tests that splits pages are extracted from the static response, including
+comment-wrapped tables, with Selenium used only as a fallback
+"""
+
+import sys
+import os
+import re
+import unittest
+from datetime import datetime
+from unittest.mock import Mock
+
+from bs4 import BeautifulSoup
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.html_parser import HTMLParser
+from src.scrapers.splits_extractor import SplitsExtractor
+
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), 'fixtures', 'pfr_splits_2024_sample.html')
+
+
+def load_fixture() -> str:
+    with open(FIXTURE_PATH, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+class TestCommentedTableExpansion(unittest.TestCase):
+    """Test expansion of PFR's comment-wrapped tables"""
+
+    def test_commented_table_is_invisible_until_expanded(self):
+        """The advanced splits table only exists after comment expansion"""
+        soup = BeautifulSoup(load_fixture(), 'html.parser')
+        self.assertIsNone(soup.find('table', id='advanced_splits'))
+
+        self.assertEqual(HTMLParser.expand_commented_tables(soup), 1)
+
+        table = soup.find('div', id='div_advanced_splits').find('table', id='advanced_splits')
+        self.assertEqual(len(table.tbody.find_all('tr')), 6)
+
+    def test_table_id_filter(self):
+        """Comments for tables not asked for are left alone"""
+        soup = BeautifulSoup(load_fixture(), 'html.parser')
+        self.assertEqual(HTMLParser.expand_commented_tables(soup, ['defense']), 0)
+        self.assertIsNone(soup.find('table', id='advanced_splits'))
+
+
+class TestStaticSplitsExtraction(unittest.TestCase):
+    """Test SplitsExtractor's static fetch path and Selenium fallback"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.selenium_manager = Mock()
+        self.request_manager = Mock()
+        self.scraped_at = datetime(2024, 12, 1)
+
+    def _extract(self, extractor):
+        return extractor.extract_player_splits('BurrJo01', 'Joe Burrow', 2024, self.scraped_at)
+
+    def test_static_page_skips_selenium(self):
+        """Both tables are extracted from the static response without a browser"""
+        self.request_manager.get_page.return_value = {'success': True, 'content': load_fixture(), 'error': None}
+        extractor = SplitsExtractor(self.selenium_manager, request_manager=self.request_manager)
+
+        result = self._extract(extractor)
+
+        self.assertEqual(result.errors, [])
+        self.assertEqual(len(result.basic_splits), 6)
+        self.assertEqual(len(result.advanced_splits), 6)
+        self.selenium_manager.get_page.assert_not_called()
+        self.assertEqual(extractor.static_page_loads, 1)
+        self.assertEqual(extractor.selenium_fallbacks, 0)
+
+        first_down = result.advanced_splits[0]
+        self.assertEqual((first_down.split, first_down.value), ('Down', '1st'))
+        self.assertEqual(first_down.first_downs, 88)
+        self.assertEqual(first_down.rush_first_downs, 6)
+
+    def test_static_and_selenium_paths_agree(self):
+        """Records from the static path match a browser-rendered page"""
+        html = load_fixture()
+        rendered = re.sub(r'<!--|-->', '', html)
+
+        self.request_manager.get_page.return_value = {'success': True, 'content': html, 'error': None}
+        static_result = self._extract(SplitsExtractor(Mock(), request_manager=self.request_manager))
+
+        self.selenium_manager.get_page.return_value = {'success': True, 'content': rendered, 'error': None}
+        browser_result = self._extract(SplitsExtractor(self.selenium_manager))
+
+        self.assertEqual(static_result.basic_splits, browser_result.basic_splits)
+        self.assertEqual(static_result.advanced_splits, browser_result.advanced_splits)
+
+    def test_falls_back_when_table_placeholder_is_empty(self):
+        """A placeholder without table markup forces the Selenium fallback"""
+        html = load_fixture()
+        stripped = re.sub(r'<!--.*?-->', '', html, flags=re.DOTALL)
+        self.request_manager.get_page.return_value = {'success': True, 'content': stripped, 'error': None}
+        self.selenium_manager.get_page.return_value = {'success': True, 'content': html, 'error': None}
+        extractor = SplitsExtractor(self.selenium_manager, request_manager=self.request_manager)
+
+        result = self._extract(extractor)
+
+        self.selenium_manager.get_page.assert_called_once()
+        self.assertTrue(self.selenium_manager.get_page.call_args.kwargs['enable_js'])
+        self.assertEqual(extractor.selenium_fallbacks, 1)
+        self.assertEqual(len(result.advanced_splits), 6)
+
+    def test_season_without_advanced_splits_stays_static(self):
+        """No advanced splits placeholder means nothing to render"""
+        html = load_fixture()
+        start = html.index('<div id="all_advanced_splits"')
+        end = html.index('<div id="footer"')
+        no_advanced = html[:start] + '</div>\n' + html[end:]
+        self.request_manager.get_page.return_value = {'success': True, 'content': no_advanced, 'error': None}
+        extractor = SplitsExtractor(self.selenium_manager, request_manager=self.request_manager)
+
+        result = self._extract(extractor)
+
+        self.selenium_manager.get_page.assert_not_called()
+        self.assertEqual(len(result.basic_splits), 6)
+        self.assertEqual(result.advanced_splits, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
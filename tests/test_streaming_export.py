@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Streaming Export Tests
+Checks JSON Lines and CSV exports over season ranges with column
+selection and gzip/zstd compression, read back from a SQLite database
+"""
+
+import sys
+import os
+import csv
+import gzip
+import io
+import json
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.database.sqlite_manager import SQLiteDatabaseManager
+from src.models.qb_models import Player, QBPassingStats, QBSplitsType1
+from src.operations import data_manager as data_manager_module
+from src.operations.data_manager import DataManager
+
+SEASONS = (2022, 2023, 2024)
+
+
+class TestStreamingExport(unittest.TestCase):
+    """Test DataManager exports against a temporary SQLite database"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        self.addCleanup(os.chdir, cwd)
+
+        self.db = SQLiteDatabaseManager(f"sqlite:///{self.tmp.name}/qb.db")
+        self.addCleanup(self.db.close)
+        self.db.insert_player(Player(pfr_id='burrjo01', player_name='Joe Burrow', pfr_url='https://example.com/b.htm'))
+        self.db.insert_qb_basic_stats([
+            QBPassingStats(pfr_id='burrjo01', player_name='Joe Burrow', player_url='u', season=season,
+                           team='CIN', att=500 + season % 10)
+            for season in SEASONS
+        ])
+        self.db.insert_qb_splits([
+            QBSplitsType1(pfr_id='burrjo01', player_name='Joe Burrow', season=season, split='place',
+                          value=value, cmp=1)
+            for season in SEASONS for value in ('Home', 'Road')
+        ])
+        self.manager = DataManager(self.db)
+
+    def test_jsonl_gzip_season_range(self):
+        """JSON Lines exports cover only the requested seasons, one gzip file per dataset"""
+        self.manager.export_data('jsonl', season=[2023, 2024], output_file='export.jsonl.gz', compression='gzip')
+
+        with gzip.open('export_qb_stats.jsonl.gz', 'rt') as f:
+            stats = [json.loads(line) for line in f]
+        with gzip.open('export_splits_data.jsonl.gz', 'rt') as f:
+            splits = [json.loads(line) for line in f]
+        self.assertEqual([row['season'] for row in stats], [2023, 2024])
+        self.assertEqual(len(splits), 4)
+        self.assertFalse(os.path.exists('export_advanced_stats.jsonl.gz'))
+
+    def test_csv_columns(self):
+        """Selected columns are the only ones read and written; datasets without them are skipped"""
+        self.manager.export_data('csv', season=2024, output_file='export.csv', columns=['pfr_id', 'season', 'att'])
+
+        with open('export_qb_stats.csv', newline='') as f:
+            rows = list(csv.DictReader(f))
+        with open('export_splits_data.csv', newline='') as f:
+            header = next(csv.reader(f))
+        self.assertEqual(rows, [{'pfr_id': 'burrjo01', 'season': '2024', 'att': '504'}])
+        self.assertEqual(header, ['pfr_id', 'season', 'att'])
+
+    def test_json_document_compressed(self):
+        """The single-document JSON export can be gzip compressed too"""
+        output = self.manager.export_data('json', output_file='export.json.gz', compression='gzip')
+
+        with gzip.open(output, 'rt') as f:
+            data = json.load(f)
+        self.assertEqual(len(data['qb_stats']), 3)
+        self.assertEqual(data['export_metadata']['total_records'], 9)
+
+    @unittest.skipUnless(data_manager_module.zstandard, "zstandard not installed")
+    def test_zstd(self):
+        """zstd exports decompress back to the same lines"""
+        self.manager.export_data('jsonl', output_file='export.jsonl.zst', compression='zstd')
+
+        with open('export_qb_stats.jsonl.zst', 'rb') as f:
+            reader = data_manager_module.zstandard.ZstdDecompressor().stream_reader(f)
+            lines = io.TextIOWrapper(reader, encoding='utf-8').read().splitlines()
+        self.assertEqual(len(lines), 3)
+
+    def test_invalid_options(self):
+        """Unknown columns, compressed SQLite and zstd without its package are rejected"""
+        with self.assertRaises(ValueError):
+            self.manager.export_data('csv', output_file='export.csv', columns=['no_such_column'])
+        with self.assertRaises(ValueError):
+            self.manager.export_data('sqlite', output_file='export.db', compression='gzip')
+        with patch.object(data_manager_module, 'zstandard', None):
+            with self.assertRaises(ValueError):
+                self.manager.export_data('jsonl', output_file='export.jsonl.zst', compression='zstd')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Streaming Table Extractor Tests
+Checks that streamed records match the DOM-based extractors and that page
+size does not grow peak memory
+"""
+
+import sys
+import os
+import gzip
+import shutil
+import tempfile
+import tracemalloc
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.html_parser import HTMLParser
+from src.core.streaming_extractor import StreamingTableExtractor
+from src.models.qb_models import QBPassingStats, QBSplitsType1, QBSplitsType2
+from src.scrapers.splits_extractor import SplitsExtractor
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+SCRAPED_AT = datetime(2024, 12, 1)
+
+
+def load_fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES_DIR, name), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+class TestStreamingParity(unittest.TestCase):
+    """Test that streamed records equal the DOM extractors' records"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.splits_html = load_fixture('pfr_splits_2024_sample.html')
+        cls.passing_html = load_fixture('pfr_passing_2024_sample.html')
+
+        request_manager = Mock()
+        request_manager.get_page.return_value = {'success': True, 'content': cls.splits_html, 'error': None}
+        result = SplitsExtractor(Mock(), request_manager=request_manager).extract_player_splits(
+            'BurrJo01', 'Joe Burrow', 2024, SCRAPED_AT
+        )
+        cls.expected_splits = result.basic_splits + result.advanced_splits
+
+        parser = HTMLParser()
+        rows = parser.parse_passing_stats_table(parser.parse_html(cls.passing_html), 2024)
+        cls.expected_passing = [QBPassingStats(**row, scraped_at=SCRAPED_AT, updated_at=SCRAPED_AT) for row in rows]
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.extractor = StreamingTableExtractor()
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_splits_match_splits_extractor(self):
+        """Basic and comment-wrapped advanced splits stream in page order"""
+        streamed = list(self.extractor.iter_splits(self.splits_html, 'BurrJo01', 'Joe Burrow', 2024, SCRAPED_AT))
+
+        self.assertEqual(len(streamed), 12)
+        self.assertEqual(streamed, self.expected_splits)
+        self.assertIsInstance(streamed[0], QBSplitsType1)
+        self.assertIsInstance(streamed[-1], QBSplitsType2)
+
+    def test_passing_matches_html_parser(self):
+        """Only QB rows with player links are streamed"""
+        streamed = list(self.extractor.iter_passing_stats(self.passing_html, 2024, SCRAPED_AT))
+
+        self.assertEqual([s.pfr_id for s in streamed], ['BurrJo01', 'GoffJa00', 'JackLa00', 'MahoPa00'])
+        self.assertEqual(streamed, self.expected_passing)
+
+    def test_sources(self):
+        """Text, bytes, plain and gzipped files (as paths or path strings) and open streams give the same records"""
+        plain_path = Path(self.temp_dir) / 'splits.html'
+        plain_path.write_text(self.splits_html, encoding='utf-8')
+        gz_path = Path(self.temp_dir) / 'splits.html.gz'
+        with gzip.open(gz_path, 'wt', encoding='utf-8') as f:
+            f.write(self.splits_html)
+
+        with open(plain_path, 'rb') as stream:
+            sources = [self.splits_html.encode('utf-8'), plain_path, gz_path, str(plain_path), str(gz_path), stream]
+            for source in sources:
+                streamed = list(self.extractor.iter_splits(source, 'BurrJo01', 'Joe Burrow', 2024, SCRAPED_AT))
+                self.assertEqual(streamed, self.expected_splits, repr(source))
+
+    def test_data_extractor_table_types(self):
+        """PFRDataExtractor's table type names select the same tables"""
+        streamed = list(self.extractor.iter_records(
+            self.splits_html, ['splits', 'advanced_splits'], 2024,
+            pfr_id='BurrJo01', player_name='Joe Burrow', scraped_at=SCRAPED_AT
+        ))
+        self.assertEqual([table_type for table_type, _ in streamed], ['basic_splits'] * 6 + ['advanced_splits'] * 6)
+
+        passing = list(self.extractor.iter_records(self.passing_html, ['basic_stats'], 2024, scraped_at=SCRAPED_AT))
+        self.assertEqual([record for _, record in passing], self.expected_passing)
+
+    def test_table_id_override_and_unknown_type(self):
+        """Table ids can be overridden; unknown table types fail loudly"""
+        renamed = self.splits_html.replace('id="stats"', 'id="stats_2024"')
+        streamed = list(self.extractor.iter_records(renamed, ['basic_splits'], 2024, scraped_at=SCRAPED_AT,
+                                                    table_ids={'basic_splits': 'stats_2024'}))
+        self.assertEqual(len(streamed), 6)
+
+        with self.assertRaises(ValueError):
+            self.extractor.resolve_table_types(['defense'])
+
+
+class TestStreamingMemory(unittest.TestCase):
+    """Test that peak memory does not grow with page size"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        html = load_fixture('pfr_splits_2024_sample.html')
+        start = html.index('<tbody>') + len('<tbody>')
+        end = html.index('</tbody>')
+        self.page_parts = (html[:start], html[start:end], html[end:])
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _stream_page(self, copies: int) -> tuple:
+        head, body, tail = self.page_parts
+        path = Path(self.temp_dir) / f'splits_{copies}.html'
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(head)
+            for _ in range(copies):
+                f.write(body)
+            f.write(tail)
+
+        extractor = StreamingTableExtractor()
+        tracemalloc.start()
+        try:
+            rows = sum(1 for _ in extractor.iter_splits(path, 'BurrJo01', 'Joe Burrow', 2024, SCRAPED_AT))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return rows, peak
+
+    def test_peak_memory_independent_of_page_size(self):
+        """A page with ten times the rows streams in the same peak memory"""
+        large_rows, large_peak = self._stream_page(10)
+        huge_rows, huge_peak = self._stream_page(100)
+
+        self.assertEqual(huge_rows - large_rows, 90 * 6)
+        self.assertLess(huge_peak, large_peak * 1.25)
+
+
+if __name__ == '__main__':
+    unittest.main()
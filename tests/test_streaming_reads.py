@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Streaming Read Tests
+Checks that bulk reads use named server-side cursors and come back in
+batches, and that export and validation consume those batches
+"""
+
+import sys
+import os
+import csv
+import json
+import tempfile
+import unittest
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.database.db_manager import DatabaseManager
+from src.operations.data_manager import DataManager
+from src.operations.validation_ops import ValidationEngine
+
+
+def _rows(count, season=2024):
+    return [{'pfr_id': f'p{i}', 'player_name': f'Player {i}', 'season': season, 'cmp': 10, 'att': 20}
+            for i in range(count)]
+
+
+class TestStreamRows(unittest.TestCase):
+    """Test DatabaseManager.stream_rows"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        with patch.object(DatabaseManager, '_initialize_pool'):
+            self.db = DatabaseManager('postgresql://test')
+        self.conn = MagicMock()
+        self.cursor = MagicMock()
+        self.conn.cursor.return_value = self.cursor
+
+        @contextmanager
+        def get_connection():
+            yield self.conn
+
+        self.db.get_connection = get_connection
+
+    def test_named_cursor_batches(self):
+        """Rows come from a named cursor, one fetchmany of itersize per batch"""
+        rows = _rows(5)
+        self.cursor.fetchmany.side_effect = [rows[:2], rows[2:4], rows[4:], []]
+
+        batches = list(self.db.stream_rows('qb_splits', season=2024, itersize=2))
+
+        self.assertEqual([len(batch) for batch in batches], [2, 2, 1])
+        self.assertTrue(self.conn.cursor.call_args.kwargs['name'].startswith('stream_qb_splits_'))
+        self.assertEqual(self.cursor.itersize, 2)
+        sql, params = self.cursor.execute.call_args.args
+        self.assertIn('WHERE season = %s', sql)
+        self.assertIn('ORDER BY pfr_id, season, split, value', sql)
+        self.assertEqual(params, (2024,))
+        self.cursor.fetchmany.assert_called_with(2)
+        self.cursor.close.assert_called_once()
+
+    def test_cursor_closed_when_abandoned(self):
+        """Closing the generator early closes the server-side cursor"""
+        self.cursor.fetchmany.return_value = _rows(2)
+
+        stream = self.db.stream_qb_stats(itersize=2)
+        next(stream)
+        stream.close()
+
+        self.cursor.close.assert_called_once()
+
+    def test_column_selection(self):
+        """Selected columns go into the SELECT list; anything but identifiers is refused"""
+        self.cursor.fetchmany.return_value = []
+
+        list(self.db.stream_rows('qb_passing_stats', columns=['pfr_id', 'season']))
+
+        sql, params = self.cursor.execute.call_args.args
+        self.assertTrue(sql.startswith('SELECT pfr_id, season FROM qb_passing_stats ORDER BY pfr_id, season'))
+        self.assertIsNone(params)
+        with self.assertRaises(ValueError):
+            list(self.db.stream_rows('qb_passing_stats', columns=['pfr_id; DROP TABLE players']))
+
+    def test_unknown_table_rejected(self):
+        """Only the stats tables can be streamed"""
+        with self.assertRaises(ValueError):
+            list(self.db.stream_rows('players'))
+
+
+class TestStreamingConsumers(unittest.TestCase):
+    """Test that export and validation read batch by batch"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.db = MagicMock()
+        self.db.stream_qb_stats.side_effect = lambda season=None: iter([_rows(2), _rows(1)])
+        self.db.stream_splits.side_effect = lambda season=None: iter(())
+        self.db.stream_advanced_stats.side_effect = lambda season=None: iter([_rows(3)])
+        self.tmp = tempfile.TemporaryDirectory()
+        cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        self.addCleanup(os.chdir, cwd)
+        self.addCleanup(self.tmp.cleanup)
+        self.manager = DataManager(self.db)
+
+    def test_json_export(self):
+        """The streamed JSON export is one valid document with every batch in it"""
+        output = self.manager.export_data('json', season=2024, output_file='export.json')
+
+        with open(output) as f:
+            data = json.load(f)
+        self.assertEqual(len(data['qb_stats']), 3)
+        self.assertEqual(data['splits_data'], [])
+        self.assertEqual(len(data['advanced_stats']), 3)
+        self.assertEqual(data['export_metadata']['total_records'], 6)
+        self.db.stream_qb_stats.assert_called_once_with(2024)
+
+    def test_csv_export(self):
+        """Each dataset with rows gets one CSV file written batch by batch"""
+        self.manager.export_data('csv', output_file='export.csv')
+
+        with open('export_qb_stats.csv', newline='') as f:
+            self.assertEqual(len(list(csv.DictReader(f))), 3)
+        self.assertFalse(os.path.exists('export_splits_data.csv'))
+
+    def test_validation_counts_every_batch(self):
+        """Validation reports cover all streamed batches"""
+        engine = ValidationEngine.__new__(ValidationEngine)
+        engine.rules = ValidationEngine._create_validation_rules(engine)
+        engine.db_manager = self.db
+
+        reports = engine.validate_all_data(season=2024)
+
+        self.assertEqual(reports['qb_stats'].total_records, 3)
+        self.assertEqual(reports['splits'].total_records, 0)
+        self.assertEqual(reports['advanced_stats'].total_records, 3)
+        self.assertEqual(self.manager.get_data_summary()['summary']['total_qb_stats'], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
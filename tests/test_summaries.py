@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Materialized Summary Tests
+Checks concurrent refresh of the materialized summaries, refresh after loads
+and the monitoring reads that use them
+"""
+
+import sys
+import os
+import unittest
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+from psycopg2 import errors as pg_errors
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.config.config import config
+from src.database.db_manager import DatabaseManager, SCHEMA_FILE, SUMMARY_VIEWS, split_sql_statements
+from src.models.qb_models import QBPassingStats
+
+
+class TestMaterializedSummaries(unittest.TestCase):
+    """Test DatabaseManager's materialized summaries"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        with patch.object(DatabaseManager, '_initialize_pool'):
+            self.db = DatabaseManager('postgresql://test')
+        self.conn = MagicMock()
+        self.cursor = MagicMock()
+
+        @contextmanager
+        def get_connection():
+            yield self.conn
+
+        @contextmanager
+        def get_cursor(conn):
+            yield self.cursor
+
+        self.db.get_connection = get_connection
+        self.db.get_cursor = get_cursor
+
+    def _statements(self):
+        return [call.args[0] for call in self.cursor.execute.call_args_list]
+
+    def test_schema_summaries_support_concurrent_refresh(self):
+        """Every materialized summary has a unique index, which CONCURRENTLY requires"""
+        with open(SCHEMA_FILE) as f:
+            statements = split_sql_statements(f.read())
+        for view, source in SUMMARY_VIEWS.items():
+            self.assertIn(f'CREATE MATERIALIZED VIEW IF NOT EXISTS {view} AS\nSELECT * FROM {source}', statements)
+            self.assertTrue(any(s.startswith('CREATE UNIQUE INDEX') and f' ON {view}(' in s for s in statements))
+
+    def test_refresh_concurrently_and_record(self):
+        """Each summary is refreshed concurrently and its refresh time recorded"""
+        self.db.summaries_stale = True
+
+        durations = self.db.refresh_summaries()
+
+        self.assertEqual(set(durations), set(SUMMARY_VIEWS))
+        statements = self._statements()
+        self.assertIn('REFRESH MATERIALIZED VIEW CONCURRENTLY mv_database_stats', statements)
+        self.assertIn('REFRESH MATERIALIZED VIEW CONCURRENTLY mv_qb_season_summary', statements)
+        recorded = [call.args[1][0] for call in self.cursor.execute.call_args_list
+                    if 'summary_refreshes' in call.args[0]]
+        self.assertEqual(recorded, list(SUMMARY_VIEWS))
+        self.assertFalse(self.db.summaries_stale)
+
+    def test_unpopulated_summary_gets_plain_refresh(self):
+        """A never-populated summary falls back to a blocking refresh"""
+        def execute(sql, params=None):
+            if 'CONCURRENTLY mv_database_stats' in sql:
+                raise pg_errors.FeatureNotSupported("CONCURRENTLY cannot be used when the materialized view is not populated")
+
+        self.cursor.execute.side_effect = execute
+        self.db.refresh_summaries()
+
+        self.assertIn('REFRESH MATERIALIZED VIEW mv_database_stats', self._statements())
+        self.conn.rollback.assert_called_once()
+
+    def test_refresh_only_after_changes(self):
+        """Loads that change rows mark the summaries stale; unchanged loads do not"""
+        original = config.bulk_operations.copy_threshold
+        config.bulk_operations.copy_threshold = 0
+        stats = [QBPassingStats(pfr_id='TestQb00', player_name='Test QB', player_url='', season=2024)]
+        try:
+            with patch('src.database.db_manager.execute_values', return_value=[]):
+                self.db.insert_qb_basic_stats(stats)
+            self.assertFalse(self.db.refresh_summaries_if_stale())
+
+            with patch('src.database.db_manager.execute_values', return_value=[{'inserted': True}]):
+                self.db.insert_qb_basic_stats(stats)
+            self.assertTrue(self.db.summaries_stale)
+        finally:
+            config.bulk_operations.copy_threshold = original
+
+        with patch.object(self.db, 'refresh_summaries') as refresh:
+            self.assertTrue(self.db.refresh_summaries_if_stale())
+        refresh.assert_called_once_with()
+
+    def test_reads_fall_back_to_plain_views(self):
+        """Before the summaries exist, reads use the plain views"""
+        def query(sql, params=None):
+            if 'mv_database_stats' in sql:
+                raise pg_errors.UndefinedTable('relation "mv_database_stats" does not exist')
+            return [{'table_name': 'qb_splits', 'record_count': 12}]
+
+        with patch.object(self.db, 'query', side_effect=query) as mocked:
+            self.assertEqual(self.db.get_database_stats(), {'qb_splits': 12})
+        self.assertEqual(mocked.call_args.args[0], 'SELECT table_name, record_count FROM database_stats')
+
+    def test_season_summary_filters_by_season(self):
+        """Season summaries read from the materialized view, filtered by season"""
+        with patch.object(self.db, 'query', return_value=[]) as mocked:
+            self.db.get_season_summary(2024)
+        sql, params = mocked.call_args.args
+        self.assertIn('FROM mv_qb_season_summary WHERE season = %s', sql)
+        self.assertEqual(params, (2024,))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Work Queue Tests
+Checks claims, leases, heartbeats and reclaim on the SQLite work queue,
+and that several workers drain one session without running an item twice
+"""
+
+import sys
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.splits_manager import SplitsManager
+from src.database.sqlite_manager import SQLiteDatabaseManager
+from src.models.qb_models import Player, QBPassingStats, QBSplitsType1
+from src.operations.batch_manager import BatchOperationManager
+from src.operations.work_queue import PostgresWorkQueue, QueueWorker, SQLiteWorkQueue, open_work_queue
+from src.scrapers.enhanced_scraper import EnhancedPFRScraper
+from src.scrapers.splits_extractor import SplitsExtractionResult
+
+
+class FakeClock:
+    """Wall clock the tests move by hand"""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestSQLiteWorkQueue(unittest.TestCase):
+    """Test SQLiteWorkQueue"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.clock = FakeClock()
+        self.queue = SQLiteWorkQueue(os.path.join(self.tmp.name, 'queue.db'), lease_seconds=60, clock=self.clock)
+        self.addCleanup(self.queue.close)
+        self.queue.enqueue('s1', [('s1_a', 'A'), ('s1_b', 'B')], payload={'season': 2024}, max_attempts=2)
+
+    def test_claims_in_order(self):
+        """Claims hand out the oldest pending item with its payload, once"""
+        first = self.queue.claim('s1', 'w1')
+        second = self.queue.claim('s1', 'w2')
+
+        self.assertEqual((first.name, first.payload, first.attempts), ('A', {'season': 2024}, 1))
+        self.assertEqual(second.name, 'B')
+        self.assertIsNone(self.queue.claim('s1', 'w3'))
+        self.assertEqual(self.queue.enqueue('s1', [('s1_a', 'A')]), 0)
+
+    def test_expired_lease_reclaimed(self):
+        """An item whose lease runs out goes to the next claimer; the old owner can no longer finish it"""
+        item = self.queue.claim('s1', 'w1')
+        self.queue.claim('s1', 'w1')
+        self.clock.now += 61
+
+        reclaimed = self.queue.claim('s1', 'w2')
+
+        self.assertEqual((reclaimed.id, reclaimed.attempts), (item.id, 2))
+        self.assertFalse(self.queue.heartbeat(item.id, 'w1'))
+        self.assertFalse(self.queue.complete(item.id, 'w1', {}))
+        self.assertTrue(self.queue.complete(item.id, 'w2', {'success': True}))
+
+    def test_heartbeat_extends_lease(self):
+        """A heartbeat before expiry keeps the item with its worker"""
+        item = self.queue.claim('s1', 'w1')
+        self.clock.now += 50
+        self.assertTrue(self.queue.heartbeat(item.id, 'w1'))
+        self.clock.now += 50
+
+        self.assertEqual(self.queue.claim('s1', 'w2').name, 'B')
+        self.assertIsNone(self.queue.claim('s1', 'w2'))
+
+    def test_failures_retry_until_attempts_used(self):
+        """fail() requeues until max_attempts claims, then marks the item failed"""
+        item = self.queue.claim('s1', 'w1')
+        self.assertEqual(self.queue.fail(item.id, 'w1', 'timeout'), 'pending')
+
+        retry = self.queue.claim('s1', 'w1')
+        self.assertEqual((retry.id, retry.attempts), (item.id, 2))
+        self.assertEqual(self.queue.fail(item.id, 'w1', 'timeout'), 'failed')
+        self.assertEqual(self.queue.counts('s1'), {'pending': 1, 'running': 0, 'completed': 0, 'failed': 1})
+
+    def test_open_work_queue_paths(self):
+        """sqlite:// URLs and plain paths open the SQLite queue"""
+        for location in (f"sqlite:///{self.tmp.name}/a.db", os.path.join(self.tmp.name, 'b.db')):
+            queue = open_work_queue(location)
+            self.assertIsInstance(queue, SQLiteWorkQueue)
+            queue.close()
+
+
+class TestPostgresWorkQueue(unittest.TestCase):
+    """Test the shared Postgres queue schema"""
+
+    def test_times_are_timezone_aware(self):
+        """Lease and queue times are TIMESTAMPTZ, like the rest of the schema"""
+        db_manager = Mock()
+        PostgresWorkQueue(db_manager)
+
+        schema = db_manager.execute.call_args.args[0]
+        for column in ('lease_expires_at', 'enqueued_at', 'updated_at'):
+            self.assertRegex(schema, rf"{column} TIMESTAMPTZ\b")
+
+
+class TestQueueWorker(unittest.TestCase):
+    """Test QueueWorker"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, 'queue.db')
+        queue = SQLiteWorkQueue(self.path)
+        queue.enqueue('s1', [(f's1_{i}', f'Player {i}') for i in range(30)])
+        queue.close()
+
+    def test_workers_drain_session_once(self):
+        """Concurrent workers with their own connections run every item exactly once"""
+        seen = []
+        lock = threading.Lock()
+
+        def handler(item):
+            with lock:
+                seen.append(item.id)
+            return {'success': True}
+
+        stats = []
+
+        def work(worker_id):
+            queue = SQLiteWorkQueue(self.path)
+            stats.append(QueueWorker(queue, 's1', handler, worker_id=worker_id, poll_interval=0.01).run())
+            queue.close()
+
+        threads = [threading.Thread(target=work, args=(f'w{i}',)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(seen), sorted(f's1_{i}' for i in range(30)))
+        self.assertEqual(sum(s['completed'] for s in stats), 30)
+        self.assertEqual(SQLiteWorkQueue(self.path).counts('s1')['completed'], 30)
+
+    def test_handler_error_fails_item(self):
+        """An exception in the handler is reported to the queue as a failure"""
+        queue = SQLiteWorkQueue(self.path)
+        queue.enqueue('s2', [('s2_a', 'A')], max_attempts=1)
+
+        def handler(item):
+            raise RuntimeError("page not found")
+
+        stats = QueueWorker(queue, 's2', handler, poll_interval=0.01).run()
+
+        self.assertEqual(stats['failed'], 1)
+        self.assertEqual(queue.counts('s2')['failed'], 1)
+        queue.close()
+
+
+class TestBatchWorker(unittest.TestCase):
+    """Test that BatchOperationManager workers scrape through ScrapingOperation and store the results"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.db = SQLiteDatabaseManager(f"sqlite:///{self.tmp.name}/qb.db")
+        self.addCleanup(self.db.close)
+        self.queue = SQLiteWorkQueue(os.path.join(self.tmp.name, 'queue.db'))
+        self.addCleanup(self.queue.close)
+        self.queue.enqueue('s1', [('s1_burrow', 'Joe Burrow')], payload={'season': 2024}, max_attempts=1)
+
+        # Only the network-facing methods are replaced, with their real signatures
+        def leaderboard(scraper, season, player_names=None, include_advanced=True):
+            return ([Player(pfr_id='burrjo01', player_name='Joe Burrow', pfr_url='u')],
+                    [QBPassingStats(pfr_id='burrjo01', player_name='Joe Burrow', player_url='u', season=season,
+                                    team='CIN', att=652)])
+
+        def splits(manager, player_name, pfr_id, season):
+            split = QBSplitsType1(pfr_id=pfr_id, player_name=player_name, season=season, split='place',
+                                  value='Home', cmp=1)
+            return SplitsExtractionResult([split], [], [], [], 1, 1, 0.0)
+
+        for target, name, side_effect in ((EnhancedPFRScraper, 'get_season_leaderboard', leaderboard),
+                                          (SplitsManager, 'extract_player_splits_by_name', splits)):
+            patcher = patch.object(target, name, autospec=True, side_effect=side_effect)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        with patch('src.operations.batch_manager.open_database', return_value=self.db):
+            self.manager = BatchOperationManager(max_workers=1)
+
+    def test_worker_stores_scraped_player(self):
+        """A queued player is scraped, stored and logged, then completed on the queue"""
+        stats = self.manager.run_worker(self.queue, 's1', poll_interval=0.01)
+
+        self.assertEqual(stats['completed'], 1)
+        self.assertEqual(self.queue.counts('s1')['completed'], 1)
+        stored = self.db.query("SELECT pfr_id, att FROM qb_passing_stats WHERE season = 2024")
+        self.assertEqual([(row['pfr_id'], row['att']) for row in stored], [('burrjo01', 652)])
+        self.assertEqual(self.db.query("SELECT COUNT(*) AS n FROM qb_splits")[0]['n'], 1)
+        logs = self.db.query("SELECT scope, total_passing_stats FROM scraping_logs")
+        self.assertEqual([(row['scope'], row['total_passing_stats']) for row in logs], [('players', 1)])
+
+    def test_summaries_refreshed_once_per_drain(self):
+        """Items skip the summary refresh; the worker refreshes once when the session drains"""
+        self.queue.enqueue('s1', [('s1_burrow_again', 'Joe Burrow')], payload={'season': 2024}, max_attempts=1)
+
+        with patch.object(self.db, 'refresh_summaries_if_stale', wraps=self.db.refresh_summaries_if_stale) as refresh:
+            stats = self.manager.run_worker(self.queue, 's1', poll_interval=0.01)
+
+        self.assertEqual(stats['completed'], 2)
+        refresh.assert_called_once_with()
+
+
+if __name__ == '__main__':
+    unittest.main()
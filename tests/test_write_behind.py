@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Write-Behind Writer Tests
+Checks that queued records are flushed by size and time, one transaction
+per flush, with the queue bounding memory
+"""
+
+import sys
+import os
+import threading
+import unittest
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.config.config import config
+from src.database.db_manager import DatabaseManager
+from src.database.write_behind import WriteBehindWriter
+from src.models.qb_models import QBPassingStats, QBSplitsType1
+
+
+def _stat(i):
+    return QBPassingStats(pfr_id=f"TestQb{i:02d}", player_name=f"Test QB {i}", player_url='', season=2024)
+
+
+def _split(i):
+    return QBSplitsType1(pfr_id=f"TestQb{i:02d}", player_name=f"Test QB {i}", season=2024,
+                         split='Place', value='Home')
+
+
+class TestWriteBehindWriter(unittest.TestCase):
+    """Test the write-behind writer"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.calls = []
+        self.transactions = 0
+
+    def _handler(self, name):
+        def handler(records):
+            self.calls.append((name, len(records)))
+            return len(records)
+        return handler
+
+    @contextmanager
+    def _transaction(self):
+        self.transactions += 1
+        yield
+
+    def _writer(self, **kwargs):
+        options = {'flush_size': 3, 'flush_interval': 60.0, 'transaction': self._transaction}
+        options.update(kwargs)
+        handlers = {QBPassingStats: self._handler('stats'), QBSplitsType1: self._handler('splits')}
+        return WriteBehindWriter(handlers, **options)
+
+    def test_flushes_by_size(self):
+        """Every flush_size records make one flush; close flushes the remainder"""
+        with self._writer() as writer:
+            writer.put_many(_stat(i) for i in range(7))
+
+        self.assertEqual(self.calls, [('stats', 3), ('stats', 3), ('stats', 1)])
+        self.assertEqual(self.transactions, 3)
+        self.assertEqual(writer.stats.written, {'QBPassingStats': 7})
+
+    def test_flushes_by_time(self):
+        """A lone record is written once flush_interval passes"""
+        flushed = threading.Event()
+        writer = WriteBehindWriter({QBPassingStats: lambda records: flushed.set() or len(records)},
+                                   flush_size=100, flush_interval=0.05)
+        writer.put(_stat(0))
+
+        self.assertTrue(flushed.wait(2.0))
+        writer.close()
+        self.assertEqual(writer.stats.flushes, 1)
+
+    def test_handler_order_within_flush(self):
+        """Passing stats go in before splits queued ahead of them in the same flush"""
+        with self._writer(flush_size=10) as writer:
+            writer.put(_split(0))
+            writer.put(_stat(0))
+
+        self.assertEqual(self.calls, [('stats', 1), ('splits', 1)])
+        self.assertEqual(self.transactions, 1)
+
+    def test_queue_bounds_memory(self):
+        """Producers block once queue_size records are waiting on a slow writer"""
+        release = threading.Event()
+
+        def slow(records):
+            release.wait(2.0)
+            return len(records)
+
+        writer = WriteBehindWriter({QBPassingStats: slow}, flush_size=1, queue_size=2)
+        producer = threading.Thread(target=writer.put_many, args=([_stat(i) for i in range(6)],))
+        producer.start()
+        producer.join(0.2)
+        self.assertTrue(producer.is_alive())
+
+        release.set()
+        producer.join(2.0)
+        writer.close()
+        self.assertLessEqual(writer.stats.max_queue_depth, 2)
+        self.assertEqual(writer.stats.total_written, 6)
+
+    def test_failed_flush_does_not_stop_writer(self):
+        """A failing flush is counted and later flushes still run"""
+        attempts = []
+
+        def flaky(records):
+            attempts.append(len(records))
+            if len(attempts) == 1:
+                raise RuntimeError("connection reset")
+            return len(records)
+
+        with WriteBehindWriter({QBPassingStats: flaky}, flush_size=2) as writer:
+            writer.put_many(_stat(i) for i in range(4))
+
+        self.assertEqual((writer.stats.failed_flushes, writer.stats.failed_records), (1, 2))
+        self.assertEqual(writer.stats.total_written, 2)
+        self.assertEqual(writer.stats.errors, ['connection reset'])
+
+    def test_rejects_unknown_records(self):
+        """Records without a handler fail on put, not in the writer thread"""
+        writer = self._writer()
+        with self.assertRaises(TypeError):
+            writer.put("not a record")
+        writer.close()
+
+
+class TestDatabaseTransaction(unittest.TestCase):
+    """Test DatabaseManager.transaction"""
+
+    def test_inserts_share_one_commit(self):
+        """Upserts inside transaction() use its connection and commit once at the end"""
+        with patch.object(DatabaseManager, '_initialize_pool'):
+            db = DatabaseManager('postgresql://test')
+        conn = MagicMock()
+        db.pool = MagicMock()
+        db.pool.getconn.return_value = conn
+        original = config.bulk_operations.copy_threshold
+        config.bulk_operations.copy_threshold = 0
+        try:
+            with patch('src.database.db_manager.execute_values'):
+                with db.transaction():
+                    db.insert_qb_basic_stats([_stat(0)])
+                    db.insert_qb_splits([_split(0)])
+        finally:
+            config.bulk_operations.copy_threshold = original
+
+        db.pool.getconn.assert_called_once()
+        conn.commit.assert_called_once()
+        db.pool.putconn.assert_called_once_with(conn, close=False)
+
+
+if __name__ == '__main__':
+    unittest.main()